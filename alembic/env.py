@@ -21,6 +21,11 @@ from src.infrastructure.persistence.database import Base
 from src.infrastructure.persistence.orm.user import SQLAlchemyUser  # noqa
 from src.infrastructure.persistence.orm.post import SQLAlchemyPost # noqa
 from src.infrastructure.persistence.orm.follow import SQLAlchemyFollow # noqa
+from src.infrastructure.persistence.orm.timeline import SQLAlchemyTimelineEntry # noqa
+from src.infrastructure.persistence.orm.refresh_token import SQLAlchemyRefreshToken # noqa
+from src.infrastructure.persistence.orm.media_blob import SQLAlchemyMediaBlob # noqa
+from src.infrastructure.persistence.orm.idempotency_key import SQLAlchemyIdempotencyKey # noqa
+from src.infrastructure.persistence.orm.media_deletion import SQLAlchemyMediaDeletion # noqa
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,57 @@
+"""create timelines table
+
+Revision ID: 3f2a9c1d7e45
+Revises: 00a8900dbb77
+Create Date: 2026-10-18 09:12:40.118230
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f2a9c1d7e45'
+down_revision: Union[str, Sequence[str], None] = '00a8900dbb77'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('timelines',
+    sa.Column('owner_id', sa.UUID(), nullable=False),
+    sa.Column('post_id', sa.UUID(), nullable=False),
+    sa.Column('author_id', sa.UUID(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['owner_id'], ['users.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['post_id'], ['posts.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['author_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('owner_id', 'post_id')
+    )
+    op.create_index(
+        'ix_timelines_owner_id_created_at',
+        'timelines',
+        ['owner_id', sa.text('created_at DESC'), sa.text('post_id DESC')],
+        unique=False,
+    )
+    op.create_index('ix_timelines_owner_id_author_id', 'timelines', ['owner_id', 'author_id'], unique=False)
+
+    # Seed existing timelines: own posts plus posts of everyone already followed
+    op.execute(
+        """
+        INSERT INTO timelines (owner_id, post_id, author_id, created_at)
+        SELECT p.user_id, p.id, p.user_id, p.created_at FROM posts p
+        UNION
+        SELECT f.follower_id, p.id, p.user_id, p.created_at
+        FROM follows f JOIN posts p ON p.user_id = f.followed_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_timelines_owner_id_author_id', table_name='timelines')
+    op.drop_index('ix_timelines_owner_id_created_at', table_name='timelines')
+    op.drop_table('timelines')
@@ -0,0 +1,35 @@
+"""add follower count to users
+
+Revision ID: 8d4e6b2f0a13
+Revises: 3f2a9c1d7e45
+Create Date: 2026-10-18 11:03:27.540912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d4e6b2f0a13'
+down_revision: Union[str, Sequence[str], None] = '3f2a9c1d7e45'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('follower_count', sa.Integer(), server_default='0', nullable=False))
+    op.execute(
+        """
+        UPDATE users SET follower_count = counts.total
+        FROM (SELECT followed_id, count(*) AS total FROM follows GROUP BY followed_id) AS counts
+        WHERE users.id = counts.followed_id
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('users', 'follower_count')
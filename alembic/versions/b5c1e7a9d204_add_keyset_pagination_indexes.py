@@ -0,0 +1,60 @@
+"""add keyset pagination indexes
+
+Revision ID: b5c1e7a9d204
+Revises: 8d4e6b2f0a13
+Create Date: 2026-10-18 13:41:09.602715
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b5c1e7a9d204'
+down_revision: Union[str, Sequence[str], None] = '8d4e6b2f0a13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Build the composite indexes without blocking writes; CONCURRENTLY cannot
+    # run inside a transaction. The single-column indexes they supersede are
+    # dropped afterwards.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_posts_user_id_created_at_id',
+            'posts',
+            ['user_id', sa.text('created_at DESC'), sa.text('id DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_follows_followed_id_created_at',
+            'follows',
+            ['followed_id', sa.text('created_at DESC'), sa.text('follower_id DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_follows_follower_id_created_at',
+            'follows',
+            ['follower_id', sa.text('created_at DESC'), sa.text('followed_id DESC')],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+    op.drop_index('ix_posts_user_id', table_name='posts')
+    op.drop_index('ix_follows_followed_id', table_name='follows')
+    op.drop_index('ix_follows_follower_id', table_name='follows')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_follows_follower_id', 'follows', ['follower_id'], unique=False)
+    op.create_index('ix_follows_followed_id', 'follows', ['followed_id'], unique=False)
+    op.create_index('ix_posts_user_id', 'posts', ['user_id'], unique=False)
+    op.drop_index('ix_follows_follower_id_created_at', table_name='follows')
+    op.drop_index('ix_follows_followed_id_created_at', table_name='follows')
+    op.drop_index('ix_posts_user_id_created_at_id', table_name='posts')
@@ -0,0 +1,32 @@
+"""add token version to users
+
+Revision ID: d2e8f4a61c37
+Revises: b5c1e7a9d204
+Create Date: 2026-10-18 15:12:44.208531
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2e8f4a61c37'
+down_revision: Union[str, Sequence[str], None] = 'b5c1e7a9d204'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('users', sa.Column('token_version', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('users', sa.Column('tokens_revoked_at', sa.DateTime(timezone=True), nullable=True))
+    op.create_index(op.f('ix_users_tokens_revoked_at'), 'users', ['tokens_revoked_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_users_tokens_revoked_at'), table_name='users')
+    op.drop_column('users', 'tokens_revoked_at')
+    op.drop_column('users', 'token_version')
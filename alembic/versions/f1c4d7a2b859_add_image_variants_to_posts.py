@@ -0,0 +1,34 @@
+"""add image variants to posts
+
+Revision ID: f1c4d7a2b859
+Revises: e6a3b9c05d18
+Create Date: 2026-10-18 17:48:19.305614
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1c4d7a2b859'
+down_revision: Union[str, Sequence[str], None] = 'e6a3b9c05d18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('posts', sa.Column('variants', postgresql.JSONB(astext_type=sa.Text()), server_default='{}', nullable=False))
+    # Existing posts only have their original image, which is all they will ever need
+    op.add_column('posts', sa.Column('media_status', sa.String(length=16), server_default='ready', nullable=False))
+    op.execute("UPDATE posts SET variants = jsonb_build_object('original', image_url)")
+    op.alter_column('posts', 'media_status', server_default='pending')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('posts', 'media_status')
+    op.drop_column('posts', 'variants')
@@ -0,0 +1,289 @@
+"""
+Benchmark for the hybrid push/pull home feed.
+
+Runs the real CreatePostUseCase and GetFeedUseCase against in-memory repositories
+that charge a simulated database cost (a fixed round trip per query plus a cost
+per row written), then reports for thresholds below and above the author's
+follower count:
+
+* write amplification: timeline rows written per post
+* post creation latency
+* feed read p50/p99 for one of the author's followers
+
+Usage:
+    python -m benchmarks.feed_fanout --followers 200000 --reads 500
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from collections import defaultdict
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable
+from datetime import datetime
+from typing import Any
+from uuid import UUID, uuid4
+
+from src.application.common.pagination import Cursor, Page
+from src.application.common.task_scheduler import AbstractTaskScheduler
+from src.application.common.unit_of_work import AbstractUnitOfWork
+from src.application.feeds.timeline_repository import AbstractTimelineRepository
+from src.application.feeds.use_cases.get_feed import GetFeedRequest, GetFeedUseCase
+from src.application.follows.follow_repository import AbstractFollowRepository
+from src.application.posts.image_processor import AbstractPostImageProcessor
+from src.application.posts.post_repository import AbstractPostRepository
+from src.application.posts.direct_upload import AbstractDirectUploadStorage, UploadTarget
+from src.application.posts.post_storage import AbstractPostImageStorage
+from src.application.posts.use_cases.create_post import CreatePostRequest, CreatePostUseCase
+from src.domain.follows.entity import Follow
+from src.domain.posts.entity import Post
+from src.domain.users.user import User
+
+
+class SimulatedDatabase:
+    def __init__(self, round_trip_ms: float, row_write_us: float) -> None:
+        self.round_trip = round_trip_ms / 1000
+        self.row_write = row_write_us / 1_000_000
+        self.rows_written = 0
+
+    async def query(self, rows_written: int = 0) -> None:
+        self.rows_written += rows_written
+        await asyncio.sleep(self.round_trip + rows_written * self.row_write)
+
+
+class InMemoryPostRepository(AbstractPostRepository):
+    def __init__(self, db: SimulatedDatabase) -> None:
+        self._db = db
+        self.posts_by_user: dict[UUID, list[Post]] = defaultdict(list)
+
+    async def add(self, post: Post) -> None:
+        await self._db.query(rows_written=1)
+        self.posts_by_user[post.user_id].insert(0, post)
+
+    async def get_by_id(self, post_id: UUID) -> Post | None:
+        raise NotImplementedError
+
+    async def list_by_user(
+        self, user_id: UUID, limit: int, cursor: Cursor | None = None
+    ) -> Page[Post]:
+        await self._db.query()
+        return Page(items=self.posts_by_user[user_id][:limit])
+
+    async def delete(self, post: Post) -> None:
+        raise NotImplementedError
+
+    async def save(self, post: Post) -> None:
+        raise NotImplementedError
+
+
+class InMemoryFollowRepository(AbstractFollowRepository):
+    def __init__(self, db: SimulatedDatabase) -> None:
+        self._db = db
+        self.followers: dict[UUID, list[UUID]] = defaultdict(list)
+        self.follower_positions: dict[UUID, dict[UUID, int]] = defaultdict(dict)
+        self.following: dict[UUID, list[UUID]] = defaultdict(list)
+
+    async def follow_if_absent(self, follow: Follow) -> int | None:
+        positions = self.follower_positions[follow.followed_id]
+        if follow.follower_id in positions:
+            return None
+        positions[follow.follower_id] = len(positions)
+        self.followers[follow.followed_id].append(follow.follower_id)
+        self.following[follow.follower_id].append(follow.followed_id)
+        return len(positions)
+
+    async def unfollow_if_present(self, follower_id: UUID, followed_id: UUID) -> bool:
+        raise NotImplementedError
+
+    async def get_followers(
+        self, user_id: UUID, limit: int, cursor: Cursor | None = None
+    ) -> Page[User]:
+        await self._db.query()
+        follower_ids = self.followers[user_id]
+        offset = self.follower_positions[user_id][cursor.id] + 1 if cursor else 0
+        items = [
+            User(id=follower_id, username="", email="", hashed_password="")
+            for follower_id in follower_ids[offset:offset + limit]
+        ]
+        has_more = offset + limit < len(follower_ids)
+        next_cursor = Cursor(created_at=datetime.now(), id=items[-1].id) if has_more else None
+        return Page(items=items, next_cursor=next_cursor)
+
+    async def get_following(
+        self, user_id: UUID, limit: int, cursor: Cursor | None = None
+    ) -> Page[User]:
+        raise NotImplementedError
+
+    async def count_followers(self, user_id: UUID) -> int:
+        await self._db.query()
+        return len(self.followers[user_id])
+
+    async def get_following_ids_with_min_followers(
+        self, user_id: UUID, min_followers: int
+    ) -> list[UUID]:
+        await self._db.query()
+        return [
+            followed_id
+            for followed_id in self.following[user_id]
+            if len(self.followers[followed_id]) >= min_followers
+        ]
+
+    async def is_following(self, follower_id: UUID, followed_id: UUID) -> bool:
+        raise NotImplementedError
+
+
+class InMemoryTimelineRepository(AbstractTimelineRepository):
+    def __init__(self, db: SimulatedDatabase) -> None:
+        self._db = db
+        self.timelines: dict[UUID, list[Post]] = defaultdict(list)
+
+    async def push(self, post: Post, owner_ids: list[UUID]) -> None:
+        await self._db.query(rows_written=len(owner_ids))
+        for owner_id in owner_ids:
+            self.timelines[owner_id].insert(0, post)
+
+    async def backfill(self, owner_id: UUID, author_id: UUID, limit: int) -> None:
+        raise NotImplementedError
+
+    async def prune(self, owner_id: UUID, author_id: UUID) -> None:
+        raise NotImplementedError
+
+    async def get_timeline(
+        self, owner_id: UUID, limit: int, cursor: Cursor | None = None
+    ) -> Page[Post]:
+        await self._db.query()
+        return Page(items=self.timelines[owner_id][:limit])
+
+
+class NullImageStorage(AbstractPostImageStorage):
+    async def save(self, post_id: UUID, file_name: str, file_stream: AsyncIterable[bytes]) -> str:
+        return f"/static/posts/{post_id}.jpg"
+
+    async def delete(self, image_url: str) -> None:
+        pass
+
+
+class NullImageProcessor(AbstractPostImageProcessor):
+    async def create_variants(self, post_id: UUID, image_url: str) -> dict[str, str]:
+        return {"original": image_url}
+
+
+class UnusedDirectUploads(AbstractDirectUploadStorage):
+    async def create_upload_target(self, user_id: UUID, file_name: str, size: int) -> UploadTarget:
+        raise NotImplementedError
+
+    async def claim_upload(self, user_id: UUID, upload_id: str, post_id: UUID) -> str:
+        raise NotImplementedError
+
+
+class DiscardingTaskScheduler(AbstractTaskScheduler):
+    # Background work happens after the response, so it is not part of write latency
+    def schedule(self, func: Callable[..., Awaitable[None]], *args: Any) -> None:
+        pass
+
+
+class InMemoryUnitOfWork(AbstractUnitOfWork):
+    # The in-memory repositories write immediately, so there is nothing to commit
+    async def begin(self) -> None:
+        pass
+
+    async def commit(self) -> None:
+        pass
+
+    async def rollback(self) -> None:
+        pass
+
+
+async def empty_image() -> AsyncIterator[bytes]:
+    yield b""
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def run_scenario(args: argparse.Namespace, threshold: int) -> dict[str, float]:
+    db = SimulatedDatabase(args.round_trip_ms, args.row_write_us)
+    post_repo = InMemoryPostRepository(db)
+    follow_repo = InMemoryFollowRepository(db)
+    timeline_repo = InMemoryTimelineRepository(db)
+
+    celebrity_id = uuid4()
+    reader_id = uuid4()
+    for _ in range(args.followers - 1):
+        await follow_repo.follow_if_absent(Follow(follower_id=uuid4(), followed_id=celebrity_id))
+    await follow_repo.follow_if_absent(Follow(follower_id=reader_id, followed_id=celebrity_id))
+
+    # The reader also follows a handful of regular accounts with recent posts
+    for _ in range(args.regular_followees):
+        regular_id = uuid4()
+        await follow_repo.follow_if_absent(Follow(follower_id=reader_id, followed_id=regular_id))
+        for _ in range(5):
+            post = Post(user_id=regular_id, image_url="")
+            await post_repo.add(post)
+            await timeline_repo.push(post, [regular_id, reader_id])
+
+    create_post = CreatePostUseCase(
+        post_repo,
+        NullImageStorage(),
+        follow_repo,
+        timeline_repo,
+        threshold,
+        NullImageProcessor(),
+        DiscardingTaskScheduler(),
+        UnusedDirectUploads(),
+        InMemoryUnitOfWork(),
+    )
+    db.rows_written = 0
+    write_latencies = []
+    for _ in range(args.posts):
+        started = time.perf_counter()
+        await create_post.execute(
+            CreatePostRequest(
+                user_id=celebrity_id, image_file_name="a.jpg", image_file_stream=empty_image()
+            )
+        )
+        write_latencies.append(time.perf_counter() - started)
+    rows_per_post = db.rows_written / args.posts
+
+    get_feed = GetFeedUseCase(timeline_repo, follow_repo, post_repo, threshold)
+    read_latencies = []
+    for _ in range(args.reads):
+        started = time.perf_counter()
+        await get_feed.execute(GetFeedRequest(user_id=reader_id, limit=20))
+        read_latencies.append(time.perf_counter() - started)
+
+    return {
+        "rows_per_post": rows_per_post,
+        "write_ms": statistics.mean(write_latencies) * 1000,
+        "read_p50_ms": percentile(read_latencies, 50) * 1000,
+        "read_p99_ms": percentile(read_latencies, 99) * 1000,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--followers", type=int, default=200_000)
+    parser.add_argument("--regular-followees", type=int, default=50)
+    parser.add_argument("--posts", type=int, default=5)
+    parser.add_argument("--reads", type=int, default=300)
+    parser.add_argument("--round-trip-ms", type=float, default=0.5)
+    parser.add_argument("--row-write-us", type=float, default=2.0)
+    args = parser.parse_args()
+
+    scenarios = {
+        "push (threshold above follower count)": args.followers + 1,
+        "pull (threshold below follower count)": args.followers,
+    }
+    print(f"author followers={args.followers}, reader follows {args.regular_followees} regular accounts + the author")
+    print(f"{'mode':<40}{'rows/post':>12}{'write ms':>12}{'read p50 ms':>14}{'read p99 ms':>14}")
+    for name, threshold in scenarios.items():
+        result = await run_scenario(args, threshold)
+        print(
+            f"{name:<40}{result['rows_per_post']:>12.0f}{result['write_ms']:>12.2f}"
+            f"{result['read_p50_ms']:>14.2f}{result['read_p99_ms']:>14.2f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
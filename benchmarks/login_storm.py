@@ -0,0 +1,100 @@
+"""
+Benchmark: latency of an unrelated endpoint during a login storm.
+
+Fires a burst of Argon2 verifications (what POST /users/login spends
+its time on) while polling GET / every few milliseconds, and reports the p50/p99
+latency of those unrelated requests:
+
+* before: verification called inline on the event loop (the old behaviour)
+* after:  PasslibPasswordHasher, which runs Argon2 on a bounded thread pool
+
+Usage:
+    python -m benchmarks.login_storm --logins 200
+"""
+import argparse
+import asyncio
+import time
+
+from httpx import ASGITransport, AsyncClient
+from passlib.context import CryptContext
+
+from main import app
+from src.application.common.exceptions import PasswordHasherBusyError
+from src.infrastructure.services.password import PasslibPasswordHasher
+
+PASSWORD = "StrongPassword123!"
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def poll_root(client: AsyncClient, stop: asyncio.Event, interval: float) -> list[float]:
+    """
+    Requests GET / on a fixed schedule. Latency is measured from the scheduled
+    send time, so time spent waiting for a blocked event loop is counted too.
+    """
+    latencies = []
+    started = time.perf_counter()
+    tick = 0
+    while not stop.is_set():
+        scheduled = started + tick * interval
+        tick += 1
+        await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+        await client.get("/")
+        latencies.append(time.perf_counter() - scheduled)
+    return latencies
+
+
+async def run_storm(logins: int, arrival_interval: float, verify) -> tuple[list[float], float, int]:
+    stop = asyncio.Event()
+    busy = 0
+
+    async def login(delay: float) -> None:
+        nonlocal busy
+        await asyncio.sleep(delay)
+        try:
+            await verify()
+        except PasswordHasherBusyError:
+            busy += 1
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        poller = asyncio.create_task(poll_root(client, stop, interval=0.005))
+        started = time.perf_counter()
+        await asyncio.gather(*(login(i * arrival_interval) for i in range(logins)))
+        elapsed = time.perf_counter() - started
+        stop.set()
+        latencies = await poller
+    return latencies, elapsed, busy
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--arrival-ms", type=float, default=5.0, help="gap between login arrivals")
+    args = parser.parse_args()
+
+    context = CryptContext(schemes=["argon2"], deprecated="auto")
+    hashed = context.hash(PASSWORD)
+    hasher = PasslibPasswordHasher()
+
+    async def inline_verify() -> None:
+        context.verify(PASSWORD, hashed)
+
+    async def pooled_verify() -> None:
+        await hasher.verify(PASSWORD, hashed)
+
+    print(f"{args.logins} logins arriving every {args.arrival_ms} ms")
+    print(f"{'mode':<12}{'GET / p50 ms':>14}{'GET / p99 ms':>14}{'GET / max ms':>14}{'storm s':>10}{'busy':>8}")
+    for name, verify in (("before", inline_verify), ("after", pooled_verify)):
+        latencies, elapsed, busy = await run_storm(args.logins, args.arrival_ms / 1000, verify)
+        print(
+            f"{name:<12}{percentile(latencies, 50) * 1000:>14.2f}"
+            f"{percentile(latencies, 99) * 1000:>14.2f}{max(latencies) * 1000:>14.2f}"
+            f"{elapsed:>10.2f}{busy:>8}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,118 @@
+"""
+Benchmark: serving uploaded media, naive FileResponse vs MediaFiles.
+
+The ASGI apps are driven directly and response bodies are written to
+/dev/null, so the numbers are the server-side cost of producing the bytes,
+not network throughput:
+
+* naive:     a route returning FileResponse(path) (64 KiB reads through Python)
+* media:     MediaFiles on a server without zero-copy support (256 KiB reads)
+* revalidate: MediaFiles answering If-None-Match with 304 (no body at all)
+
+Zero-copy send is not measured: with no real server behind it, a fake one
+calling os.sendfile into /dev/null would only time the kernel discarding data.
+
+Usage:
+    python -m benchmarks.media_serving --size-mb 4 --requests 500
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from starlette.applications import Starlette
+from starlette.responses import FileResponse
+from starlette.routing import Mount, Route
+
+from src.interfaces.api.media import IMMUTABLE, MediaFiles, strong_etag
+
+
+class DevNullServer:
+    """Just enough of an ASGI server to push response bodies into /dev/null."""
+
+    def __init__(self, app: Starlette) -> None:
+        self._app = app
+        self._sink = os.open(os.devnull, os.O_WRONLY)
+        self.bytes_sent = 0
+
+    async def get(self, path: str, headers: list[tuple[bytes, bytes]] | None = None) -> int:
+        scope = {
+            "type": "http",
+            "asgi": {"version": "3.0", "spec_version": "2.4"},
+            "http_version": "1.1",
+            "method": "GET",
+            "scheme": "http",
+            "path": path,
+            "raw_path": path.encode(),
+            "root_path": "",
+            "query_string": b"",
+            "headers": headers or [],
+            "server": ("test", 80),
+            "extensions": {},
+        }
+        status = 0
+
+        async def receive() -> dict:
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message: dict) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                self.bytes_sent += os.write(self._sink, message.get("body", b""))
+
+        await self._app(scope, receive, send)
+        return status
+
+
+async def run(server: DevNullServer, path: str, requests: int, headers=None) -> tuple[float, float]:
+    wall, cpu = time.perf_counter(), time.process_time()
+    for _ in range(requests):
+        await server.get(path, headers)
+    return time.perf_counter() - wall, time.process_time() - cpu
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=4, help="size of the served file")
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = Path(directory) / "image.jpg"
+        file_path.write_bytes(os.urandom(int(args.size_mb * 1024 * 1024)))
+
+        async def naive(request):
+            return FileResponse(file_path)
+
+        app = Starlette(
+            routes=[
+                Route("/naive/image.jpg", naive),
+                Mount("/media", MediaFiles(directory, cache_control=IMMUTABLE)),
+            ]
+        )
+
+        if_none_match = [(b"if-none-match", strong_etag(file_path.stat()).encode())]
+
+        cases = (
+            ("naive", DevNullServer(app), "/naive/image.jpg", None),
+            ("media", DevNullServer(app), "/media/image.jpg", None),
+            ("revalidate", DevNullServer(app), "/media/image.jpg", if_none_match),
+        )
+        print(f"{'mode':<12}{'req/s':>10}{'GB/s':>10}{'CPU s/GB':>12}")
+        for name, server, path, headers in cases:
+            await server.get(path, headers)  # warm up
+            server.bytes_sent = 0
+            wall, cpu = await run(server, path, args.requests, headers)
+            gigabytes = server.bytes_sent / 1024**3
+            cpu_per_gb = f"{cpu / gigabytes:.3f}" if gigabytes else "-"
+            print(
+                f"{name:<12}{args.requests / wall:>10.0f}{gigabytes / wall:>10.2f}{cpu_per_gb:>12}"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
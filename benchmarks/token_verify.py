@@ -0,0 +1,66 @@
+"""
+Benchmark: bearer token verification throughput, with and without the
+verified-token cache.
+
+A session sends the same token on every request, so the workload is a small
+set of live tokens verified over and over:
+
+* before: every call decodes the JWT and checks its HMAC signature
+* after:  JWTTokenService with a verified-token cache (SHA-256 digest lookup)
+
+Usage:
+    python -m benchmarks.token_verify --tokens 1000 --verifications 200000
+"""
+import argparse
+import random
+import time
+
+from src.domain.users.user import User
+from src.infrastructure.services.jwt import JWTTokenService
+from src.infrastructure.services.ttl_cache import TTLCache
+
+
+def run(service: JWTTokenService, tokens: list[str], verifications: int) -> float:
+    rng = random.Random(42)
+    sequence = [rng.choice(tokens) for _ in range(verifications)]
+    started = time.perf_counter()
+    for token in sequence:
+        service.verify_token(token)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tokens", type=int, default=1000, help="distinct live tokens (sessions)")
+    parser.add_argument("--verifications", type=int, default=200_000)
+    args = parser.parse_args()
+
+    issuer = JWTTokenService()
+    tokens = [
+        issuer.generate_token(
+            User(username=f"user{i}", email=f"user{i}@example.com", hashed_password="x")
+        )
+        for i in range(args.tokens)
+    ]
+
+    cache = TTLCache(max_size=args.tokens * 2, ttl_seconds=3600)
+    services = (
+        ("before", JWTTokenService()),
+        ("after", JWTTokenService(verified_cache=cache)),
+    )
+
+    print(f"{args.verifications} verifications over {args.tokens} tokens")
+    print(f"{'mode':<12}{'verify/s':>14}{'us/verify':>12}{'hit rate':>10}")
+    for name, service in services:
+        elapsed = run(service, tokens, args.verifications)
+        stats = cache.stats()
+        lookups = stats.hits + stats.misses
+        hit_rate = f"{stats.hits / lookups:.1%}" if name == "after" and lookups else "-"
+        print(
+            f"{name:<12}{args.verifications / elapsed:>14,.0f}"
+            f"{elapsed / args.verifications * 1e6:>12.2f}{hit_rate:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
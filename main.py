@@ -1,8 +1,25 @@
 from fastapi import FastAPI, Request, status
 from fastapi.responses import JSONResponse
+from src.interfaces.api.media import IMMUTABLE, MediaFiles
 from src.interfaces.api.router import api_router
+from src.interfaces.api.lifespan import InFlightRequestsMiddleware, in_flight_requests, lifespan
+from src.interfaces.api.metrics import metrics_router
+from src.infrastructure.services.blob_store import BLOBS_PATH, BLOBS_URL
+from src.infrastructure.services.post_storage import POST_IMAGES_PATH, POST_IMAGES_URL
+from src.infrastructure.services.storage import MEDIA_ROOT
+from src.application.common.exceptions import (
+    IdempotencyKeyInUseError,
+    IdempotencyKeyMismatchError,
+    ImageProcessorBusyError,
+    InvalidCursorError,
+    InvalidUploadChunkError,
+    PasswordHasherBusyError,
+    UploadNotFoundError,
+    UploadOffsetMismatchError,
+    UploadTooLargeError,
+)
 from src.domain.users.exceptions import InvalidCredentialsError, UserNotFoundError
-from src.domain.posts.exceptions import PostNotFound
+from src.domain.posts.exceptions import PostBelongsToAnotherUser, PostNotFound
 from src.domain.follows.exceptions import (
     AlreadyFollowingError,
     NotFollowingError,
@@ -13,7 +30,9 @@ app = FastAPI(
     title="Insta-Backend",
     description="An Instagram-like backend service built with Clean Architecture.",
     version="0.1.0",
+    lifespan=lifespan,
 )
+app.add_middleware(InFlightRequestsMiddleware, in_flight=in_flight_requests)
 
 @app.exception_handler(InvalidCredentialsError)
 async def invalid_credentials_exception_handler(request: Request, exc: InvalidCredentialsError):
@@ -36,6 +55,13 @@ async def post_not_found_exception_handler(request: Request, exc: PostNotFound):
         content={"detail": "Post not found"},
     )
 
+@app.exception_handler(PostBelongsToAnotherUser)
+async def post_belongs_to_another_user_exception_handler(request: Request, exc: PostBelongsToAnotherUser):
+    return JSONResponse(
+        status_code=status.HTTP_403_FORBIDDEN,
+        content={"detail": "Post belongs to another user"},
+    )
+
 @app.exception_handler(AlreadyFollowingError)
 async def already_following_exception_handler(request: Request, exc: AlreadyFollowingError):
     return JSONResponse(
@@ -57,7 +83,85 @@ async def self_follow_exception_handler(request: Request, exc: SelfFollowError):
         content={"detail": "You cannot follow yourself"},
     )
 
+@app.exception_handler(InvalidCursorError)
+async def invalid_cursor_exception_handler(request: Request, exc: InvalidCursorError):
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={"detail": "Invalid pagination cursor"},
+    )
+
+@app.exception_handler(PasswordHasherBusyError)
+async def password_hasher_busy_exception_handler(request: Request, exc: PasswordHasherBusyError):
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Server is busy, please retry shortly"},
+        headers={"Retry-After": "1"},
+    )
+
+@app.exception_handler(ImageProcessorBusyError)
+async def image_processor_busy_exception_handler(request: Request, exc: ImageProcessorBusyError):
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Server is busy, please retry shortly"},
+        headers={"Retry-After": "1"},
+    )
+
+@app.exception_handler(UploadTooLargeError)
+async def upload_too_large_exception_handler(request: Request, exc: UploadTooLargeError):
+    return JSONResponse(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        content={"detail": f"File is too large (limit is {exc.max_bytes} bytes)"},
+    )
+
+@app.exception_handler(UploadNotFoundError)
+async def upload_not_found_exception_handler(request: Request, exc: UploadNotFoundError):
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={"detail": "Upload not found or already used"},
+    )
+
+@app.exception_handler(IdempotencyKeyInUseError)
+async def idempotency_key_in_use_exception_handler(request: Request, exc: IdempotencyKeyInUseError):
+    return JSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content={"detail": str(exc)},
+        headers={"Retry-After": "1"},
+    )
+
+@app.exception_handler(IdempotencyKeyMismatchError)
+async def idempotency_key_mismatch_exception_handler(request: Request, exc: IdempotencyKeyMismatchError):
+    return JSONResponse(
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+        content={"detail": str(exc)},
+    )
+
+@app.exception_handler(UploadOffsetMismatchError)
+async def upload_offset_mismatch_exception_handler(request: Request, exc: UploadOffsetMismatchError):
+    return JSONResponse(
+        status_code=status.HTTP_409_CONFLICT,
+        content={"detail": str(exc), "offset": exc.offset},
+        headers={"Upload-Offset": str(exc.offset)},
+    )
+
+@app.exception_handler(InvalidUploadChunkError)
+async def invalid_upload_chunk_exception_handler(request: Request, exc: InvalidUploadChunkError):
+    return JSONResponse(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        content={"detail": str(exc)},
+    )
+
 app.include_router(api_router, prefix="/api/v1")
+app.include_router(metrics_router)
+
+# Uploaded media; blobs are content-addressed, post images are never replaced,
+# avatars can be overwritten in place so clients revalidate them
+app.mount(BLOBS_URL, MediaFiles(BLOBS_PATH, cache_control=IMMUTABLE), name="blobs")
+app.mount(
+    POST_IMAGES_URL,
+    MediaFiles(POST_IMAGES_PATH, cache_control="public, max-age=86400"),
+    name="post_images",
+)
+app.mount("/media/avatars", MediaFiles(f"{MEDIA_ROOT}/avatars"), name="avatars")
 
 @app.get("/")
 async def root() -> dict[str, str]:
@@ -0,0 +1,54 @@
+class ApplicationError(Exception):
+    """Base exception for application-level errors."""
+    pass
+
+
+class InvalidCursorError(ApplicationError):
+    """Raised when a pagination cursor cannot be decoded."""
+    pass
+
+
+class PasswordHasherBusyError(ApplicationError):
+    """Raised when too many password hashes are already queued; the caller should retry later."""
+    pass
+
+
+class ImageProcessorBusyError(ApplicationError):
+    """Raised when too many images are already queued for processing."""
+    pass
+
+
+class UploadTooLargeError(ApplicationError):
+    """Raised when an uploaded file exceeds the storage's size limit."""
+
+    def __init__(self, max_bytes: int) -> None:
+        super().__init__(f"Upload exceeds {max_bytes} bytes")
+        self.max_bytes = max_bytes
+
+
+class UploadNotFoundError(ApplicationError):
+    """Raised when a referenced direct upload does not exist or was not made by the user."""
+    pass
+
+
+class UploadOffsetMismatchError(ApplicationError):
+    """Raised when a chunk does not start where the upload currently ends."""
+
+    def __init__(self, offset: int) -> None:
+        super().__init__(f"Upload continues at offset {offset}")
+        self.offset = offset
+
+
+class InvalidUploadChunkError(ApplicationError):
+    """Raised when a chunk has a size the storage cannot accept at its position."""
+    pass
+
+
+class IdempotencyKeyInUseError(ApplicationError):
+    """Raised when a request with the same idempotency key is still being processed."""
+    pass
+
+
+class IdempotencyKeyMismatchError(ApplicationError):
+    """Raised when an idempotency key is reused for a different request."""
+    pass
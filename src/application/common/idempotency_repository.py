@@ -0,0 +1,53 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class IdempotencyRecord:
+    """The first request made with an idempotency key and, once it succeeded, its response."""
+    # Identifies the request, so a key reused for another request can be told apart
+    request_hash: str
+    # None while the first request is still running
+    status_code: int | None = None
+    # JSON-compatible response body; None for responses without one
+    body: Any = None
+
+    @property
+    def is_complete(self) -> bool:
+        return self.status_code is not None
+
+
+class AbstractIdempotencyRepository(ABC):
+    """
+    Abstract interface for the responses of requests sent with an idempotency
+    key, so a client retrying after a timeout gets the original response
+    instead of doing the work twice. Keys are scoped to a user and expire.
+    """
+
+    @abstractmethod
+    async def reserve(self, user_id: UUID, key: str, request_hash: str) -> IdempotencyRecord | None:
+        """
+        Claims `key` for a new request and returns None, in which case the
+        caller runs the request and then calls `complete` or `release`.
+        Returns the existing record instead if the key is already in use; a
+        record left pending by a request that never finished can be claimed
+        again after a while.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def complete(self, user_id: UUID, key: str, record: IdempotencyRecord) -> None:
+        """Stores the response of the request that reserved `key`."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def release(self, user_id: UUID, key: str) -> None:
+        """Frees a reserved key whose request failed, so it can be retried."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_expired(self, limit: int) -> int:
+        """Deletes up to `limit` expired keys and returns how many."""
+        raise NotImplementedError
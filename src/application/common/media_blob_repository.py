@@ -0,0 +1,35 @@
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+
+
+class AbstractMediaBlobRepository(ABC):
+    """
+    Abstract interface for the reference counts of content-addressed media blobs.
+    A blob is identified by the SHA-256 digest of the uploaded bytes; each post
+    or avatar using it holds one reference.
+    """
+
+    @abstractmethod
+    async def acquire(self, digest: str) -> str | None:
+        """Adds a reference to an existing blob and returns its file name, or None if unknown."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def register(self, digest: str, file_name: str, size: int) -> str:
+        """
+        Records a newly stored blob with one reference and returns its file name.
+        If the same digest was registered concurrently, adds a reference to that
+        one instead and returns its file name, so the caller's file is unused.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def release(
+        self, digest: str, delete_file: Callable[[str], Awaitable[None]]
+    ) -> bool:
+        """
+        Drops a reference. If it was the last one, removes the record and calls
+        `delete_file` with the blob's file name once the removal is committed.
+        Returns whether the blob was deleted.
+        """
+        raise NotImplementedError
@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class MediaDeletion:
+    id: int
+    url: str
+
+
+class AbstractMediaDeletionQueue(ABC):
+    """
+    Abstract interface for media files waiting to be deleted. Entries are
+    added in the same transaction that deletes whatever referenced the files
+    (see AbstractPostRepository.delete), so a crash never forgets a file.
+    """
+
+    @abstractmethod
+    async def claim(self, limit: int) -> list[MediaDeletion]:
+        """
+        Hands out up to `limit` of the oldest entries. Concurrent callers get
+        different entries; entries not completed within a lease period are
+        handed out again.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def complete(self, ids: list[int]) -> list[int]:
+        """
+        Removes entries whose files are being deleted and returns the ids that
+        were still queued. Inside a unit of work, the removal is undone if the
+        unit rolls back.
+        """
+        raise NotImplementedError
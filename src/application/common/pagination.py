@@ -0,0 +1,63 @@
+import base64
+import binascii
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Generic, TypeVar
+from uuid import UUID
+
+from src.application.common.exceptions import InvalidCursorError
+from src.domain.posts.entity import Post
+
+T = TypeVar("T")
+
+DEFAULT_PAGE_SIZE = 20
+MAX_PAGE_SIZE = 100
+
+
+@dataclass(frozen=True)
+class Cursor:
+    """
+    Keyset position in a list ordered by (created_at DESC, id DESC).
+    The next page starts strictly after this position.
+    """
+    created_at: datetime
+    id: UUID
+
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    items: list[T]
+    next_cursor: Cursor | None = None
+
+
+def encode_cursor(cursor: Cursor) -> str:
+    """Encodes a cursor as an opaque, URL-safe token."""
+    raw = f"{cursor.created_at.isoformat()}|{cursor.id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> Cursor:
+    """Decodes a token produced by encode_cursor."""
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        created_at, cursor_id = base64.urlsafe_b64decode(padded).decode().split("|")
+        return Cursor(created_at=datetime.fromisoformat(created_at), id=UUID(cursor_id))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise InvalidCursorError()
+
+
+def build_page(items: list[T], limit: int, cursor_of: Callable[[T], Cursor]) -> Page[T]:
+    """
+    Builds a page from up to limit + 1 items fetched in cursor order.
+    The extra item only signals that another page exists and is not returned.
+    """
+    if len(items) <= limit:
+        return Page(items=items)
+    items = items[:limit]
+    return Page(items=items, next_cursor=cursor_of(items[-1]))
+
+
+def post_cursor(post: Post) -> Cursor:
+    """Cursor for lists of posts ordered by (created_at, id)."""
+    return Cursor(created_at=post.created_at, id=post.id)
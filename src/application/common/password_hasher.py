@@ -4,12 +4,19 @@ from abc import ABC, abstractmethod
 class AbstractPasswordHasher(ABC):
     """
     Abstract interface for a password hashing service.
+    Hashing is deliberately CPU-expensive, so implementations must not block the
+    event loop while computing a hash.
     """
 
     @abstractmethod
-    def hash(self, password: str) -> str:
+    async def hash(self, password: str) -> str:
         raise NotImplementedError
 
     @abstractmethod
-    def verify(self, password: str, hashed_password: str) -> bool:
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def needs_rehash(self, hashed_password: str) -> bool:
+        """Returns True if the hash was made with different parameters than the current ones."""
         raise NotImplementedError
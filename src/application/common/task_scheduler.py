@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+
+class AbstractTaskScheduler(ABC):
+    """
+    Abstract interface for running work after the response has been sent.
+    Scheduled tasks must not raise: nobody is left to handle the error.
+    """
+
+    @abstractmethod
+    def schedule(self, func: Callable[..., Awaitable[None]], *args: Any) -> None:
+        raise NotImplementedError
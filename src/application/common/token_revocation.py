@@ -0,0 +1,19 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+
+class AbstractTokenRevocationList(ABC):
+    """
+    Abstract interface for checking whether an access token was revoked
+    without loading its user. Revoking a user's tokens bumps their token
+    version; tokens carrying an older version are rejected.
+    """
+
+    @abstractmethod
+    async def is_revoked(self, user_id: UUID, token_version: int) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def revoke(self, user_id: UUID, token_version: int) -> None:
+        """Records that tokens older than `token_version` are no longer valid."""
+        raise NotImplementedError
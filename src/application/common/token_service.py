@@ -1,6 +1,26 @@
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from uuid import UUID
 
+from src.domain.users.user import User
+
+
+@dataclass(frozen=True)
+class TokenClaims:
+    """
+    What a verified access token says about its holder.
+    The user fields are only present for tokens issued with embedded claims.
+    """
+    user_id: UUID
+    token_version: int = 0
+    username: str | None = None
+    email: str | None = None
+    is_public: bool | None = None
+
+    @property
+    def has_user_claims(self) -> bool:
+        return self.username is not None and self.email is not None and self.is_public is not None
+
 
 class AbstractTokenService(ABC):
     """
@@ -8,9 +28,9 @@ class AbstractTokenService(ABC):
     """
 
     @abstractmethod
-    def generate_token(self, user_id: UUID) -> str:
+    def generate_token(self, user: User) -> str:
         raise NotImplementedError
 
     @abstractmethod
-    def verify_and_extract_user_id(self, token: str) -> UUID:
+    def verify_token(self, token: str) -> TokenClaims:
         raise NotImplementedError
@@ -0,0 +1,47 @@
+from abc import ABC, abstractmethod
+from types import TracebackType
+from typing import TypeVar
+
+# typing.Self needs Python 3.11
+_UnitOfWork = TypeVar("_UnitOfWork", bound="AbstractUnitOfWork")
+
+
+class AbstractUnitOfWork(ABC):
+    """
+    Abstract interface for a transaction spanning several repository calls.
+
+    Used as `async with unit_of_work:`. While it is open, the repositories
+    sharing it leave their writes uncommitted; leaving the block commits them
+    all at once, or rolls them all back if it raises. Opening it again inside
+    the block starts a savepoint, so a nested block that raises undoes only
+    its own writes.
+    """
+
+    async def __aenter__(self: _UnitOfWork) -> _UnitOfWork:
+        await self.begin()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        if exc_type is None:
+            await self.commit()
+        else:
+            await self.rollback()
+
+    @abstractmethod
+    async def begin(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def commit(self) -> None:
+        """Commits the innermost open unit, or releases its savepoint if nested."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def rollback(self) -> None:
+        """Rolls back the innermost open unit, or only its savepoint if nested."""
+        raise NotImplementedError
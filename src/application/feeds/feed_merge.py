@@ -0,0 +1,30 @@
+import heapq
+from collections.abc import Iterable
+
+from src.domain.posts.entity import Post
+
+
+def _newest_first_key(post: Post) -> tuple:
+    return (post.created_at, post.id)
+
+
+def merge_post_streams(streams: Iterable[list[Post]], limit: int) -> list[Post]:
+    """
+    K-way merges post streams that are each ordered newest-first.
+
+    Uses a heap over the heads of the streams, so only `limit` posts plus one head
+    per stream are ever compared. Posts present in several streams (e.g. pushed
+    into a timeline before the author crossed the celebrity threshold and also
+    pulled at read time) are returned once.
+    """
+    merged = heapq.merge(*streams, key=_newest_first_key, reverse=True)
+    seen = set()
+    result: list[Post] = []
+    for post in merged:
+        if post.id in seen:
+            continue
+        seen.add(post.id)
+        result.append(post)
+        if len(result) == limit:
+            break
+    return result
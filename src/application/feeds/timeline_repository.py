@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from src.application.common.pagination import Cursor, Page
+from src.domain.posts.entity import Post
+
+
+class AbstractTimelineRepository(ABC):
+    """
+    Abstract interface for the precomputed per-user home timelines.
+    """
+
+    @abstractmethod
+    async def push(self, post: Post, owner_ids: list[UUID]) -> None:
+        """Adds a post to the timelines of the given owners."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def backfill(self, owner_id: UUID, author_id: UUID, limit: int) -> None:
+        """Copies the author's most recent posts into the owner's timeline."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def prune(self, owner_id: UUID, author_id: UUID) -> None:
+        """Removes every post by the author from the owner's timeline."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_timeline(
+        self, owner_id: UUID, limit: int, cursor: Cursor | None = None
+    ) -> Page[Post]:
+        """Returns the owner's timeline newest-first, starting after the cursor."""
+        raise NotImplementedError
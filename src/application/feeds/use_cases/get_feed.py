@@ -0,0 +1,59 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.application.common.pagination import DEFAULT_PAGE_SIZE, Cursor, Page, post_cursor
+from src.application.feeds.feed_merge import merge_post_streams
+from src.application.feeds.timeline_repository import AbstractTimelineRepository
+from src.application.follows.follow_repository import AbstractFollowRepository
+from src.application.posts.post_repository import AbstractPostRepository
+from src.domain.posts.entity import Post
+
+
+@dataclass(frozen=True)
+class GetFeedRequest:
+    user_id: UUID
+    limit: int = DEFAULT_PAGE_SIZE
+    cursor: Cursor | None = None
+
+
+class GetFeedUseCase:
+    """
+    Use case for assembling a page of a user's home feed.
+    Posts from regular accounts are read from the user's precomputed timeline
+    (push); posts from followed accounts at or above the celebrity threshold are
+    pulled at read time and merged in.
+    """
+
+    def __init__(
+        self,
+        timeline_repo: AbstractTimelineRepository,
+        follow_repo: AbstractFollowRepository,
+        post_repo: AbstractPostRepository,
+        celebrity_threshold: int,
+    ) -> None:
+        self._timeline_repo = timeline_repo
+        self._follow_repo = follow_repo
+        self._post_repo = post_repo
+        self._celebrity_threshold = celebrity_threshold
+
+    async def execute(self, request: GetFeedRequest) -> Page[Post]:
+        pages = [
+            await self._timeline_repo.get_timeline(
+                request.user_id, request.limit, request.cursor
+            )
+        ]
+
+        celebrity_ids = await self._follow_repo.get_following_ids_with_min_followers(
+            request.user_id, self._celebrity_threshold
+        )
+        for celebrity_id in celebrity_ids:
+            pages.append(
+                await self._post_repo.list_by_user(celebrity_id, request.limit, request.cursor)
+            )
+
+        posts = merge_post_streams([page.items for page in pages], request.limit + 1)
+        has_more = len(posts) > request.limit or any(page.next_cursor for page in pages)
+        posts = posts[:request.limit]
+
+        next_cursor = post_cursor(posts[-1]) if has_more and posts else None
+        return Page(items=posts, next_cursor=next_cursor)
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from uuid import UUID
 
+from src.application.common.pagination import Cursor, Page
 from src.domain.follows.entity import Follow
 from src.domain.users.user import User
 
@@ -11,23 +12,44 @@ class AbstractFollowRepository(ABC):
     """
 
     @abstractmethod
-    async def add(self, follow: Follow) -> None:
-        """Adds a new follow relationship."""
+    async def follow_if_absent(self, follow: Follow) -> int | None:
+        """
+        Adds the follow relationship unless it exists, in one atomic step.
+        Returns the followed user's follower count including it, or None if
+        the follower already followed them. Raises UserNotFoundError if either
+        user does not exist.
+        """
         raise NotImplementedError
 
     @abstractmethod
-    async def remove(self, follower_id: UUID, followed_id: UUID) -> None:
-        """Removes a follow relationship."""
+    async def unfollow_if_present(self, follower_id: UUID, followed_id: UUID) -> bool:
+        """Removes the follow relationship in one atomic step; False if there was none."""
         raise NotImplementedError
 
     @abstractmethod
-    async def get_followers(self, user_id: UUID) -> list[User]:
-        """Returns a list of Users who follow the given user_id."""
+    async def get_followers(
+        self, user_id: UUID, limit: int, cursor: Cursor | None = None
+    ) -> Page[User]:
+        """Returns Users who follow the given user_id, most recent follow first."""
         raise NotImplementedError
 
     @abstractmethod
-    async def get_following(self, user_id: UUID) -> list[User]:
-        """Returns a list of Users that the given user_id follows."""
+    async def get_following(
+        self, user_id: UUID, limit: int, cursor: Cursor | None = None
+    ) -> Page[User]:
+        """Returns Users that the given user_id follows, most recent follow first."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def count_followers(self, user_id: UUID) -> int:
+        """Returns how many users follow the given user_id."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_following_ids_with_min_followers(
+        self, user_id: UUID, min_followers: int
+    ) -> list[UUID]:
+        """Returns IDs of accounts the user follows that have at least min_followers followers."""
         raise NotImplementedError
 
     @abstractmethod
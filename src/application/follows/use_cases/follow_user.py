@@ -1,14 +1,17 @@
 from dataclasses import dataclass
 from uuid import UUID
 
+from src.application.common.unit_of_work import AbstractUnitOfWork
+from src.application.feeds.timeline_repository import AbstractTimelineRepository
 from src.application.follows.follow_repository import AbstractFollowRepository
-from src.application.users.user_repository import AbstractUserRepository
 from src.domain.follows.entity import Follow
 from src.domain.follows.exceptions import (
     AlreadyFollowingError,
     SelfFollowError,
 )
-from src.domain.users.exceptions import UserNotFoundError
+
+# How many of the followed user's recent posts are copied into the follower's timeline
+TIMELINE_BACKFILL_LIMIT = 50
 
 
 @dataclass(frozen=True)
@@ -19,31 +22,43 @@ class FollowUserRequest:
 
 class FollowUserUseCase:
     """
-    Use case for one user following another.
+    Use case for one user following another. The follow and the timeline
+    backfill commit together.
     """
 
     def __init__(
         self,
         follow_repo: AbstractFollowRepository,
-        user_repo: AbstractUserRepository,
+        timeline_repo: AbstractTimelineRepository,
+        celebrity_threshold: int,
+        unit_of_work: AbstractUnitOfWork,
     ) -> None:
         self._follow_repo = follow_repo
-        self._user_repo = user_repo
+        self._timeline_repo = timeline_repo
+        self._celebrity_threshold = celebrity_threshold
+        self._unit_of_work = unit_of_work
 
     async def execute(self, request: FollowUserRequest) -> None:
         if request.follower_id == request.followed_id:
             raise SelfFollowError()
 
-        target_user = await self._user_repo.get_by_id(request.followed_id)
-        if not target_user:
-            raise UserNotFoundError()
-
-        if await self._follow_repo.is_following(request.follower_id, request.followed_id):
-            raise AlreadyFollowingError()
-
         new_follow = Follow(
             follower_id=request.follower_id,
             followed_id=request.followed_id,
         )
 
-        await self._follow_repo.add(new_follow)
+        async with self._unit_of_work:
+            # Raises UserNotFoundError if the target does not exist
+            follower_count = await self._follow_repo.follow_if_absent(new_follow)
+            if follower_count is None:
+                raise AlreadyFollowingError()
+
+            # Celebrity posts are pulled at read time, so there is nothing to backfill
+            if follower_count >= self._celebrity_threshold:
+                return
+
+            await self._timeline_repo.backfill(
+                owner_id=request.follower_id,
+                author_id=request.followed_id,
+                limit=TIMELINE_BACKFILL_LIMIT,
+            )
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from uuid import UUID
 
+from src.application.common.pagination import DEFAULT_PAGE_SIZE, Cursor, Page
 from src.application.follows.follow_repository import AbstractFollowRepository
 from src.application.users.user_repository import AbstractUserRepository
 from src.domain.users.exceptions import UserNotFoundError
@@ -10,11 +11,13 @@ from src.domain.users.user import User
 @dataclass(frozen=True)
 class GetFollowersRequest:
     user_id: UUID
+    limit: int = DEFAULT_PAGE_SIZE
+    cursor: Cursor | None = None
 
 
 class GetFollowersUseCase:
     """
-    Use case to get a list of users who follow a specific user.
+    Use case to get a page of users who follow a specific user.
     """
 
     def __init__(
@@ -25,9 +28,11 @@ class GetFollowersUseCase:
         self._follow_repo = follow_repo
         self._user_repo = user_repo
 
-    async def execute(self, request: GetFollowersRequest) -> list[User]:
+    async def execute(self, request: GetFollowersRequest) -> Page[User]:
         target_user = await self._user_repo.get_by_id(request.user_id)
         if not target_user:
             raise UserNotFoundError()
 
-        return await self._follow_repo.get_followers(request.user_id)
+        return await self._follow_repo.get_followers(
+            request.user_id, request.limit, request.cursor
+        )
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from uuid import UUID
 
+from src.application.common.pagination import DEFAULT_PAGE_SIZE, Cursor, Page
 from src.application.follows.follow_repository import AbstractFollowRepository
 from src.application.users.user_repository import AbstractUserRepository
 from src.domain.users.exceptions import UserNotFoundError
@@ -10,11 +11,13 @@ from src.domain.users.user import User
 @dataclass(frozen=True)
 class GetFollowingRequest:
     user_id: UUID
+    limit: int = DEFAULT_PAGE_SIZE
+    cursor: Cursor | None = None
 
 
 class GetFollowingUseCase:
     """
-    Use case to get a list of users that a specific user follows.
+    Use case to get a page of users that a specific user follows.
     """
 
     def __init__(
@@ -25,9 +28,11 @@ class GetFollowingUseCase:
         self._follow_repo = follow_repo
         self._user_repo = user_repo
 
-    async def execute(self, request: GetFollowingRequest) -> list[User]:
+    async def execute(self, request: GetFollowingRequest) -> Page[User]:
         target_user = await self._user_repo.get_by_id(request.user_id)
         if not target_user:
             raise UserNotFoundError()
 
-        return await self._follow_repo.get_following(request.user_id)
+        return await self._follow_repo.get_following(
+            request.user_id, request.limit, request.cursor
+        )
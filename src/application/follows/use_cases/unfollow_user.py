@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 from uuid import UUID
 
+from src.application.common.unit_of_work import AbstractUnitOfWork
+from src.application.feeds.timeline_repository import AbstractTimelineRepository
 from src.application.follows.follow_repository import AbstractFollowRepository
 from src.application.users.user_repository import AbstractUserRepository
 from src.domain.follows.exceptions import NotFollowingError
@@ -15,26 +17,36 @@ class UnfollowUserRequest:
 
 class UnfollowUserUseCase:
     """
-    Use case for one user unfollowing another.
+    Use case for one user unfollowing another. Removing the follow and
+    pruning the timeline commit together.
     """
 
     def __init__(
         self,
         follow_repo: AbstractFollowRepository,
         user_repo: AbstractUserRepository,
+        timeline_repo: AbstractTimelineRepository,
+        unit_of_work: AbstractUnitOfWork,
     ) -> None:
         self._follow_repo = follow_repo
         self._user_repo = user_repo
+        self._timeline_repo = timeline_repo
+        self._unit_of_work = unit_of_work
 
     async def execute(self, request: UnfollowUserRequest) -> None:
-        target_user = await self._user_repo.get_by_id(request.followed_id)
-        if not target_user:
+        async with self._unit_of_work:
+            removed = await self._follow_repo.unfollow_if_present(
+                follower_id=request.follower_id,
+                followed_id=request.followed_id,
+            )
+            if removed:
+                await self._timeline_repo.prune(
+                    owner_id=request.follower_id,
+                    author_id=request.followed_id,
+                )
+                return
+
+        # Only a failed unfollow looks the target up, to report why it failed
+        if not await self._user_repo.get_by_id(request.followed_id):
             raise UserNotFoundError()
-
-        if not await self._follow_repo.is_following(request.follower_id, request.followed_id):
-            raise NotFollowingError()
-
-        await self._follow_repo.remove(
-            follower_id=request.follower_id,
-            followed_id=request.followed_id,
-        )
+        raise NotFollowingError()
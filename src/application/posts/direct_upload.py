@@ -0,0 +1,45 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class UploadTarget:
+    """Where and how a client uploads an image itself, without going through the API."""
+    # Opaque reference the client passes back when it creates the post
+    upload_id: str
+    url: str
+    method: str
+    expires_at: datetime
+    # Headers the client must send with the upload exactly as given
+    headers: dict[str, str] = field(default_factory=dict)
+
+
+class AbstractDirectUploadStorage(ABC):
+    """
+    Abstract interface for images uploaded by clients straight to storage.
+    """
+
+    @abstractmethod
+    async def create_upload_target(self, user_id: UUID, file_name: str, size: int) -> UploadTarget:
+        """
+        Returns a signed, expiring target for one upload of exactly `size` bytes.
+
+        Raises:
+            UploadTooLargeError: If `size` exceeds the storage's size limit.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def claim_upload(self, user_id: UUID, upload_id: str, post_id: UUID) -> str:
+        """
+        Moves a completed upload of `user_id` into post storage and returns
+        the image URL. Claiming consumes the upload.
+
+        Raises:
+            UploadNotFoundError: If the upload does not exist, has not finished,
+                belongs to another user, or was already claimed.
+            UploadTooLargeError: If the stored object exceeds the size limit.
+        """
+        raise NotImplementedError
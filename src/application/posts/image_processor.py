@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+
+class AbstractPostImageProcessor(ABC):
+    """
+    Abstract interface for producing resized variants of a stored post image.
+    """
+
+    @abstractmethod
+    async def create_variants(self, post_id: UUID, image_url: str) -> dict[str, str]:
+        """
+        Renders the variants of the image stored at `image_url`.
+
+        Returns:
+            A map of variant name to URL, including "original".
+        """
+        raise NotImplementedError
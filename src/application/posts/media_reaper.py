@@ -0,0 +1,69 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Sequence
+
+from src.application.common.media_deletion_queue import AbstractMediaDeletionQueue
+from src.application.common.unit_of_work import AbstractUnitOfWork
+from src.application.posts.post_storage import AbstractPostImageStorage
+
+logger = logging.getLogger(__name__)
+
+
+class MediaReaper:
+    """
+    Deletes the files queued for deletion, a batch at a time and at most
+    `max_per_second` files per second, so a burst of deleted posts does not
+    compete with uploads and media serving for disk or object store capacity.
+
+    Every URL is handed to each storage, which ignores URLs it did not
+    produce. Entries whose deletion fails stay queued and are retried once
+    their lease runs out.
+
+    Entries can be handed out more than once, but releasing a shared blob must
+    happen only once per entry. Each entry is therefore removed from the queue
+    in the same unit of work as its deletion: a rerun finds it gone and skips
+    it, and a failed deletion rolls the removal back with it.
+    """
+
+    def __init__(
+        self,
+        queue: AbstractMediaDeletionQueue,
+        unit_of_work: AbstractUnitOfWork,
+        storages: Sequence[AbstractPostImageStorage],
+        batch_size: int,
+        max_per_second: float,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self._queue = queue
+        self._unit_of_work = unit_of_work
+        self._storages = storages
+        self._batch_size = batch_size
+        self._interval = 1 / max_per_second if max_per_second > 0 else 0.0
+        self._sleep = sleep
+
+    async def run_once(self) -> int:
+        """Deletes one batch and returns how many files were handled."""
+        batch = await self._queue.claim(self._batch_size)
+        deleted = 0
+        for index, deletion in enumerate(batch):
+            if index and self._interval:
+                await self._sleep(self._interval)
+            try:
+                async with self._unit_of_work:
+                    if not await self._queue.complete([deletion.id]):
+                        # Completed by an earlier run whose lease had expired
+                        continue
+                    for storage in self._storages:
+                        await storage.delete(deletion.url)
+            except Exception:
+                logger.exception("Deleting media file %s failed; will retry", deletion.url)
+                continue
+            deleted += 1
+        return deleted
+
+    async def drain(self) -> int:
+        """Deletes batches until the queue has nothing left to hand out."""
+        total = 0
+        while deleted := await self.run_once():
+            total += deleted
+        return total
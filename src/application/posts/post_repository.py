@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from uuid import UUID
 
+from src.application.common.pagination import Cursor, Page
 from src.domain.posts.entity import Post
 
 
@@ -18,13 +19,21 @@ class AbstractPostRepository(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    async def list_by_user(self, user_id: UUID) -> list[Post]:
+    async def list_by_user(
+        self, user_id: UUID, limit: int, cursor: Cursor | None = None
+    ) -> Page[Post]:
+        """Returns the user's posts newest-first, starting after the cursor."""
         raise NotImplementedError
 
     @abstractmethod
     async def delete(self, post: Post) -> None:
+        """
+        Deletes the post and, in the same transaction, queues its image and
+        variants for the media reaper.
+        """
         raise NotImplementedError
 
     @abstractmethod
     async def save(self, post: Post) -> None:
+        """Stores changes to an existing post; a post deleted in the meantime stays deleted."""
         raise NotImplementedError
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterable
 from uuid import UUID
 
 
@@ -8,16 +9,27 @@ class AbstractPostImageStorage(ABC):
     """
 
     @abstractmethod
-    async def save(self, post_id: UUID, file_name: str, file_data: bytes) -> str:
+    async def save(self, post_id: UUID, file_name: str, file_stream: AsyncIterable[bytes]) -> str:
         """
         Saves a post image and returns the URL/path.
 
         Args:
             post_id: The ID of the post the image belongs to.
             file_name: The original name of the file.
-            file_data: The binary content of the file.
+            file_stream: The binary content of the file, in chunks.
 
         Returns:
             The public URL or path to the saved image.
+
+        Raises:
+            UploadTooLargeError: If the content exceeds the storage's size limit.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(self, image_url: str) -> None:
+        """
+        Releases an image returned by `save`. URLs this storage did not
+        produce are ignored.
         """
         raise NotImplementedError
@@ -0,0 +1,71 @@
+from abc import ABC, abstractmethod
+from collections.abc import AsyncIterable
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class UploadSession:
+    """An upload sent in chunks; `offset` is how many bytes have been stored so far."""
+    # Passed to POST /posts/from-upload once the upload is complete
+    upload_id: str
+    size: int
+    offset: int
+    # Chunks should be this long; storages may reject other sizes except for the last chunk
+    chunk_size: int
+    expires_at: datetime
+
+    @property
+    def is_complete(self) -> bool:
+        return self.offset == self.size
+
+
+class AbstractResumableUploadStorage(ABC):
+    """
+    Abstract interface for uploads that survive dropped connections: the
+    client sends the image in chunks and, after a failure, asks for the
+    offset and continues from there instead of starting over.
+    """
+
+    @abstractmethod
+    async def create_session(self, user_id: UUID, file_name: str, size: int) -> UploadSession:
+        """
+        Starts an upload of exactly `size` bytes.
+
+        Raises:
+            UploadTooLargeError: If `size` exceeds the storage's size limit.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_session(self, user_id: UUID, upload_id: str) -> UploadSession:
+        """
+        Returns the session with its current offset.
+
+        Raises:
+            UploadNotFoundError: If there is no such unexpired session of `user_id`.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def append_chunk(
+        self, user_id: UUID, upload_id: str, offset: int, chunk: AsyncIterable[bytes]
+    ) -> UploadSession:
+        """
+        Stores `chunk` at `offset` and returns the session with its new offset.
+        Once the offset reaches the size, the upload can be claimed like a
+        direct upload.
+
+        Raises:
+            UploadNotFoundError: If there is no such unexpired session of `user_id`.
+            UploadOffsetMismatchError: If `offset` is not the current offset.
+            InvalidUploadChunkError: If the storage cannot take a chunk of this size here.
+            UploadTooLargeError: If the chunk goes past the announced size.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_expired_sessions(self) -> int:
+        """Removes abandoned sessions and their partial data; returns how many."""
+        raise NotImplementedError
@@ -0,0 +1,27 @@
+from collections.abc import AsyncIterable
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.application.posts.resumable_upload import AbstractResumableUploadStorage, UploadSession
+
+
+@dataclass(frozen=True)
+class AppendUploadChunkRequest:
+    user_id: UUID
+    upload_id: str
+    offset: int
+    chunk_stream: AsyncIterable[bytes]
+
+
+class AppendUploadChunkUseCase:
+    """
+    Use case for sending the next chunk of a resumable upload.
+    """
+
+    def __init__(self, resumable_uploads: AbstractResumableUploadStorage) -> None:
+        self._resumable_uploads = resumable_uploads
+
+    async def execute(self, request: AppendUploadChunkRequest) -> UploadSession:
+        return await self._resumable_uploads.append_chunk(
+            request.user_id, request.upload_id, request.offset, request.chunk_stream
+        )
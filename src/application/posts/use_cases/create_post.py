@@ -1,31 +1,66 @@
+import logging
+from collections.abc import AsyncIterable
 from dataclasses import dataclass
 from uuid import UUID
 
+from src.application.common.task_scheduler import AbstractTaskScheduler
+from src.application.common.unit_of_work import AbstractUnitOfWork
+from src.application.feeds.timeline_repository import AbstractTimelineRepository
+from src.application.follows.follow_repository import AbstractFollowRepository
+from src.application.posts.direct_upload import AbstractDirectUploadStorage
+from src.application.posts.image_processor import AbstractPostImageProcessor
 from src.application.posts.post_repository import AbstractPostRepository
 from src.application.posts.post_storage import AbstractPostImageStorage
-from src.domain.posts.entity import Post
+from src.domain.posts.entity import MediaStatus, Post
+
+logger = logging.getLogger(__name__)
+
+# Followers fetched per page while fanning a post out to their timelines
+FANOUT_PAGE_SIZE = 1000
 
 
 @dataclass(frozen=True)
 class CreatePostRequest:
+    """
+    The image is either streamed with the request (`image_file_name` and
+    `image_file_stream`) or was uploaded directly to storage (`upload_id`).
+    """
     user_id: UUID
-    image_file_name: str
-    image_file_data: bytes
+    image_file_name: str | None = None
+    image_file_stream: AsyncIterable[bytes] | None = None
     caption: str | None = None
+    upload_id: str | None = None
 
 
 class CreatePostUseCase:
     """
     Use case for creating a new post.
+    The post is returned as soon as the original image is stored; its resized
+    variants are rendered after the response and `media_status` tracks them.
+    The post row and its timeline entries commit together.
     """
 
     def __init__(
         self,
         post_repo: AbstractPostRepository,
         image_storage: AbstractPostImageStorage,
+        follow_repo: AbstractFollowRepository,
+        timeline_repo: AbstractTimelineRepository,
+        celebrity_threshold: int,
+        image_processor: AbstractPostImageProcessor,
+        task_scheduler: AbstractTaskScheduler,
+        direct_uploads: AbstractDirectUploadStorage,
+        unit_of_work: AbstractUnitOfWork,
     ) -> None:
         self._post_repo = post_repo
         self._image_storage = image_storage
+        self._follow_repo = follow_repo
+        self._timeline_repo = timeline_repo
+        self._celebrity_threshold = celebrity_threshold
+        self._image_processor = image_processor
+        self._task_scheduler = task_scheduler
+        self._direct_uploads = direct_uploads
+        self._unit_of_work = unit_of_work
 
     async def execute(self, request: CreatePostRequest) -> Post:
         # 1. Create the post entity first to generate an ID
@@ -36,17 +71,58 @@ class CreatePostUseCase:
             caption=request.caption,
         )
 
-        # 2. Save the image
-        image_url = await self._image_storage.save(
-            post_id=new_post.id,
-            file_name=request.image_file_name,
-            file_data=request.image_file_data,
-        )
+        # 2. Save the image, or take over the one the client uploaded directly
+        if request.upload_id is not None:
+            image_url = await self._direct_uploads.claim_upload(
+                request.user_id, request.upload_id, new_post.id
+            )
+        else:
+            image_url = await self._image_storage.save(
+                post_id=new_post.id,
+                file_name=request.image_file_name,
+                file_stream=request.image_file_stream,
+            )
 
         # 3. Update post with actual image URL
         new_post.image_url = image_url
+        new_post.variants = {"original": image_url}
+        new_post.media_status = MediaStatus.PENDING
 
-        # 4. Persist to DB
-        await self._post_repo.add(new_post)
+        # 4. Persist to DB and fan out to the author's and their followers' timelines
+        async with self._unit_of_work:
+            await self._post_repo.add(new_post)
+            await self._fan_out(new_post)
+
+        # 5. Render the resized variants once the response is sent
+        self._task_scheduler.schedule(self._create_variants, new_post)
 
         return new_post
+
+    async def _create_variants(self, post: Post) -> None:
+        try:
+            post.variants = await self._image_processor.create_variants(post.id, post.image_url)
+            post.media_status = MediaStatus.READY
+        except Exception:
+            # Includes undecodable uploads; clients keep showing the original
+            logger.exception("Creating image variants failed for post %s", post.id)
+            post.media_status = MediaStatus.FAILED
+        await self._post_repo.save(post)
+
+    async def _fan_out(self, post: Post) -> None:
+        owner_ids = [post.user_id]
+
+        # Celebrity posts only go to the author's own timeline; followers pull them at read time
+        follower_count = await self._follow_repo.count_followers(post.user_id)
+        if follower_count >= self._celebrity_threshold:
+            await self._timeline_repo.push(post, owner_ids)
+            return
+
+        cursor = None
+        while True:
+            page = await self._follow_repo.get_followers(post.user_id, FANOUT_PAGE_SIZE, cursor)
+            owner_ids += [follower.id for follower in page.items]
+            await self._timeline_repo.push(post, owner_ids)
+            if page.next_cursor is None:
+                return
+            owner_ids = []
+            cursor = page.next_cursor
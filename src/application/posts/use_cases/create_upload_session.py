@@ -0,0 +1,46 @@
+import logging
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.application.common.task_scheduler import AbstractTaskScheduler
+from src.application.posts.resumable_upload import AbstractResumableUploadStorage, UploadSession
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CreateUploadSessionRequest:
+    user_id: UUID
+    file_name: str
+    size: int
+
+
+class CreateUploadSessionUseCase:
+    """
+    Use case for starting a resumable upload. Abandoned sessions are cleaned
+    up after the response, piggybacking on new ones.
+    """
+
+    def __init__(
+        self,
+        resumable_uploads: AbstractResumableUploadStorage,
+        task_scheduler: AbstractTaskScheduler,
+    ) -> None:
+        self._resumable_uploads = resumable_uploads
+        self._task_scheduler = task_scheduler
+
+    async def execute(self, request: CreateUploadSessionRequest) -> UploadSession:
+        session = await self._resumable_uploads.create_session(
+            request.user_id, request.file_name, request.size
+        )
+        self._task_scheduler.schedule(self._delete_expired_sessions)
+        return session
+
+    async def _delete_expired_sessions(self) -> None:
+        try:
+            removed = await self._resumable_uploads.delete_expired_sessions()
+        except Exception:
+            logger.exception("Deleting expired upload sessions failed")
+            return
+        if removed:
+            logger.info("Deleted %d expired upload sessions", removed)
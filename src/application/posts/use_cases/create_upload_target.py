@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.application.posts.direct_upload import AbstractDirectUploadStorage, UploadTarget
+
+
+@dataclass(frozen=True)
+class CreateUploadTargetRequest:
+    user_id: UUID
+    file_name: str
+    size: int
+
+
+class CreateUploadTargetUseCase:
+    """
+    Use case for starting a direct upload: the client sends the image to the
+    returned target, then creates the post with its `upload_id`.
+    """
+
+    def __init__(self, direct_uploads: AbstractDirectUploadStorage) -> None:
+        self._direct_uploads = direct_uploads
+
+    async def execute(self, request: CreateUploadTargetRequest) -> UploadTarget:
+        return await self._direct_uploads.create_upload_target(
+            request.user_id, request.file_name, request.size
+        )
@@ -0,0 +1,51 @@
+import logging
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.application.common.task_scheduler import AbstractTaskScheduler
+from src.application.posts.media_reaper import MediaReaper
+from src.application.posts.post_repository import AbstractPostRepository
+from src.domain.posts.exceptions import PostBelongsToAnotherUser, PostNotFound
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DeletePostRequest:
+    user_id: UUID
+    post_id: UUID
+
+
+class DeletePostUseCase:
+    """
+    Use case for deleting one of the user's posts. Only the row is deleted
+    before responding; its media files are queued and removed by the reaper
+    after the response.
+    """
+
+    def __init__(
+        self,
+        post_repo: AbstractPostRepository,
+        media_reaper: MediaReaper,
+        task_scheduler: AbstractTaskScheduler,
+    ) -> None:
+        self._post_repo = post_repo
+        self._media_reaper = media_reaper
+        self._task_scheduler = task_scheduler
+
+    async def execute(self, request: DeletePostRequest) -> None:
+        post = await self._post_repo.get_by_id(request.post_id)
+        if post is None:
+            raise PostNotFound()
+        if post.user_id != request.user_id:
+            raise PostBelongsToAnotherUser()
+
+        await self._post_repo.delete(post)
+        self._task_scheduler.schedule(self._reap_media)
+
+    async def _reap_media(self) -> None:
+        try:
+            await self._media_reaper.run_once()
+        except Exception:
+            # Whatever is left stays queued for the next run
+            logger.exception("Reaping deleted media failed")
@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.application.posts.resumable_upload import AbstractResumableUploadStorage, UploadSession
+
+
+@dataclass(frozen=True)
+class GetUploadSessionRequest:
+    user_id: UUID
+    upload_id: str
+
+
+class GetUploadSessionUseCase:
+    """
+    Use case for finding out where an interrupted upload should continue.
+    """
+
+    def __init__(self, resumable_uploads: AbstractResumableUploadStorage) -> None:
+        self._resumable_uploads = resumable_uploads
+
+    async def execute(self, request: GetUploadSessionRequest) -> UploadSession:
+        return await self._resumable_uploads.get_session(request.user_id, request.upload_id)
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from uuid import UUID
 
+from src.application.common.pagination import DEFAULT_PAGE_SIZE, Cursor, Page
 from src.application.posts.post_repository import AbstractPostRepository
 from src.domain.posts.entity import Post
 
@@ -8,15 +9,19 @@ from src.domain.posts.entity import Post
 @dataclass(frozen=True)
 class ListPostsRequest:
     user_id: UUID
+    limit: int = DEFAULT_PAGE_SIZE
+    cursor: Cursor | None = None
 
 
 class ListPostsUseCase:
     """
-    Use case for listing all posts by a specific user.
+    Use case for listing a page of posts by a specific user.
     """
 
     def __init__(self, post_repo: AbstractPostRepository) -> None:
         self._post_repo = post_repo
 
-    async def execute(self, request: ListPostsRequest) -> list[Post]:
-        return await self._post_repo.list_by_user(request.user_id)
+    async def execute(self, request: ListPostsRequest) -> Page[Post]:
+        return await self._post_repo.list_by_user(
+            request.user_id, request.limit, request.cursor
+        )
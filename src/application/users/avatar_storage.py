@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterable
 from uuid import UUID
 
 
@@ -8,8 +9,17 @@ class AbstractAvatarStorage(ABC):
     """
 
     @abstractmethod
-    async def save(self, user_id: UUID, file_name: str, file_data: bytes) -> str:
+    async def save(self, user_id: UUID, file_name: str, file_stream: AsyncIterable[bytes]) -> str:
         """
-        Saves the file and returns its public URL.
+        Saves the file, read from the stream chunk by chunk, and returns its public URL.
+        Raises UploadTooLargeError if the content exceeds the storage's size limit.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(self, avatar_url: str) -> None:
+        """
+        Releases an avatar returned by `save`. URLs this storage did not
+        produce (such as generated default avatars) are ignored.
         """
         raise NotImplementedError
@@ -1,9 +1,19 @@
+import logging
 from dataclasses import dataclass
+from datetime import timedelta
 
+from src.application.common.exceptions import PasswordHasherBusyError
 from src.application.common.password_hasher import AbstractPasswordHasher
+from src.application.common.task_scheduler import AbstractTaskScheduler
 from src.application.common.token_service import AbstractTokenService
+from src.application.common.unit_of_work import AbstractUnitOfWork
+from src.application.users.refresh_token_repository import AbstractRefreshTokenRepository
+from src.application.users.refresh_tokens import issue_refresh_token
 from src.application.users.user_repository import AbstractUserRepository
 from src.domain.users.exceptions import InvalidCredentialsError
+from src.domain.users.user import User
+
+logger = logging.getLogger(__name__)
 
 
 @dataclass(frozen=True)
@@ -15,6 +25,7 @@ class LoginUserRequest:
 @dataclass(frozen=True)
 class LoginUserResponse:
     access_token: str
+    refresh_token: str
 
 
 class LoginUserUseCase:
@@ -27,23 +38,48 @@ class LoginUserUseCase:
         user_repo: AbstractUserRepository,
         password_hasher: AbstractPasswordHasher,
         token_service: AbstractTokenService,
+        task_scheduler: AbstractTaskScheduler,
+        refresh_token_repo: AbstractRefreshTokenRepository,
+        refresh_token_lifetime: timedelta,
+        unit_of_work: AbstractUnitOfWork,
     ) -> None:
         self._user_repo = user_repo
         self._password_hasher = password_hasher
         self._token_service = token_service
+        self._task_scheduler = task_scheduler
+        self._refresh_token_repo = refresh_token_repo
+        self._refresh_token_lifetime = refresh_token_lifetime
+        self._unit_of_work = unit_of_work
 
     async def execute(self, request: LoginUserRequest) -> LoginUserResponse:
         user = await self._user_repo.get_by_email(request.email)
         if not user:
             raise InvalidCredentialsError()
 
-        if not self._password_hasher.verify(request.password, user.hashed_password):
+        if not await self._password_hasher.verify(request.password, user.hashed_password):
             raise InvalidCredentialsError()
 
-        access_token = self._token_service.generate_token(user.id)
+        # The plaintext password is only available right now, so this is the
+        # moment to move an outdated hash to the current cost parameters.
+        if self._password_hasher.needs_rehash(user.hashed_password):
+            self._task_scheduler.schedule(self._rehash_password, user, request.password)
 
-        return LoginUserResponse(access_token=access_token)
+        access_token = self._token_service.generate_token(user)
+        # Each login starts a new refresh token family; drop the user's dead ones
+        async with self._unit_of_work:
+            await self._refresh_token_repo.delete_expired_for_user(user.id)
+            refresh_token = await issue_refresh_token(
+                self._refresh_token_repo, user.id, self._refresh_token_lifetime
+            )
 
-        access_token = self._token_service.generate_token(user.id)
+        return LoginUserResponse(access_token=access_token, refresh_token=refresh_token)
 
-        return LoginUserResponse(access_token=access_token)
+    async def _rehash_password(self, user: User, password: str) -> None:
+        try:
+            user.hashed_password = await self._password_hasher.hash(password)
+            await self._user_repo.save(user)
+        except PasswordHasherBusyError:
+            # Not urgent: the old hash keeps working and is retried on the next login
+            logger.info("Skipped password rehash for user %s: hasher busy", user.id)
+        except Exception:
+            logger.exception("Password rehash failed for user %s", user.id)
@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+from uuid import UUID
+
+from src.application.common.token_revocation import AbstractTokenRevocationList
+from src.application.common.unit_of_work import AbstractUnitOfWork
+from src.application.users.refresh_token_repository import AbstractRefreshTokenRepository
+from src.application.users.user_repository import AbstractUserRepository
+from src.domain.users.exceptions import UserNotFoundError
+
+
+@dataclass(frozen=True)
+class LogoutAllSessionsRequest:
+    user_id: UUID
+
+
+class LogoutAllSessionsUseCase:
+    """
+    Use case for revoking every access and refresh token issued to a user so far.
+    """
+
+    def __init__(
+        self,
+        user_repo: AbstractUserRepository,
+        revocation_list: AbstractTokenRevocationList,
+        refresh_token_repo: AbstractRefreshTokenRepository,
+        unit_of_work: AbstractUnitOfWork,
+    ) -> None:
+        self._user_repo = user_repo
+        self._revocation_list = revocation_list
+        self._refresh_token_repo = refresh_token_repo
+        self._unit_of_work = unit_of_work
+
+    async def execute(self, request: LogoutAllSessionsRequest) -> None:
+        async with self._unit_of_work:
+            token_version = await self._user_repo.increment_token_version(request.user_id)
+            if token_version is None:
+                raise UserNotFoundError()
+            await self._refresh_token_repo.revoke_all_for_user(request.user_id)
+        await self._revocation_list.revoke(request.user_id, token_version)
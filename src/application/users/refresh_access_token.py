@@ -0,0 +1,76 @@
+from dataclasses import dataclass
+from datetime import timedelta
+
+from src.application.common.token_service import AbstractTokenService
+from src.application.common.unit_of_work import AbstractUnitOfWork
+from src.application.users.refresh_token_repository import AbstractRefreshTokenRepository
+from src.application.users.refresh_tokens import hash_refresh_token, issue_refresh_token
+from src.application.users.user_repository import AbstractUserRepository
+from src.domain.users.exceptions import InvalidCredentialsError
+
+
+@dataclass(frozen=True)
+class RefreshAccessTokenRequest:
+    refresh_token: str
+
+
+@dataclass(frozen=True)
+class RefreshAccessTokenResponse:
+    access_token: str
+    refresh_token: str
+
+
+class RefreshAccessTokenUseCase:
+    """
+    Use case for exchanging a refresh token for a new access token.
+    The refresh token is rotated: it is consumed and a new one is returned.
+    Presenting an already used token means it leaked, so its whole family is
+    revoked and the legitimate holder has to log in again. Consuming the old
+    token and storing the new one commit together, so a failure in between
+    never leaves the client without a usable token.
+    """
+
+    def __init__(
+        self,
+        refresh_token_repo: AbstractRefreshTokenRepository,
+        user_repo: AbstractUserRepository,
+        token_service: AbstractTokenService,
+        refresh_token_lifetime: timedelta,
+        unit_of_work: AbstractUnitOfWork,
+    ) -> None:
+        self._refresh_token_repo = refresh_token_repo
+        self._user_repo = user_repo
+        self._token_service = token_service
+        self._refresh_token_lifetime = refresh_token_lifetime
+        self._unit_of_work = unit_of_work
+
+    async def execute(self, request: RefreshAccessTokenRequest) -> RefreshAccessTokenResponse:
+        token_hash = hash_refresh_token(request.refresh_token)
+
+        async with self._unit_of_work:
+            stored = await self._refresh_token_repo.mark_used(token_hash)
+            if stored is not None:
+                if stored.is_expired():
+                    raise InvalidCredentialsError()
+
+                user = await self._user_repo.get_by_id(stored.user_id)
+                if user is None:
+                    raise InvalidCredentialsError()
+
+                refresh_token = await issue_refresh_token(
+                    self._refresh_token_repo,
+                    user.id,
+                    self._refresh_token_lifetime,
+                    family_id=stored.family_id,
+                )
+
+        # Outside the unit of work, which would roll the revocation back on raising
+        if stored is None:
+            reused = await self._refresh_token_repo.get_by_hash(token_hash)
+            if reused is not None:
+                await self._refresh_token_repo.revoke_family(reused.family_id)
+            raise InvalidCredentialsError()
+
+        access_token = self._token_service.generate_token(user)
+
+        return RefreshAccessTokenResponse(access_token=access_token, refresh_token=refresh_token)
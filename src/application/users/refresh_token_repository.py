@@ -0,0 +1,39 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from src.domain.users.refresh_token import RefreshToken
+
+
+class AbstractRefreshTokenRepository(ABC):
+    """
+    Abstract interface for a refresh token repository.
+    """
+
+    @abstractmethod
+    async def add(self, token: RefreshToken) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_by_hash(self, token_hash: str) -> RefreshToken | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def mark_used(self, token_hash: str) -> RefreshToken | None:
+        """
+        Atomically marks an unused token as used and returns it.
+        Returns None if there is no such token or it was already used, so two
+        concurrent refreshes with the same token cannot both succeed.
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def revoke_family(self, family_id: UUID) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def revoke_all_for_user(self, user_id: UUID) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete_expired_for_user(self, user_id: UUID) -> None:
+        raise NotImplementedError
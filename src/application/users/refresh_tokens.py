@@ -0,0 +1,32 @@
+import hashlib
+import secrets
+from datetime import datetime, timedelta, timezone
+from uuid import UUID, uuid4
+
+from src.application.users.refresh_token_repository import AbstractRefreshTokenRepository
+from src.domain.users.refresh_token import RefreshToken
+
+
+def hash_refresh_token(token: str) -> str:
+    # Refresh tokens are 256 random bits, so a fast hash is enough: there is
+    # nothing to brute-force, unlike a password.
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+async def issue_refresh_token(
+    repo: AbstractRefreshTokenRepository,
+    user_id: UUID,
+    lifetime: timedelta,
+    family_id: UUID | None = None,
+) -> str:
+    """Stores a new refresh token for the user and returns its plaintext value."""
+    token = secrets.token_urlsafe(32)
+    await repo.add(
+        RefreshToken(
+            user_id=user_id,
+            family_id=family_id or uuid4(),
+            token_hash=hash_refresh_token(token),
+            expires_at=datetime.now(timezone.utc) + lifetime,
+        )
+    )
+    return token
@@ -36,7 +36,7 @@ class RegisterUserUseCase:
         if await self._user_repo.get_by_email(request.email):
             raise EmailAlreadyExistsError()
 
-        hashed_password = self._password_hasher.hash(request.password)
+        hashed_password = await self._password_hasher.hash(request.password)
 
         # Generate default avatar using ui-avatars.com based on username
         default_avatar_url = f"https://ui-avatars.com/api/?name={request.username}&background=random"
@@ -1,6 +1,8 @@
+from collections.abc import AsyncIterable
 from dataclasses import dataclass
 from uuid import UUID
 
+from src.application.common.unit_of_work import AbstractUnitOfWork
 from src.application.users.avatar_storage import AbstractAvatarStorage
 from src.application.users.user_repository import AbstractUserRepository
 from src.domain.users.exceptions import UserNotFoundError
@@ -12,7 +14,7 @@ class UpdateUserProfileRequest:
     user_id: UUID
     nickname: str | None = None
     avatar_file_name: str | None = None
-    avatar_file_data: bytes | None = None
+    avatar_file_stream: AsyncIterable[bytes] | None = None
     bio: str | None = None
     is_public: bool | None = None
     should_delete_avatar: bool = False
@@ -21,15 +23,19 @@ class UpdateUserProfileRequest:
 class UpdateUserProfileUseCase:
     """
     Use case for updating a user's profile.
+    Storing a new avatar takes a reference on it (the same picture uploaded
+    again takes a second one), which commits together with the user row.
     """
 
     def __init__(
         self,
         user_repo: AbstractUserRepository,
         avatar_storage: AbstractAvatarStorage,
+        unit_of_work: AbstractUnitOfWork,
     ) -> None:
         self._user_repo = user_repo
         self._avatar_storage = avatar_storage
+        self._unit_of_work = unit_of_work
 
     async def execute(self, request: UpdateUserProfileRequest) -> User:
         user = await self._user_repo.get_by_id(request.user_id)
@@ -43,17 +49,25 @@ class UpdateUserProfileUseCase:
         if request.is_public is not None:
             user.is_public = request.is_public
 
-        if request.should_delete_avatar:
-            # Revert to default avatar instead of None
-            user.avatar_url = f"https://ui-avatars.com/api/?name={user.username}&background=random"
-        elif request.avatar_file_data and request.avatar_file_name:
-            avatar_url = await self._avatar_storage.save(
-                user_id=user.id,
-                file_name=request.avatar_file_name,
-                file_data=request.avatar_file_data,
-            )
-            user.avatar_url = avatar_url
-
-        await self._user_repo.save(user)
+        previous_avatar_url = user.avatar_url
+        uploaded = False
+        async with self._unit_of_work:
+            if request.should_delete_avatar:
+                # Revert to default avatar instead of None
+                user.avatar_url = f"https://ui-avatars.com/api/?name={user.username}&background=random"
+            elif request.avatar_file_stream is not None and request.avatar_file_name:
+                user.avatar_url = await self._avatar_storage.save(
+                    user_id=user.id,
+                    file_name=request.avatar_file_name,
+                    file_stream=request.avatar_file_stream,
+                )
+                uploaded = True
+
+            await self._user_repo.save(user)
+
+        # Release the previous avatar once the user no longer needs its reference:
+        # after any upload, even of the same picture, which took a reference of its own
+        if previous_avatar_url and (uploaded or previous_avatar_url != user.avatar_url):
+            await self._avatar_storage.delete(previous_avatar_url)
 
         return user
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 from uuid import UUID
 
 from src.domain.users.user import User
@@ -28,3 +29,12 @@ class AbstractUserRepository(ABC):
     @abstractmethod
     async def save(self, user: User) -> None:
         raise NotImplementedError
+
+    @abstractmethod
+    async def increment_token_version(self, user_id: UUID) -> int | None:
+        """Revokes the user's current tokens. Returns the new version, or None if no such user."""
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get_token_versions_changed_since(self, since: datetime) -> dict[UUID, int]:
+        raise NotImplementedError
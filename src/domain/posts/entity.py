@@ -1,8 +1,19 @@
 from dataclasses import dataclass, field
 from datetime import datetime
+from enum import Enum
 from uuid import UUID, uuid4
 
 
+class MediaStatus(str, Enum):
+    """
+    Progress of the resized image variants of a post.
+    Until they are READY, clients should display `image_url`.
+    """
+    PENDING = "pending"
+    READY = "ready"
+    FAILED = "failed"
+
+
 @dataclass(kw_only=True)
 class Post:
     """
@@ -12,5 +23,8 @@ class Post:
     user_id: UUID
     image_url: str
     caption: str | None = None
+    # Variant name (e.g. "thumbnail", "feed", "original") -> URL
+    variants: dict[str, str] = field(default_factory=dict)
+    media_status: MediaStatus = MediaStatus.PENDING
     created_at: datetime = field(default_factory=datetime.now)
     updated_at: datetime = field(default_factory=datetime.now)
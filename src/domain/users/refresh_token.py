@@ -0,0 +1,21 @@
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+
+@dataclass(kw_only=True)
+class RefreshToken:
+    """
+    A long-lived credential that can be exchanged once for a new access token.
+    Only a hash of the token is stored. Every token issued by rotating another
+    one shares its `family_id`, so a replayed token can revoke the whole chain.
+    """
+    id: UUID = field(default_factory=uuid4)
+    user_id: UUID
+    family_id: UUID
+    token_hash: str
+    expires_at: datetime
+    used_at: datetime | None = None
+
+    def is_expired(self, now: datetime | None = None) -> bool:
+        return self.expires_at <= (now or datetime.now(timezone.utc))
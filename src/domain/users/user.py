@@ -15,3 +15,5 @@ class User:
     avatar_url: str | None = None
     bio: str | None = None
     is_public: bool = True
+    # Bumped to revoke every token issued before; tokens carry the version they were issued with
+    token_version: int = 0
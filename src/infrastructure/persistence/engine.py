@@ -0,0 +1,214 @@
+import bisect
+import os
+import time
+from collections.abc import Mapping
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, replace
+from typing import Any
+
+from sqlalchemy import exc, make_url, text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, PoolProxiedConnection
+
+# Upper bounds (seconds) of the checkout wait histogram
+WAIT_BUCKETS = (0.001, 0.005, 0.025, 0.1, 0.5, 2.5, 10.0)
+
+
+@dataclass(frozen=True)
+class EngineSettings:
+    echo: bool
+    # Without a pool every session opens its own connection (tests, pgbouncer in front)
+    pooled: bool
+    pool_size: int
+    max_overflow: int
+    # Seconds a checkout waits for a free connection before failing
+    pool_timeout: float
+    # Connections older than this many seconds are replaced; -1 never replaces them
+    pool_recycle: int
+    pool_pre_ping: bool
+    # Prepared statements asyncpg keeps per connection; 0 disables the cache
+    statement_cache_size: int
+    # Connections opened at startup, so the first requests after a deploy find them ready
+    warmup_connections: int
+
+
+PROFILES: dict[str, EngineSettings] = {
+    "development": EngineSettings(
+        echo=False,
+        pooled=True,
+        pool_size=5,
+        max_overflow=10,
+        pool_timeout=30.0,
+        pool_recycle=1800,
+        pool_pre_ping=True,
+        statement_cache_size=100,
+        warmup_connections=1,
+    ),
+    # Fail fast when the pool is exhausted instead of stacking up requests
+    "production": EngineSettings(
+        echo=False,
+        pooled=True,
+        pool_size=10,
+        max_overflow=5,
+        pool_timeout=5.0,
+        pool_recycle=1800,
+        pool_pre_ping=True,
+        statement_cache_size=500,
+        warmup_connections=10,
+    ),
+    # Each test may run on its own event loop, and asyncpg connections cannot move between loops
+    "test": EngineSettings(
+        echo=False,
+        pooled=False,
+        pool_size=0,
+        max_overflow=0,
+        pool_timeout=30.0,
+        pool_recycle=-1,
+        pool_pre_ping=False,
+        statement_cache_size=100,
+        warmup_connections=0,
+    ),
+}
+
+_OVERRIDES: dict[str, tuple[str, type]] = {
+    "DB_ECHO": ("echo", bool),
+    "DB_POOL_SIZE": ("pool_size", int),
+    "DB_MAX_OVERFLOW": ("max_overflow", int),
+    "DB_POOL_TIMEOUT_SECONDS": ("pool_timeout", float),
+    "DB_POOL_RECYCLE_SECONDS": ("pool_recycle", int),
+    "DB_POOL_PRE_PING": ("pool_pre_ping", bool),
+    "DB_STATEMENT_CACHE_SIZE": ("statement_cache_size", int),
+    "DB_POOL_WARMUP_CONNECTIONS": ("warmup_connections", int),
+}
+
+
+def _parse_bool(value: str) -> bool:
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def load_engine_settings(environ: Mapping[str, str] = os.environ) -> EngineSettings:
+    """
+    Starts from the profile named by DB_PROFILE (default "development") and
+    applies any of the DB_* overrides that are set.
+    """
+    profile = environ.get("DB_PROFILE", "development").lower()
+    try:
+        settings = PROFILES[profile]
+    except KeyError:
+        raise ValueError(f"Unknown DB_PROFILE {profile!r}; expected one of {sorted(PROFILES)}")
+
+    overrides: dict[str, Any] = {}
+    for variable, (field, kind) in _OVERRIDES.items():
+        value = environ.get(variable)
+        if value:
+            overrides[field] = _parse_bool(value) if kind is bool else kind(value)
+    return replace(settings, **overrides)
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    pool_size: int
+    max_overflow: int
+    checked_out: int
+    checked_in: int
+    # Connections open beyond pool_size
+    overflow: int
+    checkouts: int
+    # Checkouts that gave up after pool_timeout
+    timeouts: int
+    wait_seconds_total: float
+    # Checkouts that took at most each of WAIT_BUCKETS, cumulative
+    wait_buckets: tuple[tuple[float, int], ...]
+
+
+class InstrumentedAsyncPool(AsyncAdaptedQueuePool):
+    """
+    The default asyncio queue pool, counting checkouts, timeouts and how long
+    each checkout took (waiting for a free connection, plus opening or
+    pre-pinging one). A growing share of slow checkouts shows the pool running
+    dry well before requests start failing with timeouts.
+
+    Like the pool itself, it is only used from the event loop thread.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._checkouts = 0
+        self._timeouts = 0
+        self._wait_seconds_total = 0.0
+        self._wait_counts = [0] * (len(WAIT_BUCKETS) + 1)
+
+    def connect(self) -> PoolProxiedConnection:
+        started = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self._timeouts += 1
+            raise
+        waited = time.perf_counter() - started
+        self._checkouts += 1
+        self._wait_seconds_total += waited
+        self._wait_counts[bisect.bisect_left(WAIT_BUCKETS, waited)] += 1
+        return connection
+
+    def stats(self) -> PoolStats:
+        cumulative = []
+        count = 0
+        for bound, bucket_count in zip(WAIT_BUCKETS, self._wait_counts):
+            count += bucket_count
+            cumulative.append((bound, count))
+        return PoolStats(
+            pool_size=self.size(),
+            max_overflow=self._max_overflow,
+            checked_out=self.checkedout(),
+            checked_in=self.checkedin(),
+            overflow=max(self.overflow(), 0),
+            checkouts=self._checkouts,
+            timeouts=self._timeouts,
+            wait_seconds_total=self._wait_seconds_total,
+            wait_buckets=tuple(cumulative),
+        )
+
+
+def create_engine(url: str, settings: EngineSettings) -> AsyncEngine:
+    options: dict[str, Any] = {"echo": settings.echo, "pool_pre_ping": settings.pool_pre_ping}
+    if make_url(url).get_driver_name() == "asyncpg":
+        options["connect_args"] = {"prepared_statement_cache_size": settings.statement_cache_size}
+    if settings.pooled:
+        options.update(
+            poolclass=InstrumentedAsyncPool,
+            pool_size=settings.pool_size,
+            max_overflow=settings.max_overflow,
+            pool_timeout=settings.pool_timeout,
+            pool_recycle=settings.pool_recycle,
+        )
+    else:
+        options["poolclass"] = NullPool
+    return create_async_engine(url, **options)
+
+
+async def warm_up_pool(engine: AsyncEngine, connections: int) -> int:
+    """
+    Checks out up to `connections` pooled connections, all held at once so
+    each is a new one, and returns them to the pool, ready for the first
+    requests. Never opens more than the pool keeps, since the rest would be
+    closed again right away. Returns how many connections were opened.
+    """
+    pool = engine.sync_engine.pool
+    if not isinstance(pool, InstrumentedAsyncPool):
+        return 0
+    connections = min(connections, pool.size())
+
+    async with AsyncExitStack() as stack:
+        for _ in range(connections):
+            connection = await stack.enter_async_context(engine.connect())
+            await connection.execute(text("SELECT 1"))
+    return connections
+
+
+def get_pool_stats(engine: AsyncEngine) -> PoolStats | None:
+    """Live statistics of the engine's pool, or None if it is not pooled."""
+    pool = engine.sync_engine.pool
+    if isinstance(pool, InstrumentedAsyncPool):
+        return pool.stats()
+    return None
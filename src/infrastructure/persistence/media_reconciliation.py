@@ -0,0 +1,106 @@
+import asyncio
+import re
+import time
+from collections.abc import Hashable
+from pathlib import Path
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from src.infrastructure.persistence.orm.media_blob import SQLAlchemyMediaBlob
+from src.infrastructure.persistence.orm.post import SQLAlchemyPost
+
+_DIGEST = re.compile(r"^([0-9a-f]{64})(-|\.|$)")
+
+
+def _old_files(root: Path, modified_before: float) -> list[Path]:
+    if not root.is_dir():
+        return []
+    return [
+        path
+        for path in root.rglob("*")
+        if path.is_file() and path.stat().st_mtime < modified_before
+    ]
+
+
+async def find_orphaned_files(
+    session: AsyncSession,
+    posts_root: Path,
+    blobs_root: Path,
+    min_age_seconds: float,
+    batch_size: int = 1000,
+) -> list[Path]:
+    """
+    Lists files under the storage roots that no row refers to: post images and
+    variants (named after their post id) of posts that no longer exist, blobs
+    that are not the file named in their digest's `media_blobs` row, and
+    leftover temporary files.
+
+    Files younger than `min_age_seconds` are never listed, since their row may
+    just not be committed yet. Ids are looked up `batch_size` at a time.
+    Unrecognised file names are left alone.
+    """
+    modified_before = time.time() - min_age_seconds
+    orphans: list[Path] = []
+    by_post: dict[UUID, list[Path]] = {}
+    by_digest: dict[str, list[Path]] = {}
+
+    for path in await asyncio.to_thread(_old_files, posts_root, modified_before):
+        if path.name.startswith("."):
+            orphans.append(path)
+            continue
+        try:
+            post_id = UUID(path.name[:36])
+        except ValueError:
+            continue
+        by_post.setdefault(post_id, []).append(path)
+
+    for path in await asyncio.to_thread(_old_files, blobs_root, modified_before):
+        if path.name.startswith("."):
+            orphans.append(path)
+            continue
+        match = _DIGEST.match(path.name)
+        if match is not None:
+            by_digest.setdefault(match.group(1), []).append(path)
+
+    orphans += await _unreferenced(session, SQLAlchemyPost.id, by_post, batch_size)
+    orphans += await _unregistered_blobs(session, by_digest, batch_size)
+    return orphans
+
+
+async def _unreferenced(
+    session: AsyncSession,
+    column: InstrumentedAttribute,
+    files_by_key: dict[Hashable, list[Path]],
+    batch_size: int,
+) -> list[Path]:
+    keys = list(files_by_key)
+    unreferenced = []
+    for start in range(0, len(keys), batch_size):
+        batch = keys[start : start + batch_size]
+        result = await session.execute(select(column).where(column.in_(batch)))
+        existing = set(result.scalars())
+        for key in batch:
+            if key not in existing:
+                unreferenced += files_by_key[key]
+    return unreferenced
+
+
+async def _unregistered_blobs(
+    session: AsyncSession,
+    files_by_digest: dict[str, list[Path]],
+    batch_size: int,
+) -> list[Path]:
+    digests = list(files_by_digest)
+    unregistered = []
+    for start in range(0, len(digests), batch_size):
+        batch = digests[start : start + batch_size]
+        result = await session.execute(
+            select(SQLAlchemyMediaBlob.file_name).where(SQLAlchemyMediaBlob.digest.in_(batch))
+        )
+        registered = set(result.scalars())
+        for digest in batch:
+            unregistered += [path for path in files_by_digest[digest] if path.name not in registered]
+    return unregistered
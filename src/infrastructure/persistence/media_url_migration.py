@@ -0,0 +1,114 @@
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import column, select, update, values
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from src.infrastructure.persistence.orm.post import SQLAlchemyPost
+from src.infrastructure.persistence.orm.user import SQLAlchemyUser
+
+# Maps a stored URL to its new form, or None to leave it alone
+UrlRewrite = Callable[[str], str | None]
+
+
+@dataclass(frozen=True)
+class RewriteCounts:
+    posts: int
+    users: int
+
+
+async def rewrite_media_urls(
+    session: AsyncSession, rewrite: UrlRewrite, batch_size: int = 1000
+) -> RewriteCounts:
+    """
+    Rewrites `posts.image_url`, `posts.variants` and `users.avatar_url`.
+    Rows are walked in primary key order and each batch is written with one
+    UPDATE per column and committed, so locks stay short and an interrupted
+    run can simply be started again. Only the columns that change are written,
+    and only where they still hold the value that was read, so a row updated
+    concurrently (say, its variants rendered meanwhile) is left alone rather
+    than overwritten with stale data; the next run picks it up.
+    """
+    posts = await _rewrite_posts(session, rewrite, batch_size)
+    users = await _rewrite_users(session, rewrite, batch_size)
+    return RewriteCounts(posts=posts, users=users)
+
+
+async def _rewrite_posts(session: AsyncSession, rewrite: UrlRewrite, batch_size: int) -> int:
+    rewritten = 0
+    last_id = None
+    while True:
+        stmt = select(SQLAlchemyPost.id, SQLAlchemyPost.image_url, SQLAlchemyPost.variants)
+        if last_id is not None:
+            stmt = stmt.where(SQLAlchemyPost.id > last_id)
+        rows = (await session.execute(stmt.order_by(SQLAlchemyPost.id).limit(batch_size))).all()
+        if not rows:
+            return rewritten
+
+        image_urls = []
+        variants = []
+        for row in rows:
+            if (image_url := rewrite(row.image_url)) is not None:
+                image_urls.append((row.id, row.image_url, image_url))
+            if row.variants is not None:
+                new_variants = {name: rewrite(url) or url for name, url in row.variants.items()}
+                if new_variants != row.variants:
+                    variants.append((row.id, row.variants, new_variants))
+        if image_urls or variants:
+            updated = await _update_where_unchanged(session, SQLAlchemyPost.image_url, image_urls)
+            updated |= await _update_where_unchanged(session, SQLAlchemyPost.variants, variants)
+            await session.commit()
+            rewritten += len(updated)
+        last_id = rows[-1].id
+
+
+async def _rewrite_users(session: AsyncSession, rewrite: UrlRewrite, batch_size: int) -> int:
+    rewritten = 0
+    last_id = None
+    while True:
+        stmt = select(SQLAlchemyUser.id, SQLAlchemyUser.avatar_url).where(
+            SQLAlchemyUser.avatar_url.is_not(None)
+        )
+        if last_id is not None:
+            stmt = stmt.where(SQLAlchemyUser.id > last_id)
+        rows = (await session.execute(stmt.order_by(SQLAlchemyUser.id).limit(batch_size))).all()
+        if not rows:
+            return rewritten
+
+        changes = [
+            (row.id, row.avatar_url, new_url)
+            for row in rows
+            if (new_url := rewrite(row.avatar_url)) is not None
+        ]
+        if changes:
+            updated = await _update_where_unchanged(session, SQLAlchemyUser.avatar_url, changes)
+            await session.commit()
+            rewritten += len(updated)
+        last_id = rows[-1].id
+
+
+async def _update_where_unchanged(
+    session: AsyncSession, target: InstrumentedAttribute, changes: list[tuple[Any, Any, Any]]
+) -> set[Any]:
+    """
+    Sets `target` from old to new for each (id, old, new), in one statement,
+    on the rows where it still holds the old value; returns their ids.
+    """
+    if not changes:
+        return set()
+    model = target.class_
+    rewrites = values(
+        column("id", model.id.type),
+        column("old", target.type),
+        column("new", target.type),
+        name="rewrites",
+    ).data(changes)
+    stmt = (
+        update(model)
+        .where(model.id == rewrites.c.id, target == rewrites.c.old)
+        .values({target: rewrites.c.new})
+        .returning(model.id)
+    )
+    return set((await session.execute(stmt)).scalars())
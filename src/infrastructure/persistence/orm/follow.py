@@ -21,10 +21,20 @@ class SQLAlchemyFollow(Base):
     )
 
     __table_args__ = (
-        # Index for getting all followers of a user
-        sa.Index("ix_follows_followed_id", "followed_id"),
-        # Index for getting all users a specific user follows
-        sa.Index("ix_follows_follower_id", "follower_id"),
+        # Index for keyset pagination of a user's followers, most recent first
+        sa.Index(
+            "ix_follows_followed_id_created_at",
+            "followed_id",
+            sa.text("created_at DESC"),
+            sa.text("follower_id DESC"),
+        ),
+        # Index for keyset pagination of the users a specific user follows
+        sa.Index(
+            "ix_follows_follower_id_created_at",
+            "follower_id",
+            sa.text("created_at DESC"),
+            sa.text("followed_id DESC"),
+        ),
     )
 
 
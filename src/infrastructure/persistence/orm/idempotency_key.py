@@ -0,0 +1,33 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import UUID, DateTime, ForeignKey, SmallInteger, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.persistence.database import Base
+
+
+class SQLAlchemyIdempotencyKey(Base):
+    """
+    The stored response of a request sent with an `Idempotency-Key` header.
+    Rows live until `expires_at` and are deleted in batches after that.
+    """
+    __tablename__ = "idempotency_keys"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    # SHA-256 hex digest of the request method, path and payload (JSON body, or every form
+    # field including uploaded file contents; see request_fingerprint), so reusing a key
+    # with a different payload is refused instead of replaying the stored response
+    request_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    # NULL while the first request with this key is running
+    status_code: Mapped[int | None] = mapped_column(SmallInteger)
+    response_body: Mapped[dict | list | None] = mapped_column(JSONB)
+    # When the key was (last) reserved
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.persistence.database import Base
+
+
+class SQLAlchemyMediaBlob(Base):
+    """
+    One stored media file, named after the SHA-256 digest of the uploaded bytes.
+    `ref_count` is the number of posts and avatars pointing at it.
+    """
+    __tablename__ = "media_blobs"
+
+    digest: Mapped[str] = mapped_column(String(64), primary_key=True)
+    # Digest plus the extension the stored (possibly re-encoded) file ended up with
+    file_name: Mapped[str] = mapped_column(String(80), nullable=False)
+    size: Mapped[int] = mapped_column(BigInteger, nullable=False)
+    ref_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
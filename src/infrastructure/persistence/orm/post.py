@@ -2,9 +2,10 @@ import uuid
 from datetime import datetime
 import sqlalchemy as sa # Added import
 from sqlalchemy import UUID, ForeignKey, String, Text, func
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.domain.posts.entity import Post as DomainPost
+from src.domain.posts.entity import MediaStatus, Post as DomainPost
 from src.infrastructure.persistence.database import Base
 
 
@@ -19,6 +20,12 @@ class SQLAlchemyPost(Base):
     )
     image_url: Mapped[str] = mapped_column(String(512), nullable=False)
     caption: Mapped[str | None] = mapped_column(Text)
+    variants: Mapped[dict[str, str]] = mapped_column(
+        JSONB, default=dict, server_default="{}", nullable=False
+    )
+    media_status: Mapped[str] = mapped_column(
+        String(16), default=MediaStatus.PENDING.value, server_default="pending", nullable=False
+    )
     created_at: Mapped[datetime] = mapped_column(
         server_default=func.now(), nullable=False
     )
@@ -30,8 +37,13 @@ class SQLAlchemyPost(Base):
     # user = relationship("SQLAlchemyUser", back_populates="posts")
 
     __table_args__ = (
-        # Index for efficient lookup of posts by user
-        sa.Index("ix_posts_user_id", "user_id"), # Corrected
+        # Index for keyset pagination of a user's posts, newest first
+        sa.Index(
+            "ix_posts_user_id_created_at_id",
+            "user_id",
+            sa.text("created_at DESC"),
+            sa.text("id DESC"),
+        ),
         # Index for efficient sorting of posts by creation date
         sa.Index("ix_posts_created_at", "created_at"), # Corrected
     )
@@ -44,6 +56,8 @@ def post_to_domain(post: SQLAlchemyPost) -> DomainPost:
         user_id=post.user_id,
         image_url=post.image_url,
         caption=post.caption,
+        variants=dict(post.variants),
+        media_status=MediaStatus(post.media_status),
         created_at=post.created_at,
         updated_at=post.updated_at,
     )
@@ -56,6 +70,8 @@ def post_to_orm(post: DomainPost) -> SQLAlchemyPost:
         user_id=post.user_id,
         image_url=post.image_url,
         caption=post.caption,
+        variants=dict(post.variants),
+        media_status=post.media_status.value,
         created_at=post.created_at,
         updated_at=post.updated_at,
     )
@@ -0,0 +1,51 @@
+import uuid
+from datetime import datetime
+
+from sqlalchemy import UUID, DateTime, ForeignKey, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.domain.users.refresh_token import RefreshToken as DomainRefreshToken
+from src.infrastructure.persistence.database import Base
+
+
+class SQLAlchemyRefreshToken(Base):
+    __tablename__ = "refresh_tokens"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+    )
+    family_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), nullable=False, index=True)
+    # SHA-256 hex digest; the lookup on every refresh is a unique index probe
+    token_hash: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    used_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+
+def refresh_token_to_domain(token: SQLAlchemyRefreshToken) -> DomainRefreshToken:
+    """Maps an ORM refresh token to a domain refresh token."""
+    return DomainRefreshToken(
+        id=token.id,
+        user_id=token.user_id,
+        family_id=token.family_id,
+        token_hash=token.token_hash,
+        expires_at=token.expires_at,
+        used_at=token.used_at,
+    )
+
+
+def refresh_token_to_orm(token: DomainRefreshToken) -> SQLAlchemyRefreshToken:
+    """Maps a domain refresh token to an ORM refresh token."""
+    return SQLAlchemyRefreshToken(
+        id=token.id,
+        user_id=token.user_id,
+        family_id=token.family_id,
+        token_hash=token.token_hash,
+        expires_at=token.expires_at,
+        used_at=token.used_at,
+    )
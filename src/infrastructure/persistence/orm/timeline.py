@@ -0,0 +1,40 @@
+import uuid
+from datetime import datetime
+
+import sqlalchemy as sa
+from sqlalchemy import UUID, ForeignKey
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.infrastructure.persistence.database import Base
+
+
+class SQLAlchemyTimelineEntry(Base):
+    """
+    One post in one user's precomputed home timeline.
+    `author_id` and `created_at` are copied from the post so that reading and
+    pruning a timeline never has to touch the posts table.
+    """
+    __tablename__ = "timelines"
+
+    owner_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    post_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("posts.id", ondelete="CASCADE"), primary_key=True
+    )
+    author_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False
+    )
+    created_at: Mapped[datetime] = mapped_column(nullable=False)
+
+    __table_args__ = (
+        # Index for reading a timeline newest-first as a single range scan
+        sa.Index(
+            "ix_timelines_owner_id_created_at",
+            "owner_id",
+            sa.text("created_at DESC"),
+            sa.text("post_id DESC"),
+        ),
+        # Index for pruning an author's posts when the owner unfollows them
+        sa.Index("ix_timelines_owner_id_author_id", "owner_id", "author_id"),
+    )
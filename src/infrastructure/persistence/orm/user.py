@@ -1,6 +1,6 @@
 import uuid
 from datetime import datetime
-from sqlalchemy import UUID, Boolean, String, Text, func
+from sqlalchemy import UUID, Boolean, DateTime, Integer, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from src.domain.users.user import User as DomainUser
@@ -20,6 +20,16 @@ class SQLAlchemyUser(Base):
     avatar_url: Mapped[str | None] = mapped_column(String(512))
     bio: Mapped[str | None] = mapped_column(Text)
     is_public: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
+    # Denormalized counter maintained by the follow repository. It is deliberately
+    # not part of the domain entity so that merging a user never overwrites it.
+    follower_count: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+    token_version: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
+    # When token_version was last bumped; lets revocation lists load only recent changes
+    tokens_revoked_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), index=True)
     created_at: Mapped[datetime] = mapped_column(
         server_default=func.now(), nullable=False
     )
@@ -39,6 +49,7 @@ def user_to_domain(user: SQLAlchemyUser) -> DomainUser:
         avatar_url=user.avatar_url,
         bio=user.bio,
         is_public=user.is_public,
+        token_version=user.token_version,
     )
 
 
@@ -53,4 +64,6 @@ def user_to_orm(user: DomainUser) -> SQLAlchemyUser:
         avatar_url=user.avatar_url,
         bio=user.bio,
         is_public=user.is_public,
+        # token_version is left out on purpose: it only changes through
+        # increment_token_version, so saving a stale copy cannot undo a revocation
     )
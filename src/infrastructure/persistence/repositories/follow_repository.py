@@ -1,20 +1,24 @@
 from uuid import UUID
 
-from sqlalchemy import select, delete, exists
+from sqlalchemy import Select, select, delete, exists, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.application.common.pagination import Cursor, Page, build_page
 from src.application.follows.follow_repository import AbstractFollowRepository
 from src.domain.follows.entity import Follow as DomainFollow
+from src.domain.users.exceptions import UserNotFoundError
 from src.domain.users.user import User as DomainUser
-from src.infrastructure.persistence.orm.follow import (
-    SQLAlchemyFollow,
-    follow_to_domain,
-    follow_to_orm,
-)
+from src.infrastructure.persistence.orm.follow import SQLAlchemyFollow
 from src.infrastructure.persistence.orm.user import (
     SQLAlchemyUser,
     user_to_domain,
 )
+from src.infrastructure.persistence.unit_of_work import commit_or_defer
+
+# SQLSTATE of an insert referring to a row that does not exist
+FOREIGN_KEY_VIOLATION = "23503"
 
 
 class SQLAlchemyFollowRepository(AbstractFollowRepository):
@@ -25,40 +29,124 @@ class SQLAlchemyFollowRepository(AbstractFollowRepository):
     def __init__(self, session: AsyncSession) -> None:
         self._session = session
 
-    async def add(self, follow: DomainFollow) -> None:
-        orm_follow = follow_to_orm(follow)
-        self._session.add(orm_follow)
-        await self._session.commit()
+    async def follow_if_absent(self, follow: DomainFollow) -> int | None:
+        # One statement: the UPDATE only sees a row if the INSERT added one, so
+        # concurrent double taps add one follow and count it once.
+        inserted = (
+            insert(SQLAlchemyFollow)
+            .values(
+                follower_id=follow.follower_id,
+                followed_id=follow.followed_id,
+                created_at=follow.created_at,
+            )
+            .on_conflict_do_nothing()
+            .returning(SQLAlchemyFollow.followed_id)
+            .cte("inserted")
+        )
+        stmt = (
+            update(SQLAlchemyUser)
+            .where(SQLAlchemyUser.id.in_(select(inserted.c.followed_id)))
+            .values(follower_count=SQLAlchemyUser.follower_count + 1)
+            .returning(SQLAlchemyUser.follower_count)
+        )
+        try:
+            result = await self._session.execute(stmt)
+        except IntegrityError as error:
+            if getattr(error.orig, "sqlstate", None) == FOREIGN_KEY_VIOLATION:
+                raise UserNotFoundError() from error
+            raise
+        follower_count = result.scalar_one_or_none()
+        await commit_or_defer(self._session)
+        return follower_count
 
-    async def remove(self, follower_id: UUID, followed_id: UUID) -> None:
-        stmt = delete(SQLAlchemyFollow).where(
-            SQLAlchemyFollow.follower_id == follower_id,
-            SQLAlchemyFollow.followed_id == followed_id,
+    async def unfollow_if_present(self, follower_id: UUID, followed_id: UUID) -> bool:
+        deleted = (
+            delete(SQLAlchemyFollow)
+            .where(
+                SQLAlchemyFollow.follower_id == follower_id,
+                SQLAlchemyFollow.followed_id == followed_id,
+            )
+            .returning(SQLAlchemyFollow.followed_id)
+            .cte("deleted")
+        )
+        stmt = (
+            update(SQLAlchemyUser)
+            .where(SQLAlchemyUser.id.in_(select(deleted.c.followed_id)))
+            .values(follower_count=SQLAlchemyUser.follower_count - 1)
+            .returning(SQLAlchemyUser.id)
         )
-        await self._session.execute(stmt)
-        await self._session.commit()
+        result = await self._session.execute(stmt)
+        removed = result.scalar_one_or_none() is not None
+        await commit_or_defer(self._session)
+        return removed
 
-    async def get_followers(self, user_id: UUID) -> list[DomainUser]:
+    async def get_followers(
+        self, user_id: UUID, limit: int, cursor: Cursor | None = None
+    ) -> Page[DomainUser]:
         # Join Follow -> User (where Follow.followed_id == user_id, select User who is follower)
         stmt = (
-            select(SQLAlchemyUser)
+            select(SQLAlchemyUser, SQLAlchemyFollow.created_at)
             .join(SQLAlchemyFollow, SQLAlchemyFollow.follower_id == SQLAlchemyUser.id)
             .where(SQLAlchemyFollow.followed_id == user_id)
+            .order_by(SQLAlchemyFollow.created_at.desc(), SQLAlchemyFollow.follower_id.desc())
+            .limit(limit + 1)
         )
-        result = await self._session.execute(stmt)
-        orm_users = result.scalars().all()
-        return [user_to_domain(u) for u in orm_users]
+        if cursor is not None:
+            stmt = stmt.where(
+                tuple_(SQLAlchemyFollow.created_at, SQLAlchemyFollow.follower_id)
+                < tuple_(cursor.created_at, cursor.id)
+            )
+        return await self._fetch_user_page(stmt, limit)
 
-    async def get_following(self, user_id: UUID) -> list[DomainUser]:
+    async def get_following(
+        self, user_id: UUID, limit: int, cursor: Cursor | None = None
+    ) -> Page[DomainUser]:
         # Join Follow -> User (where Follow.follower_id == user_id, select User who is followed)
         stmt = (
-            select(SQLAlchemyUser)
+            select(SQLAlchemyUser, SQLAlchemyFollow.created_at)
             .join(SQLAlchemyFollow, SQLAlchemyFollow.followed_id == SQLAlchemyUser.id)
             .where(SQLAlchemyFollow.follower_id == user_id)
+            .order_by(SQLAlchemyFollow.created_at.desc(), SQLAlchemyFollow.followed_id.desc())
+            .limit(limit + 1)
+        )
+        if cursor is not None:
+            stmt = stmt.where(
+                tuple_(SQLAlchemyFollow.created_at, SQLAlchemyFollow.followed_id)
+                < tuple_(cursor.created_at, cursor.id)
+            )
+        return await self._fetch_user_page(stmt, limit)
+
+    async def _fetch_user_page(self, stmt: Select, limit: int) -> Page[DomainUser]:
+        result = await self._session.execute(stmt)
+        # Rows are (user, follow created_at); the follow time is the cursor key
+        page = build_page(
+            result.all(),
+            limit,
+            lambda row: Cursor(created_at=row[1], id=row[0].id),
+        )
+        return Page(
+            items=[user_to_domain(orm_user) for orm_user, _ in page.items],
+            next_cursor=page.next_cursor,
+        )
+
+    async def count_followers(self, user_id: UUID) -> int:
+        stmt = select(SQLAlchemyUser.follower_count).where(SQLAlchemyUser.id == user_id)
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none() or 0
+
+    async def get_following_ids_with_min_followers(
+        self, user_id: UUID, min_followers: int
+    ) -> list[UUID]:
+        stmt = (
+            select(SQLAlchemyFollow.followed_id)
+            .join(SQLAlchemyUser, SQLAlchemyUser.id == SQLAlchemyFollow.followed_id)
+            .where(
+                SQLAlchemyFollow.follower_id == user_id,
+                SQLAlchemyUser.follower_count >= min_followers,
+            )
         )
         result = await self._session.execute(stmt)
-        orm_users = result.scalars().all()
-        return [user_to_domain(u) for u in orm_users]
+        return list(result.scalars().all())
 
     async def is_following(self, follower_id: UUID, followed_id: UUID) -> bool:
         stmt = select(
@@ -0,0 +1,131 @@
+from datetime import timedelta
+from uuid import UUID
+
+from sqlalchemy import and_, delete, func, or_, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.common.idempotency_repository import (
+    AbstractIdempotencyRepository,
+    IdempotencyRecord,
+)
+from src.infrastructure.persistence.orm.idempotency_key import SQLAlchemyIdempotencyKey
+from src.infrastructure.services.ttl_cache import TTLCache
+
+IdempotencyCache = TTLCache[tuple[UUID, str], IdempotencyRecord]
+
+
+class SQLAlchemyIdempotencyRepository(AbstractIdempotencyRepository):
+    """
+    Concrete implementation of the idempotency repository using SQLAlchemy.
+
+    Completed records never change, so the optional process-wide `cache` can
+    answer replays that reach the same worker without touching the database.
+    Reserving is a single INSERT ... ON CONFLICT DO NOTHING, so of two
+    concurrent requests with the same key exactly one gets to run.
+    """
+
+    def __init__(
+        self,
+        session: AsyncSession,
+        ttl: timedelta,
+        pending_timeout: timedelta,
+        cache: IdempotencyCache | None = None,
+    ) -> None:
+        self._session = session
+        self._ttl = ttl
+        self._pending_timeout = pending_timeout
+        self._cache = cache
+
+    async def reserve(self, user_id: UUID, key: str, request_hash: str) -> IdempotencyRecord | None:
+        if self._cache is not None:
+            cached = self._cache.get((user_id, key))
+            if cached is not None:
+                return cached
+
+        table = SQLAlchemyIdempotencyKey
+        stmt = (
+            insert(table)
+            .values(
+                user_id=user_id,
+                key=key,
+                request_hash=request_hash,
+                expires_at=func.now() + self._ttl,
+            )
+            .on_conflict_do_nothing()
+            .returning(table.key)
+        )
+        reserved = (await self._session.execute(stmt)).scalar_one_or_none() is not None
+
+        if not reserved:
+            # Expired keys not swept yet, and keys whose request died without releasing them
+            stmt = (
+                update(table)
+                .where(
+                    table.user_id == user_id,
+                    table.key == key,
+                    or_(
+                        table.expires_at <= func.now(),
+                        and_(
+                            table.status_code.is_(None),
+                            table.created_at <= func.now() - self._pending_timeout,
+                        ),
+                    ),
+                )
+                .values(
+                    request_hash=request_hash,
+                    status_code=None,
+                    response_body=None,
+                    created_at=func.now(),
+                    expires_at=func.now() + self._ttl,
+                )
+                .returning(table.key)
+            )
+            reserved = (await self._session.execute(stmt)).scalar_one_or_none() is not None
+
+        existing = None
+        if not reserved:
+            stmt = select(table).where(table.user_id == user_id, table.key == key)
+            row = (await self._session.execute(stmt)).scalar_one_or_none()
+            if row is None:
+                # Released by a concurrent request in the meantime; the client may retry
+                existing = IdempotencyRecord(request_hash=request_hash)
+            else:
+                existing = IdempotencyRecord(row.request_hash, row.status_code, row.response_body)
+        await self._session.commit()
+
+        if existing is not None and existing.is_complete and self._cache is not None:
+            self._cache.set((user_id, key), existing)
+        return existing
+
+    async def complete(self, user_id: UUID, key: str, record: IdempotencyRecord) -> None:
+        table = SQLAlchemyIdempotencyKey
+        stmt = (
+            update(table)
+            .where(table.user_id == user_id, table.key == key)
+            .values(status_code=record.status_code, response_body=record.body)
+        )
+        await self._session.execute(stmt)
+        await self._session.commit()
+        if self._cache is not None:
+            self._cache.set((user_id, key), record)
+
+    async def release(self, user_id: UUID, key: str) -> None:
+        # Whatever the failed request left uncommitted (possibly a failed transaction) goes first
+        await self._session.rollback()
+        table = SQLAlchemyIdempotencyKey
+        stmt = delete(table).where(
+            table.user_id == user_id, table.key == key, table.status_code.is_(None)
+        )
+        await self._session.execute(stmt)
+        await self._session.commit()
+
+    async def delete_expired(self, limit: int) -> int:
+        table = SQLAlchemyIdempotencyKey
+        expired = (
+            select(table.user_id, table.key).where(table.expires_at <= func.now()).limit(limit)
+        )
+        stmt = delete(table).where(tuple_(table.user_id, table.key).in_(expired))
+        result = await self._session.execute(stmt)
+        await self._session.commit()
+        return result.rowcount
@@ -0,0 +1,70 @@
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy import delete, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.common.media_blob_repository import AbstractMediaBlobRepository
+from src.infrastructure.persistence.orm.media_blob import SQLAlchemyMediaBlob
+from src.infrastructure.persistence.unit_of_work import commit_or_defer, run_after_commit
+
+
+class SQLAlchemyMediaBlobRepository(AbstractMediaBlobRepository):
+    """
+    Concrete implementation of the media blob repository using SQLAlchemy.
+    Every count change is a single atomic statement, so concurrent uploads and
+    deletions of the same blob never lose a reference.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def acquire(self, digest: str) -> str | None:
+        stmt = (
+            update(SQLAlchemyMediaBlob)
+            .where(SQLAlchemyMediaBlob.digest == digest)
+            .values(ref_count=SQLAlchemyMediaBlob.ref_count + 1)
+            .returning(SQLAlchemyMediaBlob.file_name)
+        )
+        result = await self._session.execute(stmt)
+        file_name = result.scalar_one_or_none()
+        await commit_or_defer(self._session)
+        return file_name
+
+    async def register(self, digest: str, file_name: str, size: int) -> str:
+        stmt = insert(SQLAlchemyMediaBlob).values(
+            digest=digest, file_name=file_name, size=size, ref_count=1
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[SQLAlchemyMediaBlob.digest],
+            set_={"ref_count": SQLAlchemyMediaBlob.ref_count + 1},
+        ).returning(SQLAlchemyMediaBlob.file_name)
+        result = await self._session.execute(stmt)
+        registered = result.scalar_one()
+        await commit_or_defer(self._session)
+        return registered
+
+    async def release(
+        self, digest: str, delete_file: Callable[[str], Awaitable[None]]
+    ) -> bool:
+        # The decrement locks the row until commit, so a concurrent acquire
+        # waits, then finds no row and stores the blob again under a new file
+        # name. The file is deleted only once the row's removal is committed:
+        # a rollback leaves both in place.
+        stmt = (
+            update(SQLAlchemyMediaBlob)
+            .where(SQLAlchemyMediaBlob.digest == digest)
+            .values(ref_count=SQLAlchemyMediaBlob.ref_count - 1)
+            .returning(SQLAlchemyMediaBlob.ref_count, SQLAlchemyMediaBlob.file_name)
+        )
+        row = (await self._session.execute(stmt)).one_or_none()
+        if row is None or row.ref_count > 0:
+            await commit_or_defer(self._session)
+            return False
+
+        await self._session.execute(
+            delete(SQLAlchemyMediaBlob).where(SQLAlchemyMediaBlob.digest == digest)
+        )
+        await commit_or_defer(self._session)
+        await run_after_commit(self._session, lambda: delete_file(row.file_name))
+        return True
@@ -0,0 +1,51 @@
+from datetime import timedelta
+
+from sqlalchemy import delete, func, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.common.media_deletion_queue import AbstractMediaDeletionQueue, MediaDeletion
+from src.infrastructure.persistence.orm.media_deletion import SQLAlchemyMediaDeletion
+from src.infrastructure.persistence.unit_of_work import commit_or_defer
+
+
+class SQLAlchemyMediaDeletionQueue(AbstractMediaDeletionQueue):
+    """
+    Concrete implementation of the media deletion queue using SQLAlchemy.
+    Claiming takes row locks with SKIP LOCKED and stamps a lease on the rows in
+    one statement, so concurrent reapers neither block nor share entries.
+    """
+
+    def __init__(self, session: AsyncSession, lease: timedelta) -> None:
+        self._session = session
+        self._lease = lease
+
+    async def claim(self, limit: int) -> list[MediaDeletion]:
+        table = SQLAlchemyMediaDeletion
+        claimable = (
+            select(table.id)
+            .where(or_(table.claimed_until.is_(None), table.claimed_until <= func.now()))
+            .order_by(table.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        stmt = (
+            update(table)
+            .where(table.id.in_(claimable))
+            .values(claimed_until=func.now() + self._lease, attempts=table.attempts + 1)
+            .returning(table.id, table.url)
+        )
+        rows = (await self._session.execute(stmt)).all()
+        await self._session.commit()
+        return [MediaDeletion(id=row.id, url=row.url) for row in sorted(rows)]
+
+    async def complete(self, ids: list[int]) -> list[int]:
+        # The DELETE locks the rows until commit, so a concurrent reaper
+        # completing the same entry waits, then finds it gone
+        stmt = (
+            delete(SQLAlchemyMediaDeletion)
+            .where(SQLAlchemyMediaDeletion.id.in_(ids))
+            .returning(SQLAlchemyMediaDeletion.id)
+        )
+        removed = list((await self._session.execute(stmt)).scalars())
+        await commit_or_defer(self._session)
+        return removed
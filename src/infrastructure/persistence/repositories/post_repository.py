@@ -1,15 +1,18 @@
 from uuid import UUID
 
-from sqlalchemy import select, delete
+from sqlalchemy import insert, select, delete, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.application.common.pagination import Cursor, Page, build_page, post_cursor
 from src.application.posts.post_repository import AbstractPostRepository
 from src.domain.posts.entity import Post as DomainPost
+from src.infrastructure.persistence.orm.media_deletion import SQLAlchemyMediaDeletion
 from src.infrastructure.persistence.orm.post import (
     SQLAlchemyPost,
     post_to_domain,
     post_to_orm,
 )
+from src.infrastructure.persistence.unit_of_work import commit_or_defer
 
 
 class SQLAlchemyPostRepository(AbstractPostRepository):
@@ -23,7 +26,7 @@ class SQLAlchemyPostRepository(AbstractPostRepository):
     async def add(self, post: DomainPost) -> None:
         orm_post = post_to_orm(post)
         self._session.add(orm_post)
-        await self._session.commit()
+        await commit_or_defer(self._session)
 
     async def get_by_id(self, post_id: UUID) -> DomainPost | None:
         stmt = select(SQLAlchemyPost).where(SQLAlchemyPost.id == post_id)
@@ -31,24 +34,56 @@ class SQLAlchemyPostRepository(AbstractPostRepository):
         orm_post = result.scalar_one_or_none()
         return post_to_domain(orm_post) if orm_post else None
 
-    async def list_by_user(self, user_id: UUID) -> list[DomainPost]:
+    async def list_by_user(
+        self, user_id: UUID, limit: int, cursor: Cursor | None = None
+    ) -> Page[DomainPost]:
+        # Keyset pagination served by ix_posts_user_id_created_at_id: every page
+        # is a range scan starting at the cursor, however deep it is.
         stmt = (
             select(SQLAlchemyPost)
             .where(SQLAlchemyPost.user_id == user_id)
-            .order_by(SQLAlchemyPost.created_at.desc())
+            .order_by(SQLAlchemyPost.created_at.desc(), SQLAlchemyPost.id.desc())
+            .limit(limit + 1)
         )
+        if cursor is not None:
+            stmt = stmt.where(
+                tuple_(SQLAlchemyPost.created_at, SQLAlchemyPost.id)
+                < tuple_(cursor.created_at, cursor.id)
+            )
         result = await self._session.execute(stmt)
-        orm_posts = result.scalars().all()
-        return [post_to_domain(p) for p in orm_posts]
+        posts = [post_to_domain(p) for p in result.scalars().all()]
+        return build_page(posts, limit, post_cursor)
 
     async def delete(self, post: DomainPost) -> None:
-        # We can delete by ID directly to avoid attaching the object if not needed,
-        # but typically we delete the object itself.
-        # Here, we delete based on ID to be safe.
-        stmt = delete(SQLAlchemyPost).where(SQLAlchemyPost.id == post.id)
-        await self._session.execute(stmt)
-        await self._session.commit()
+        # The stored URLs come from the deleted row, not the caller's copy,
+        # which may predate the variants. Timeline entries go with the row (ON
+        # DELETE CASCADE); the files are queued in the same transaction.
+        stmt = (
+            delete(SQLAlchemyPost)
+            .where(SQLAlchemyPost.id == post.id)
+            .returning(SQLAlchemyPost.image_url, SQLAlchemyPost.variants)
+        )
+        row = (await self._session.execute(stmt)).one_or_none()
+        if row is not None:
+            urls = dict.fromkeys([row.image_url, *row.variants.values()])
+            await self._session.execute(
+                insert(SQLAlchemyMediaDeletion), [{"url": url} for url in urls]
+            )
+        await commit_or_defer(self._session)
 
     async def save(self, post: DomainPost) -> None:
-        await self._session.merge(post_to_orm(post))
-        await self._session.commit()
+        # An UPDATE rather than a merge, so a background task finishing after
+        # the post was deleted cannot bring it back
+        stmt = (
+            update(SQLAlchemyPost)
+            .where(SQLAlchemyPost.id == post.id)
+            .values(
+                image_url=post.image_url,
+                caption=post.caption,
+                variants=dict(post.variants),
+                media_status=post.media_status.value,
+            )
+        )
+        await self._session.execute(stmt)
+        await commit_or_defer(self._session)
+
@@ -0,0 +1,71 @@
+from uuid import UUID
+
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.users.refresh_token_repository import AbstractRefreshTokenRepository
+from src.domain.users.refresh_token import RefreshToken as DomainRefreshToken
+from src.infrastructure.persistence.orm.refresh_token import (
+    SQLAlchemyRefreshToken,
+    refresh_token_to_domain,
+    refresh_token_to_orm,
+)
+from src.infrastructure.persistence.unit_of_work import commit_or_defer
+
+
+class SQLAlchemyRefreshTokenRepository(AbstractRefreshTokenRepository):
+    """
+    Concrete implementation of the refresh token repository using SQLAlchemy.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def add(self, token: DomainRefreshToken) -> None:
+        self._session.add(refresh_token_to_orm(token))
+        await commit_or_defer(self._session)
+
+    async def get_by_hash(self, token_hash: str) -> DomainRefreshToken | None:
+        stmt = select(SQLAlchemyRefreshToken).where(
+            SQLAlchemyRefreshToken.token_hash == token_hash
+        )
+        result = await self._session.execute(stmt)
+        orm_token = result.scalar_one_or_none()
+        return refresh_token_to_domain(orm_token) if orm_token else None
+
+    async def mark_used(self, token_hash: str) -> DomainRefreshToken | None:
+        # A single UPDATE ... RETURNING: the row lock makes a concurrent second
+        # use of the same token see used_at already set and match nothing.
+        stmt = (
+            update(SQLAlchemyRefreshToken)
+            .where(
+                SQLAlchemyRefreshToken.token_hash == token_hash,
+                SQLAlchemyRefreshToken.used_at.is_(None),
+            )
+            .values(used_at=func.now())
+            .returning(SQLAlchemyRefreshToken)
+        )
+        result = await self._session.execute(stmt)
+        orm_token = result.scalar_one_or_none()
+        await commit_or_defer(self._session)
+        return refresh_token_to_domain(orm_token) if orm_token else None
+
+    async def revoke_family(self, family_id: UUID) -> None:
+        stmt = delete(SQLAlchemyRefreshToken).where(
+            SQLAlchemyRefreshToken.family_id == family_id
+        )
+        await self._session.execute(stmt)
+        await commit_or_defer(self._session)
+
+    async def revoke_all_for_user(self, user_id: UUID) -> None:
+        stmt = delete(SQLAlchemyRefreshToken).where(SQLAlchemyRefreshToken.user_id == user_id)
+        await self._session.execute(stmt)
+        await commit_or_defer(self._session)
+
+    async def delete_expired_for_user(self, user_id: UUID) -> None:
+        stmt = delete(SQLAlchemyRefreshToken).where(
+            SQLAlchemyRefreshToken.user_id == user_id,
+            SQLAlchemyRefreshToken.expires_at <= func.now(),
+        )
+        await self._session.execute(stmt)
+        await commit_or_defer(self._session)
@@ -0,0 +1,89 @@
+from uuid import UUID
+
+from sqlalchemy import delete, literal, select, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.application.common.pagination import Cursor, Page, build_page, post_cursor
+from src.application.feeds.timeline_repository import AbstractTimelineRepository
+from src.domain.posts.entity import Post as DomainPost
+from src.infrastructure.persistence.orm.post import SQLAlchemyPost, post_to_domain
+from src.infrastructure.persistence.orm.timeline import SQLAlchemyTimelineEntry
+from src.infrastructure.persistence.unit_of_work import commit_or_defer
+
+# Rows per INSERT statement when fanning a post out to many timelines
+FANOUT_BATCH_SIZE = 1000
+
+
+class SQLAlchemyTimelineRepository(AbstractTimelineRepository):
+    """
+    Concrete implementation of the timeline repository using SQLAlchemy.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def push(self, post: DomainPost, owner_ids: list[UUID]) -> None:
+        for start in range(0, len(owner_ids), FANOUT_BATCH_SIZE):
+            rows = [
+                {
+                    "owner_id": owner_id,
+                    "post_id": post.id,
+                    "author_id": post.user_id,
+                    "created_at": post.created_at,
+                }
+                for owner_id in owner_ids[start:start + FANOUT_BATCH_SIZE]
+            ]
+            stmt = insert(SQLAlchemyTimelineEntry).values(rows).on_conflict_do_nothing()
+            await self._session.execute(stmt)
+        await commit_or_defer(self._session)
+
+    async def backfill(self, owner_id: UUID, author_id: UUID, limit: int) -> None:
+        recent_posts = (
+            select(
+                literal(owner_id),
+                SQLAlchemyPost.id,
+                SQLAlchemyPost.user_id,
+                SQLAlchemyPost.created_at,
+            )
+            .where(SQLAlchemyPost.user_id == author_id)
+            .order_by(SQLAlchemyPost.created_at.desc(), SQLAlchemyPost.id.desc())
+            .limit(limit)
+        )
+        stmt = (
+            insert(SQLAlchemyTimelineEntry)
+            .from_select(["owner_id", "post_id", "author_id", "created_at"], recent_posts)
+            .on_conflict_do_nothing()
+        )
+        await self._session.execute(stmt)
+        await commit_or_defer(self._session)
+
+    async def prune(self, owner_id: UUID, author_id: UUID) -> None:
+        stmt = delete(SQLAlchemyTimelineEntry).where(
+            SQLAlchemyTimelineEntry.owner_id == owner_id,
+            SQLAlchemyTimelineEntry.author_id == author_id,
+        )
+        await self._session.execute(stmt)
+        await commit_or_defer(self._session)
+
+    async def get_timeline(
+        self, owner_id: UUID, limit: int, cursor: Cursor | None = None
+    ) -> Page[DomainPost]:
+        stmt = (
+            select(SQLAlchemyPost)
+            .join(SQLAlchemyTimelineEntry, SQLAlchemyTimelineEntry.post_id == SQLAlchemyPost.id)
+            .where(SQLAlchemyTimelineEntry.owner_id == owner_id)
+            .order_by(
+                SQLAlchemyTimelineEntry.created_at.desc(),
+                SQLAlchemyTimelineEntry.post_id.desc(),
+            )
+            .limit(limit + 1)
+        )
+        if cursor is not None:
+            stmt = stmt.where(
+                tuple_(SQLAlchemyTimelineEntry.created_at, SQLAlchemyTimelineEntry.post_id)
+                < tuple_(cursor.created_at, cursor.id)
+            )
+        result = await self._session.execute(stmt)
+        posts = [post_to_domain(p) for p in result.scalars().all()]
+        return build_page(posts, limit, post_cursor)
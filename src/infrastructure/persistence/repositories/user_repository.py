@@ -1,6 +1,8 @@
+from dataclasses import replace
+from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import event, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.application.users.user_repository import AbstractUserRepository
@@ -10,26 +12,53 @@ from src.infrastructure.persistence.orm.user import (
     user_to_domain,
     user_to_orm,
 )
+from src.infrastructure.persistence.unit_of_work import commit_or_defer, in_unit_of_work
+from src.infrastructure.services.ttl_cache import TTLCache
 
 
 class SQLAlchemyUserRepository(AbstractUserRepository):
     """
     Concrete implementation of the user repository using SQLAlchemy.
+
+    `get_by_id` is served from two cache levels: the repository instance
+    (one per request) remembers the users it already loaded, and the optional
+    process-wide `cache` is shared across requests. The shared cache only holds
+    copies, so callers mutating a returned user cannot corrupt it. Writes go
+    through `add`/`save`, which invalidate the shared entry.
     """
 
-    def __init__(self, session: AsyncSession) -> None:
+    def __init__(
+        self, session: AsyncSession, cache: TTLCache[UUID, DomainUser] | None = None
+    ) -> None:
         self._session = session
+        self._cache = cache
+        self._loaded: dict[UUID, DomainUser] = {}
 
     async def add(self, user: DomainUser) -> None:
         orm_user = user_to_orm(user)
         self._session.add(orm_user)
-        await self._session.commit()
+        await self._commit(user.id)
 
     async def get_by_id(self, user_id: UUID) -> DomainUser | None:
+        if user_id in self._loaded:
+            return self._loaded[user_id]
+        if self._cache is not None:
+            cached = self._cache.get(user_id)
+            if cached is not None:
+                user = replace(cached)
+                self._loaded[user_id] = user
+                return user
+
         stmt = select(SQLAlchemyUser).where(SQLAlchemyUser.id == user_id)
         result = await self._session.execute(stmt)
         orm_user = result.scalar_one_or_none()
-        return user_to_domain(orm_user) if orm_user else None
+        if orm_user is None:
+            return None
+        user = user_to_domain(orm_user)
+        self._loaded[user_id] = user
+        if self._cache is not None:
+            self._cache.set(user_id, replace(user))
+        return user
 
     async def get_by_username(self, username: str) -> DomainUser | None:
         stmt = select(SQLAlchemyUser).where(SQLAlchemyUser.username == username)
@@ -47,4 +76,45 @@ class SQLAlchemyUserRepository(AbstractUserRepository):
         # The session tracks changes on attached objects, so a flush is enough.
         # Merging ensures the object is attached to the session.
         await self._session.merge(user_to_orm(user))
-        await self._session.commit()
+        await self._commit(user.id)
+
+    async def increment_token_version(self, user_id: UUID) -> int | None:
+        stmt = (
+            update(SQLAlchemyUser)
+            .where(SQLAlchemyUser.id == user_id)
+            .values(
+                token_version=SQLAlchemyUser.token_version + 1,
+                tokens_revoked_at=func.now(),
+            )
+            .returning(SQLAlchemyUser.token_version)
+        )
+        result = await self._session.execute(stmt)
+        token_version = result.scalar_one_or_none()
+        await self._commit(user_id)
+        return token_version
+
+    async def get_token_versions_changed_since(self, since: datetime) -> dict[UUID, int]:
+        stmt = select(SQLAlchemyUser.id, SQLAlchemyUser.token_version).where(
+            SQLAlchemyUser.tokens_revoked_at > since
+        )
+        result = await self._session.execute(stmt)
+        return {user_id: token_version for user_id, token_version in result.all()}
+
+    async def _commit(self, user_id: UUID) -> None:
+        await commit_or_defer(self._session)
+        self._invalidate(user_id)
+        if in_unit_of_work(self._session):
+            # Once more when the unit of work commits: until then, other
+            # requests still read the old row and may cache it again
+            event.listen(
+                self._session.sync_session,
+                "after_commit",
+                lambda _: self._invalidate(user_id),
+                once=True,
+            )
+
+    def _invalidate(self, user_id: UUID) -> None:
+        # Other worker processes keep their copy until it expires (USER_CACHE_TTL_SECONDS)
+        self._loaded.pop(user_id, None)
+        if self._cache is not None:
+            self._cache.invalidate(user_id)
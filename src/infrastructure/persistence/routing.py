@@ -0,0 +1,175 @@
+import asyncio
+import itertools
+import logging
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass
+from uuid import UUID
+
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine, AsyncSession, async_sessionmaker
+
+from src.infrastructure.services.ttl_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+# How far behind the primary a streaming replica is. A replica whose WAL receiver
+# is streaming and that has replayed everything it received counts as current
+# even if the primary has been idle. With the receiver disconnected (or its status
+# hidden: reading it needs pg_read_all_stats), having replayed everything says
+# nothing, so the lag is the age of the last replayed transaction, infinite if
+# there is none. A server that is not a replica at all (e.g. the primary) has no lag.
+_POSTGRES_LAG = text(
+    """
+    SELECT CASE
+        WHEN NOT pg_is_in_recovery() THEN 0
+        WHEN NOT EXISTS (SELECT 1 FROM pg_stat_wal_receiver WHERE status = 'streaming')
+            THEN COALESCE(
+                EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())::float8,
+                'Infinity'::float8
+            )
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp())::float8, 0)
+    END
+    """
+)
+
+
+async def measure_lag(connection: AsyncConnection) -> float:
+    """Replication lag in seconds; databases without replication (SQLite files) have none."""
+    if connection.dialect.name != "postgresql":
+        await connection.execute(text("SELECT 1"))
+        return 0.0
+    return float((await connection.execute(_POSTGRES_LAG)).scalar_one())
+
+
+@dataclass
+class Replica:
+    name: str
+    engine: AsyncEngine
+    sessionmaker: async_sessionmaker[AsyncSession]
+    # Last measured lag in seconds; None until measured, or while unreachable
+    lag_seconds: float | None = None
+    next_check: float = 0.0
+
+
+class SessionRouter:
+    """
+    Hands out sessions on the primary for writes and on a replica for reads.
+
+    Reads go to the replicas in turn, skipping any whose lag is over
+    `max_lag_seconds` or which could not be reached; without a usable
+    replica they go to the primary. Each replica's lag is measured at most
+    every `lag_check_interval` seconds, in the background, so a slow or
+    unreachable replica never holds up a read; reads use the last result.
+
+    Once a user's primary session commits, that user's reads stay on the
+    primary for `sticky_seconds`, so they see their own writes. This is
+    remembered per process: a read served by another worker within the
+    window may still be up to `max_lag_seconds` behind.
+    """
+
+    def __init__(
+        self,
+        primary: async_sessionmaker[AsyncSession],
+        replicas: Sequence[Replica],
+        recent_writers: TTLCache[UUID, bool],
+        sticky_seconds: float,
+        max_lag_seconds: float,
+        lag_check_interval: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._primary = primary
+        self._replicas = list(replicas)
+        self._recent_writers = recent_writers
+        self._sticky_seconds = sticky_seconds
+        self._max_lag_seconds = max_lag_seconds
+        self._lag_check_interval = lag_check_interval
+        self._clock = clock
+        self._turn = itertools.count()
+        self._checks: set[asyncio.Task[None]] = set()
+
+    @property
+    def has_replicas(self) -> bool:
+        return bool(self._replicas)
+
+    @property
+    def replicas(self) -> list[Replica]:
+        return list(self._replicas)
+
+    def primary(self, user_id: UUID | None = None) -> AsyncSession:
+        """A session on the primary; once it commits, `user_id` reads from the primary a while."""
+        session = self._primary()
+        if user_id is not None and self._replicas:
+            event.listen(
+                session.sync_session, "after_commit", lambda _: self.mark_written(user_id)
+            )
+        return session
+
+    def mark_written(self, user_id: UUID) -> None:
+        self._recent_writers.set(user_id, True, self._sticky_seconds)
+
+    def read(self, user_id: UUID | None = None) -> AsyncSession | None:
+        """A session on a current replica, or None if the read should use the primary."""
+        if user_id is not None and self._recent_writers.get(user_id):
+            return None
+        replica = self._pick_replica()
+        if replica is None:
+            return None
+        return replica.sessionmaker()
+
+    async def check_replicas(self) -> None:
+        """Measures every replica's lag now, e.g. so reads can use them from the first request."""
+        for replica in self._replicas:
+            replica.next_check = self._clock() + self._lag_check_interval
+        await asyncio.gather(*(self._check_lag(replica) for replica in self._replicas))
+
+    def _pick_replica(self) -> Replica | None:
+        if not self._replicas:
+            return None
+        start = next(self._turn)
+        for offset in range(len(self._replicas)):
+            replica = self._replicas[(start + offset) % len(self._replicas)]
+            if self._clock() >= replica.next_check:
+                replica.next_check = self._clock() + self._lag_check_interval
+                task = asyncio.create_task(self._check_lag(replica))
+                self._checks.add(task)
+                task.add_done_callback(self._checks.discard)
+            if self._usable(replica):
+                return replica
+        return None
+
+    async def _check_lag(self, replica: Replica) -> None:
+        was_usable = self._usable(replica)
+        try:
+            replica.lag_seconds = await asyncio.wait_for(
+                self._measure(replica), self._lag_check_interval
+            )
+        except Exception:
+            replica.lag_seconds = None
+
+        # Log changes only, not every check
+        if was_usable and replica.lag_seconds is None:
+            logger.warning("Replica %s is unreachable; reading from the primary", replica.name)
+        elif was_usable and not self._usable(replica):
+            logger.warning(
+                "Replica %s is %.1f s behind; reading from the primary",
+                replica.name,
+                replica.lag_seconds,
+            )
+        elif not was_usable and self._usable(replica):
+            logger.info("Reading from replica %s", replica.name)
+
+    @staticmethod
+    async def _measure(replica: Replica) -> float:
+        async with replica.engine.connect() as connection:
+            return await measure_lag(connection)
+
+    def _usable(self, replica: Replica) -> bool:
+        return replica.lag_seconds is not None and replica.lag_seconds <= self._max_lag_seconds
+
+    async def dispose(self) -> None:
+        for task in self._checks:
+            task.cancel()
+        for replica in self._replicas:
+            await replica.engine.dispose()
@@ -0,0 +1,93 @@
+import logging
+from collections.abc import Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession, AsyncSessionTransaction
+
+from src.application.common.unit_of_work import AbstractUnitOfWork
+
+logger = logging.getLogger(__name__)
+
+# Units of work open on a session, kept in `session.info` so that every
+# repository using the session can tell, whichever unit opened it
+_DEPTH = "unit_of_work_depth"
+# Callbacks waiting for the outermost unit on the session to commit
+_AFTER_COMMIT = "unit_of_work_after_commit"
+
+
+def in_unit_of_work(session: AsyncSession) -> bool:
+    return session.info.get(_DEPTH, 0) > 0
+
+
+async def commit_or_defer(session: AsyncSession) -> None:
+    """
+    Ends a repository write: commits it, unless a unit of work is open on the
+    session, which commits later. The write is still flushed then, so
+    constraint violations are raised by the call that caused them.
+    """
+    if in_unit_of_work(session):
+        await session.flush()
+    else:
+        await session.commit()
+
+
+async def run_after_commit(session: AsyncSession, callback: Callable[[], Awaitable[None]]) -> None:
+    """
+    Runs `callback` once the session's writes are committed: right away when
+    no unit of work is open, since `commit_or_defer` has committed already,
+    otherwise after the outermost unit commits. It is dropped if the unit, or
+    the savepoint it was registered in, rolls back.
+    """
+    if in_unit_of_work(session):
+        session.info.setdefault(_AFTER_COMMIT, []).append(callback)
+    else:
+        await callback()
+
+
+class SQLAlchemyUnitOfWork(AbstractUnitOfWork):
+    """
+    Unit of work over the request's session. The outermost unit uses the
+    session's own transaction, which begins with its first statement; nested
+    units use SAVEPOINTs.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+        # One entry per open unit, innermost last: its savepoint (None for the
+        # outermost) and how many after-commit callbacks were pending before it
+        self._savepoints: list[tuple[AsyncSessionTransaction | None, int]] = []
+
+    async def begin(self) -> None:
+        depth = self._session.info.get(_DEPTH, 0)
+        savepoint = await self._session.begin_nested() if depth else None
+        self._savepoints.append((savepoint, len(self._after_commit())))
+        self._session.info[_DEPTH] = depth + 1
+
+    async def commit(self) -> None:
+        savepoint, _ = self._leave()
+        if savepoint is not None:
+            await savepoint.commit()
+            return
+        callbacks = self._session.info.pop(_AFTER_COMMIT, [])
+        await self._session.commit()
+        for callback in callbacks:
+            try:
+                await callback()
+            except Exception:
+                # The writes are committed; what the callback left behind is
+                # for the reconciliation jobs to clean up
+                logger.exception("After-commit callback failed")
+
+    async def rollback(self) -> None:
+        savepoint, pending = self._leave()
+        del self._after_commit()[pending:]
+        if savepoint is None:
+            await self._session.rollback()
+        elif savepoint.is_active:
+            await savepoint.rollback()
+
+    def _after_commit(self) -> list[Callable[[], Awaitable[None]]]:
+        return self._session.info.get(_AFTER_COMMIT, [])
+
+    def _leave(self) -> tuple[AsyncSessionTransaction | None, int]:
+        self._session.info[_DEPTH] -= 1
+        return self._savepoints.pop()
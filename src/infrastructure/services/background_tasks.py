@@ -0,0 +1,22 @@
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from starlette.background import BackgroundTasks
+
+from src.application.common.task_scheduler import AbstractTaskScheduler
+
+
+class StarletteTaskScheduler(AbstractTaskScheduler):
+    """
+    Concrete implementation of the task scheduler on top of Starlette's
+    per-request BackgroundTasks. Tasks run once the response has been sent,
+    while request-scoped dependencies (such as the DB session) are still open:
+    FastAPI only closes yield dependencies after background tasks from 0.118 on,
+    which is why that is the lowest version allowed.
+    """
+
+    def __init__(self, background_tasks: BackgroundTasks) -> None:
+        self._background_tasks = background_tasks
+
+    def schedule(self, func: Callable[..., Awaitable[None]], *args: Any) -> None:
+        self._background_tasks.add_task(func, *args)
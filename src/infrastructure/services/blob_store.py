@@ -0,0 +1,117 @@
+import asyncio
+import hashlib
+import os
+import re
+import uuid
+from collections.abc import AsyncIterable
+from pathlib import Path
+
+from src.application.common.media_blob_repository import AbstractMediaBlobRepository
+from src.infrastructure.services.file_writer import write_stream
+from src.infrastructure.services.image_transform import UploadImageTransformer
+from src.infrastructure.services.sharding import relative_media_path, shard_dir, sharded_name
+
+BLOBS_PATH = "uploads/blobs"
+BLOBS_URL = "/static/blobs"
+
+_BLOB_NAME = re.compile(r"^([0-9a-f]{64})(-[0-9a-f]+)?(\.[A-Za-z0-9]+)?$")
+_EXTENSION = re.compile(r"^\.[A-Za-z0-9]{1,10}$")
+
+
+def _hash_file(path: Path) -> tuple[str, int]:
+    digest = hashlib.sha256()
+    size = 0
+    with path.open("rb") as file:
+        while chunk := file.read(1024 * 1024):
+            digest.update(chunk)
+            size += len(chunk)
+    return digest.hexdigest(), size
+
+
+def file_extension(file_name: str) -> str:
+    """The lower-cased extension of a client-supplied file name, or "" if it looks odd."""
+    extension = Path(file_name).suffix.lower()
+    return extension if _EXTENSION.match(extension) else ""
+
+
+def create_blob_directory(base_path: str = BLOBS_PATH) -> None:
+    """Creates the store's root, where uploads are written before they are hashed."""
+    Path(base_path).mkdir(parents=True, exist_ok=True)
+
+
+class ContentAddressedBlobStore:
+    """
+    Stores each distinct upload once, named after the SHA-256 digest of the
+    bytes received, with a reference count per blob. `base_path` must exist
+    (see `create_blob_directory`). Files are fanned out
+    into directories by the leading characters of the digest. Each stored file
+    also gets a random suffix, so a blob stored again after its last release
+    never shares a path with the file still waiting to be deleted.
+
+    The digest is computed while the upload streams to disk. Uploading bytes
+    that are already stored only adds a reference (and skips re-encoding). The
+    content behind a URL never changes, so responses can be cached immutably.
+    """
+
+    def __init__(
+        self,
+        blob_repo: AbstractMediaBlobRepository,
+        base_path: str = BLOBS_PATH,
+        base_url: str = BLOBS_URL,
+        transformer: UploadImageTransformer | None = None,
+    ) -> None:
+        self._blob_repo = blob_repo
+        self._base_path = Path(base_path)
+        self._base_url = base_url
+        self._transformer = transformer
+
+    async def put(self, stream: AsyncIterable[bytes], extension: str, max_bytes: int) -> str:
+        """Stores the stream (or references the identical stored blob) and returns its URL."""
+        digest = hashlib.sha256()
+        upload_path = self._upload_path()
+        size = await write_stream(stream, upload_path, max_bytes, digest=digest)
+        return await self._store(upload_path, digest.hexdigest(), size, extension)
+
+    async def adopt(self, path: Path, extension: str) -> str:
+        """
+        Like `put`, for a file that is already on disk (on the same file
+        system); the file is moved into the store or removed.
+        """
+        upload_path = self._upload_path()
+        await asyncio.to_thread(os.replace, path, upload_path)
+        hex_digest, size = await asyncio.to_thread(_hash_file, upload_path)
+        return await self._store(upload_path, hex_digest, size, extension)
+
+    def _upload_path(self) -> Path:
+        return self._base_path / f".{uuid.uuid4().hex}.upload"
+
+    async def _store(self, upload_path: Path, hex_digest: str, size: int, extension: str) -> str:
+        existing = await self._blob_repo.acquire(hex_digest)
+        if existing is not None:
+            upload_path.unlink(missing_ok=True)
+            return f"{self._base_url}/{sharded_name(existing)}"
+
+        directory = self._base_path / shard_dir(hex_digest)
+        directory.mkdir(parents=True, exist_ok=True)
+        stem = f"{hex_digest}-{uuid.uuid4().hex[:12]}"
+        if self._transformer is not None:
+            stored = await self._transformer.transform(upload_path, directory / stem, extension)
+        else:
+            stored = upload_path.rename(directory / f"{stem}{extension}")
+
+        file_name = await self._blob_repo.register(hex_digest, stored.name, size)
+        if file_name != stored.name:
+            stored.unlink(missing_ok=True)
+        return f"{self._base_url}/{sharded_name(file_name)}"
+
+    async def release(self, url: str) -> None:
+        """Drops one reference to the blob behind `url`; URLs not from this store are ignored."""
+        relative = relative_media_path(url, self._base_url)
+        match = _BLOB_NAME.match(relative.name) if relative is not None else None
+        if match is None:
+            return
+        await self._blob_repo.release(match.group(1), self._delete_file)
+
+    async def _delete_file(self, file_name: str) -> None:
+        path = self._base_path / shard_dir(file_name) / file_name
+        await asyncio.to_thread(path.unlink, missing_ok=True)
@@ -0,0 +1,74 @@
+import asyncio
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class ExecutorStats:
+    workers: int
+    max_pending: int
+    pending: int
+    rejected: int
+
+
+class BoundedExecutor:
+    """
+    Runs blocking calls on a thread pool without blocking the event loop.
+    With `use_processes`, a process pool is used instead, for pure-Python or
+    GIL-holding CPU work; functions and arguments must then be picklable.
+
+    At most `max_pending` calls may be running or queued at once. Beyond that,
+    `run` fails fast with `reject_with` instead of letting the queue (and every
+    caller's latency) grow without bound.
+
+    The pending counter is only touched from the event loop thread, so it needs
+    no lock.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_pending: int,
+        reject_with: type[Exception],
+        thread_name_prefix: str = "",
+        use_processes: bool = False,
+    ) -> None:
+        self._executor: Executor
+        if use_processes:
+            self._executor = ProcessPoolExecutor(max_workers=max_workers)
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix=thread_name_prefix
+            )
+        self._max_workers = max_workers
+        self._max_pending = max_pending
+        self._reject_with = reject_with
+        self._pending = 0
+        self._rejected = 0
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        if self._pending >= self._max_pending:
+            self._rejected += 1
+            raise self._reject_with()
+
+        self._pending += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self._pending -= 1
+
+    def stats(self) -> ExecutorStats:
+        return ExecutorStats(
+            workers=self._max_workers,
+            max_pending=self._max_pending,
+            pending=self._pending,
+            rejected=self._rejected,
+        )
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,208 @@
+import hashlib
+import hmac
+import re
+import time
+import uuid
+from collections.abc import AsyncIterable
+from datetime import datetime, timezone
+from pathlib import Path
+from urllib.parse import urlencode
+from uuid import UUID
+
+from src.application.common.exceptions import UploadNotFoundError, UploadTooLargeError
+from src.application.posts.direct_upload import AbstractDirectUploadStorage, UploadTarget
+from src.infrastructure.services.blob_store import ContentAddressedBlobStore, file_extension
+from src.infrastructure.services.file_writer import write_stream
+from src.infrastructure.services.object_storage import S3Client
+from src.infrastructure.settings import (
+    DIRECT_UPLOAD_EXPIRE_SECONDS,
+    POST_IMAGE_MAX_BYTES,
+    S3_PUBLIC_BASE_URL,
+    UPLOAD_SIGNING_KEY,
+)
+
+INCOMING_PATH = "uploads/incoming"
+GATEWAY_URL = "/api/v1/uploads"
+
+# "<user id>/<random hex><extension>"; the owner is part of the reference
+_UPLOAD_ID = re.compile(r"^([0-9a-f-]{36})/[0-9a-f]{32}(\.[a-z0-9]{1,10})?$")
+
+
+class InvalidUploadSignatureError(Exception):
+    """The upload URL was tampered with or has expired."""
+    pass
+
+
+def new_upload_id(user_id: UUID, file_name: str) -> str:
+    return f"{user_id}/{uuid.uuid4().hex}{file_extension(file_name)}"
+
+
+def owned_upload_id(user_id: UUID, upload_id: str) -> re.Match[str]:
+    match = _UPLOAD_ID.match(upload_id)
+    if match is None or match.group(1) != str(user_id):
+        raise UploadNotFoundError()
+    return match
+
+
+class LocalUploadGateway:
+    """
+    Stand-in for an object store's pre-signed URLs in development: issues
+    HMAC-signed, expiring URLs for the upload route and stores what is sent
+    to them under `incoming_path` until a post claims it.
+    """
+
+    def __init__(
+        self,
+        signing_key: str = UPLOAD_SIGNING_KEY,
+        base_url: str = GATEWAY_URL,
+        incoming_path: str = INCOMING_PATH,
+        expires_seconds: int = DIRECT_UPLOAD_EXPIRE_SECONDS,
+    ) -> None:
+        self._signing_key = signing_key.encode()
+        self._base_url = base_url
+        self._incoming_path = Path(incoming_path)
+        self._expires_seconds = expires_seconds
+
+    def issue(self, upload_id: str, size: int) -> UploadTarget:
+        expires = int(time.time()) + self._expires_seconds
+        query = urlencode(
+            {"size": size, "expires": expires, "signature": self._sign(upload_id, size, expires)}
+        )
+        return UploadTarget(
+            upload_id=upload_id,
+            url=f"{self._base_url}/{upload_id}?{query}",
+            method="PUT",
+            expires_at=datetime.fromtimestamp(expires, timezone.utc),
+        )
+
+    async def receive(
+        self, upload_id: str, size: int, expires: int, signature: str, stream: AsyncIterable[bytes]
+    ) -> None:
+        """
+        Stores the body of a PUT to a URL from `issue`.
+
+        Raises:
+            InvalidUploadSignatureError: If the URL is not one we issued or has expired.
+            UploadTooLargeError: If the body is longer than the signed size.
+        """
+        expected = self._sign(upload_id, size, expires)
+        if not hmac.compare_digest(expected, signature) or expires < time.time():
+            raise InvalidUploadSignatureError()
+        if _UPLOAD_ID.match(upload_id) is None:
+            raise InvalidUploadSignatureError()
+
+        path = self.path_of(upload_id)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        written = await write_stream(stream, path, max_bytes=size)
+        if written != size:
+            # Like a signed Content-Length: only the announced size is accepted
+            path.unlink(missing_ok=True)
+            raise InvalidUploadSignatureError()
+
+    @property
+    def incoming_path(self) -> Path:
+        return self._incoming_path
+
+    def path_of(self, upload_id: str) -> Path:
+        return self._incoming_path / upload_id
+
+    def _sign(self, upload_id: str, size: int, expires: int) -> str:
+        message = f"PUT\n{upload_id}\n{size}\n{expires}".encode()
+        return hmac.new(self._signing_key, message, hashlib.sha256).hexdigest()
+
+
+class LocalDirectUploadStorage(AbstractDirectUploadStorage):
+    """
+    Direct uploads through the local gateway; claimed uploads are moved into
+    the content-addressed blob store like any other post image.
+    """
+
+    def __init__(
+        self,
+        gateway: LocalUploadGateway,
+        blob_store: ContentAddressedBlobStore,
+        max_bytes: int = POST_IMAGE_MAX_BYTES,
+    ) -> None:
+        self._gateway = gateway
+        self._blob_store = blob_store
+        self._max_bytes = max_bytes
+
+    async def create_upload_target(self, user_id: UUID, file_name: str, size: int) -> UploadTarget:
+        if size > self._max_bytes:
+            raise UploadTooLargeError(self._max_bytes)
+        return self._gateway.issue(new_upload_id(user_id, file_name), size)
+
+    async def claim_upload(self, user_id: UUID, upload_id: str, post_id: UUID) -> str:
+        match = owned_upload_id(user_id, upload_id)
+        try:
+            return await self._blob_store.adopt(
+                self._gateway.path_of(upload_id), match.group(2) or ""
+            )
+        except FileNotFoundError:
+            # Never uploaded, or already claimed by a concurrent request
+            raise UploadNotFoundError()
+
+
+class S3DirectUploadStorage(AbstractDirectUploadStorage):
+    """
+    Direct uploads to an S3-compatible store through pre-signed PUT URLs.
+    Uploads land under "incoming/" (give that prefix a lifecycle rule to
+    expire unclaimed ones) and are copied server-side to "posts/" when claimed.
+
+    Claiming is several requests, so it is serialised by a conditional write
+    of a marker under "claims/" (which can expire like "incoming/"): only one
+    of two concurrent claims of an upload gets to copy it. The copy is also
+    conditional on the ETag whose size was checked, in case the upload was
+    replaced through its still valid URL in between.
+    """
+
+    def __init__(
+        self,
+        client: S3Client,
+        public_base_url: str = S3_PUBLIC_BASE_URL,
+        max_bytes: int = POST_IMAGE_MAX_BYTES,
+        expires_seconds: int = DIRECT_UPLOAD_EXPIRE_SECONDS,
+    ) -> None:
+        self._client = client
+        self._public_base_url = public_base_url.rstrip("/")
+        self._max_bytes = max_bytes
+        self._expires_seconds = expires_seconds
+
+    async def create_upload_target(self, user_id: UUID, file_name: str, size: int) -> UploadTarget:
+        if size > self._max_bytes:
+            raise UploadTooLargeError(self._max_bytes)
+        upload_id = new_upload_id(user_id, file_name)
+        return UploadTarget(
+            upload_id=upload_id,
+            url=self._client.presign_put(f"incoming/{upload_id}", size, self._expires_seconds),
+            method="PUT",
+            expires_at=datetime.fromtimestamp(
+                time.time() + self._expires_seconds, timezone.utc
+            ),
+            headers={"Content-Length": str(size)},
+        )
+
+    async def claim_upload(self, user_id: UUID, upload_id: str, post_id: UUID) -> str:
+        match = owned_upload_id(user_id, upload_id)
+        incoming_key = f"incoming/{upload_id}"
+        stat = await self._client.stat_object(incoming_key)
+        if stat is None:
+            raise UploadNotFoundError()
+        size, etag = stat
+        if size > self._max_bytes:
+            await self._client.delete_object(incoming_key)
+            raise UploadTooLargeError(self._max_bytes)
+
+        claim_key = f"claims/{upload_id}"
+        if not await self._client.create_object(claim_key, str(post_id).encode()):
+            # Claimed by another request
+            raise UploadNotFoundError()
+        key = f"posts/{post_id}{match.group(2) or ''}"
+        try:
+            await self._client.copy_object(incoming_key, key, if_match=etag)
+        except Exception:
+            # Nothing was copied, so the upload can be claimed again
+            await self._client.delete_object(claim_key)
+            raise
+        await self._client.delete_object(incoming_key)
+        return f"{self._public_base_url}/{key}"
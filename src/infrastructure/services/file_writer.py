@@ -0,0 +1,79 @@
+import fcntl
+import hashlib
+import os
+import uuid
+from collections.abc import AsyncIterable
+from pathlib import Path
+
+import aiofiles
+
+from src.application.common.exceptions import UploadOffsetMismatchError, UploadTooLargeError
+
+
+async def write_stream(
+    stream: AsyncIterable[bytes],
+    destination: Path,
+    max_bytes: int,
+    digest: "hashlib._Hash | None" = None,
+) -> int:
+    """
+    Writes a byte stream to `destination` one chunk at a time and returns its size.
+    If a `digest` is given, every chunk is also fed to it on the way through.
+
+    Memory use is one chunk regardless of the file size. The data goes to a
+    temporary file next to the destination that is renamed into place at the
+    end, so readers never see a partial file; if the stream exceeds `max_bytes`
+    (or fails) the temporary file is removed and nothing is written.
+    """
+    temp_path = destination.with_name(f".{destination.name}.{uuid.uuid4().hex}.part")
+    written = 0
+    try:
+        async with aiofiles.open(temp_path, "wb") as f:
+            async for chunk in stream:
+                written += len(chunk)
+                if written > max_bytes:
+                    raise UploadTooLargeError(max_bytes)
+                if digest is not None:
+                    digest.update(chunk)
+                await f.write(chunk)
+        os.replace(temp_path, destination)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+    return written
+
+
+async def append_stream(stream: AsyncIterable[bytes], path: Path, offset: int, max_bytes: int) -> int:
+    """
+    Appends a byte stream to the file at `path`, which must currently be
+    exactly `offset` bytes long, and returns the file's new size.
+
+    Unlike `write_stream`, whatever arrives is kept when the stream fails
+    halfway (a dropped connection), so the next append continues from there.
+    Only a stream longer than `max_bytes` is discarded as a whole: the file is
+    cut back to `offset`. An exclusive lock keeps concurrent appends from
+    interleaving; the one that does not get it is told the current size.
+    """
+    async with aiofiles.open(path, "r+b") as f:
+        try:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            raise UploadOffsetMismatchError(os.fstat(f.fileno()).st_size)
+        size = os.fstat(f.fileno()).st_size
+        if size != offset:
+            raise UploadOffsetMismatchError(size)
+
+        await f.seek(offset)
+        written = 0
+        try:
+            async for chunk in stream:
+                written += len(chunk)
+                if written > max_bytes:
+                    raise UploadTooLargeError(max_bytes)
+                await f.write(chunk)
+        except UploadTooLargeError:
+            await f.truncate(offset)
+            raise
+        finally:
+            await f.flush()
+        return offset + written
@@ -0,0 +1,26 @@
+from src.application.common.exceptions import ImageProcessorBusyError
+from src.infrastructure.services.bounded_executor import BoundedExecutor
+from src.infrastructure.settings import IMAGE_PROCESSOR_MAX_PENDING, IMAGE_PROCESSOR_WORKERS
+
+_image_executor: BoundedExecutor | None = None
+
+
+def get_image_executor() -> BoundedExecutor:
+    """Returns the process-wide pool shared by all image decoding and encoding work."""
+    global _image_executor
+    if _image_executor is None:
+        _image_executor = BoundedExecutor(
+            max_workers=IMAGE_PROCESSOR_WORKERS,
+            max_pending=IMAGE_PROCESSOR_MAX_PENDING,
+            reject_with=ImageProcessorBusyError,
+            use_processes=True,
+        )
+    return _image_executor
+
+
+def shutdown_image_executor() -> None:
+    """Waits for running image work and stops the worker processes, if they were started."""
+    global _image_executor
+    if _image_executor is not None:
+        _image_executor.shutdown()
+        _image_executor = None
@@ -0,0 +1,112 @@
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from uuid import UUID
+
+from PIL import Image, ImageOps
+
+from src.application.posts.image_processor import AbstractPostImageProcessor
+from src.infrastructure.services.blob_store import BLOBS_PATH, BLOBS_URL
+from src.infrastructure.services.bounded_executor import BoundedExecutor
+from src.infrastructure.services.image_pool import get_image_executor
+from src.infrastructure.services.post_storage import POST_IMAGES_PATH, POST_IMAGES_URL
+from src.infrastructure.services.sharding import relative_media_path, shard_dir
+
+
+@dataclass(frozen=True)
+class VariantSpec:
+    name: str
+    # Longest edge in pixels; for square variants, the side of the center crop
+    size: int
+    square: bool = False
+
+
+POST_IMAGE_VARIANTS = (
+    VariantSpec("thumbnail", 320, square=True),  # profile grid
+    VariantSpec("feed", 1080),
+)
+
+
+def render_variants(source_path: str, targets: list[tuple[VariantSpec, str]]) -> None:
+    """
+    Decodes the source image once and writes every variant as a JPEG.
+    Runs in a worker process, so it must stay a picklable module-level function.
+    """
+    with Image.open(source_path) as image:
+        # Let the JPEG decoder downscale while decoding; far cheaper than a full decode
+        largest = max(spec.size for spec, _ in targets)
+        image.draft("RGB", (largest, largest))
+        image = ImageOps.exif_transpose(image).convert("RGB")
+
+        for spec, target_path in targets:
+            if spec.square:
+                variant = ImageOps.fit(image, (spec.size, spec.size), Image.Resampling.LANCZOS)
+            else:
+                variant = image.copy()
+                variant.thumbnail((spec.size, spec.size), Image.Resampling.LANCZOS)
+
+            temp_path = f"{target_path}.part"
+            variant.save(temp_path, "JPEG", quality=85, optimize=True, progressive=True)
+            os.replace(temp_path, target_path)
+
+
+class PillowPostImageProcessor(AbstractPostImageProcessor):
+    """
+    Concrete implementation of the post image processor using Pillow.
+    Reads originals written by LocalPostImageStorage or the blob store and
+    writes the variants to `base_path`. Rendering runs on a bounded process pool.
+    """
+
+    def __init__(
+        self,
+        base_path: str = POST_IMAGES_PATH,
+        base_url: str = POST_IMAGES_URL,
+        executor: BoundedExecutor | None = None,
+        variants: tuple[VariantSpec, ...] = POST_IMAGE_VARIANTS,
+        source_roots: dict[str, str] | None = None,
+    ) -> None:
+        self._base_path = Path(base_path)
+        self._base_url = base_url
+        # URL prefix -> directory, for every place an original may be stored
+        self._source_roots = {
+            prefix: Path(path)
+            for prefix, path in (source_roots or {base_url: base_path, BLOBS_URL: BLOBS_PATH}).items()
+        }
+        self._executor = executor
+        self._variants = variants
+
+    async def create_variants(self, post_id: UUID, image_url: str) -> dict[str, str]:
+        source_path = self._resolve_source(image_url)
+        # Variants share the post's shard directory
+        directory = shard_dir(str(post_id))
+        file_names = {
+            spec.name: f"{directory}/{post_id}_{spec.name}.jpg" for spec in self._variants
+        }
+        targets = [
+            (spec, str(self._base_path / file_names[spec.name])) for spec in self._variants
+        ]
+
+        (self._base_path / directory).mkdir(parents=True, exist_ok=True)
+        executor = self._executor or get_image_executor()
+        await executor.run(render_variants, str(source_path), targets)
+
+        urls = {name: f"{self._base_url}/{file_name}" for name, file_name in file_names.items()}
+        urls["original"] = image_url
+        return urls
+
+    def _resolve_source(self, image_url: str) -> Path:
+        for prefix, root in self._source_roots.items():
+            relative = relative_media_path(image_url, prefix)
+            if relative is not None:
+                return root / relative
+        raise ValueError(f"Image URL {image_url!r} is not served from local storage")
+
+
+class OriginalOnlyPostImageProcessor(AbstractPostImageProcessor):
+    """
+    Post image processor for originals that are not on local disk (the S3
+    backend): renders no variants, so clients are served the original.
+    """
+
+    async def create_variants(self, post_id: UUID, image_url: str) -> dict[str, str]:
+        return {"original": image_url}
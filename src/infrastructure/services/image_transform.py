@@ -0,0 +1,132 @@
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from src.infrastructure.services.bounded_executor import BoundedExecutor
+from src.infrastructure.services.image_pool import get_image_executor
+from src.infrastructure.settings import UPLOAD_IMAGE_FORMAT, UPLOAD_IMAGE_QUALITY
+
+logger = logging.getLogger(__name__)
+
+_EXTENSIONS = {"WEBP": ".webp", "JPEG": ".jpg"}
+
+
+@dataclass(frozen=True)
+class TransformStats:
+    images: int
+    # Uploads stored as received because they could not be re-encoded
+    passed_through: int
+    original_bytes: int
+    stored_bytes: int
+
+
+def recompress_image(source_path: str, target_stem: str, image_format: str, quality: int) -> str | None:
+    """
+    Re-encodes an image without its metadata and returns the path written,
+    or None if the file is not an image Pillow can re-encode as a still.
+    Runs in a worker process, so it must stay a picklable module-level function.
+    """
+    target_path = f"{target_stem}{_EXTENSIONS[image_format]}"
+    temp_path = f"{target_path}.part"
+    try:
+        with Image.open(source_path) as image:
+            if getattr(image, "is_animated", False):
+                return None
+            icc_profile = image.info.get("icc_profile")
+            # Apply the EXIF orientation to the pixels, since the EXIF block is dropped
+            image = ImageOps.exif_transpose(image)
+            if image_format == "JPEG" or image.mode not in ("RGB", "RGBA"):
+                image = image.convert("RGB" if image_format == "JPEG" else "RGBA")
+
+            options = {"quality": quality}
+            if image_format == "JPEG":
+                options.update(optimize=True, progressive=True)
+            else:
+                options.update(method=4)
+            # Only the colour profile is carried over; EXIF (GPS, camera) and XMP are not
+            if icc_profile:
+                options["icc_profile"] = icc_profile
+            image.save(temp_path, image_format, **options)
+    except (UnidentifiedImageError, Image.DecompressionBombError, OSError, ValueError):
+        Path(temp_path).unlink(missing_ok=True)
+        return None
+    os.replace(temp_path, target_path)
+    return target_path
+
+
+class UploadImageTransformer:
+    """
+    Re-encodes uploaded images to a compact format without metadata before
+    they are stored, on the image worker pool. Counts bytes received vs. bytes
+    stored so the savings can be measured. Files that cannot be decoded are
+    stored unchanged.
+    """
+
+    def __init__(
+        self,
+        image_format: str = UPLOAD_IMAGE_FORMAT,
+        quality: int = UPLOAD_IMAGE_QUALITY,
+        executor: BoundedExecutor | None = None,
+    ) -> None:
+        if image_format not in _EXTENSIONS:
+            raise ValueError(f"Unsupported upload image format: {image_format}")
+        self._image_format = image_format
+        self._quality = quality
+        # None: the process-wide pool, looked up per call so a restarted pool is picked up
+        self._executor = executor
+        self._images = 0
+        self._passed_through = 0
+        self._original_bytes = 0
+        self._stored_bytes = 0
+
+    async def transform(self, source: Path, target_stem: Path, fallback_extension: str) -> Path:
+        """
+        Stores the image at `source` as `target_stem` + the extension of the
+        chosen format, or + `fallback_extension` if it is passed through.
+        `source` is consumed either way.
+        """
+        original_size = source.stat().st_size
+        executor = self._executor or get_image_executor()
+        try:
+            written = await executor.run(
+                recompress_image, str(source), str(target_stem), self._image_format, self._quality
+            )
+        except BaseException:
+            source.unlink(missing_ok=True)
+            raise
+        if written is None:
+            target = target_stem.with_name(f"{target_stem.name}{fallback_extension}")
+            os.replace(source, target)
+            self._passed_through += 1
+        else:
+            target = Path(written)
+            source.unlink(missing_ok=True)
+
+        stored_size = target.stat().st_size
+        self._images += 1
+        self._original_bytes += original_size
+        self._stored_bytes += stored_size
+        logger.info("Stored upload %s: %d -> %d bytes", target.name, original_size, stored_size)
+        return target
+
+    def stats(self) -> TransformStats:
+        return TransformStats(
+            images=self._images,
+            passed_through=self._passed_through,
+            original_bytes=self._original_bytes,
+            stored_bytes=self._stored_bytes,
+        )
+
+
+_upload_transformer: UploadImageTransformer | None = None
+
+
+def get_upload_transformer() -> UploadImageTransformer:
+    """Returns the process-wide transformer, so its byte counters cover every upload."""
+    global _upload_transformer
+    if _upload_transformer is None:
+        _upload_transformer = UploadImageTransformer()
+    return _upload_transformer
@@ -1,37 +1,83 @@
+import hashlib
 import os
+import time
 from datetime import datetime, timedelta, timezone
 from uuid import UUID
 
 from jose import JWTError, jwt
 
-from src.application.common.token_service import AbstractTokenService
+from src.application.common.token_service import AbstractTokenService, TokenClaims
 from src.domain.users.exceptions import InvalidCredentialsError
+from src.domain.users.user import User
+from src.infrastructure.services.ttl_cache import TTLCache
 
 # It's recommended to use environment variables for these
 SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-super-secret-key")
 ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("JWT_EXPIRE_MINUTES", "30"))
+# Stateless mode: put the user fields routes need into the token so that
+# authenticating a request does not have to load the user from the database.
+# Profile changes then only show up in tokens issued after them.
+EMBED_USER_CLAIMS = os.getenv("JWT_EMBED_USER_CLAIMS", "false").lower() == "true"
 
 
 class JWTTokenService(AbstractTokenService):
     """
     Concrete implementation of the token service using python-jose.
+
+    Clients send the same token on every request, so with a `verified_cache`
+    the claims of a successfully verified token are remembered until the
+    token's own `exp`. The key is a SHA-256 digest, so the cache never holds
+    usable tokens. Only valid tokens are cached; revocation is checked by the
+    caller on every request either way.
     """
 
-    def generate_token(self, user_id: UUID) -> str:
+    def __init__(
+        self,
+        embed_user_claims: bool = EMBED_USER_CLAIMS,
+        verified_cache: TTLCache[bytes, TokenClaims] | None = None,
+    ) -> None:
+        self._embed_user_claims = embed_user_claims
+        self._verified_cache = verified_cache
+
+    def generate_token(self, user: User) -> str:
         expire = datetime.now(timezone.utc) + timedelta(
             minutes=ACCESS_TOKEN_EXPIRE_MINUTES
         )
-        to_encode = {"exp": expire, "sub": str(user_id)}
+        to_encode = {"exp": expire, "sub": str(user.id), "ver": user.token_version}
+        if self._embed_user_claims:
+            to_encode.update(
+                username=user.username, email=user.email, is_public=user.is_public
+            )
         encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
         return encoded_jwt
 
-    def verify_and_extract_user_id(self, token: str) -> UUID:
+    def verify_token(self, token: str) -> TokenClaims:
+        if self._verified_cache is None:
+            claims, _ = self._decode(token)
+            return claims
+
+        digest = hashlib.sha256(token.encode()).digest()
+        claims = self._verified_cache.get(digest)
+        if claims is None:
+            claims, expires_at = self._decode(token)
+            self._verified_cache.set(digest, claims, ttl_seconds=expires_at - time.time())
+        return claims
+
+    def _decode(self, token: str) -> tuple[TokenClaims, float]:
+        """Verifies the signature and expiry; returns the claims and the expiry timestamp."""
         try:
             payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
             user_id: str | None = payload.get("sub")
             if user_id is None:
                 raise InvalidCredentialsError()
-            return UUID(user_id)
-        except JWTError:
+            claims = TokenClaims(
+                user_id=UUID(user_id),
+                token_version=int(payload.get("ver", 0)),
+                username=payload.get("username"),
+                email=payload.get("email"),
+                is_public=payload.get("is_public"),
+            )
+            return claims, float(payload["exp"])
+        except (JWTError, KeyError, ValueError):
             raise InvalidCredentialsError()
@@ -0,0 +1,454 @@
+import asyncio
+import hashlib
+import hmac
+import xml.etree.ElementTree as ElementTree
+from collections.abc import AsyncIterable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from urllib.parse import quote, unquote, urlsplit
+
+import httpx
+
+from src.application.common.exceptions import UploadTooLargeError
+from src.infrastructure.settings import (
+    S3_ACCESS_KEY_ID,
+    S3_BUCKET,
+    S3_ENDPOINT_URL,
+    S3_MAX_CONNECTIONS,
+    S3_MULTIPART_CONCURRENCY,
+    S3_MULTIPART_PART_SIZE,
+    S3_REGION,
+    S3_SECRET_ACCESS_KEY,
+)
+
+# S3 rejects multipart parts smaller than this (except the last one)
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+_EMPTY_SHA256 = hashlib.sha256(b"").hexdigest()
+
+
+class ObjectStorageError(Exception):
+    """The object store rejected a request or answered with something unexpected."""
+
+    def __init__(self, message: str, status_code: int | None = None) -> None:
+        super().__init__(message)
+        self.status_code = status_code
+
+
+@dataclass(frozen=True)
+class Credentials:
+    access_key_id: str
+    secret_access_key: str
+    region: str
+
+
+def _hmac(key: bytes, message: str) -> bytes:
+    return hmac.new(key, message.encode(), hashlib.sha256).digest()
+
+
+def _canonical_query(query: str) -> str:
+    pairs = sorted(
+        (quote(unquote(key), safe="-_.~"), quote(unquote(value), safe="-_.~"))
+        for key, _, value in (pair.partition("=") for pair in query.split("&") if pair)
+    )
+    return "&".join(f"{key}={value}" for key, value in pairs)
+
+
+def _signature(
+    method: str,
+    url: str,
+    headers: dict[str, str],
+    payload_sha256: str,
+    credentials: Credentials,
+    amz_date: str,
+    service: str,
+) -> tuple[str, str, str]:
+    """Returns (credential scope, signed header names, signature) for the request."""
+    parts = urlsplit(url)
+    signed = {name.lower(): " ".join(value.split()) for name, value in headers.items()}
+    signed["host"] = parts.netloc
+    signed_names = ";".join(sorted(signed))
+
+    canonical_request = "\n".join(
+        [
+            method,
+            # Already percent-encoded once; S3 does not encode it a second time
+            parts.path or "/",
+            _canonical_query(parts.query),
+            "".join(f"{name}:{signed[name]}\n" for name in sorted(signed)),
+            signed_names,
+            payload_sha256,
+        ]
+    )
+
+    date = amz_date[:8]
+    scope = f"{date}/{credentials.region}/{service}/aws4_request"
+    string_to_sign = "\n".join(
+        [
+            "AWS4-HMAC-SHA256",
+            amz_date,
+            scope,
+            hashlib.sha256(canonical_request.encode()).hexdigest(),
+        ]
+    )
+    key = _hmac(f"AWS4{credentials.secret_access_key}".encode(), date)
+    for step in (credentials.region, service, "aws4_request"):
+        key = _hmac(key, step)
+    signature = hmac.new(key, string_to_sign.encode(), hashlib.sha256).hexdigest()
+    return scope, signed_names, signature
+
+
+def sign_request(
+    method: str,
+    url: str,
+    headers: dict[str, str],
+    payload_sha256: str,
+    credentials: Credentials,
+    now: datetime,
+    service: str = "s3",
+) -> dict[str, str]:
+    """
+    Returns `headers` plus the AWS Signature Version 4 headers
+    (x-amz-date, x-amz-content-sha256 and Authorization) for the request.
+    """
+    amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+    headers = {**headers, "x-amz-date": amz_date, "x-amz-content-sha256": payload_sha256}
+    scope, signed_names, signature = _signature(
+        method, url, headers, payload_sha256, credentials, amz_date, service
+    )
+    return {
+        **headers,
+        "Authorization": (
+            f"AWS4-HMAC-SHA256 Credential={credentials.access_key_id}/{scope}, "
+            f"SignedHeaders={signed_names}, Signature={signature}"
+        ),
+    }
+
+
+def presign_url(
+    method: str,
+    url: str,
+    headers: dict[str, str],
+    credentials: Credentials,
+    now: datetime,
+    expires_seconds: int,
+    service: str = "s3",
+) -> str:
+    """
+    Returns `url` with an AWS Signature Version 4 query string, valid for
+    `expires_seconds`. Whoever uses it must send `headers` unchanged.
+    """
+    amz_date = now.strftime("%Y%m%dT%H%M%SZ")
+    signed_names = ";".join(sorted({"host", *(name.lower() for name in headers)}))
+    scope = f"{amz_date[:8]}/{credentials.region}/{service}/aws4_request"
+    auth_query = "&".join(
+        [
+            "X-Amz-Algorithm=AWS4-HMAC-SHA256",
+            f"X-Amz-Credential={quote(f'{credentials.access_key_id}/{scope}', safe='')}",
+            f"X-Amz-Date={amz_date}",
+            f"X-Amz-Expires={expires_seconds}",
+            f"X-Amz-SignedHeaders={quote(signed_names, safe='')}",
+        ]
+    )
+    unsigned_url = f"{url}&{auth_query}" if urlsplit(url).query else f"{url}?{auth_query}"
+    _, _, signature = _signature(
+        method, unsigned_url, headers, "UNSIGNED-PAYLOAD", credentials, amz_date, service
+    )
+    return f"{unsigned_url}&X-Amz-Signature={signature}"
+
+
+def _find_text(body: bytes, tag: str) -> str | None:
+    # Tags are namespaced on AWS but not on every S3-compatible store
+    for element in ElementTree.fromstring(body).iter():
+        if element.tag.rsplit("}", 1)[-1] == tag:
+            return element.text
+    return None
+
+
+class S3Client:
+    """
+    Minimal S3 API client over a shared keep-alive httpx connection pool.
+    Objects are addressed path-style ({endpoint}/{bucket}/{key}), which works
+    with AWS as well as MinIO and other S3-compatible stores.
+    """
+
+    def __init__(
+        self,
+        http_client: httpx.AsyncClient,
+        endpoint_url: str,
+        bucket: str,
+        credentials: Credentials,
+        part_size: int = S3_MULTIPART_PART_SIZE,
+        concurrency: int = S3_MULTIPART_CONCURRENCY,
+    ) -> None:
+        if part_size < MIN_PART_SIZE:
+            raise ValueError(f"part_size must be at least {MIN_PART_SIZE} bytes")
+        self._http = http_client
+        self._bucket = bucket
+        self._bucket_url = f"{endpoint_url.rstrip('/')}/{bucket}"
+        self._credentials = credentials
+        self._part_size = part_size
+        self._concurrency = concurrency
+
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
+    async def put_object(self, key: str, body: bytes, content_type: str | None = None) -> None:
+        headers = {"content-type": content_type} if content_type else {}
+        await self._request("PUT", key, body=body, headers=headers)
+
+    async def create_object(self, key: str, body: bytes) -> bool:
+        """
+        Writes the object only if nothing is stored under `key` yet (a
+        conditional write), and returns False if something was.
+        """
+        try:
+            await self._request("PUT", key, body=body, headers={"if-none-match": "*"})
+        except ObjectStorageError as exc:
+            if exc.status_code == 412:
+                return False
+            raise
+        return True
+
+    async def delete_object(self, key: str) -> None:
+        await self._request("DELETE", key)
+
+    async def get_object(self, key: str) -> bytes | None:
+        """The object's content, or None if it does not exist."""
+        try:
+            response = await self._request("GET", key)
+        except ObjectStorageError as exc:
+            if exc.status_code == 404:
+                return None
+            raise
+        return response.content
+
+    async def head_object(self, key: str) -> int | None:
+        """The object's size in bytes, or None if it does not exist."""
+        stat = await self.stat_object(key)
+        return stat[0] if stat is not None else None
+
+    async def stat_object(self, key: str) -> tuple[int, str] | None:
+        """The object's size in bytes and ETag, or None if it does not exist."""
+        try:
+            response = await self._request("HEAD", key)
+        except ObjectStorageError as exc:
+            if exc.status_code == 404:
+                return None
+            raise
+        return int(response.headers["content-length"]), response.headers["etag"]
+
+    async def copy_object(self, source_key: str, key: str, if_match: str | None = None) -> None:
+        """
+        Copies an object inside the bucket without downloading it. With
+        `if_match`, only if the source still has that ETag (412 otherwise).
+        """
+        source = f"/{self._bucket}/{quote(source_key, safe='/-_.~')}"
+        headers = {"x-amz-copy-source": source}
+        if if_match is not None:
+            headers["x-amz-copy-source-if-match"] = if_match
+        await self._request("PUT", key, headers=headers)
+
+    def presign_put(self, key: str, size: int, expires_seconds: int) -> str:
+        """
+        A URL anyone can PUT exactly `size` bytes to as `key` until it
+        expires; the signed Content-Length rejects any other size.
+        """
+        return presign_url(
+            "PUT",
+            self._object_url(key),
+            {"content-length": str(size)},
+            self._credentials,
+            datetime.now(timezone.utc),
+            expires_seconds,
+        )
+
+    async def upload_stream(
+        self,
+        key: str,
+        stream: AsyncIterable[bytes],
+        max_bytes: int,
+        content_type: str | None = None,
+    ) -> int:
+        """
+        Uploads the stream and returns its size. Anything up to one part is a
+        single PUT; larger streams become a multipart upload whose parts are
+        sent concurrently while the next part is still being received. At most
+        `concurrency` parts are held in memory. On any failure, including
+        UploadTooLargeError, the multipart upload is aborted.
+        """
+        size = 0
+        buffer = bytearray()
+        upload_id: str | None = None
+        uploads: list[asyncio.Task[tuple[int, str]]] = []
+        slots = asyncio.Semaphore(self._concurrency)
+
+        async def send_part(part_number: int, body: bytes) -> tuple[int, str]:
+            try:
+                return part_number, await self.upload_part(key, upload_id, part_number, body)
+            finally:
+                slots.release()
+
+        async def start_part(body: bytes) -> None:
+            nonlocal upload_id
+            if upload_id is None:
+                upload_id = await self.create_multipart_upload(key, content_type)
+            await slots.acquire()
+            uploads.append(asyncio.create_task(send_part(len(uploads) + 1, body)))
+
+        try:
+            async for chunk in stream:
+                size += len(chunk)
+                if size > max_bytes:
+                    raise UploadTooLargeError(max_bytes)
+                buffer += chunk
+                # Strictly larger, so a stream of exactly one part stays a single PUT
+                while len(buffer) > self._part_size:
+                    await start_part(bytes(buffer[: self._part_size]))
+                    del buffer[: self._part_size]
+
+            if upload_id is None:
+                await self.put_object(key, bytes(buffer), content_type)
+                return size
+
+            if buffer:
+                await start_part(bytes(buffer))
+            parts = await asyncio.gather(*uploads)
+            await self.complete_multipart_upload(key, upload_id, parts)
+            return size
+        except BaseException:
+            for upload in uploads:
+                upload.cancel()
+            await asyncio.gather(*uploads, return_exceptions=True)
+            if upload_id is not None:
+                await asyncio.shield(self.abort_multipart_upload(key, upload_id))
+            raise
+
+    async def create_multipart_upload(self, key: str, content_type: str | None) -> str:
+        headers = {"content-type": content_type} if content_type else {}
+        response = await self._request("POST", key, params="uploads", headers=headers)
+        upload_id = _find_text(response.content, "UploadId")
+        if not upload_id:
+            raise ObjectStorageError("CreateMultipartUpload returned no UploadId")
+        return upload_id
+
+    async def upload_part(self, key: str, upload_id: str, part_number: int, body: bytes) -> str:
+        response = await self._request(
+            "PUT",
+            key,
+            params=f"partNumber={part_number}&uploadId={quote(upload_id, safe='')}",
+            body=body,
+        )
+        return response.headers["etag"]
+
+    async def complete_multipart_upload(
+        self, key: str, upload_id: str, parts: list[tuple[int, str]]
+    ) -> None:
+        body = "".join(
+            f"<Part><PartNumber>{number}</PartNumber><ETag>{etag}</ETag></Part>"
+            for number, etag in sorted(parts)
+        )
+        response = await self._request(
+            "POST",
+            key,
+            params=f"uploadId={quote(upload_id, safe='')}",
+            body=f"<CompleteMultipartUpload>{body}</CompleteMultipartUpload>".encode(),
+        )
+        # S3 can answer 200 and still report the failure in the body
+        if _find_text(response.content, "Code") is not None:
+            raise ObjectStorageError(f"CompleteMultipartUpload failed: {response.text}")
+
+    async def list_parts(self, key: str, upload_id: str) -> list[tuple[int, str, int]]:
+        """
+        The (part number, ETag, size) of every part uploaded so far, by part
+        number. Only the first 1000 parts are listed, far more than an image needs.
+        """
+        response = await self._request("GET", key, params=f"uploadId={quote(upload_id, safe='')}")
+        parts = []
+        for element in ElementTree.fromstring(response.content).iter():
+            if element.tag.rsplit("}", 1)[-1] != "Part":
+                continue
+            fields = {child.tag.rsplit("}", 1)[-1]: child.text for child in element}
+            parts.append((int(fields["PartNumber"]), fields["ETag"], int(fields["Size"])))
+        return sorted(parts)
+
+    async def list_multipart_uploads(self, prefix: str) -> list[tuple[str, str, datetime]]:
+        """
+        The (key, UploadId, initiation time) of unfinished multipart uploads
+        whose key starts with `prefix`; at most the first 1000.
+        """
+        response = await self._request("GET", "", params=f"uploads&prefix={quote(prefix, safe='')}")
+        uploads = []
+        for element in ElementTree.fromstring(response.content).iter():
+            if element.tag.rsplit("}", 1)[-1] != "Upload":
+                continue
+            fields = {child.tag.rsplit("}", 1)[-1]: child.text for child in element}
+            initiated = datetime.fromisoformat(fields["Initiated"].replace("Z", "+00:00"))
+            uploads.append((fields["Key"], fields["UploadId"], initiated))
+        return uploads
+
+    async def abort_multipart_upload(self, key: str, upload_id: str) -> None:
+        try:
+            await self._request("DELETE", key, params=f"uploadId={quote(upload_id, safe='')}")
+        except (ObjectStorageError, httpx.HTTPError):
+            # Leftover parts are removed by the bucket's abort-incomplete-upload lifecycle rule
+            pass
+
+    def _object_url(self, key: str) -> str:
+        return f"{self._bucket_url}/{quote(key, safe='/-_.~')}"
+
+    async def _request(
+        self,
+        method: str,
+        key: str,
+        params: str = "",
+        body: bytes = b"",
+        headers: dict[str, str] | None = None,
+    ) -> httpx.Response:
+        url = self._object_url(key)
+        if params:
+            url = f"{url}?{params}"
+        payload_sha256 = hashlib.sha256(body).hexdigest() if body else _EMPTY_SHA256
+        signed = sign_request(
+            method, url, headers or {}, payload_sha256, self._credentials, datetime.now(timezone.utc)
+        )
+        response = await self._http.request(method, url, content=body, headers=signed)
+        if response.status_code >= 300:
+            raise ObjectStorageError(
+                f"{method} {key} failed with {response.status_code}: {response.text[:200]}",
+                status_code=response.status_code,
+            )
+        return response
+
+
+_s3_client: S3Client | None = None
+
+
+def get_s3_client() -> S3Client:
+    """
+    The process-wide client; all requests share one pool of keep-alive
+    connections to the object store.
+    """
+    global _s3_client
+    if _s3_client is None:
+        http_client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=S3_MAX_CONNECTIONS, max_keepalive_connections=S3_MAX_CONNECTIONS
+            ),
+            timeout=httpx.Timeout(30.0, connect=5.0),
+        )
+        _s3_client = S3Client(
+            http_client,
+            S3_ENDPOINT_URL,
+            S3_BUCKET,
+            Credentials(S3_ACCESS_KEY_ID, S3_SECRET_ACCESS_KEY, S3_REGION),
+        )
+    return _s3_client
+
+
+async def close_s3_client() -> None:
+    """Closes the process-wide client's connections, if it was created."""
+    global _s3_client
+    if _s3_client is not None:
+        await _s3_client.aclose()
+        _s3_client = None
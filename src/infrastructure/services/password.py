@@ -1,19 +1,77 @@
+import os
+
 from passlib.context import CryptContext
 
+from src.application.common.exceptions import PasswordHasherBusyError
 from src.application.common.password_hasher import AbstractPasswordHasher
+from src.infrastructure.services.bounded_executor import BoundedExecutor
+
+# argon2-cffi releases the GIL while hashing, so a thread pool gives real parallelism
+PASSWORD_HASHER_WORKERS = int(os.getenv("PASSWORD_HASHER_WORKERS", str(os.cpu_count() or 1)))
+# Hashes allowed to be running or queued before new ones fail fast as "busy"
+PASSWORD_HASHER_MAX_PENDING = int(
+    os.getenv("PASSWORD_HASHER_MAX_PENDING", str(PASSWORD_HASHER_WORKERS * 8))
+)
+
+# Argon2 cost parameters; pick them with `python -m src.interfaces.cli.calibrate_password_hasher`.
+# Unset values fall back to the passlib defaults. Changing them makes existing
+# hashes "outdated": they keep verifying and are rehashed on the next login.
+ARGON2_TIME_COST = os.getenv("ARGON2_TIME_COST")
+ARGON2_MEMORY_COST = os.getenv("ARGON2_MEMORY_COST")  # KiB
+ARGON2_PARALLELISM = os.getenv("ARGON2_PARALLELISM")
+
+_hashing_executor: BoundedExecutor | None = None
+
+
+def get_hashing_executor() -> BoundedExecutor:
+    """Returns the process-wide executor shared by all password hasher instances."""
+    global _hashing_executor
+    if _hashing_executor is None:
+        _hashing_executor = BoundedExecutor(
+            max_workers=PASSWORD_HASHER_WORKERS,
+            max_pending=PASSWORD_HASHER_MAX_PENDING,
+            reject_with=PasswordHasherBusyError,
+            thread_name_prefix="argon2",
+        )
+    return _hashing_executor
+
+
+def shutdown_hashing_executor() -> None:
+    """Waits for running hashes and stops the process-wide executor, if it was started."""
+    global _hashing_executor
+    if _hashing_executor is not None:
+        _hashing_executor.shutdown()
+        _hashing_executor = None
+
+
+def _argon2_settings() -> dict[str, int]:
+    settings = {
+        "argon2__time_cost": ARGON2_TIME_COST,
+        "argon2__memory_cost": ARGON2_MEMORY_COST,
+        "argon2__parallelism": ARGON2_PARALLELISM,
+    }
+    return {key: int(value) for key, value in settings.items() if value}
 
 
 class PasslibPasswordHasher(AbstractPasswordHasher):
     """
     Concrete implementation of the password hasher using passlib.
     Uses Argon2, which is modern, secure, and handles long passwords natively.
+    Hashing runs on a bounded thread pool so it never blocks the event loop.
     """
 
-    def __init__(self) -> None:
-        self._context = CryptContext(schemes=["argon2"], deprecated="auto")
+    def __init__(self, executor: BoundedExecutor | None = None) -> None:
+        self._context = CryptContext(schemes=["argon2"], deprecated="auto", **_argon2_settings())
+        # None: the process-wide executor, looked up per call so a restarted one is picked up
+        self._executor = executor
+
+    async def hash(self, password: str) -> str:
+        executor = self._executor or get_hashing_executor()
+        return await executor.run(self._context.hash, password)
 
-    def hash(self, password: str) -> str:
-        return self._context.hash(password)
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        executor = self._executor or get_hashing_executor()
+        return await executor.run(self._context.verify, password, hashed_password)
 
-    def verify(self, password: str, hashed_password: str) -> bool:
-        return self._context.verify(password, hashed_password)
\ No newline at end of file
+    def needs_rehash(self, hashed_password: str) -> bool:
+        return self._context.needs_update(hashed_password)
@@ -0,0 +1,84 @@
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+
+from passlib.hash import argon2
+
+# Memory costs (KiB) tried from the most to the least expensive. The tail are
+# the OWASP-recommended Argon2id configurations.
+MEMORY_COST_CANDIDATES = (262144, 131072, 65536, 47104, 19456, 12288, 9216, 7168)
+MAX_TIME_COST = 10
+
+# OWASP minimum configurations as (memory_cost KiB, time_cost), parallelism 1
+OWASP_MINIMUMS = ((47104, 1), (19456, 2), (12288, 3), (9216, 4), (7168, 5))
+
+
+@dataclass(frozen=True)
+class Argon2Parameters:
+    time_cost: int
+    memory_cost: int  # KiB
+    parallelism: int = 1
+
+    def meets_owasp_minimum(self) -> bool:
+        return any(
+            self.memory_cost >= memory_cost and self.time_cost >= time_cost
+            for memory_cost, time_cost in OWASP_MINIMUMS
+        )
+
+
+@dataclass(frozen=True)
+class CalibrationResult:
+    parameters: Argon2Parameters
+    hash_seconds: float
+    budget_seconds: float
+
+
+def measure_hash_seconds(parameters: Argon2Parameters, samples: int = 3) -> float:
+    """Median wall time of one Argon2 hash with the given parameters on this host."""
+    hasher = argon2.using(
+        time_cost=parameters.time_cost,
+        memory_cost=parameters.memory_cost,
+        parallelism=parameters.parallelism,
+    )
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        hasher.hash("calibration-password")
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def calibrate(
+    target_ms: float,
+    logins_per_second_per_core: float,
+    measure: Callable[[Argon2Parameters], float] = measure_hash_seconds,
+) -> CalibrationResult:
+    """
+    Picks the most expensive Argon2 parameters whose hash time fits both the
+    latency target and the per-core throughput target.
+
+    Parallelism is fixed to 1: a login occupies one core, so the per-core
+    budget is simply 1 / logins_per_second_per_core. Memory cost is chosen
+    first (it is what makes GPU attacks expensive), then time cost is raised
+    as far as the remaining budget allows. If even the cheapest candidate is
+    too slow, the cheapest one is returned so the caller can see the gap.
+    """
+    budget = min(target_ms / 1000, 1 / logins_per_second_per_core)
+
+    for memory_cost in MEMORY_COST_CANDIDATES:
+        parameters = Argon2Parameters(time_cost=1, memory_cost=memory_cost)
+        seconds = measure(parameters)
+        if seconds <= budget:
+            break
+
+    while parameters.time_cost < MAX_TIME_COST:
+        candidate = Argon2Parameters(
+            time_cost=parameters.time_cost + 1, memory_cost=parameters.memory_cost
+        )
+        candidate_seconds = measure(candidate)
+        if candidate_seconds > budget:
+            break
+        parameters, seconds = candidate, candidate_seconds
+
+    return CalibrationResult(parameters=parameters, hash_seconds=seconds, budget_seconds=budget)
@@ -1,9 +1,19 @@
-import os
-import aiofiles
+import mimetypes
+from collections.abc import AsyncIterable
 from pathlib import Path
 from uuid import UUID
 
 from src.application.posts.post_storage import AbstractPostImageStorage
+from src.infrastructure.services.blob_store import ContentAddressedBlobStore, file_extension
+from src.infrastructure.services.file_writer import write_stream
+from src.infrastructure.services.image_transform import UploadImageTransformer
+from src.infrastructure.services.object_storage import S3Client
+from src.infrastructure.services.sharding import relative_media_path, shard_dir, sharded_name
+from src.infrastructure.settings import POST_IMAGE_MAX_BYTES, S3_PUBLIC_BASE_URL
+
+# Where post images live on disk and the URL prefix they are served under
+POST_IMAGES_PATH = "uploads/posts"
+POST_IMAGES_URL = "/static/posts"
 
 
 class LocalPostImageStorage(AbstractPostImageStorage):
@@ -11,22 +21,89 @@ class LocalPostImageStorage(AbstractPostImageStorage):
     Concrete implementation of post image storage using the local filesystem.
     """
 
-    def __init__(self, base_path: str = "uploads/posts", base_url: str = "/static/posts") -> None:
+    def __init__(
+        self,
+        base_path: str = POST_IMAGES_PATH,
+        base_url: str = POST_IMAGES_URL,
+        max_bytes: int = POST_IMAGE_MAX_BYTES,
+        transformer: UploadImageTransformer | None = None,
+    ) -> None:
         self._base_path = Path(base_path)
         self._base_url = base_url
+        self._max_bytes = max_bytes
+        self._transformer = transformer
         self._ensure_directory_exists()
 
     def _ensure_directory_exists(self) -> None:
         self._base_path.mkdir(parents=True, exist_ok=True)
 
-    async def save(self, post_id: UUID, file_name: str, file_data: bytes) -> str:
-        # Generate a unique filename
+    async def save(self, post_id: UUID, file_name: str, file_stream: AsyncIterable[bytes]) -> str:
+        # Generate a unique filename, fanned out into directories by its leading hex characters
         extension = Path(file_name).suffix
-        unique_filename = f"{post_id}{extension}"
-        file_path = self._base_path / unique_filename
+        directory = self._base_path / shard_dir(str(post_id))
+        directory.mkdir(parents=True, exist_ok=True)
+        file_path = directory / f"{post_id}{extension}"
 
-        async with aiofiles.open(file_path, "wb") as f:
-            await f.write(file_data)
+        if self._transformer is None:
+            await write_stream(file_stream, file_path, self._max_bytes)
+        else:
+            # Re-encoding may change the extension, so the final name comes from the transformer
+            upload_path = directory / f".{post_id}.upload"
+            await write_stream(file_stream, upload_path, self._max_bytes)
+            file_path = await self._transformer.transform(
+                upload_path, directory / str(post_id), extension
+            )
 
         # Return the relative URL (assuming static file serving is set up)
-        return f"{self._base_url}/{unique_filename}"
+        return f"{self._base_url}/{sharded_name(file_path.name)}"
+
+    async def delete(self, image_url: str) -> None:
+        relative = relative_media_path(image_url, self._base_url)
+        if relative is not None:
+            (self._base_path / relative).unlink(missing_ok=True)
+
+
+class ContentAddressedPostImageStorage(AbstractPostImageStorage):
+    """
+    Post image storage on top of the deduplicating blob store: the same image
+    posted twice is stored once.
+    """
+
+    def __init__(
+        self, blob_store: ContentAddressedBlobStore, max_bytes: int = POST_IMAGE_MAX_BYTES
+    ) -> None:
+        self._blob_store = blob_store
+        self._max_bytes = max_bytes
+
+    async def save(self, post_id: UUID, file_name: str, file_stream: AsyncIterable[bytes]) -> str:
+        return await self._blob_store.put(file_stream, file_extension(file_name), self._max_bytes)
+
+    async def delete(self, image_url: str) -> None:
+        await self._blob_store.release(image_url)
+
+
+class S3PostImageStorage(AbstractPostImageStorage):
+    """
+    Post image storage in an S3-compatible object store, shared by every app host.
+    Uploads are streamed to the store as they arrive.
+    """
+
+    def __init__(
+        self,
+        client: S3Client,
+        public_base_url: str = S3_PUBLIC_BASE_URL,
+        max_bytes: int = POST_IMAGE_MAX_BYTES,
+    ) -> None:
+        self._client = client
+        self._public_base_url = public_base_url.rstrip("/")
+        self._max_bytes = max_bytes
+
+    async def save(self, post_id: UUID, file_name: str, file_stream: AsyncIterable[bytes]) -> str:
+        key = f"posts/{post_id}{file_extension(file_name)}"
+        content_type = mimetypes.guess_type(file_name)[0]
+        await self._client.upload_stream(key, file_stream, self._max_bytes, content_type)
+        return f"{self._public_base_url}/{key}"
+
+    async def delete(self, image_url: str) -> None:
+        if image_url.startswith(f"{self._public_base_url}/posts/"):
+            await self._client.delete_object(image_url.removeprefix(f"{self._public_base_url}/"))
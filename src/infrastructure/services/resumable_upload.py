@@ -0,0 +1,293 @@
+import asyncio
+import json
+import os
+import time
+from collections.abc import AsyncIterable
+from datetime import datetime, timezone
+from pathlib import Path
+from uuid import UUID
+
+from src.application.common.exceptions import (
+    InvalidUploadChunkError,
+    UploadNotFoundError,
+    UploadOffsetMismatchError,
+    UploadTooLargeError,
+)
+from src.application.posts.resumable_upload import AbstractResumableUploadStorage, UploadSession
+from src.infrastructure.services.direct_upload import (
+    LocalUploadGateway,
+    new_upload_id,
+    owned_upload_id,
+)
+from src.infrastructure.services.file_writer import append_stream
+from src.infrastructure.services.object_storage import MIN_PART_SIZE, ObjectStorageError, S3Client
+from src.infrastructure.settings import (
+    POST_IMAGE_MAX_BYTES,
+    RESUMABLE_UPLOAD_CHUNK_SIZE,
+    RESUMABLE_UPLOAD_EXPIRE_SECONDS,
+)
+
+# Abandoned sessions are looked for at most this often per process
+SWEEP_INTERVAL_SECONDS = 60.0
+
+_PART_SUFFIX = ".part"
+_SESSION_SUFFIX = ".session"
+
+
+def _timestamp(seconds: float) -> datetime:
+    return datetime.fromtimestamp(seconds, timezone.utc)
+
+
+class LocalResumableUploadStorage(AbstractResumableUploadStorage):
+    """
+    Resumable uploads on local disk, next to the gateway's direct uploads.
+    Chunks are appended to "<upload id>.part" and a small "<upload id>.session"
+    file records the announced size and the expiry. The finished file is
+    renamed to where a direct upload would have been stored, so it is claimed
+    the same way (POST /posts/from-upload).
+
+    The sweep removes expired sessions, and also direct uploads and finished
+    sessions that were never claimed within the same time.
+    """
+
+    def __init__(
+        self,
+        gateway: LocalUploadGateway,
+        max_bytes: int = POST_IMAGE_MAX_BYTES,
+        chunk_size: int = RESUMABLE_UPLOAD_CHUNK_SIZE,
+        expires_seconds: int = RESUMABLE_UPLOAD_EXPIRE_SECONDS,
+        sweep_interval: float = SWEEP_INTERVAL_SECONDS,
+    ) -> None:
+        self._gateway = gateway
+        self._max_bytes = max_bytes
+        self._chunk_size = chunk_size
+        self._expires_seconds = expires_seconds
+        self._sweep_interval = sweep_interval
+        self._next_sweep = 0.0
+
+    async def create_session(self, user_id: UUID, file_name: str, size: int) -> UploadSession:
+        if size > self._max_bytes:
+            raise UploadTooLargeError(self._max_bytes)
+        upload_id = new_upload_id(user_id, file_name)
+        expires_at = time.time() + self._expires_seconds
+        await asyncio.to_thread(self._start, self._gateway.path_of(upload_id), size, expires_at)
+        return UploadSession(upload_id, size, 0, self._chunk_size, _timestamp(expires_at))
+
+    async def get_session(self, user_id: UUID, upload_id: str) -> UploadSession:
+        owned_upload_id(user_id, upload_id)
+        return await asyncio.to_thread(self._load, upload_id)
+
+    async def append_chunk(
+        self, user_id: UUID, upload_id: str, offset: int, chunk: AsyncIterable[bytes]
+    ) -> UploadSession:
+        session = await self.get_session(user_id, upload_id)
+        if offset != session.offset or session.is_complete:
+            raise UploadOffsetMismatchError(session.offset)
+
+        path = self._gateway.path_of(upload_id)
+        part_path, session_path = self._session_files(path)
+        try:
+            new_offset = await append_stream(
+                chunk, part_path, offset, max_bytes=session.size - offset
+            )
+        except FileNotFoundError:
+            # Finished or swept by a concurrent request
+            raise UploadNotFoundError()
+
+        if new_offset == session.size:
+            os.replace(part_path, path)
+            session_path.unlink(missing_ok=True)
+        return UploadSession(
+            upload_id, session.size, new_offset, self._chunk_size, session.expires_at
+        )
+
+    async def delete_expired_sessions(self) -> int:
+        if time.monotonic() < self._next_sweep:
+            return 0
+        self._next_sweep = time.monotonic() + self._sweep_interval
+        return await asyncio.to_thread(self._sweep, time.time())
+
+    def _start(self, path: Path, size: int, expires_at: float) -> None:
+        part_path, session_path = self._session_files(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        part_path.touch()
+        session_path.write_text(json.dumps({"size": size, "expires_at": expires_at}))
+
+    def _load(self, upload_id: str) -> UploadSession:
+        path = self._gateway.path_of(upload_id)
+        part_path, session_path = self._session_files(path)
+        try:
+            metadata = json.loads(session_path.read_text())
+            offset = part_path.stat().st_size
+        except FileNotFoundError:
+            # Finished uploads stay visible until a post claims them
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                raise UploadNotFoundError()
+            expires_at = _timestamp(stat.st_mtime + self._expires_seconds)
+            return UploadSession(upload_id, stat.st_size, stat.st_size, self._chunk_size, expires_at)
+
+        if metadata["expires_at"] < time.time():
+            raise UploadNotFoundError()
+        return UploadSession(
+            upload_id, metadata["size"], offset, self._chunk_size, _timestamp(metadata["expires_at"])
+        )
+
+    def _sweep(self, now: float) -> int:
+        removed = 0
+        for session_path in self._gateway.incoming_path.glob(f"*/*{_SESSION_SUFFIX}"):
+            try:
+                expired = json.loads(session_path.read_text())["expires_at"] < now
+            except (FileNotFoundError, ValueError, KeyError):
+                expired = True
+            if expired:
+                path = session_path.with_name(session_path.name.removesuffix(_SESSION_SUFFIX))
+                self._session_files(path)[0].unlink(missing_ok=True)
+                session_path.unlink(missing_ok=True)
+                removed += 1
+
+        # Uploads nobody claimed, and leftovers of sessions interrupted while starting
+        for path in self._gateway.incoming_path.glob("*/*"):
+            if path.suffix == _SESSION_SUFFIX:
+                continue
+            if path.with_name(path.name.removesuffix(_PART_SUFFIX) + _SESSION_SUFFIX).exists():
+                continue
+            try:
+                if path.stat().st_mtime + self._expires_seconds < now:
+                    path.unlink()
+                    removed += 1
+            except FileNotFoundError:
+                pass
+        return removed
+
+    @staticmethod
+    def _session_files(path: Path) -> tuple[Path, Path]:
+        return path.with_name(path.name + _PART_SUFFIX), path.with_name(path.name + _SESSION_SUFFIX)
+
+
+class S3ResumableUploadStorage(AbstractResumableUploadStorage):
+    """
+    Resumable uploads as S3 multipart uploads to "incoming/<upload id>", one
+    part per chunk. The partial data lives in the bucket, so any app host can
+    take the next chunk, and the offset is the size of the parts S3 lists.
+    The session itself (size, expiry, multipart UploadId) is a small object
+    under "upload-sessions/". Once the last part arrives the multipart upload
+    is completed and the object is claimed like a direct upload.
+
+    Every chunk but the last must be exactly `chunk_size` bytes (at least S3's
+    minimum part size) and is held in memory while it is sent on. Expired
+    sessions are found through the bucket's list of unfinished multipart uploads.
+    """
+
+    def __init__(
+        self,
+        client: S3Client,
+        max_bytes: int = POST_IMAGE_MAX_BYTES,
+        chunk_size: int = RESUMABLE_UPLOAD_CHUNK_SIZE,
+        expires_seconds: int = RESUMABLE_UPLOAD_EXPIRE_SECONDS,
+        sweep_interval: float = SWEEP_INTERVAL_SECONDS,
+    ) -> None:
+        self._client = client
+        self._max_bytes = max_bytes
+        self._chunk_size = max(chunk_size, MIN_PART_SIZE)
+        self._expires_seconds = expires_seconds
+        self._sweep_interval = sweep_interval
+        self._next_sweep = 0.0
+
+    async def create_session(self, user_id: UUID, file_name: str, size: int) -> UploadSession:
+        if size > self._max_bytes:
+            raise UploadTooLargeError(self._max_bytes)
+        upload_id = new_upload_id(user_id, file_name)
+        expires_at = time.time() + self._expires_seconds
+        multipart_id = await self._client.create_multipart_upload(f"incoming/{upload_id}", None)
+        await self._client.put_object(
+            self._session_key(upload_id),
+            json.dumps({"size": size, "expires_at": expires_at, "multipart_id": multipart_id}).encode(),
+            "application/json",
+        )
+        return UploadSession(upload_id, size, 0, self._chunk_size, _timestamp(expires_at))
+
+    async def get_session(self, user_id: UUID, upload_id: str) -> UploadSession:
+        owned_upload_id(user_id, upload_id)
+        session, _, _ = await self._load(upload_id)
+        return session
+
+    async def append_chunk(
+        self, user_id: UUID, upload_id: str, offset: int, chunk: AsyncIterable[bytes]
+    ) -> UploadSession:
+        owned_upload_id(user_id, upload_id)
+        session, multipart_id, parts = await self._load(upload_id)
+        if offset != session.offset or session.is_complete:
+            raise UploadOffsetMismatchError(session.offset)
+
+        expected = min(self._chunk_size, session.size - offset)
+        body = bytearray()
+        async for data in chunk:
+            body += data
+            if len(body) > expected:
+                if offset + len(body) > session.size:
+                    raise UploadTooLargeError(session.size - offset)
+                raise InvalidUploadChunkError(f"Chunk at offset {offset} must be {expected} bytes")
+        if len(body) != expected:
+            raise InvalidUploadChunkError(f"Chunk at offset {offset} must be {expected} bytes")
+
+        key = f"incoming/{upload_id}"
+        part_number = offset // self._chunk_size + 1
+        etag = await self._client.upload_part(key, multipart_id, part_number, bytes(body))
+        offset += len(body)
+        if offset == session.size:
+            await self._client.complete_multipart_upload(
+                key, multipart_id, [(number, tag) for number, tag, _ in parts] + [(part_number, etag)]
+            )
+            await self._client.delete_object(self._session_key(upload_id))
+        return UploadSession(upload_id, session.size, offset, self._chunk_size, session.expires_at)
+
+    async def delete_expired_sessions(self) -> int:
+        if time.monotonic() < self._next_sweep:
+            return 0
+        self._next_sweep = time.monotonic() + self._sweep_interval
+
+        removed = 0
+        cutoff = time.time() - self._expires_seconds
+        for key, multipart_id, initiated in await self._client.list_multipart_uploads("incoming/"):
+            if initiated.timestamp() >= cutoff:
+                continue
+            await self._client.abort_multipart_upload(key, multipart_id)
+            await self._client.delete_object(self._session_key(key.removeprefix("incoming/")))
+            removed += 1
+        return removed
+
+    async def _load(
+        self, upload_id: str
+    ) -> tuple[UploadSession, str | None, list[tuple[int, str, int]]]:
+        """The session, its multipart UploadId (None once finished) and the parts so far."""
+        key = f"incoming/{upload_id}"
+        content = await self._client.get_object(self._session_key(upload_id))
+        if content is None:
+            # Finished uploads stay visible until a post claims them
+            size = await self._client.head_object(key)
+            if size is None:
+                raise UploadNotFoundError()
+            expires_at = _timestamp(time.time() + self._expires_seconds)
+            return UploadSession(upload_id, size, size, self._chunk_size, expires_at), None, []
+
+        metadata = json.loads(content)
+        if metadata["expires_at"] < time.time():
+            raise UploadNotFoundError()
+        try:
+            parts = await self._client.list_parts(key, metadata["multipart_id"])
+        except ObjectStorageError as exc:
+            if exc.status_code == 404:
+                # Completed by a concurrent request, or swept
+                raise UploadNotFoundError()
+            raise
+        offset = sum(size for _, _, size in parts)
+        session = UploadSession(
+            upload_id, metadata["size"], offset, self._chunk_size, _timestamp(metadata["expires_at"])
+        )
+        return session, metadata["multipart_id"], parts
+
+    @staticmethod
+    def _session_key(upload_id: str) -> str:
+        return f"upload-sessions/{upload_id}.json"
@@ -0,0 +1,80 @@
+import os
+import re
+import shutil
+from pathlib import Path
+
+# Two levels of two hex characters: 65,536 leaf directories, so even a hundred
+# million files leaves only a few thousand entries per directory
+SHARD_LEVELS = 2
+SHARD_WIDTH = 2
+
+_SHARDABLE = re.compile(rf"^[0-9a-f]{{{SHARD_LEVELS * SHARD_WIDTH}}}")
+
+
+def shard_dir(file_name: str) -> str:
+    """
+    The relative directory a file lives in, taken from the leading hex
+    characters of its name (a post ID or content digest):
+    "3fa85f64-....jpg" -> "3f/a8".
+    """
+    if not _SHARDABLE.match(file_name):
+        raise ValueError(f"{file_name!r} does not start with a hex prefix")
+    return "/".join(
+        file_name[level * SHARD_WIDTH : (level + 1) * SHARD_WIDTH] for level in range(SHARD_LEVELS)
+    )
+
+
+def sharded_name(file_name: str) -> str:
+    """The file name with its shard directories in front: "3f/a8/3fa85f64-....jpg"."""
+    return f"{shard_dir(file_name)}/{file_name}"
+
+
+def sharded_url(url: str, base_url: str) -> str | None:
+    """
+    The sharded form of a flat `base_url/<file>` URL, or None if `url` is
+    not a flat URL under `base_url` (already sharded, or served elsewhere).
+    """
+    prefix = f"{base_url}/"
+    if not url.startswith(prefix):
+        return None
+    file_name = url.removeprefix(prefix)
+    if "/" in file_name or not _SHARDABLE.match(file_name):
+        return None
+    return f"{prefix}{sharded_name(file_name)}"
+
+
+def relative_media_path(url: str, base_url: str) -> Path | None:
+    """
+    The path below the storage root that `url` points at, or None if it is
+    not under `base_url` or tries to escape it.
+    """
+    prefix = f"{base_url}/"
+    if not url.startswith(prefix):
+        return None
+    relative = Path(url.removeprefix(prefix))
+    if relative.is_absolute() or ".." in relative.parts or not relative.parts:
+        return None
+    return relative
+
+
+def link_into_shards(root: Path) -> list[Path]:
+    """
+    Hard-links every flat file directly under `root` into its shard directory
+    (copying where links are not supported) and returns the flat paths.
+    Both paths serve the same file until the flat ones are removed, so URLs
+    can be rewritten while the app keeps running. Safe to run repeatedly.
+    """
+    flat_files = []
+    for path in sorted(root.iterdir()):
+        # Dot-files are in-flight uploads
+        if not path.is_file() or path.name.startswith(".") or not _SHARDABLE.match(path.name):
+            continue
+        target = root / sharded_name(path.name)
+        if not target.exists():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                os.link(path, target)
+            except OSError:
+                shutil.copy2(path, target)
+        flat_files.append(path)
+    return flat_files
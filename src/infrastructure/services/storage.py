@@ -1,27 +1,58 @@
-import os
-import aiofiles
+import mimetypes
+import uuid
+from collections.abc import AsyncIterable
 from uuid import UUID
 
 from src.application.users.avatar_storage import AbstractAvatarStorage
+from src.infrastructure.services.blob_store import ContentAddressedBlobStore, file_extension
+from src.infrastructure.services.object_storage import S3Client
+from src.infrastructure.settings import AVATAR_MAX_BYTES, S3_PUBLIC_BASE_URL
 
+# Avatars uploaded before they were stored as blobs, still served from here
 MEDIA_ROOT = "./media"
 
 
-class LocalAvatarStorage(AbstractAvatarStorage):
+class ContentAddressedAvatarStorage(AbstractAvatarStorage):
     """
-    Concrete implementation for storing avatar files locally.
+    Avatar storage on top of the deduplicating blob store: re-uploading the
+    same picture, or many users picking the same one, stores it once.
     """
 
-    async def save(self, user_id: UUID, file_name: str, file_data: bytes) -> str:
-        # Ensure the user's media directory exists
-        user_media_path = os.path.join(MEDIA_ROOT, "avatars", str(user_id))
-        os.makedirs(user_media_path, exist_ok=True)
+    def __init__(
+        self, blob_store: ContentAddressedBlobStore, max_bytes: int = AVATAR_MAX_BYTES
+    ) -> None:
+        self._blob_store = blob_store
+        self._max_bytes = max_bytes
 
-        # Create a unique file path
-        file_path = os.path.join(user_media_path, file_name)
+    async def save(self, user_id: UUID, file_name: str, file_stream: AsyncIterable[bytes]) -> str:
+        return await self._blob_store.put(file_stream, file_extension(file_name), self._max_bytes)
 
-        async with aiofiles.open(file_path, "wb") as f:
-            await f.write(file_data)
+    async def delete(self, avatar_url: str) -> None:
+        await self._blob_store.release(avatar_url)
 
-        # Return a URL path that can be served by the web server
-        return f"/media/avatars/{user_id}/{file_name}"
+
+class S3AvatarStorage(AbstractAvatarStorage):
+    """
+    Avatar storage in an S3-compatible object store, shared by every app host.
+    Every upload gets a new key, so a cached old avatar is never served for a new one.
+    """
+
+    def __init__(
+        self,
+        client: S3Client,
+        public_base_url: str = S3_PUBLIC_BASE_URL,
+        max_bytes: int = AVATAR_MAX_BYTES,
+    ) -> None:
+        self._client = client
+        self._public_base_url = public_base_url.rstrip("/")
+        self._max_bytes = max_bytes
+
+    async def save(self, user_id: UUID, file_name: str, file_stream: AsyncIterable[bytes]) -> str:
+        key = f"avatars/{user_id}/{uuid.uuid4().hex}{file_extension(file_name)}"
+        content_type = mimetypes.guess_type(file_name)[0]
+        await self._client.upload_stream(key, file_stream, self._max_bytes, content_type)
+        return f"{self._public_base_url}/{key}"
+
+    async def delete(self, avatar_url: str) -> None:
+        if avatar_url.startswith(f"{self._public_base_url}/avatars/"):
+            await self._client.delete_object(avatar_url.removeprefix(f"{self._public_base_url}/"))
@@ -0,0 +1,67 @@
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from src.application.common.token_revocation import AbstractTokenRevocationList
+
+logger = logging.getLogger(__name__)
+
+# Loads {user_id: token_version} for users whose tokens were revoked after the given time
+RevocationLoader = Callable[[datetime], Awaitable[dict[UUID, int]]]
+
+
+class InMemoryTokenRevocationList(AbstractTokenRevocationList):
+    """
+    Process-wide map of user id -> minimum valid token version.
+
+    Only revocations younger than the access token lifetime matter (older
+    tokens have expired anyway), so the map stays small. It is reloaded from
+    the database at most every `refresh_seconds`, which is how revocations made
+    by other worker processes arrive here; revocations made in this process
+    apply immediately. If a reload fails the previous map is kept.
+    """
+
+    def __init__(
+        self,
+        loader: RevocationLoader,
+        token_lifetime: timedelta,
+        refresh_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._loader = loader
+        self._token_lifetime = token_lifetime
+        self._refresh_seconds = refresh_seconds
+        self._clock = clock
+        self._min_versions: dict[UUID, int] = {}
+        # Local revocations made while a reload is in flight, which it may have missed
+        self._revoked_during_refresh: dict[UUID, int] = {}
+        self._next_refresh_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def is_revoked(self, user_id: UUID, token_version: int) -> bool:
+        if self._clock() >= self._next_refresh_at:
+            await self._refresh()
+        return token_version < self._min_versions.get(user_id, 0)
+
+    async def revoke(self, user_id: UUID, token_version: int) -> None:
+        self._min_versions[user_id] = max(self._min_versions.get(user_id, 0), token_version)
+        self._revoked_during_refresh[user_id] = self._min_versions[user_id]
+
+    async def _refresh(self) -> None:
+        async with self._lock:
+            # Another request may have refreshed while this one waited for the lock
+            if self._clock() < self._next_refresh_at:
+                return
+            since = datetime.now(timezone.utc) - self._token_lifetime
+            self._revoked_during_refresh = {}
+            try:
+                min_versions = await self._loader(since)
+                for user_id, token_version in self._revoked_during_refresh.items():
+                    min_versions[user_id] = max(min_versions.get(user_id, 0), token_version)
+                self._min_versions = min_versions
+            except Exception:
+                logger.exception("Failed to reload token revocations; keeping the previous set")
+            self._next_refresh_at = self._clock() + self._refresh_seconds
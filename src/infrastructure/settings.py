@@ -0,0 +1,101 @@
+import os
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Accounts with at least this many followers are not fanned out on write;
+# their posts are pulled into followers' feeds at read time instead.
+FEED_CELEBRITY_FOLLOWER_THRESHOLD = int(os.getenv("FEED_CELEBRITY_FOLLOWER_THRESHOLD", "10000"))
+
+# Process-wide cache in front of user lookups by id (every authenticated request).
+# The TTL bounds staleness across worker processes; 0 entries disables the cache.
+USER_CACHE_MAX_SIZE = int(os.getenv("USER_CACHE_MAX_SIZE", "10000"))
+USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", "30"))
+
+# How often each process reloads revoked token versions from the database. This is
+# how long a logout-all takes to reach other workers when tokens embed user claims.
+TOKEN_REVOCATION_REFRESH_SECONDS = float(os.getenv("TOKEN_REVOCATION_REFRESH_SECONDS", "10"))
+
+# Verified access tokens remembered per process (until each token's own expiry)
+# so repeated requests skip the signature check; 0 disables the cache.
+TOKEN_CACHE_MAX_SIZE = int(os.getenv("TOKEN_CACHE_MAX_SIZE", "10000"))
+
+# Requests sent with an Idempotency-Key header (creating posts, following) are answered
+# from the stored response when retried within the TTL. A key whose first request died
+# without a response can be reused after the pending timeout. Completed responses are
+# also cached per process; 0 entries disables that cache.
+IDEMPOTENCY_KEY_TTL_SECONDS = int(os.getenv("IDEMPOTENCY_KEY_TTL_SECONDS", "86400"))
+IDEMPOTENCY_PENDING_TIMEOUT_SECONDS = int(os.getenv("IDEMPOTENCY_PENDING_TIMEOUT_SECONDS", "60"))
+IDEMPOTENCY_CACHE_MAX_SIZE = int(os.getenv("IDEMPOTENCY_CACHE_MAX_SIZE", "10000"))
+
+# Lifetime of a refresh token. Each refresh rotates the token and restarts it.
+REFRESH_TOKEN_EXPIRE_DAYS = int(os.getenv("REFRESH_TOKEN_EXPIRE_DAYS", "30"))
+
+# Upload size limits; uploads are streamed to disk and aborted once they exceed them
+POST_IMAGE_MAX_BYTES = int(os.getenv("POST_IMAGE_MAX_BYTES", str(20 * 1024 * 1024)))
+AVATAR_MAX_BYTES = int(os.getenv("AVATAR_MAX_BYTES", str(5 * 1024 * 1024)))
+
+# Processes rendering post image variants, and how many images may wait for them
+IMAGE_PROCESSOR_WORKERS = int(os.getenv("IMAGE_PROCESSOR_WORKERS", str(os.cpu_count() or 1)))
+IMAGE_PROCESSOR_MAX_PENDING = int(
+    os.getenv("IMAGE_PROCESSOR_MAX_PENDING", str(IMAGE_PROCESSOR_WORKERS * 32))
+)
+
+# Uploaded images are re-encoded to this format ("WEBP" or "JPEG") without metadata
+UPLOAD_IMAGE_FORMAT = os.getenv("UPLOAD_IMAGE_FORMAT", "WEBP").upper()
+UPLOAD_IMAGE_QUALITY = int(os.getenv("UPLOAD_IMAGE_QUALITY", "80"))
+
+# Pre-signed direct uploads (POST /posts/uploads): how long a target stays valid, and
+# the key signing targets for the local upload gateway. The key is a secret of its own;
+# only the development and test DB profiles fall back to a fixed one, anything else
+# refuses to start without it.
+DIRECT_UPLOAD_EXPIRE_SECONDS = int(os.getenv("DIRECT_UPLOAD_EXPIRE_SECONDS", "900"))
+UPLOAD_SIGNING_KEY = os.getenv("UPLOAD_SIGNING_KEY", "")
+if not UPLOAD_SIGNING_KEY:
+    if os.getenv("DB_PROFILE", "development").lower() not in ("development", "test"):
+        raise RuntimeError("UPLOAD_SIGNING_KEY must be set outside development and test")
+    UPLOAD_SIGNING_KEY = "insecure-development-upload-signing-key"
+
+# Resumable uploads (POST /posts/upload-sessions): sessions not finished this long after
+# they start are garbage-collected, and clients are asked to send chunks of this size (the S3
+# backend needs at least 5 MiB per chunk and raises smaller values to that)
+RESUMABLE_UPLOAD_EXPIRE_SECONDS = int(os.getenv("RESUMABLE_UPLOAD_EXPIRE_SECONDS", "86400"))
+RESUMABLE_UPLOAD_CHUNK_SIZE = int(os.getenv("RESUMABLE_UPLOAD_CHUNK_SIZE", str(1024 * 1024)))
+
+# Files of deleted posts are removed in the background in batches of this size, at most
+# this many files per second. A batch not finished within the lease is retried.
+MEDIA_REAPER_BATCH_SIZE = int(os.getenv("MEDIA_REAPER_BATCH_SIZE", "100"))
+MEDIA_REAPER_MAX_PER_SECOND = float(os.getenv("MEDIA_REAPER_MAX_PER_SECOND", "50"))
+MEDIA_DELETION_LEASE_SECONDS = int(os.getenv("MEDIA_DELETION_LEASE_SECONDS", "300"))
+
+# Read replicas (DB_REPLICA_URLS in database.py): a replica further behind than the max lag is
+# skipped until it catches up, checked at most every interval. After a user's write commits,
+# their reads stay on the primary for the read-your-writes window.
+DB_REPLICA_MAX_LAG_SECONDS = float(os.getenv("DB_REPLICA_MAX_LAG_SECONDS", "2"))
+DB_REPLICA_CHECK_SECONDS = float(os.getenv("DB_REPLICA_CHECK_SECONDS", "1"))
+DB_READ_YOUR_WRITES_SECONDS = float(os.getenv("DB_READ_YOUR_WRITES_SECONDS", "5"))
+
+# GET /metrics requires "Authorization: Bearer <token>" with this token; without one it
+# only answers clients on the same host (a local scraper or sidecar)
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+# On shutdown, requests still running get this long to finish before connections are closed;
+# requests arriving meanwhile are refused with 503
+SHUTDOWN_DRAIN_SECONDS = float(os.getenv("SHUTDOWN_DRAIN_SECONDS", "30"))
+
+# Where uploaded media is stored: "local" (files under uploads/ and media/) or "s3"
+# (any S3-compatible object store, which lets several app hosts share media)
+MEDIA_STORAGE_BACKEND = os.getenv("MEDIA_STORAGE_BACKEND", "local").lower()
+S3_ENDPOINT_URL = os.getenv("S3_ENDPOINT_URL", "http://localhost:9000")
+S3_BUCKET = os.getenv("S3_BUCKET", "insta-media")
+S3_REGION = os.getenv("S3_REGION", "us-east-1")
+S3_ACCESS_KEY_ID = os.getenv("S3_ACCESS_KEY_ID", "")
+S3_SECRET_ACCESS_KEY = os.getenv("S3_SECRET_ACCESS_KEY", "")
+# URL prefix clients fetch objects from (a CDN or the public bucket URL)
+S3_PUBLIC_BASE_URL = os.getenv("S3_PUBLIC_BASE_URL", f"{S3_ENDPOINT_URL}/{S3_BUCKET}")
+# Larger uploads are sent as multipart uploads of this part size, several parts at a time
+S3_MULTIPART_PART_SIZE = int(os.getenv("S3_MULTIPART_PART_SIZE", str(8 * 1024 * 1024)))
+S3_MULTIPART_CONCURRENCY = int(os.getenv("S3_MULTIPART_CONCURRENCY", "4"))
+# Keep-alive connections to the object store shared by all requests in a process
+S3_MAX_CONNECTIONS = int(os.getenv("S3_MAX_CONNECTIONS", "32"))
@@ -2,10 +2,12 @@ from fastapi import Depends, HTTPException
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from starlette import status
 
+from src.application.common.token_revocation import AbstractTokenRevocationList
 from src.application.common.token_service import AbstractTokenService
 from src.application.users.user_repository import AbstractUserRepository
 from src.domain.users.user import User as DomainUser
 from src.interfaces.api.dependencies import (
+    get_token_revocation_list,
     get_token_service,
     get_user_repository,
 )
@@ -17,20 +19,47 @@ async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     token_service: AbstractTokenService = Depends(get_token_service),
     user_repo: AbstractUserRepository = Depends(get_user_repository),
+    revocation_list: AbstractTokenRevocationList = Depends(get_token_revocation_list),
 ) -> DomainUser:
     """
     Dependency to get the current authenticated user.
-    Verifies JWT from the Authorization header and fetches the user from the DB.
+    Verifies JWT from the Authorization header. Tokens with embedded user claims
+    are trusted as they are (checked only against the revocation list);
+    otherwise the user is fetched from the user cache or the primary. Never
+    from a read replica: one that lags behind a logout-all would still have
+    the old token version.
     """
     token = credentials.credentials
     try:
-        user_id = token_service.verify_and_extract_user_id(token)
-        user = await user_repo.get_by_id(user_id)
+        claims = token_service.verify_token(token)
+        if claims.has_user_claims:
+            if await revocation_list.is_revoked(claims.user_id, claims.token_version):
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Token revoked",
+                )
+            # The password hash never leaves the database, and no route reads it
+            # from the authenticated user.
+            return DomainUser(
+                id=claims.user_id,
+                username=claims.username,
+                email=claims.email,
+                hashed_password="",
+                is_public=claims.is_public,
+                token_version=claims.token_version,
+            )
+
+        user = await user_repo.get_by_id(claims.user_id)
         if user is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="User not found",
             )
+        if claims.token_version < user.token_version:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token revoked",
+            )
         return user
     except Exception:
         raise HTTPException(
@@ -1,15 +1,31 @@
+from dataclasses import dataclass
+from datetime import datetime, timedelta
 from typing import AsyncGenerator
+from uuid import UUID
 
-from fastapi import Depends
+from fastapi import BackgroundTasks, Depends, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.application.common.media_blob_repository import AbstractMediaBlobRepository
 from src.application.common.password_hasher import AbstractPasswordHasher
-from src.application.common.token_service import AbstractTokenService
+from src.application.common.task_scheduler import AbstractTaskScheduler
+from src.application.common.token_revocation import AbstractTokenRevocationList
+from src.application.common.token_service import AbstractTokenService, TokenClaims
+from src.application.common.unit_of_work import AbstractUnitOfWork
+from src.application.feeds.timeline_repository import AbstractTimelineRepository
+from src.application.feeds.use_cases.get_feed import GetFeedUseCase
 from src.application.health.health_check import HealthCheckUseCase
 from src.application.health.health_repository import AbstractHealthRepository
 from src.application.users.avatar_storage import AbstractAvatarStorage
+from src.application.posts.image_processor import AbstractPostImageProcessor
 from src.application.posts.post_storage import AbstractPostImageStorage
+from src.application.posts.direct_upload import AbstractDirectUploadStorage
 from src.application.posts.use_cases.create_post import CreatePostUseCase
+from src.application.posts.use_cases.create_upload_target import CreateUploadTargetUseCase
+from src.application.posts.resumable_upload import AbstractResumableUploadStorage
+from src.application.posts.use_cases.create_upload_session import CreateUploadSessionUseCase
+from src.application.posts.use_cases.get_upload_session import GetUploadSessionUseCase
+from src.application.posts.use_cases.append_upload_chunk import AppendUploadChunkUseCase
 from src.application.posts.use_cases.get_post import GetPostUseCase
 from src.application.posts.use_cases.list_posts import ListPostsUseCase
 from src.application.follows.use_cases.follow_user import FollowUserUseCase
@@ -17,14 +33,24 @@ from src.application.follows.use_cases.unfollow_user import UnfollowUserUseCase
 from src.application.follows.use_cases.get_followers import GetFollowersUseCase
 from src.application.follows.use_cases.get_following import GetFollowingUseCase
 from src.application.users.login_user import LoginUserUseCase
+from src.application.users.logout_all_sessions import LogoutAllSessionsUseCase
+from src.application.users.refresh_access_token import RefreshAccessTokenUseCase
+from src.application.users.refresh_token_repository import AbstractRefreshTokenRepository
 from src.application.users.register_user import RegisterUserUseCase
 from src.application.users.update_user_profile import UpdateUserProfileUseCase
 from src.application.users.user_repository import AbstractUserRepository
 from src.application.posts.post_repository import AbstractPostRepository
-from src.infrastructure.persistence.database import AsyncSessionLocal
+from src.domain.users.user import User as DomainUser
+from src.infrastructure.persistence.database import AsyncSessionLocal, session_router
 from src.infrastructure.persistence.repositories.health_repository import (
     DummyHealthRepository,
 )
+from src.infrastructure.persistence.repositories.media_blob_repository import (
+    SQLAlchemyMediaBlobRepository,
+)
+from src.infrastructure.persistence.repositories.refresh_token_repository import (
+    SQLAlchemyRefreshTokenRepository,
+)
 from src.infrastructure.persistence.repositories.user_repository import (
     SQLAlchemyUserRepository,
 )
@@ -34,44 +60,326 @@ from src.infrastructure.persistence.repositories.post_repository import (
 from src.infrastructure.persistence.repositories.follow_repository import (
     SQLAlchemyFollowRepository,
 )
+from src.infrastructure.persistence.repositories.timeline_repository import (
+    SQLAlchemyTimelineRepository,
+)
+from src.infrastructure.persistence.unit_of_work import SQLAlchemyUnitOfWork
+from src.infrastructure.settings import (
+    FEED_CELEBRITY_FOLLOWER_THRESHOLD,
+    IDEMPOTENCY_CACHE_MAX_SIZE,
+    IDEMPOTENCY_KEY_TTL_SECONDS,
+    IDEMPOTENCY_PENDING_TIMEOUT_SECONDS,
+    MEDIA_DELETION_LEASE_SECONDS,
+    MEDIA_REAPER_BATCH_SIZE,
+    MEDIA_REAPER_MAX_PER_SECOND,
+    MEDIA_STORAGE_BACKEND,
+    REFRESH_TOKEN_EXPIRE_DAYS,
+    TOKEN_CACHE_MAX_SIZE,
+    TOKEN_REVOCATION_REFRESH_SECONDS,
+    USER_CACHE_MAX_SIZE,
+    USER_CACHE_TTL_SECONDS,
+)
+from src.infrastructure.services.background_tasks import StarletteTaskScheduler
 from src.infrastructure.services.password import PasslibPasswordHasher
-from src.infrastructure.services.jwt import JWTTokenService
-from src.infrastructure.services.storage import LocalAvatarStorage
-from src.infrastructure.services.post_storage import LocalPostImageStorage
+from src.infrastructure.services.jwt import ACCESS_TOKEN_EXPIRE_MINUTES, JWTTokenService
+from src.infrastructure.services.storage import ContentAddressedAvatarStorage, S3AvatarStorage
+from src.infrastructure.services.token_revocation import InMemoryTokenRevocationList
+from src.infrastructure.services.ttl_cache import TTLCache
+from src.infrastructure.services.image_processing import (
+    OriginalOnlyPostImageProcessor,
+    PillowPostImageProcessor,
+)
+from src.infrastructure.services.image_transform import get_upload_transformer
+from src.infrastructure.services.post_storage import (
+    ContentAddressedPostImageStorage,
+    LocalPostImageStorage,
+    S3PostImageStorage,
+)
+from src.infrastructure.services.object_storage import get_s3_client
+from src.infrastructure.services.direct_upload import (
+    LocalDirectUploadStorage,
+    LocalUploadGateway,
+    S3DirectUploadStorage,
+)
+from src.infrastructure.services.resumable_upload import (
+    LocalResumableUploadStorage,
+    S3ResumableUploadStorage,
+)
+from src.infrastructure.services.blob_store import ContentAddressedBlobStore, create_blob_directory
 from src.application.follows.follow_repository import AbstractFollowRepository
+from src.application.common.media_deletion_queue import AbstractMediaDeletionQueue
+from src.application.posts.media_reaper import MediaReaper
+from src.application.posts.use_cases.delete_post import DeletePostUseCase
+from src.infrastructure.persistence.repositories.media_deletion_queue import (
+    SQLAlchemyMediaDeletionQueue,
+)
+from src.application.common.idempotency_repository import (
+    AbstractIdempotencyRepository,
+    IdempotencyRecord,
+)
+from src.infrastructure.persistence.repositories.idempotency_repository import (
+    SQLAlchemyIdempotencyRepository,
+)
 
 
-# --- Database Session ---
-async def get_db_session() -> AsyncGenerator[AsyncSession, None]:
-    async with AsyncSessionLocal() as session:
-        yield session
+# --- Services ---
+# Each entry expires together with its token, which overrides the default TTL
+_verified_token_cache: TTLCache[bytes, TokenClaims] = TTLCache(
+    max_size=TOKEN_CACHE_MAX_SIZE, ttl_seconds=ACCESS_TOKEN_EXPIRE_MINUTES * 60
+)
+
+
+def get_verified_token_cache() -> TTLCache[bytes, TokenClaims]:
+    return _verified_token_cache
+
+
+@dataclass(frozen=True)
+class Services:
+    """
+    Services that hold no per-request state, built once per process instead
+    of on every request. The app's lifespan builds them at startup; outside
+    the app (CLI commands, tests) they are built on first use. Building them
+    also creates the local blob directory, so requests never have to.
+    """
+
+    password_hasher: AbstractPasswordHasher
+    token_service: AbstractTokenService
+    post_image_processor: AbstractPostImageProcessor
+    health_repository: AbstractHealthRepository
+    # Variants, and originals from before dedup, on local disk
+    local_post_images: LocalPostImageStorage
+
+
+_services: Services | None = None
+
+
+def get_services() -> Services:
+    global _services
+    if _services is None:
+        if MEDIA_STORAGE_BACKEND != "s3":
+            create_blob_directory()
+        _services = Services(
+            password_hasher=PasslibPasswordHasher(),
+            token_service=JWTTokenService(verified_cache=_verified_token_cache),
+            post_image_processor=(
+                OriginalOnlyPostImageProcessor()
+                if MEDIA_STORAGE_BACKEND == "s3"
+                else PillowPostImageProcessor()
+            ),
+            health_repository=DummyHealthRepository(),
+            local_post_images=LocalPostImageStorage(),
+        )
+    return _services
 
 
-# --- Services ---
 def get_password_hasher() -> AbstractPasswordHasher:
-    return PasslibPasswordHasher()
+    return get_services().password_hasher
 
 
 def get_token_service() -> AbstractTokenService:
-    return JWTTokenService()
+    return get_services().token_service
+
+
+# --- Database Session ---
+def get_request_user_id(
+    request: Request,
+    token_service: AbstractTokenService = Depends(get_token_service),
+) -> UUID | None:
+    """
+    The user a request is made by, for routing its queries only. Unauthenticated
+    or invalid requests get None here; `get_current_user` rejects them where needed.
+    """
+    if not session_router.has_replicas:
+        return None
+    scheme, _, token = request.headers.get("authorization", "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    try:
+        return token_service.verify_token(token).user_id
+    except Exception:
+        return None
+
+
+async def get_db_session(
+    user_id: UUID | None = Depends(get_request_user_id),
+) -> AsyncGenerator[AsyncSession, None]:
+    async with session_router.primary(user_id) as session:
+        yield session
+
+
+async def get_read_session(
+    user_id: UUID | None = Depends(get_request_user_id),
+    primary: AsyncSession = Depends(get_db_session),
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    A session for queries only, on a read replica when one is configured and
+    current. Otherwise it is the request's primary session (which connects
+    only when used), so reads never hold a second primary connection.
+    """
+    session = session_router.read(user_id)
+    if session is None:
+        yield primary
+        return
+    async with session:
+        yield session
+
+
+def get_unit_of_work(
+    session: AsyncSession = Depends(get_db_session),
+) -> AbstractUnitOfWork:
+    return SQLAlchemyUnitOfWork(session)
+
+
+def get_task_scheduler(background_tasks: BackgroundTasks) -> AbstractTaskScheduler:
+    return StarletteTaskScheduler(background_tasks)
+
+
+def get_media_blob_repository(
+    session: AsyncSession = Depends(get_db_session),
+) -> AbstractMediaBlobRepository:
+    return SQLAlchemyMediaBlobRepository(session)
+
+
+def get_blob_store(
+    blob_repo: AbstractMediaBlobRepository = Depends(get_media_blob_repository),
+) -> ContentAddressedBlobStore | None:
+    """The local blob store, or None with the S3 backend, which stores media itself."""
+    if MEDIA_STORAGE_BACKEND == "s3":
+        return None
+    return ContentAddressedBlobStore(blob_repo, transformer=get_upload_transformer())
+
+
+def get_avatar_storage(
+    blob_store: ContentAddressedBlobStore | None = Depends(get_blob_store),
+) -> AbstractAvatarStorage:
+    if blob_store is None:
+        return S3AvatarStorage(get_s3_client())
+    return ContentAddressedAvatarStorage(blob_store)
+
+
+def get_post_image_storage(
+    blob_store: ContentAddressedBlobStore | None = Depends(get_blob_store),
+) -> AbstractPostImageStorage:
+    if blob_store is None:
+        return S3PostImageStorage(get_s3_client())
+    return ContentAddressedPostImageStorage(blob_store)
 
 
-def get_avatar_storage() -> AbstractAvatarStorage:
-    return LocalAvatarStorage()
+def get_media_deletion_queue(
+    session: AsyncSession = Depends(get_db_session),
+) -> AbstractMediaDeletionQueue:
+    return SQLAlchemyMediaDeletionQueue(
+        session, lease=timedelta(seconds=MEDIA_DELETION_LEASE_SECONDS)
+    )
+
+
+def media_reaper_storages(
+    blob_store: ContentAddressedBlobStore | None,
+) -> list[AbstractPostImageStorage]:
+    """Every storage a deleted post's files may be in."""
+    if blob_store is None:
+        return [S3PostImageStorage(get_s3_client())]
+    # Originals are blobs; variants (and originals from before dedup) are plain files
+    return [ContentAddressedPostImageStorage(blob_store), get_services().local_post_images]
+
+
+def get_media_reaper(
+    queue: AbstractMediaDeletionQueue = Depends(get_media_deletion_queue),
+    unit_of_work: AbstractUnitOfWork = Depends(get_unit_of_work),
+    blob_store: ContentAddressedBlobStore | None = Depends(get_blob_store),
+) -> MediaReaper:
+    return MediaReaper(
+        queue,
+        unit_of_work,
+        media_reaper_storages(blob_store),
+        MEDIA_REAPER_BATCH_SIZE,
+        MEDIA_REAPER_MAX_PER_SECOND,
+    )
+
+
+_local_upload_gateway = LocalUploadGateway()
+
 
+def get_local_upload_gateway() -> LocalUploadGateway:
+    return _local_upload_gateway
 
-def get_post_image_storage() -> AbstractPostImageStorage:
-    return LocalPostImageStorage()
+
+def get_direct_upload_storage(
+    blob_store: ContentAddressedBlobStore | None = Depends(get_blob_store),
+    gateway: LocalUploadGateway = Depends(get_local_upload_gateway),
+) -> AbstractDirectUploadStorage:
+    if blob_store is None:
+        return S3DirectUploadStorage(get_s3_client())
+    return LocalDirectUploadStorage(gateway, blob_store)
+
+
+# Process-wide, so abandoned sessions are swept at most once per interval
+_resumable_uploads: AbstractResumableUploadStorage | None = None
+
+
+def get_resumable_upload_storage(
+    gateway: LocalUploadGateway = Depends(get_local_upload_gateway),
+) -> AbstractResumableUploadStorage:
+    global _resumable_uploads
+    if _resumable_uploads is None:
+        if MEDIA_STORAGE_BACKEND == "s3":
+            _resumable_uploads = S3ResumableUploadStorage(get_s3_client())
+        else:
+            _resumable_uploads = LocalResumableUploadStorage(gateway)
+    return _resumable_uploads
+
+
+def get_post_image_processor() -> AbstractPostImageProcessor:
+    return get_services().post_image_processor
 
 
 # --- Repositories ---
 def get_health_repository() -> AbstractHealthRepository:
-    return DummyHealthRepository()
+    return get_services().health_repository
+
+
+_user_cache: TTLCache[UUID, DomainUser] = TTLCache(
+    max_size=USER_CACHE_MAX_SIZE, ttl_seconds=USER_CACHE_TTL_SECONDS
+)
+
+
+def get_user_cache() -> TTLCache[UUID, DomainUser]:
+    return _user_cache
+
+
+async def _load_token_revocations(since: datetime) -> dict[UUID, int]:
+    async with AsyncSessionLocal() as session:
+        return await SQLAlchemyUserRepository(session).get_token_versions_changed_since(since)
+
+
+_token_revocation_list = InMemoryTokenRevocationList(
+    loader=_load_token_revocations,
+    token_lifetime=timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES),
+    refresh_seconds=TOKEN_REVOCATION_REFRESH_SECONDS,
+)
+
+
+def get_token_revocation_list() -> AbstractTokenRevocationList:
+    return _token_revocation_list
+
+
+def get_refresh_token_repository(
+    session: AsyncSession = Depends(get_db_session),
+) -> AbstractRefreshTokenRepository:
+    return SQLAlchemyRefreshTokenRepository(session)
 
 
 def get_user_repository(
     session: AsyncSession = Depends(get_db_session),
+    cache: TTLCache[UUID, DomainUser] = Depends(get_user_cache),
+) -> AbstractUserRepository:
+    return SQLAlchemyUserRepository(session, cache)
+
+
+def get_read_user_repository(
+    session: AsyncSession = Depends(get_read_session),
 ) -> AbstractUserRepository:
+    # No shared cache: rows from a lagging replica could undo an invalidation
     return SQLAlchemyUserRepository(session)
 
 
@@ -81,12 +389,50 @@ def get_post_repository(
     return SQLAlchemyPostRepository(session)
 
 
+def get_read_post_repository(
+    session: AsyncSession = Depends(get_read_session),
+) -> AbstractPostRepository:
+    return SQLAlchemyPostRepository(session)
+
+
 def get_follow_repository(
     session: AsyncSession = Depends(get_db_session),
 ) -> AbstractFollowRepository:
     return SQLAlchemyFollowRepository(session)
 
 
+def get_read_follow_repository(
+    session: AsyncSession = Depends(get_read_session),
+) -> AbstractFollowRepository:
+    return SQLAlchemyFollowRepository(session)
+
+
+_idempotency_cache: TTLCache[tuple[UUID, str], IdempotencyRecord] = TTLCache(
+    max_size=IDEMPOTENCY_CACHE_MAX_SIZE, ttl_seconds=IDEMPOTENCY_KEY_TTL_SECONDS
+)
+
+
+def get_idempotency_cache() -> TTLCache[tuple[UUID, str], IdempotencyRecord]:
+    return _idempotency_cache
+
+
+def get_idempotency_repository(
+    session: AsyncSession = Depends(get_db_session),
+) -> AbstractIdempotencyRepository:
+    return SQLAlchemyIdempotencyRepository(
+        session,
+        ttl=timedelta(seconds=IDEMPOTENCY_KEY_TTL_SECONDS),
+        pending_timeout=timedelta(seconds=IDEMPOTENCY_PENDING_TIMEOUT_SECONDS),
+        cache=_idempotency_cache,
+    )
+
+
+def get_timeline_repository(
+    session: AsyncSession = Depends(get_db_session),
+) -> AbstractTimelineRepository:
+    return SQLAlchemyTimelineRepository(session)
+
+
 # --- Health Check Use Case ---
 def get_health_check_use_case(
     repo: AbstractHealthRepository = Depends(get_health_repository),
@@ -106,33 +452,118 @@ def get_login_user_use_case(
     repo: AbstractUserRepository = Depends(get_user_repository),
     hasher: AbstractPasswordHasher = Depends(get_password_hasher),
     token_service: AbstractTokenService = Depends(get_token_service),
+    task_scheduler: AbstractTaskScheduler = Depends(get_task_scheduler),
+    refresh_token_repo: AbstractRefreshTokenRepository = Depends(get_refresh_token_repository),
+    unit_of_work: AbstractUnitOfWork = Depends(get_unit_of_work),
 ) -> LoginUserUseCase:
-    return LoginUserUseCase(repo, hasher, token_service)
+    return LoginUserUseCase(
+        repo,
+        hasher,
+        token_service,
+        task_scheduler,
+        refresh_token_repo,
+        timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS),
+        unit_of_work,
+    )
+
+
+def get_refresh_access_token_use_case(
+    refresh_token_repo: AbstractRefreshTokenRepository = Depends(get_refresh_token_repository),
+    repo: AbstractUserRepository = Depends(get_user_repository),
+    token_service: AbstractTokenService = Depends(get_token_service),
+    unit_of_work: AbstractUnitOfWork = Depends(get_unit_of_work),
+) -> RefreshAccessTokenUseCase:
+    return RefreshAccessTokenUseCase(
+        refresh_token_repo,
+        repo,
+        token_service,
+        timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS),
+        unit_of_work,
+    )
 
 
 def get_update_user_profile_use_case(
     repo: AbstractUserRepository = Depends(get_user_repository),
     storage: AbstractAvatarStorage = Depends(get_avatar_storage),
+    unit_of_work: AbstractUnitOfWork = Depends(get_unit_of_work),
 ) -> UpdateUserProfileUseCase:
-    return UpdateUserProfileUseCase(repo, storage)
+    return UpdateUserProfileUseCase(repo, storage, unit_of_work)
+
+
+def get_logout_all_sessions_use_case(
+    repo: AbstractUserRepository = Depends(get_user_repository),
+    revocation_list: AbstractTokenRevocationList = Depends(get_token_revocation_list),
+    refresh_token_repo: AbstractRefreshTokenRepository = Depends(get_refresh_token_repository),
+    unit_of_work: AbstractUnitOfWork = Depends(get_unit_of_work),
+) -> LogoutAllSessionsUseCase:
+    return LogoutAllSessionsUseCase(repo, revocation_list, refresh_token_repo, unit_of_work)
 
 
 # --- Post Use Cases ---
 def get_create_post_use_case(
     repo: AbstractPostRepository = Depends(get_post_repository),
     storage: AbstractPostImageStorage = Depends(get_post_image_storage),
+    follow_repo: AbstractFollowRepository = Depends(get_follow_repository),
+    timeline_repo: AbstractTimelineRepository = Depends(get_timeline_repository),
+    image_processor: AbstractPostImageProcessor = Depends(get_post_image_processor),
+    task_scheduler: AbstractTaskScheduler = Depends(get_task_scheduler),
+    direct_uploads: AbstractDirectUploadStorage = Depends(get_direct_upload_storage),
+    unit_of_work: AbstractUnitOfWork = Depends(get_unit_of_work),
 ) -> CreatePostUseCase:
-    return CreatePostUseCase(repo, storage)
+    return CreatePostUseCase(
+        repo,
+        storage,
+        follow_repo,
+        timeline_repo,
+        FEED_CELEBRITY_FOLLOWER_THRESHOLD,
+        image_processor,
+        task_scheduler,
+        direct_uploads,
+        unit_of_work,
+    )
 
 
-def get_get_post_use_case(
+def get_create_upload_target_use_case(
+    direct_uploads: AbstractDirectUploadStorage = Depends(get_direct_upload_storage),
+) -> CreateUploadTargetUseCase:
+    return CreateUploadTargetUseCase(direct_uploads)
+
+
+def get_create_upload_session_use_case(
+    resumable_uploads: AbstractResumableUploadStorage = Depends(get_resumable_upload_storage),
+    task_scheduler: AbstractTaskScheduler = Depends(get_task_scheduler),
+) -> CreateUploadSessionUseCase:
+    return CreateUploadSessionUseCase(resumable_uploads, task_scheduler)
+
+
+def get_get_upload_session_use_case(
+    resumable_uploads: AbstractResumableUploadStorage = Depends(get_resumable_upload_storage),
+) -> GetUploadSessionUseCase:
+    return GetUploadSessionUseCase(resumable_uploads)
+
+
+def get_append_upload_chunk_use_case(
+    resumable_uploads: AbstractResumableUploadStorage = Depends(get_resumable_upload_storage),
+) -> AppendUploadChunkUseCase:
+    return AppendUploadChunkUseCase(resumable_uploads)
+
+
+def get_delete_post_use_case(
     repo: AbstractPostRepository = Depends(get_post_repository),
+    media_reaper: MediaReaper = Depends(get_media_reaper),
+    task_scheduler: AbstractTaskScheduler = Depends(get_task_scheduler),
+) -> DeletePostUseCase:
+    return DeletePostUseCase(repo, media_reaper, task_scheduler)
+
+
+def get_get_post_use_case(
+    repo: AbstractPostRepository = Depends(get_read_post_repository),
 ) -> GetPostUseCase:
     return GetPostUseCase(repo)
 
 
 def get_list_posts_use_case(
-    repo: AbstractPostRepository = Depends(get_post_repository),
+    repo: AbstractPostRepository = Depends(get_read_post_repository),
 ) -> ListPostsUseCase:
     return ListPostsUseCase(repo)
 
@@ -140,27 +571,43 @@ def get_list_posts_use_case(
 # --- Follow Use Cases ---
 def get_follow_user_use_case(
     follow_repo: AbstractFollowRepository = Depends(get_follow_repository),
-    user_repo: AbstractUserRepository = Depends(get_user_repository),
+    timeline_repo: AbstractTimelineRepository = Depends(get_timeline_repository),
+    unit_of_work: AbstractUnitOfWork = Depends(get_unit_of_work),
 ) -> FollowUserUseCase:
-    return FollowUserUseCase(follow_repo, user_repo)
+    return FollowUserUseCase(
+        follow_repo, timeline_repo, FEED_CELEBRITY_FOLLOWER_THRESHOLD, unit_of_work
+    )
 
 
 def get_unfollow_user_use_case(
     follow_repo: AbstractFollowRepository = Depends(get_follow_repository),
     user_repo: AbstractUserRepository = Depends(get_user_repository),
+    timeline_repo: AbstractTimelineRepository = Depends(get_timeline_repository),
+    unit_of_work: AbstractUnitOfWork = Depends(get_unit_of_work),
 ) -> UnfollowUserUseCase:
-    return UnfollowUserUseCase(follow_repo, user_repo)
+    return UnfollowUserUseCase(follow_repo, user_repo, timeline_repo, unit_of_work)
 
 
 def get_get_followers_use_case(
-    follow_repo: AbstractFollowRepository = Depends(get_follow_repository),
-    user_repo: AbstractUserRepository = Depends(get_user_repository),
+    follow_repo: AbstractFollowRepository = Depends(get_read_follow_repository),
+    user_repo: AbstractUserRepository = Depends(get_read_user_repository),
 ) -> GetFollowersUseCase:
     return GetFollowersUseCase(follow_repo, user_repo)
 
 
 def get_get_following_use_case(
-    follow_repo: AbstractFollowRepository = Depends(get_follow_repository),
-    user_repo: AbstractUserRepository = Depends(get_user_repository),
+    follow_repo: AbstractFollowRepository = Depends(get_read_follow_repository),
+    user_repo: AbstractUserRepository = Depends(get_read_user_repository),
 ) -> GetFollowingUseCase:
-    return GetFollowingUseCase(follow_repo, user_repo)
\ No newline at end of file
+    return GetFollowingUseCase(follow_repo, user_repo)
+
+
+# --- Feed Use Cases ---
+def get_get_feed_use_case(
+    timeline_repo: AbstractTimelineRepository = Depends(get_timeline_repository),
+    follow_repo: AbstractFollowRepository = Depends(get_follow_repository),
+    post_repo: AbstractPostRepository = Depends(get_post_repository),
+) -> GetFeedUseCase:
+    return GetFeedUseCase(
+        timeline_repo, follow_repo, post_repo, FEED_CELEBRITY_FOLLOWER_THRESHOLD
+    )
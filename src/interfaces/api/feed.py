@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Depends
+
+from src.application.common.pagination import Cursor
+from src.application.feeds.use_cases.get_feed import GetFeedRequest, GetFeedUseCase
+from src.domain.users.user import User as DomainUser
+from src.interfaces.api.auth import get_current_user
+from src.interfaces.api.dependencies import get_get_feed_use_case
+from src.interfaces.api.pagination import get_page_cursor, get_page_limit, to_page_out
+from src.interfaces.api.posts import PostPageOut
+
+
+feed_router = APIRouter(prefix="/feed", tags=["Feed"])
+
+
+@feed_router.get("", response_model=PostPageOut)
+async def get_feed(
+    limit: int = Depends(get_page_limit),
+    cursor: Cursor | None = Depends(get_page_cursor),
+    current_user: DomainUser = Depends(get_current_user),
+    use_case: GetFeedUseCase = Depends(get_get_feed_use_case),
+):
+    """
+    Get a page of the current user's home feed, newest posts first.
+    """
+    request = GetFeedRequest(user_id=current_user.id, limit=limit, cursor=cursor)
+    page = await use_case.execute(request)
+    return to_page_out(page)
@@ -3,6 +3,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends, status
 from pydantic import BaseModel, ConfigDict
 
+from src.application.common.pagination import Cursor
 from src.application.follows.use_cases.follow_user import FollowUserRequest, FollowUserUseCase
 from src.application.follows.use_cases.get_followers import GetFollowersRequest, GetFollowersUseCase
 from src.application.follows.use_cases.get_following import GetFollowingRequest, GetFollowingUseCase
@@ -15,7 +16,9 @@ from src.interfaces.api.dependencies import (
     get_get_following_use_case,
     get_unfollow_user_use_case,
 )
-from src.interfaces.api.users import UserOut
+from src.interfaces.api.idempotency import Idempotency, get_idempotency
+from src.interfaces.api.pagination import get_page_cursor, get_page_limit, to_page_out
+from src.interfaces.api.users import UserPageOut
 
 
 follows_router = APIRouter(prefix="/users", tags=["Follows"])
@@ -26,15 +29,19 @@ async def follow_user(
     user_id: UUID,
     current_user: DomainUser = Depends(get_current_user),
     use_case: FollowUserUseCase = Depends(get_follow_user_use_case),
+    idempotency: Idempotency = Depends(get_idempotency),
 ):
     """
-    Follow a user.
+    Follow a user. With an `Idempotency-Key` header, a retry of a follow that
+    succeeded gets its 204 again instead of an "already following" error.
     """
     request = FollowUserRequest(
         follower_id=current_user.id,
         followed_id=user_id,
     )
-    await use_case.execute(request)
+    return await idempotency.run(
+        lambda: use_case.execute(request), status.HTTP_204_NO_CONTENT
+    )
 
 
 @follows_router.delete("/{user_id}/follow", status_code=status.HTTP_204_NO_CONTENT)
@@ -42,38 +49,45 @@ async def unfollow_user(
     user_id: UUID,
     current_user: DomainUser = Depends(get_current_user),
     use_case: UnfollowUserUseCase = Depends(get_unfollow_user_use_case),
+    idempotency: Idempotency = Depends(get_idempotency),
 ):
     """
-    Unfollow a user.
+    Unfollow a user. Accepts an `Idempotency-Key` header like following.
     """
     request = UnfollowUserRequest(
         follower_id=current_user.id,
         followed_id=user_id,
     )
-    await use_case.execute(request)
+    return await idempotency.run(
+        lambda: use_case.execute(request), status.HTTP_204_NO_CONTENT
+    )
 
 
-@follows_router.get("/{user_id}/followers", response_model=list[UserOut])
+@follows_router.get("/{user_id}/followers", response_model=UserPageOut)
 async def get_followers(
     user_id: UUID,
+    limit: int = Depends(get_page_limit),
+    cursor: Cursor | None = Depends(get_page_cursor),
     use_case: GetFollowersUseCase = Depends(get_get_followers_use_case),
 ):
     """
-    Get a list of users who follow the specified user.
+    Get a page of users who follow the specified user, most recent first.
     """
-    request = GetFollowersRequest(user_id=user_id)
-    followers = await use_case.execute(request)
-    return followers
+    request = GetFollowersRequest(user_id=user_id, limit=limit, cursor=cursor)
+    page = await use_case.execute(request)
+    return to_page_out(page)
 
 
-@follows_router.get("/{user_id}/following", response_model=list[UserOut])
+@follows_router.get("/{user_id}/following", response_model=UserPageOut)
 async def get_following(
     user_id: UUID,
+    limit: int = Depends(get_page_limit),
+    cursor: Cursor | None = Depends(get_page_cursor),
     use_case: GetFollowingUseCase = Depends(get_get_following_use_case),
 ):
     """
-    Get a list of users that the specified user follows.
+    Get a page of users that the specified user follows, most recent first.
     """
-    request = GetFollowingRequest(user_id=user_id)
-    following = await use_case.execute(request)
-    return following
+    request = GetFollowingRequest(user_id=user_id, limit=limit, cursor=cursor)
+    page = await use_case.execute(request)
+    return to_page_out(page)
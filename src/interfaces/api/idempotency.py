@@ -0,0 +1,158 @@
+import hashlib
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+from uuid import UUID
+
+from fastapi import Depends, Header, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from starlette.datastructures import UploadFile
+
+from src.application.common.exceptions import IdempotencyKeyInUseError, IdempotencyKeyMismatchError
+from src.application.common.idempotency_repository import (
+    AbstractIdempotencyRepository,
+    IdempotencyRecord,
+)
+from src.application.common.task_scheduler import AbstractTaskScheduler
+from src.domain.users.user import User as DomainUser
+from src.interfaces.api.auth import get_current_user
+from src.interfaces.api.dependencies import get_idempotency_repository, get_task_scheduler
+
+logger = logging.getLogger(__name__)
+
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+# Expired keys are deleted at most this often per process, this many at a time
+SWEEP_INTERVAL_SECONDS = 60.0
+SWEEP_BATCH_SIZE = 1000
+
+_FORM_CONTENT_TYPES = ("multipart/form-data", "application/x-www-form-urlencoded")
+_READ_CHUNK_SIZE = 1024 * 1024
+
+_next_sweep = 0.0
+
+
+async def request_fingerprint(request: Request) -> str:
+    """
+    SHA-256 of the request's method, path and payload: the raw body, or for
+    forms every field, uploaded files by name and content. FastAPI has already
+    read the payload when dependencies run, so this only hashes it; uploaded
+    files are rewound afterwards.
+    """
+    digest = hashlib.sha256(f"{request.method} {request.url.path}\n".encode())
+    if not request.headers.get("content-type", "").startswith(_FORM_CONTENT_TYPES):
+        digest.update(await request.body())
+        return digest.hexdigest()
+
+    form = await request.form()
+    for name, value in sorted(form.multi_items(), key=lambda item: item[0]):
+        if isinstance(value, UploadFile):
+            digest.update(f"{name}\0file\0{value.filename}\0{value.size}\0".encode())
+            while chunk := await value.read(_READ_CHUNK_SIZE):
+                digest.update(chunk)
+            await value.seek(0)
+        else:
+            encoded = value.encode()
+            digest.update(f"{name}\0field\0{len(encoded)}\0".encode() + encoded)
+    return digest.hexdigest()
+
+
+class Idempotency:
+    """
+    Makes a route safe to retry with an `Idempotency-Key` header. The first
+    request with a key runs and its successful response is stored; repeats
+    get that response back (marked with `Idempotent-Replayed: true`) without
+    running anything, and a repeat arriving while the first request is still
+    running gets a 409, and reusing the key with another route or payload
+    gets a 422. Failed requests are not stored, so the same key can be
+    retried. Requests without the header run as usual.
+    """
+
+    def __init__(
+        self,
+        repo: AbstractIdempotencyRepository,
+        task_scheduler: AbstractTaskScheduler,
+        user_id: UUID,
+        key: str | None,
+        request_hash: str,
+    ) -> None:
+        self._repo = repo
+        self._task_scheduler = task_scheduler
+        self._user_id = user_id
+        self._key = key
+        self._request_hash = request_hash
+
+    async def run(
+        self,
+        execute: Callable[[], Awaitable[Any]],
+        status_code: int,
+        response_model: type[BaseModel] | None = None,
+    ) -> Response:
+        """Runs `execute` once per key and renders its result with `response_model`."""
+        if self._key is None:
+            return self._render(self._record(await execute(), status_code, response_model))
+
+        existing = await self._repo.reserve(self._user_id, self._key, self._request_hash)
+        if existing is not None:
+            if existing.request_hash != self._request_hash:
+                raise IdempotencyKeyMismatchError(
+                    "Idempotency key was used for a different request or payload"
+                )
+            if not existing.is_complete:
+                raise IdempotencyKeyInUseError("A request with this idempotency key is in progress")
+            response = self._render(existing)
+            response.headers[REPLAYED_HEADER] = "true"
+            return response
+
+        try:
+            result = await execute()
+        except Exception:
+            await self._repo.release(self._user_id, self._key)
+            raise
+        record = self._record(result, status_code, response_model)
+        await self._repo.complete(self._user_id, self._key, record)
+        self._schedule_sweep()
+        return self._render(record)
+
+    def _record(
+        self, result: Any, status_code: int, response_model: type[BaseModel] | None
+    ) -> IdempotencyRecord:
+        body = None
+        if response_model is not None:
+            body = jsonable_encoder(response_model.model_validate(result))
+        return IdempotencyRecord(self._request_hash, status_code, body)
+
+    @staticmethod
+    def _render(record: IdempotencyRecord) -> Response:
+        if record.body is None:
+            return Response(status_code=record.status_code)
+        return JSONResponse(record.body, status_code=record.status_code)
+
+    def _schedule_sweep(self) -> None:
+        global _next_sweep
+        if time.monotonic() < _next_sweep:
+            return
+        _next_sweep = time.monotonic() + SWEEP_INTERVAL_SECONDS
+        self._task_scheduler.schedule(self._delete_expired)
+
+    async def _delete_expired(self) -> None:
+        try:
+            await self._repo.delete_expired(SWEEP_BATCH_SIZE)
+        except Exception:
+            logger.exception("Deleting expired idempotency keys failed")
+
+
+async def get_idempotency(
+    request: Request,
+    idempotency_key: str | None = Header(None, alias="Idempotency-Key", min_length=1, max_length=255),
+    current_user: DomainUser = Depends(get_current_user),
+    repo: AbstractIdempotencyRepository = Depends(get_idempotency_repository),
+    task_scheduler: AbstractTaskScheduler = Depends(get_task_scheduler),
+) -> Idempotency:
+    # Keys are per user; the same key with another route or payload is a client
+    # bug, not a replay. Without a key nothing is stored, so nothing is hashed.
+    request_hash = await request_fingerprint(request) if idempotency_key is not None else ""
+    return Idempotency(repo, task_scheduler, current_user.id, idempotency_key, request_hash)
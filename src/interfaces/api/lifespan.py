@@ -0,0 +1,122 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI
+from starlette.responses import PlainTextResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from src.infrastructure.persistence.database import ENGINE_SETTINGS, engine, session_router
+from src.infrastructure.persistence.engine import warm_up_pool
+from src.infrastructure.services.image_pool import shutdown_image_executor
+from src.infrastructure.services.object_storage import close_s3_client
+from src.infrastructure.services.password import shutdown_hashing_executor
+from src.infrastructure.settings import SHUTDOWN_DRAIN_SECONDS
+from src.interfaces.api.dependencies import get_services
+
+logger = logging.getLogger(__name__)
+
+
+class InFlightRequests:
+    """
+    Counts the HTTP requests being handled, background tasks included, so
+    shutdown can wait for them. Once draining, new requests are refused.
+    Only touched from the event loop thread, so it needs no lock.
+    """
+
+    def __init__(self) -> None:
+        self._count = 0
+        # Only exists while draining, so it belongs to the loop that drains
+        self._idle: asyncio.Event | None = None
+        self.draining = False
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def started(self) -> None:
+        self._count += 1
+
+    def finished(self) -> None:
+        self._count -= 1
+        if self._count == 0 and self._idle is not None:
+            self._idle.set()
+
+    async def drain(self, timeout: float) -> bool:
+        """Refuses new requests and waits for running ones; False if some are still running."""
+        self.draining = True
+        if self._count == 0:
+            return True
+        self._idle = asyncio.Event()
+        try:
+            await asyncio.wait_for(self._idle.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            self._idle = None
+        return True
+
+
+class InFlightRequestsMiddleware:
+    """Tracks requests in `in_flight` and answers 503 while the app is shutting down."""
+
+    def __init__(self, app: ASGIApp, in_flight: InFlightRequests) -> None:
+        self._app = app
+        self._in_flight = in_flight
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+        if self._in_flight.draining:
+            response = PlainTextResponse(
+                "Shutting down", status_code=503, headers={"Connection": "close", "Retry-After": "1"}
+            )
+            await response(scope, receive, send)
+            return
+
+        self._in_flight.started()
+        try:
+            await self._app(scope, receive, send)
+        finally:
+            self._in_flight.finished()
+
+
+in_flight_requests = InFlightRequests()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """
+    Startup builds the shared services and opens pooled database connections
+    ahead of the first requests. Shutdown waits up to SHUTDOWN_DRAIN_SECONDS
+    for running requests, then stops the worker pools and closes connections.
+    """
+    get_services()
+    engines = {"primary": engine} | {r.name: r.engine for r in session_router.replicas}
+    for name, warmed_engine in engines.items():
+        try:
+            opened = await asyncio.wait_for(
+                warm_up_pool(warmed_engine, ENGINE_SETTINGS.warmup_connections),
+                ENGINE_SETTINGS.pool_timeout,
+            )
+            logger.info("Opened %d connections to %s", opened, name)
+        except Exception:
+            # Requests open connections on demand, and the health check reports the outage
+            logger.exception("Warming up the pool of %s failed", name)
+    await session_router.check_replicas()
+
+    yield
+
+    if not await in_flight_requests.drain(SHUTDOWN_DRAIN_SECONDS):
+        logger.warning(
+            "Shutting down with %d requests still running after %.0f s",
+            in_flight_requests.count,
+            SHUTDOWN_DRAIN_SECONDS,
+        )
+    shutdown_hashing_executor()
+    shutdown_image_executor()
+    await close_s3_client()
+    await session_router.dispose()
+    await engine.dispose()
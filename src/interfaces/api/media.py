@@ -0,0 +1,108 @@
+import os
+from pathlib import Path
+
+import anyio
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Receive, Scope, Send
+
+# Content-addressed URLs never change what they point at
+IMMUTABLE = "public, max-age=31536000, immutable"
+# Files that can be replaced in place are revalidated on every use (a cheap 304)
+REVALIDATE = "public, no-cache"
+
+ZEROCOPY_EXTENSION = "http.response.zerocopysend"
+
+
+def strong_etag(stat_result: os.stat_result) -> str:
+    """
+    A validator that changes whenever the file does. Uploads are written to a
+    temporary file and renamed into place, so new content always means a new
+    inode and modification time, never a partial rewrite of the old file.
+    """
+    return f'"{stat_result.st_ino:x}-{stat_result.st_size:x}-{stat_result.st_mtime_ns:x}"'
+
+
+class MediaFileResponse(FileResponse):
+    """
+    FileResponse that hands the file descriptor to the server for whole-file
+    and single-range bodies when it supports the ASGI zero-copy send
+    extension, so the kernel copies the bytes straight to the socket
+    (sendfile). Otherwise Starlette's own handling applies: path send where
+    supported, chunked reads elsewhere.
+    """
+
+    # Fewer, larger reads when the bytes have to pass through Python
+    chunk_size = 256 * 1024
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self._zerocopy = ZEROCOPY_EXTENSION in scope.get("extensions", {})
+        await super().__call__(scope, receive, send)
+
+    async def _handle_simple(self, send: Send, send_header_only: bool, send_pathsend: bool) -> None:
+        if not self._zerocopy or send_header_only:
+            return await super()._handle_simple(send, send_header_only, send_pathsend)
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        await self._zerocopy_send(send, 0, int(self.headers["content-length"]))
+
+    async def _handle_single_range(
+        self, send: Send, start: int, end: int, file_size: int, send_header_only: bool
+    ) -> None:
+        if not self._zerocopy or send_header_only:
+            return await super()._handle_single_range(send, start, end, file_size, send_header_only)
+        headers = MutableHeaders(raw=list(self.raw_headers))
+        headers["content-range"] = f"bytes {start}-{end - 1}/{file_size}"
+        headers["content-length"] = str(end - start)
+        await send({"type": "http.response.start", "status": 206, "headers": headers.raw})
+        await self._zerocopy_send(send, start, end - start)
+
+    async def _zerocopy_send(self, send: Send, offset: int, count: int) -> None:
+        file = await anyio.to_thread.run_sync(open, self.path, "rb")
+        try:
+            await send(
+                {
+                    "type": ZEROCOPY_EXTENSION,
+                    "file": file,
+                    "offset": offset,
+                    "count": count,
+                    "more_body": False,
+                }
+            )
+        finally:
+            file.close()
+
+
+class MediaFiles(StaticFiles):
+    """
+    Serves one storage root. Adds strong ETags and the given Cache-Control to
+    Starlette's static files, which already answer If-None-Match and
+    If-Modified-Since with 304 and serve byte ranges.
+    """
+
+    def __init__(self, directory: str | Path, cache_control: str = REVALIDATE) -> None:
+        super().__init__(directory=directory, check_dir=False)
+        self._cache_control = cache_control
+
+    async def check_config(self) -> None:
+        # Storage roots are created on first upload; until then every path is a 404
+        if self.directory is not None and not await anyio.Path(self.directory).exists():
+            return
+        await super().check_config()
+
+    def file_response(
+        self,
+        full_path: str | os.PathLike[str],
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        response = MediaFileResponse(
+            full_path,
+            status_code=status_code,
+            stat_result=stat_result,
+            headers={"etag": strong_etag(stat_result), "cache-control": self._cache_control},
+        )
+        if self.is_not_modified(response.headers, Headers(scope=scope)):
+            return NotModifiedResponse(response.headers)
+        return response
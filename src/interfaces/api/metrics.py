@@ -0,0 +1,174 @@
+import hmac
+from dataclasses import asdict
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request
+from fastapi.responses import PlainTextResponse
+from starlette import status
+
+from src.infrastructure.persistence.database import engine, session_router
+from src.infrastructure.persistence.engine import PoolStats, get_pool_stats
+from src.infrastructure.services.bounded_executor import ExecutorStats
+from src.infrastructure.services.image_pool import get_image_executor
+from src.infrastructure.services.image_transform import TransformStats, get_upload_transformer
+from src.infrastructure.services.password import get_hashing_executor
+from src.infrastructure.services.ttl_cache import CacheStats
+from src.infrastructure.settings import METRICS_TOKEN
+from src.interfaces.api.dependencies import (
+    get_idempotency_cache,
+    get_user_cache,
+    get_verified_token_cache,
+)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# HELP text of each stats field, and which of them only ever grow
+_HELP = {
+    "hits": "Lookups answered from the cache.",
+    "misses": "Lookups the cache could not answer.",
+    "evictions": "Entries dropped to stay within the maximum size.",
+    "size": "Entries held.",
+    "max_size": "Entries that may be held.",
+    "workers": "Worker threads or processes.",
+    "max_pending": "Calls that may be running or queued at once.",
+    "pending": "Calls running or queued.",
+    "rejected": "Calls refused because too many were pending.",
+    "images": "Uploads stored.",
+    "passed_through": "Uploads stored as received because they could not be re-encoded.",
+    "original_bytes": "Bytes received.",
+    "stored_bytes": "Bytes stored after re-encoding.",
+}
+_COUNTERS = {"hits", "misses", "evictions", "rejected", "images", "passed_through"}
+
+
+class _Exposition:
+    """Collects samples in the Prometheus text format, one HELP/TYPE header per metric."""
+
+    def __init__(self) -> None:
+        self._lines: list[str] = []
+        self._declared: set[str] = set()
+
+    def sample(
+        self,
+        name: str,
+        kind: str,
+        help_text: str,
+        value: float,
+        labels: dict[str, str] | None = None,
+        family: str | None = None,
+    ) -> None:
+        family = f"insta_{family or name}"
+        name = f"insta_{name}"
+        if family not in self._declared:
+            self._declared.add(family)
+            self._lines.append(f"# HELP {family} {help_text}")
+            self._lines.append(f"# TYPE {family} {kind}")
+        label_text = ""
+        if labels:
+            label_text = "{" + ",".join(f'{key}="{value}"' for key, value in labels.items()) + "}"
+        self._lines.append(f"{name}{label_text} {value}")
+
+    def render(self) -> str:
+        return "\n".join(self._lines) + "\n"
+
+
+def _pool(out: _Exposition, stats: PoolStats) -> None:
+    gauges = {
+        "db_pool_size": ("Connections kept open by the pool.", stats.pool_size),
+        "db_pool_max_overflow": ("Connections allowed beyond the pool size.", stats.max_overflow),
+        "db_pool_checked_out": ("Connections in use.", stats.checked_out),
+        "db_pool_checked_in": ("Idle connections in the pool.", stats.checked_in),
+        "db_pool_overflow": ("Connections open beyond the pool size.", stats.overflow),
+    }
+    for name, (help_text, value) in gauges.items():
+        out.sample(name, "gauge", help_text, value)
+    out.sample("db_pool_timeouts_total", "counter", "Checkouts that timed out.", stats.timeouts)
+
+    # Histogram samples share the base name's HELP/TYPE header
+    name = "db_pool_checkout_seconds"
+    help_text = "Time taken to check out a connection."
+    for bound, count in [*stats.wait_buckets, (float("inf"), stats.checkouts)]:
+        le = "+Inf" if bound == float("inf") else f"{bound:g}"
+        out.sample(f"{name}_bucket", "histogram", help_text, count, {"le": le}, family=name)
+    out.sample(f"{name}_sum", "histogram", help_text, stats.wait_seconds_total, family=name)
+    out.sample(f"{name}_count", "histogram", help_text, stats.checkouts, family=name)
+
+
+def _fields(
+    out: _Exposition,
+    prefix: str,
+    stats: CacheStats | ExecutorStats | TransformStats,
+    labels: dict[str, str],
+) -> None:
+    for field, value in asdict(stats).items():
+        if field in _COUNTERS or field.endswith("_bytes"):
+            out.sample(f"{prefix}_{field}_total", "counter", _HELP[field], value, labels)
+        else:
+            out.sample(f"{prefix}_{field}", "gauge", _HELP[field], value, labels)
+
+
+def render_metrics() -> str:
+    """Current statistics of this worker process in the Prometheus text format."""
+    out = _Exposition()
+    pool_stats = get_pool_stats(engine)
+    if pool_stats is not None:
+        _pool(out, pool_stats)
+    for replica in session_router.replicas:
+        labels = {"replica": replica.name}
+        up = replica.lag_seconds is not None
+        help_text = "Whether the replica answered its last lag check."
+        out.sample("db_replica_up", "gauge", help_text, int(up), labels)
+        if replica.lag_seconds is not None:
+            help_text = "Replication lag at the last check."
+            out.sample("db_replica_lag_seconds", "gauge", help_text, replica.lag_seconds, labels)
+
+    caches = {
+        "user": get_user_cache(),
+        "verified_token": get_verified_token_cache(),
+        "idempotency": get_idempotency_cache(),
+    }
+    for name, cache in caches.items():
+        _fields(out, "cache", cache.stats(), {"cache": name})
+
+    executors = {"password_hasher": get_hashing_executor(), "image": get_image_executor()}
+    for name, executor in executors.items():
+        _fields(out, "executor", executor.stats(), {"executor": name})
+
+    _fields(out, "upload_transform", get_upload_transformer().stats(), {})
+    return out.render()
+
+
+_LOOPBACK_HOSTS = {"127.0.0.1", "::1", "localhost"}
+
+
+def require_metrics_access(
+    request: Request,
+    authorization: str | None = Header(None),
+) -> None:
+    """
+    Lets a scraper in with the METRICS_TOKEN bearer token, or, when no token
+    is configured, only from the same host.
+    """
+    if METRICS_TOKEN:
+        scheme, _, token = (authorization or "").partition(" ")
+        if scheme.lower() != "bearer" or not hmac.compare_digest(token, METRICS_TOKEN):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid metrics token",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+    elif request.client is None or request.client.host not in _LOOPBACK_HOSTS:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Forbidden")
+
+
+metrics_router = APIRouter()
+
+
+@metrics_router.get(
+    "/metrics", include_in_schema=False, dependencies=[Depends(require_metrics_access)]
+)
+async def metrics() -> PlainTextResponse:
+    """
+    Endpoint for Prometheus to scrape. Every worker process reports its own
+    numbers, so scrape each worker (or aggregate by instance).
+    """
+    return PlainTextResponse(render_metrics(), media_type=CONTENT_TYPE)
@@ -0,0 +1,34 @@
+from fastapi import Query
+
+from src.application.common.pagination import (
+    DEFAULT_PAGE_SIZE,
+    MAX_PAGE_SIZE,
+    Cursor,
+    Page,
+    decode_cursor,
+    encode_cursor,
+)
+
+
+def get_page_limit(
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+) -> int:
+    return limit
+
+
+def get_page_cursor(
+    cursor: str | None = Query(None, description="`next_cursor` of the previous page"),
+) -> Cursor | None:
+    """
+    Decodes the opaque cursor query parameter.
+    Empty strings sent by clients are treated as "first page".
+    """
+    return decode_cursor(cursor) if cursor else None
+
+
+def to_page_out(page: Page) -> dict:
+    """Maps an application page to the `{items, next_cursor}` response body."""
+    return {
+        "items": page.items,
+        "next_cursor": encode_cursor(page.next_cursor) if page.next_cursor else None,
+    }
@@ -1,19 +1,45 @@
 from datetime import datetime
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, Form, UploadFile, status
-from pydantic import BaseModel, ConfigDict
+from fastapi import APIRouter, Depends, File, Form, Header, Request, Response, UploadFile, status
+from pydantic import BaseModel, ConfigDict, Field
 
+from src.application.common.pagination import Cursor
+from src.application.posts.use_cases.append_upload_chunk import (
+    AppendUploadChunkRequest,
+    AppendUploadChunkUseCase,
+)
 from src.application.posts.use_cases.create_post import CreatePostRequest, CreatePostUseCase
+from src.application.posts.use_cases.create_upload_session import (
+    CreateUploadSessionRequest,
+    CreateUploadSessionUseCase,
+)
+from src.application.posts.use_cases.create_upload_target import (
+    CreateUploadTargetRequest,
+    CreateUploadTargetUseCase,
+)
+from src.application.posts.use_cases.delete_post import DeletePostRequest, DeletePostUseCase
 from src.application.posts.use_cases.get_post import GetPostRequest, GetPostUseCase
+from src.application.posts.use_cases.get_upload_session import (
+    GetUploadSessionRequest,
+    GetUploadSessionUseCase,
+)
 from src.application.posts.use_cases.list_posts import ListPostsRequest, ListPostsUseCase
 from src.domain.users.user import User as DomainUser
 from src.interfaces.api.auth import get_current_user
 from src.interfaces.api.dependencies import (
+    get_append_upload_chunk_use_case,
     get_create_post_use_case,
+    get_create_upload_session_use_case,
+    get_create_upload_target_use_case,
+    get_delete_post_use_case,
     get_get_post_use_case,
+    get_get_upload_session_use_case,
     get_list_posts_use_case,
 )
+from src.interfaces.api.idempotency import Idempotency, get_idempotency
+from src.interfaces.api.pagination import get_page_cursor, get_page_limit, to_page_out
+from src.interfaces.api.uploads import iter_upload
 
 
 class PostOut(BaseModel):
@@ -22,9 +48,55 @@ class PostOut(BaseModel):
     user_id: UUID
     image_url: str
     caption: str | None
+    # Resized renditions by name ("thumbnail", "feed", "original"); until
+    # media_status is "ready" only "original" is guaranteed to exist
+    variants: dict[str, str]
+    media_status: str
     created_at: datetime
 
 
+class PostPageOut(BaseModel):
+    items: list[PostOut]
+    next_cursor: str | None
+
+
+class UploadTargetIn(BaseModel):
+    file_name: str
+    # Exact size of the image in bytes; the upload target only accepts this size
+    size: int = Field(gt=0)
+
+
+class UploadTargetOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    upload_id: str
+    url: str
+    method: str
+    headers: dict[str, str]
+    expires_at: datetime
+
+
+class UploadSessionIn(BaseModel):
+    file_name: str
+    # Exact size of the image in bytes
+    size: int = Field(gt=0)
+
+
+class UploadSessionOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+    upload_id: str
+    size: int
+    # Bytes stored so far; the next chunk starts here
+    offset: int
+    # Send chunks of this size; only the last one may be shorter
+    chunk_size: int
+    expires_at: datetime
+
+
+class PostFromUploadIn(BaseModel):
+    upload_id: str
+    caption: str | None = None
+
+
 posts_router = APIRouter(prefix="/posts", tags=["Posts"])
 
 
@@ -32,21 +104,120 @@ posts_router = APIRouter(prefix="/posts", tags=["Posts"])
 async def create_post(
     current_user: DomainUser = Depends(get_current_user),
     use_case: CreatePostUseCase = Depends(get_create_post_use_case),
+    idempotency: Idempotency = Depends(get_idempotency),
     caption: str | None = Form(None),
     image: UploadFile = File(...),
 ):
     """
-    Create a new post with an image and optional caption.
+    Create a new post with an image and optional caption. Send an
+    `Idempotency-Key` header to make retries return the same post.
     """
-    image_data = await image.read()
     request = CreatePostRequest(
         user_id=current_user.id,
         image_file_name=image.filename,
-        image_file_data=image_data,
+        image_file_stream=iter_upload(image),
         caption=caption,
     )
-    post = await use_case.execute(request)
-    return post
+    return await idempotency.run(
+        lambda: use_case.execute(request), status.HTTP_201_CREATED, PostOut
+    )
+
+
+@posts_router.post(
+    "/uploads", response_model=UploadTargetOut, status_code=status.HTTP_201_CREATED
+)
+async def create_upload_target(
+    body: UploadTargetIn,
+    current_user: DomainUser = Depends(get_current_user),
+    use_case: CreateUploadTargetUseCase = Depends(get_create_upload_target_use_case),
+):
+    """
+    Start a direct upload: send the image to the returned URL with the returned
+    method and headers, then create the post with `POST /posts/from-upload`.
+    """
+    request = CreateUploadTargetRequest(
+        user_id=current_user.id, file_name=body.file_name, size=body.size
+    )
+    return await use_case.execute(request)
+
+
+@posts_router.post(
+    "/upload-sessions", response_model=UploadSessionOut, status_code=status.HTTP_201_CREATED
+)
+async def create_upload_session(
+    body: UploadSessionIn,
+    current_user: DomainUser = Depends(get_current_user),
+    use_case: CreateUploadSessionUseCase = Depends(get_create_upload_session_use_case),
+):
+    """
+    Start a resumable upload for large images on unreliable connections: send
+    the image in chunks with `PATCH /posts/upload-sessions/{upload_id}`, then
+    create the post with `POST /posts/from-upload`.
+    """
+    request = CreateUploadSessionRequest(
+        user_id=current_user.id, file_name=body.file_name, size=body.size
+    )
+    return await use_case.execute(request)
+
+
+@posts_router.get("/upload-sessions/{upload_id:path}", response_model=UploadSessionOut)
+async def get_upload_session(
+    upload_id: str,
+    response: Response,
+    current_user: DomainUser = Depends(get_current_user),
+    use_case: GetUploadSessionUseCase = Depends(get_get_upload_session_use_case),
+):
+    """
+    Get the offset to resume an interrupted upload from.
+    """
+    request = GetUploadSessionRequest(user_id=current_user.id, upload_id=upload_id)
+    session = await use_case.execute(request)
+    response.headers["Upload-Offset"] = str(session.offset)
+    return session
+
+
+@posts_router.patch("/upload-sessions/{upload_id:path}", response_model=UploadSessionOut)
+async def append_upload_chunk(
+    upload_id: str,
+    request: Request,
+    response: Response,
+    upload_offset: int = Header(..., alias="Upload-Offset", ge=0),
+    current_user: DomainUser = Depends(get_current_user),
+    use_case: AppendUploadChunkUseCase = Depends(get_append_upload_chunk_use_case),
+):
+    """
+    Append the request body at `Upload-Offset`, which must be the session's
+    current offset (409 with the right one otherwise). If the connection drops,
+    get the session to see how much arrived and continue from there.
+    """
+    chunk_request = AppendUploadChunkRequest(
+        user_id=current_user.id,
+        upload_id=upload_id,
+        offset=upload_offset,
+        chunk_stream=request.stream(),
+    )
+    session = await use_case.execute(chunk_request)
+    response.headers["Upload-Offset"] = str(session.offset)
+    return session
+
+
+@posts_router.post("/from-upload", response_model=PostOut, status_code=status.HTTP_201_CREATED)
+async def create_post_from_upload(
+    body: PostFromUploadIn,
+    current_user: DomainUser = Depends(get_current_user),
+    use_case: CreatePostUseCase = Depends(get_create_post_use_case),
+    idempotency: Idempotency = Depends(get_idempotency),
+):
+    """
+    Create a new post from an image uploaded directly to storage or through an
+    upload session. Accepts an `Idempotency-Key` header like `POST /posts/`.
+    """
+    request = CreatePostRequest(
+        user_id=current_user.id, upload_id=body.upload_id, caption=body.caption
+    )
+    return await idempotency.run(
+        lambda: use_case.execute(request), status.HTTP_201_CREATED, PostOut
+    )
 
 
 @posts_router.get("/{post_id}", response_model=PostOut)
@@ -62,14 +233,29 @@ async def get_post(
     return post
 
 
-@posts_router.get("/user/{user_id}", response_model=list[PostOut])
+@posts_router.delete("/{post_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_post(
+    post_id: UUID,
+    current_user: DomainUser = Depends(get_current_user),
+    use_case: DeletePostUseCase = Depends(get_delete_post_use_case),
+):
+    """
+    Delete one of your posts. Its image files are removed in the background.
+    """
+    request = DeletePostRequest(user_id=current_user.id, post_id=post_id)
+    await use_case.execute(request)
+
+
+@posts_router.get("/user/{user_id}", response_model=PostPageOut)
 async def list_user_posts(
     user_id: UUID,
+    limit: int = Depends(get_page_limit),
+    cursor: Cursor | None = Depends(get_page_cursor),
     use_case: ListPostsUseCase = Depends(get_list_posts_use_case),
 ):
     """
-    List all posts belonging to a specific user.
+    List a page of posts belonging to a specific user, newest first.
     """
-    request = ListPostsRequest(user_id=user_id)
-    posts = await use_case.execute(request)
-    return posts
+    request = ListPostsRequest(user_id=user_id, limit=limit, cursor=cursor)
+    page = await use_case.execute(request)
+    return to_page_out(page)
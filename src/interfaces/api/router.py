@@ -4,9 +4,13 @@ from src.interfaces.api.health import health_router
 from src.interfaces.api.users import users_router
 from src.interfaces.api.posts import posts_router
 from src.interfaces.api.follows import follows_router
+from src.interfaces.api.feed import feed_router
+from src.interfaces.api.upload_gateway import upload_gateway_router
 
 api_router = APIRouter()
 api_router.include_router(health_router)
 api_router.include_router(users_router)
 api_router.include_router(posts_router)
 api_router.include_router(follows_router)
+api_router.include_router(feed_router)
+api_router.include_router(upload_gateway_router)
@@ -0,0 +1,29 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+
+from src.infrastructure.services.direct_upload import (
+    InvalidUploadSignatureError,
+    LocalUploadGateway,
+)
+from src.interfaces.api.dependencies import get_local_upload_gateway
+
+upload_gateway_router = APIRouter(prefix="/uploads", tags=["Uploads"])
+
+
+@upload_gateway_router.put("/{upload_id:path}", status_code=status.HTTP_204_NO_CONTENT)
+async def receive_upload(
+    upload_id: str,
+    request: Request,
+    size: int = Query(...),
+    expires: int = Query(...),
+    signature: str = Query(...),
+    gateway: LocalUploadGateway = Depends(get_local_upload_gateway),
+):
+    """
+    Local stand-in for a pre-signed object store URL, used when media is stored
+    on disk. The URL itself is the credential; no bearer token is needed.
+    """
+    try:
+        await gateway.receive(upload_id, size, expires, signature, request.stream())
+    except InvalidUploadSignatureError:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid upload URL")
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,12 @@
+from collections.abc import AsyncIterator
+
+from fastapi import UploadFile
+
+# Bytes read from an upload at a time; bounds the memory one upload can hold
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+async def iter_upload(upload: UploadFile, chunk_size: int = UPLOAD_CHUNK_SIZE) -> AsyncIterator[bytes]:
+    """Yields the content of an uploaded file in fixed-size chunks."""
+    while chunk := await upload.read(chunk_size):
+        yield chunk
@@ -1,6 +1,6 @@
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, File, Form, UploadFile
+from fastapi import APIRouter, Depends, File, Form, UploadFile, status
 from pydantic import BaseModel, ConfigDict, EmailStr
 
 from src.application.users.login_user import (
@@ -8,6 +8,14 @@ from src.application.users.login_user import (
     LoginUserResponse,
     LoginUserUseCase,
 )
+from src.application.users.logout_all_sessions import (
+    LogoutAllSessionsRequest,
+    LogoutAllSessionsUseCase,
+)
+from src.application.users.refresh_access_token import (
+    RefreshAccessTokenRequest,
+    RefreshAccessTokenUseCase,
+)
 from src.application.users.register_user import (
     RegisterUserRequest,
     RegisterUserUseCase,
@@ -20,9 +28,12 @@ from src.domain.users.user import User as DomainUser
 from src.interfaces.api.auth import get_current_user
 from src.interfaces.api.dependencies import (
     get_login_user_use_case,
+    get_logout_all_sessions_use_case,
+    get_refresh_access_token_use_case,
     get_register_user_use_case,
     get_update_user_profile_use_case,
 )
+from src.interfaces.api.uploads import iter_upload
 
 # --- Pydantic Schemas ---
 
@@ -43,13 +54,23 @@ class UserOut(BaseModel):
     is_public: bool
 
 
+class UserPageOut(BaseModel):
+    items: list[UserOut]
+    next_cursor: str | None
+
+
 class UserLoginIn(BaseModel):
     email: EmailStr
     password: str
 
 
+class TokenRefreshIn(BaseModel):
+    refresh_token: str
+
+
 class TokenOut(BaseModel):
     access_token: str
+    refresh_token: str
     token_type: str = "bearer"
 
 
@@ -80,6 +101,31 @@ async def login_for_access_token(
     return login_response
 
 
+@users_router.post("/token/refresh", response_model=TokenOut)
+async def refresh_access_token(
+    schema: TokenRefreshIn,
+    use_case: RefreshAccessTokenUseCase = Depends(get_refresh_access_token_use_case),
+):
+    """
+    Exchange a refresh token for a new access token and a new refresh token.
+    Unlike login, this costs an indexed lookup instead of a password hash.
+    """
+    request_dto = RefreshAccessTokenRequest(refresh_token=schema.refresh_token)
+    return await use_case.execute(request_dto)
+
+
+@users_router.post("/logout-all", status_code=status.HTTP_204_NO_CONTENT)
+async def logout_all_sessions(
+    current_user: DomainUser = Depends(get_current_user),
+    use_case: LogoutAllSessionsUseCase = Depends(get_logout_all_sessions_use_case),
+):
+    """
+    Revoke every access token issued to the current user, including this one.
+    """
+    request = LogoutAllSessionsRequest(user_id=current_user.id)
+    await use_case.execute(request)
+
+
 @users_router.patch("/profile", response_model=UserOut)
 async def update_user_profile(
     current_user: DomainUser = Depends(get_current_user),
@@ -90,7 +136,7 @@ async def update_user_profile(
     delete_avatar: bool = Form(False),
     avatar: UploadFile | None = File(None),
 ):
-    avatar_data = await avatar.read() if avatar else None
+    avatar_stream = iter_upload(avatar) if avatar else None
     avatar_filename = avatar.filename if avatar else None
 
     request_dto = UpdateUserProfileRequest(
@@ -99,7 +145,7 @@ async def update_user_profile(
         bio=bio,
         is_public=is_public,
         should_delete_avatar=delete_avatar,
-        avatar_file_data=avatar_data,
+        avatar_file_stream=avatar_stream,
         avatar_file_name=avatar_filename,
     )
     user = await use_case.execute(request_dto)
@@ -0,0 +1,49 @@
+"""
+Measures Argon2 on this host and prints the cost parameters to put in .env.
+
+    python -m src.interfaces.cli.calibrate_password_hasher --target-ms 250 --logins-per-second 4
+
+Run it on the production hardware. After changing the parameters, existing
+hashes keep working and are upgraded on each user's next successful login.
+"""
+
+import argparse
+import sys
+
+from src.infrastructure.services.password_calibration import calibrate
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Calibrate Argon2 password hashing cost")
+    parser.add_argument(
+        "--target-ms", type=float, default=250, help="Maximum login hashing latency in ms"
+    )
+    parser.add_argument(
+        "--logins-per-second",
+        type=float,
+        default=4,
+        help="Logins each CPU core must sustain per second",
+    )
+    args = parser.parse_args(argv)
+
+    result = calibrate(args.target_ms, args.logins_per_second)
+    parameters = result.parameters
+
+    print(
+        f"# hash takes {result.hash_seconds * 1000:.0f} ms "
+        f"(budget {result.budget_seconds * 1000:.0f} ms)",
+        file=sys.stderr,
+    )
+    if result.hash_seconds > result.budget_seconds:
+        print("# warning: even the cheapest parameters exceed the budget", file=sys.stderr)
+    if not parameters.meets_owasp_minimum():
+        print("# warning: parameters are below the OWASP minimum", file=sys.stderr)
+
+    print(f"ARGON2_TIME_COST={parameters.time_cost}")
+    print(f"ARGON2_MEMORY_COST={parameters.memory_cost}")
+    print(f"ARGON2_PARALLELISM={parameters.parallelism}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
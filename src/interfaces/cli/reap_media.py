@@ -0,0 +1,68 @@
+"""
+Deletes the media files of deleted posts that are still queued.
+
+    python -m src.interfaces.cli.reap_media             # until the queue is empty
+    python -m src.interfaces.cli.reap_media --follow    # keep running, polling for more
+
+The API already reaps a batch after every deleted post; this catches up on
+backlogs and retries deletions that failed. Several copies can run at once,
+each paced by MEDIA_REAPER_MAX_PER_SECOND unless --rate is given.
+"""
+
+import argparse
+import asyncio
+import sys
+
+from src.application.posts.media_reaper import MediaReaper
+from src.infrastructure.persistence.database import AsyncSessionLocal
+from src.infrastructure.persistence.unit_of_work import SQLAlchemyUnitOfWork
+from src.infrastructure.settings import MEDIA_REAPER_BATCH_SIZE, MEDIA_REAPER_MAX_PER_SECOND
+from src.interfaces.api.dependencies import (
+    get_blob_store,
+    get_media_blob_repository,
+    get_media_deletion_queue,
+    media_reaper_storages,
+)
+
+
+async def run(batch_size: int, rate: float, follow: bool, poll_seconds: float) -> int:
+    total = 0
+    async with AsyncSessionLocal() as session:
+        blob_store = get_blob_store(get_media_blob_repository(session))
+        reaper = MediaReaper(
+            get_media_deletion_queue(session),
+            SQLAlchemyUnitOfWork(session),
+            media_reaper_storages(blob_store),
+            batch_size,
+            rate,
+        )
+        while True:
+            deleted = await reaper.drain()
+            total += deleted
+            if deleted:
+                print(f"# deleted {total} files so far", file=sys.stderr)
+            if not follow:
+                break
+            await asyncio.sleep(poll_seconds)
+    print(f"# deleted {total} files", file=sys.stderr)
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Delete the media files of deleted posts")
+    parser.add_argument(
+        "--batch-size", type=int, default=MEDIA_REAPER_BATCH_SIZE, help="Entries claimed at a time"
+    )
+    parser.add_argument(
+        "--rate", type=float, default=MEDIA_REAPER_MAX_PER_SECOND, help="Files deleted per second"
+    )
+    parser.add_argument("--follow", action="store_true", help="Keep running and poll for more")
+    parser.add_argument(
+        "--poll-seconds", type=float, default=30.0, help="Wait between polls with --follow"
+    )
+    args = parser.parse_args(argv)
+    return asyncio.run(run(args.batch_size, args.rate, args.follow, args.poll_seconds))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,63 @@
+"""
+Finds stored media files that no row refers to any more and deletes them.
+
+    python -m src.interfaces.cli.reconcile_media --dry-run
+    python -m src.interfaces.cli.reconcile_media --min-age-hours 24 --rate 50
+
+Orphans appear when a process dies between writing a file and committing its
+row, or when variants finish rendering after their post was deleted. Only
+local storage is scanned; files younger than --min-age-hours are skipped so
+uploads still in flight are never touched.
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+from src.infrastructure.persistence.database import AsyncSessionLocal
+from src.infrastructure.persistence.media_reconciliation import find_orphaned_files
+from src.infrastructure.services.blob_store import BLOBS_PATH
+from src.infrastructure.services.post_storage import POST_IMAGES_PATH
+from src.infrastructure.settings import MEDIA_REAPER_MAX_PER_SECOND
+
+
+async def run(min_age_hours: float, rate: float, dry_run: bool) -> int:
+    async with AsyncSessionLocal() as session:
+        orphans = await find_orphaned_files(
+            session, Path(POST_IMAGES_PATH), Path(BLOBS_PATH), min_age_hours * 3600
+        )
+
+    size = 0
+    for index, path in enumerate(orphans):
+        if dry_run:
+            print(path)
+            continue
+        if index and rate > 0:
+            await asyncio.sleep(1 / rate)
+        try:
+            size += path.stat().st_size
+            path.unlink()
+        except FileNotFoundError:
+            pass
+
+    verb = "found" if dry_run else f"deleted ({size} bytes)"
+    print(f"# {len(orphans)} orphaned files {verb}", file=sys.stderr)
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Delete media files no row refers to")
+    parser.add_argument(
+        "--min-age-hours", type=float, default=24.0, help="Skip files modified more recently"
+    )
+    parser.add_argument(
+        "--rate", type=float, default=MEDIA_REAPER_MAX_PER_SECOND, help="Files deleted per second"
+    )
+    parser.add_argument("--dry-run", action="store_true", help="Only list the orphaned files")
+    args = parser.parse_args(argv)
+    return asyncio.run(run(args.min_age_hours, args.rate, args.dry_run))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,71 @@
+"""
+Moves uploads from the old flat directories into the sharded layout and
+rewrites the stored URLs.
+
+    python -m src.interfaces.cli.shard_uploads --batch-size 1000
+
+Files are first hard-linked into their shard directories, so old and new
+URLs both work while rows are rewritten; the flat names are removed last.
+The app can keep running, and an interrupted run can be started again.
+Cached users may show their old avatar URL until `USER_CACHE_TTL_SECONDS`
+passes, which is why the flat files are only removed with `--remove-flat`.
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+from src.infrastructure.persistence.database import AsyncSessionLocal
+from src.infrastructure.persistence.media_url_migration import rewrite_media_urls
+from src.infrastructure.services.blob_store import BLOBS_PATH, BLOBS_URL
+from src.infrastructure.services.post_storage import POST_IMAGES_PATH, POST_IMAGES_URL
+from src.infrastructure.services.sharding import link_into_shards, sharded_url
+
+# Storage root on disk -> URL prefix it is served under
+UPLOAD_ROOTS = {POST_IMAGES_PATH: POST_IMAGES_URL, BLOBS_PATH: BLOBS_URL}
+
+
+def rewrite_url(url: str) -> str | None:
+    for base_url in UPLOAD_ROOTS.values():
+        new_url = sharded_url(url, base_url)
+        if new_url is not None:
+            return new_url
+    return None
+
+
+async def run(batch_size: int, remove_flat: bool) -> int:
+    flat_files = []
+    for root in UPLOAD_ROOTS:
+        if Path(root).is_dir():
+            linked = link_into_shards(Path(root))
+            print(f"# {root}: {len(linked)} files linked into shards", file=sys.stderr)
+            flat_files += linked
+
+    async with AsyncSessionLocal() as session:
+        counts = await rewrite_media_urls(session, rewrite_url, batch_size)
+    print(f"# rewrote {counts.posts} posts and {counts.users} users", file=sys.stderr)
+
+    if remove_flat:
+        for path in flat_files:
+            path.unlink(missing_ok=True)
+        print(f"# removed {len(flat_files)} flat files", file=sys.stderr)
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Move uploads into the sharded directory layout")
+    parser.add_argument(
+        "--batch-size", type=int, default=1000, help="Rows rewritten per UPDATE and commit"
+    )
+    parser.add_argument(
+        "--remove-flat",
+        action="store_true",
+        help="Delete the old flat file names once every URL has been rewritten",
+    )
+    args = parser.parse_args(argv)
+    return asyncio.run(run(args.batch_size, args.remove_flat))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,99 @@
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from main import app
+
+@pytest.mark.asyncio
+async def test_logout_all_revokes_existing_tokens_flow():
+    """
+    Integration test verifying that logging out everywhere revokes tokens:
+    1. Register and log in
+    2. The token is accepted
+    3. Log out of all sessions
+    4. The old token is rejected
+    5. A fresh login works again
+    """
+    unique_suffix = str(id(app))
+    email = f"logout_{unique_suffix}@example.com"
+    password = "StrongPassword123!"
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        # 1. Register and log in
+        reg_res = await ac.post(
+            "/api/v1/users/register",
+            json={"username": f"logout_{unique_suffix}", "email": email, "password": password},
+        )
+        assert reg_res.status_code == 201
+        login_res = await ac.post(
+            "/api/v1/users/login", json={"email": email, "password": password}
+        )
+        headers = {"Authorization": f"Bearer {login_res.json()['access_token']}"}
+
+        # 2. The token is accepted
+        feed_res = await ac.get("/api/v1/feed", headers=headers)
+        assert feed_res.status_code == 200
+
+        # 3. Log out of all sessions
+        logout_res = await ac.post("/api/v1/users/logout-all", headers=headers)
+        assert logout_res.status_code == 204
+
+        # 4. The old token is rejected
+        revoked_res = await ac.get("/api/v1/feed", headers=headers)
+        assert revoked_res.status_code == 401
+
+        # 5. A fresh login works again
+        relogin_res = await ac.post(
+            "/api/v1/users/login", json={"email": email, "password": password}
+        )
+        new_headers = {"Authorization": f"Bearer {relogin_res.json()['access_token']}"}
+        feed_res_2 = await ac.get("/api/v1/feed", headers=new_headers)
+        assert feed_res_2.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_refresh_token_rotation_flow():
+    """
+    Integration test verifying the refresh token flow:
+    1. Log in and receive a refresh token
+    2. Exchange it for a new access token and refresh token
+    3. The new access token works
+    4. Reusing the old refresh token fails and revokes its successor
+    """
+    unique_suffix = str(id(app))
+    email = f"refresh_{unique_suffix}@example.com"
+    password = "StrongPassword123!"
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        # 1. Log in and receive a refresh token
+        await ac.post(
+            "/api/v1/users/register",
+            json={"username": f"refresh_{unique_suffix}", "email": email, "password": password},
+        )
+        login_res = await ac.post(
+            "/api/v1/users/login", json={"email": email, "password": password}
+        )
+        assert login_res.status_code == 200
+        first_refresh = login_res.json()["refresh_token"]
+
+        # 2. Exchange it for a new access token and refresh token
+        refresh_res = await ac.post(
+            "/api/v1/users/token/refresh", json={"refresh_token": first_refresh}
+        )
+        assert refresh_res.status_code == 200
+        second_refresh = refresh_res.json()["refresh_token"]
+        assert second_refresh != first_refresh
+
+        # 3. The new access token works
+        headers = {"Authorization": f"Bearer {refresh_res.json()['access_token']}"}
+        feed_res = await ac.get("/api/v1/feed", headers=headers)
+        assert feed_res.status_code == 200
+
+        # 4. Reusing the old refresh token fails and revokes its successor
+        reuse_res = await ac.post(
+            "/api/v1/users/token/refresh", json={"refresh_token": first_refresh}
+        )
+        assert reuse_res.status_code == 401
+        successor_res = await ac.post(
+            "/api/v1/users/token/refresh", json={"refresh_token": second_refresh}
+        )
+        assert successor_res.status_code == 401
@@ -0,0 +1,86 @@
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from main import app
+
+
+@pytest.mark.asyncio
+async def test_feed_lifecycle_flow():
+    """
+    Integration test verifying the home feed:
+    1. Register Users A and B
+    2. User B creates a post before A follows them
+    3. User A follows User B (backfills B's post into A's feed)
+    4. User B creates another post (fanned out to A's feed)
+    5. User A unfollows User B (prunes B's posts from A's feed)
+    """
+    unique_suffix = "feed_" + str(id(app))
+
+    async def register_and_login(ac, name):
+        username = f"{name}_{unique_suffix}"
+        email = f"{name}_{unique_suffix}@example.com"
+        password = "StrongPassword123!"
+
+        reg_res = await ac.post(
+            "/api/v1/users/register",
+            json={"username": username, "email": email, "password": password},
+        )
+        assert reg_res.status_code == 201
+        user_id = reg_res.json()["id"]
+
+        login_res = await ac.post(
+            "/api/v1/users/login",
+            json={"email": email, "password": password},
+        )
+        assert login_res.status_code == 200
+        token = login_res.json()["access_token"]
+        return user_id, {"Authorization": f"Bearer {token}"}
+
+    async def create_post(ac, headers, caption):
+        files = {"image": ("feed_image.jpg", b"fake image content", "image/jpeg")}
+        res = await ac.post("/api/v1/posts/", headers=headers, data={"caption": caption}, files=files)
+        assert res.status_code == 201, res.text
+        return res.json()["id"]
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        # 1. Register Users
+        id_a, headers_a = await register_and_login(ac, "feed_a")
+        id_b, headers_b = await register_and_login(ac, "feed_b")
+
+        # 2. User B posts before being followed
+        old_post_id = await create_post(ac, headers_b, "before follow")
+
+        # 3. User A follows User B; the old post is backfilled
+        follow_res = await ac.post(f"/api/v1/users/{id_b}/follow", headers=headers_a)
+        assert follow_res.status_code == 204
+
+        feed_res = await ac.get("/api/v1/feed", headers=headers_a)
+        assert feed_res.status_code == 200
+        assert [p["id"] for p in feed_res.json()["items"]] == [old_post_id]
+
+        # 4. A new post from User B is pushed to A's feed, newest first
+        new_post_id = await create_post(ac, headers_b, "after follow")
+
+        feed_res = await ac.get("/api/v1/feed", headers=headers_a)
+        assert [p["id"] for p in feed_res.json()["items"]] == [new_post_id, old_post_id]
+
+        # The author sees their own posts too
+        own_feed_res = await ac.get("/api/v1/feed", headers=headers_b)
+        assert [p["id"] for p in own_feed_res.json()["items"]] == [new_post_id, old_post_id]
+
+        # Feed pages chain through next_cursor
+        first_page = await ac.get("/api/v1/feed", headers=headers_a, params={"limit": 1})
+        assert [p["id"] for p in first_page.json()["items"]] == [new_post_id]
+        second_page = await ac.get(
+            "/api/v1/feed",
+            headers=headers_a,
+            params={"limit": 1, "cursor": first_page.json()["next_cursor"]},
+        )
+        assert [p["id"] for p in second_page.json()["items"]] == [old_post_id]
+
+        # 5. Unfollowing prunes User B's posts from A's feed
+        unfollow_res = await ac.delete(f"/api/v1/users/{id_b}/follow", headers=headers_a)
+        assert unfollow_res.status_code == 204
+
+        feed_res = await ac.get("/api/v1/feed", headers=headers_a)
+        assert feed_res.json()["items"] == []
@@ -1,3 +1,6 @@
+import asyncio
+from uuid import uuid4
+
 import pytest
 from httpx import ASGITransport, AsyncClient
 
@@ -56,7 +59,7 @@ async def test_follows_lifecycle_flow():
         # (Anyone can view followers, but let's use A's token)
         followers_res = await ac.get(f"/api/v1/users/{id_b}/followers", headers=headers_a)
         assert followers_res.status_code == 200
-        followers_list = followers_res.json()
+        followers_list = followers_res.json()["items"]
         assert len(followers_list) == 1
         assert followers_list[0]["id"] == id_a
         assert followers_list[0]["username"] == username_a
@@ -64,7 +67,7 @@ async def test_follows_lifecycle_flow():
         # 4. Verify User B is in User A's following
         following_res = await ac.get(f"/api/v1/users/{id_a}/following", headers=headers_a)
         assert following_res.status_code == 200
-        following_list = following_res.json()
+        following_list = following_res.json()["items"]
         assert len(following_list) == 1
         assert following_list[0]["id"] == id_b
 
@@ -84,12 +87,94 @@ async def test_follows_lifecycle_flow():
 
         # 8. Verify lists are updated (empty)
         followers_res_2 = await ac.get(f"/api/v1/users/{id_b}/followers", headers=headers_a)
-        assert len(followers_res_2.json()) == 0
+        assert len(followers_res_2.json()["items"]) == 0
         
         following_res_2 = await ac.get(f"/api/v1/users/{id_a}/following", headers=headers_a)
-        assert len(following_res_2.json()) == 0
+        assert len(following_res_2.json()["items"]) == 0
         
         # 9. Unfollow again should fail
         dup_unfollow = await ac.delete(f"/api/v1/users/{id_b}/follow", headers=headers_a)
         assert dup_unfollow.status_code == 400
         assert "not following" in dup_unfollow.json()["detail"].lower()
+
+
+@pytest.mark.asyncio
+async def test_follow_retry_with_idempotency_key_is_replayed():
+    """
+    A follow retried with the same Idempotency-Key gets the original 204
+    instead of an "already following" error.
+    """
+    unique_suffix = "idem_" + str(id(app))
+    password = "StrongPassword123!"
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        ids = []
+        for name in ("idem_a", "idem_b"):
+            reg_res = await ac.post(
+                "/api/v1/users/register",
+                json={
+                    "username": f"{name}_{unique_suffix}",
+                    "email": f"{name}_{unique_suffix}@example.com",
+                    "password": password,
+                },
+            )
+            assert reg_res.status_code == 201
+            ids.append(reg_res.json()["id"])
+        login_res = await ac.post(
+            "/api/v1/users/login",
+            json={"email": f"idem_a_{unique_suffix}@example.com", "password": password},
+        )
+        headers = {
+            "Authorization": f"Bearer {login_res.json()['access_token']}",
+            "Idempotency-Key": f"follow-{unique_suffix}",
+        }
+
+        first = await ac.post(f"/api/v1/users/{ids[1]}/follow", headers=headers)
+        retry = await ac.post(f"/api/v1/users/{ids[1]}/follow", headers=headers)
+        other_route = await ac.delete(f"/api/v1/users/{ids[1]}/follow", headers=headers)
+
+        assert first.status_code == 204
+        assert retry.status_code == 204
+        assert retry.headers["Idempotent-Replayed"] == "true"
+        assert other_route.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_concurrent_double_follow_adds_one_follow():
+    """
+    Two follow requests racing each other add a single follow: one gets 204,
+    the other "already following". Following a user that does not exist is
+    a 404.
+    """
+    unique_suffix = "race_" + str(id(app))
+    password = "StrongPassword123!"
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        ids = []
+        for name in ("race_a", "race_b"):
+            reg_res = await ac.post(
+                "/api/v1/users/register",
+                json={
+                    "username": f"{name}_{unique_suffix}",
+                    "email": f"{name}_{unique_suffix}@example.com",
+                    "password": password,
+                },
+            )
+            assert reg_res.status_code == 201
+            ids.append(reg_res.json()["id"])
+        login_res = await ac.post(
+            "/api/v1/users/login",
+            json={"email": f"race_a_{unique_suffix}@example.com", "password": password},
+        )
+        headers = {"Authorization": f"Bearer {login_res.json()['access_token']}"}
+
+        responses = await asyncio.gather(
+            ac.post(f"/api/v1/users/{ids[1]}/follow", headers=headers),
+            ac.post(f"/api/v1/users/{ids[1]}/follow", headers=headers),
+        )
+        followers_res = await ac.get(f"/api/v1/users/{ids[1]}/followers", headers=headers)
+        missing_res = await ac.post(f"/api/v1/users/{uuid4()}/follow", headers=headers)
+
+        assert sorted(res.status_code for res in responses) == [204, 400]
+        assert [user["id"] for user in followers_res.json()["items"]] == [ids[0]]
+        assert missing_res.status_code == 404
@@ -69,8 +69,159 @@ async def test_posts_lifecycle_flow():
         # 5. List Posts by User
         list_response = await ac.get(f"/api/v1/posts/user/{user_id}", headers=headers)
         assert list_response.status_code == 200
-        posts_list = list_response.json()
+        posts_list = list_response.json()["items"]
         assert isinstance(posts_list, list)
         assert len(posts_list) >= 1
         # Check that our post is in the list
         assert any(p["id"] == post_id for p in posts_list)
+
+        # 6. Page through the user's posts one at a time
+        second_file = {"image": ("second.jpg", b"more fake image content", "image/jpeg")}
+        second_response = await ac.post("/api/v1/posts/", headers=headers, files=second_file)
+        assert second_response.status_code == 201
+        second_post_id = second_response.json()["id"]
+
+        first_page = await ac.get(f"/api/v1/posts/user/{user_id}", params={"limit": 1})
+        assert first_page.status_code == 200
+        assert [p["id"] for p in first_page.json()["items"]] == [second_post_id]
+        next_cursor = first_page.json()["next_cursor"]
+        assert next_cursor
+
+        second_page = await ac.get(
+            f"/api/v1/posts/user/{user_id}", params={"limit": 1, "cursor": next_cursor}
+        )
+        assert second_page.status_code == 200
+        assert [p["id"] for p in second_page.json()["items"]] == [post_id]
+        assert second_page.json()["next_cursor"] is None
+
+        # 7. A malformed cursor is rejected
+        bad_cursor = await ac.get(f"/api/v1/posts/user/{user_id}", params={"cursor": "not-a-cursor"})
+        assert bad_cursor.status_code == 400
+
+        # 8. Delete the second post; it is gone right away and only once
+        delete_response = await ac.delete(f"/api/v1/posts/{second_post_id}", headers=headers)
+        assert delete_response.status_code == 204
+        assert (await ac.get(f"/api/v1/posts/{second_post_id}")).status_code == 404
+        again = await ac.delete(f"/api/v1/posts/{second_post_id}", headers=headers)
+        assert again.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_direct_upload_flow():
+    """
+    Integration test of a direct upload through the local upload gateway:
+    1. Request an upload target
+    2. PUT the image to it
+    3. Create the post from the upload, which can be used only once
+    """
+    unique_id = "direct_upload_user_" + str(id(app))
+    email = f"user_{unique_id}@example.com"
+    password = "StrongPassword123!"
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        await ac.post(
+            "/api/v1/users/register",
+            json={"username": f"user_{unique_id}", "email": email, "password": password},
+        )
+        login_response = await ac.post(
+            "/api/v1/users/login", json={"email": email, "password": password}
+        )
+        headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+        content = b"directly uploaded image"
+
+        # 1. Upload target
+        target_response = await ac.post(
+            "/api/v1/posts/uploads",
+            headers=headers,
+            json={"file_name": "direct.jpg", "size": len(content)},
+        )
+        assert target_response.status_code == 201, target_response.text
+        target = target_response.json()
+
+        # 2. Upload without a bearer token; the signed URL is the credential
+        upload_response = await ac.request(
+            target["method"], target["url"], headers=target["headers"], content=content
+        )
+        assert upload_response.status_code == 204, upload_response.text
+
+        # 3. Create the post from it
+        create_response = await ac.post(
+            "/api/v1/posts/from-upload",
+            headers=headers,
+            json={"upload_id": target["upload_id"], "caption": "direct"},
+        )
+        assert create_response.status_code == 201, create_response.text
+        assert create_response.json()["image_url"].endswith(".jpg")
+
+        reuse_response = await ac.post(
+            "/api/v1/posts/from-upload",
+            headers=headers,
+            json={"upload_id": target["upload_id"]},
+        )
+        assert reuse_response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_resumable_upload_flow():
+    """
+    Integration test of a resumable upload:
+    1. Start an upload session
+    2. Send the first chunk, then a chunk at a stale offset (rejected with the right one)
+    3. Ask for the offset and send the rest from there
+    4. Create the post from the finished upload
+    """
+    unique_id = "resumable_upload_user_" + str(id(app))
+    email = f"user_{unique_id}@example.com"
+    password = "StrongPassword123!"
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        await ac.post(
+            "/api/v1/users/register",
+            json={"username": f"user_{unique_id}", "email": email, "password": password},
+        )
+        login_response = await ac.post(
+            "/api/v1/users/login", json={"email": email, "password": password}
+        )
+        headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+        content = b"resumably uploaded image"
+
+        # 1. Session
+        session_response = await ac.post(
+            "/api/v1/posts/upload-sessions",
+            headers=headers,
+            json={"file_name": "resumable.jpg", "size": len(content)},
+        )
+        assert session_response.status_code == 201, session_response.text
+        upload_id = session_response.json()["upload_id"]
+        session_url = f"/api/v1/posts/upload-sessions/{upload_id}"
+
+        # 2. First chunk, then a retransmission from the start
+        first = await ac.patch(
+            session_url, headers={**headers, "Upload-Offset": "0"}, content=content[:10]
+        )
+        assert first.status_code == 200, first.text
+        assert first.headers["Upload-Offset"] == "10"
+
+        stale = await ac.patch(
+            session_url, headers={**headers, "Upload-Offset": "0"}, content=content
+        )
+        assert stale.status_code == 409
+        assert stale.json()["offset"] == 10
+
+        # 3. Resume
+        offset = (await ac.get(session_url, headers=headers)).json()["offset"]
+        rest = await ac.patch(
+            session_url,
+            headers={**headers, "Upload-Offset": str(offset)},
+            content=content[offset:],
+        )
+        assert rest.status_code == 200, rest.text
+        assert rest.json()["offset"] == len(content)
+
+        # 4. Post
+        create_response = await ac.post(
+            "/api/v1/posts/from-upload",
+            headers=headers,
+            json={"upload_id": upload_id, "caption": "resumable"},
+        )
+        assert create_response.status_code == 201, create_response.text
@@ -0,0 +1,55 @@
+import pytest
+from datetime import datetime
+from uuid import uuid4
+
+from src.application.common.exceptions import InvalidCursorError
+from src.application.common.pagination import (
+    Cursor,
+    build_page,
+    decode_cursor,
+    encode_cursor,
+    post_cursor,
+)
+from src.domain.posts.entity import Post
+
+
+def test_cursor_round_trip():
+    # Arrange
+    cursor = Cursor(created_at=datetime(2026, 5, 17, 8, 30, 15, 123456), id=uuid4())
+
+    # Act
+    token = encode_cursor(cursor)
+
+    # Assert
+    assert "|" not in token
+    assert decode_cursor(token) == cursor
+
+
+@pytest.mark.parametrize("token", ["", "not-a-cursor", "bm90fGE="])
+def test_decode_invalid_cursor(token):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(token)
+
+
+def test_build_page_uses_extra_item_as_more_marker():
+    # Arrange
+    posts = [Post(user_id=uuid4(), image_url="") for _ in range(3)]
+
+    # Act
+    page = build_page(posts, 2, post_cursor)
+
+    # Assert
+    assert page.items == posts[:2]
+    assert page.next_cursor == post_cursor(posts[1])
+
+
+def test_build_page_last_page_has_no_cursor():
+    # Arrange
+    posts = [Post(user_id=uuid4(), image_url="") for _ in range(2)]
+
+    # Act
+    page = build_page(posts, 2, post_cursor)
+
+    # Assert
+    assert page.items == posts
+    assert page.next_cursor is None
@@ -0,0 +1,99 @@
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from src.application.common.pagination import Cursor, Page
+from src.application.feeds.feed_merge import merge_post_streams
+from src.application.feeds.timeline_repository import AbstractTimelineRepository
+from src.application.feeds.use_cases.get_feed import GetFeedRequest, GetFeedUseCase
+from src.application.follows.follow_repository import AbstractFollowRepository
+from src.application.posts.post_repository import AbstractPostRepository
+from src.domain.posts.entity import Post
+
+
+def make_post(minutes_ago: int) -> Post:
+    return Post(
+        user_id=uuid4(),
+        image_url="/static/posts/image.jpg",
+        created_at=datetime(2026, 1, 1) - timedelta(minutes=minutes_ago),
+    )
+
+
+@pytest.fixture
+def mock_timeline_repo():
+    return AsyncMock(spec=AbstractTimelineRepository)
+
+
+@pytest.fixture
+def mock_follow_repo():
+    return AsyncMock(spec=AbstractFollowRepository)
+
+
+@pytest.fixture
+def mock_post_repo():
+    return AsyncMock(spec=AbstractPostRepository)
+
+
+@pytest.fixture
+def get_feed_use_case(mock_timeline_repo, mock_follow_repo, mock_post_repo):
+    return GetFeedUseCase(
+        mock_timeline_repo, mock_follow_repo, mock_post_repo, celebrity_threshold=100
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_feed_reads_precomputed_timeline(
+    get_feed_use_case, mock_timeline_repo, mock_follow_repo, mock_post_repo
+):
+    # Arrange
+    user_id = uuid4()
+    posts = [make_post(1), make_post(2)]
+    mock_timeline_repo.get_timeline.return_value = Page(items=posts)
+    mock_follow_repo.get_following_ids_with_min_followers.return_value = []
+
+    # Act
+    result = await get_feed_use_case.execute(GetFeedRequest(user_id=user_id, limit=10))
+
+    # Assert
+    assert result.items == posts
+    assert result.next_cursor is None
+    mock_timeline_repo.get_timeline.assert_called_once_with(user_id, 10, None)
+    mock_follow_repo.get_following_ids_with_min_followers.assert_called_once_with(user_id, 100)
+    mock_post_repo.list_by_user.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_feed_merges_pulled_celebrity_posts(
+    get_feed_use_case, mock_timeline_repo, mock_follow_repo, mock_post_repo
+):
+    # Arrange
+    celebrity_id = uuid4()
+    pushed = [make_post(1), make_post(5)]
+    pulled = [make_post(3), make_post(7)]
+    mock_timeline_repo.get_timeline.return_value = Page(items=pushed)
+    mock_follow_repo.get_following_ids_with_min_followers.return_value = [celebrity_id]
+    mock_post_repo.list_by_user.return_value = Page(items=pulled)
+
+    # Act
+    result = await get_feed_use_case.execute(GetFeedRequest(user_id=uuid4(), limit=3))
+
+    # Assert
+    assert result.items == [pushed[0], pulled[0], pushed[1]]
+    assert result.next_cursor == Cursor(created_at=pushed[1].created_at, id=pushed[1].id)
+    mock_post_repo.list_by_user.assert_called_once_with(celebrity_id, 3, None)
+
+
+def test_merge_post_streams_deduplicates():
+    # Arrange
+    shared = make_post(2)
+    streams = [[make_post(1), shared], [shared, make_post(4)]]
+
+    # Act
+    result = merge_post_streams(streams, limit=10)
+
+    # Assert
+    assert [p.created_at for p in result] == sorted(
+        (p.created_at for p in result), reverse=True
+    )
+    assert len(result) == 3
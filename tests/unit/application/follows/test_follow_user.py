@@ -0,0 +1,215 @@
+import pytest
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from src.application.common.unit_of_work import AbstractUnitOfWork
+from src.application.feeds.timeline_repository import AbstractTimelineRepository
+from src.application.follows.follow_repository import AbstractFollowRepository
+from src.application.follows.use_cases.follow_user import (
+    TIMELINE_BACKFILL_LIMIT,
+    FollowUserRequest,
+    FollowUserUseCase,
+)
+from src.application.follows.use_cases.unfollow_user import (
+    UnfollowUserRequest,
+    UnfollowUserUseCase,
+)
+from src.application.users.user_repository import AbstractUserRepository
+from src.domain.follows.exceptions import (
+    AlreadyFollowingError,
+    NotFollowingError,
+    SelfFollowError,
+)
+from src.domain.users.exceptions import UserNotFoundError
+from src.domain.users.user import User
+
+
+@pytest.fixture
+def mock_follow_repo():
+    return AsyncMock(spec=AbstractFollowRepository)
+
+
+@pytest.fixture
+def mock_user_repo():
+    return AsyncMock(spec=AbstractUserRepository)
+
+
+@pytest.fixture
+def mock_timeline_repo():
+    return AsyncMock(spec=AbstractTimelineRepository)
+
+
+@pytest.fixture
+def mock_unit_of_work():
+    return AsyncMock(spec=AbstractUnitOfWork)
+
+
+@pytest.fixture
+def target_user():
+    return User(username="target", email="t@example.com", hashed_password="hash")
+
+
+@pytest.fixture
+def follow_use_case(mock_follow_repo, mock_timeline_repo, mock_unit_of_work):
+    return FollowUserUseCase(
+        mock_follow_repo,
+        mock_timeline_repo,
+        celebrity_threshold=100,
+        unit_of_work=mock_unit_of_work,
+    )
+
+
+@pytest.fixture
+def unfollow_use_case(mock_follow_repo, mock_user_repo, mock_timeline_repo, mock_unit_of_work):
+    return UnfollowUserUseCase(
+        mock_follow_repo, mock_user_repo, mock_timeline_repo, mock_unit_of_work
+    )
+
+
+@pytest.mark.asyncio
+async def test_follow_backfills_timeline(
+    follow_use_case, mock_follow_repo, mock_timeline_repo, mock_unit_of_work, target_user
+):
+    # Arrange
+    follower_id = uuid4()
+    mock_follow_repo.follow_if_absent.return_value = 1
+
+    # Act
+    await follow_use_case.execute(
+        FollowUserRequest(follower_id=follower_id, followed_id=target_user.id)
+    )
+
+    # Assert
+    new_follow = mock_follow_repo.follow_if_absent.call_args.args[0]
+    assert (new_follow.follower_id, new_follow.followed_id) == (follower_id, target_user.id)
+    mock_timeline_repo.backfill.assert_called_once_with(
+        owner_id=follower_id,
+        author_id=target_user.id,
+        limit=TIMELINE_BACKFILL_LIMIT,
+    )
+    mock_unit_of_work.__aexit__.assert_awaited_once_with(None, None, None)
+
+
+@pytest.mark.asyncio
+async def test_follow_is_rolled_back_when_backfill_fails(
+    follow_use_case, mock_follow_repo, mock_timeline_repo, mock_unit_of_work, target_user
+):
+    # Arrange
+    mock_follow_repo.follow_if_absent.return_value = 1
+    mock_timeline_repo.backfill.side_effect = RuntimeError("database went away")
+
+    # Act & Assert
+    with pytest.raises(RuntimeError):
+        await follow_use_case.execute(
+            FollowUserRequest(follower_id=uuid4(), followed_id=target_user.id)
+        )
+    mock_follow_repo.follow_if_absent.assert_called_once()
+    exc_type, _, _ = mock_unit_of_work.__aexit__.await_args.args
+    assert exc_type is RuntimeError
+
+
+@pytest.mark.asyncio
+async def test_follow_celebrity_skips_backfill(
+    follow_use_case, mock_follow_repo, mock_timeline_repo, target_user
+):
+    # Arrange
+    mock_follow_repo.follow_if_absent.return_value = 100
+
+    # Act
+    await follow_use_case.execute(FollowUserRequest(follower_id=uuid4(), followed_id=target_user.id))
+
+    # Assert
+    mock_follow_repo.follow_if_absent.assert_called_once()
+    mock_follow_repo.count_followers.assert_not_called()
+    mock_timeline_repo.backfill.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_follow_already_following(
+    follow_use_case, mock_follow_repo, mock_timeline_repo, target_user
+):
+    # Arrange
+    mock_follow_repo.follow_if_absent.return_value = None
+
+    # Act & Assert
+    with pytest.raises(AlreadyFollowingError):
+        await follow_use_case.execute(
+            FollowUserRequest(follower_id=uuid4(), followed_id=target_user.id)
+        )
+
+    mock_timeline_repo.backfill.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_follow_unknown_user(follow_use_case, mock_follow_repo, mock_timeline_repo):
+    # Arrange
+    mock_follow_repo.follow_if_absent.side_effect = UserNotFoundError()
+
+    # Act & Assert
+    with pytest.raises(UserNotFoundError):
+        await follow_use_case.execute(FollowUserRequest(follower_id=uuid4(), followed_id=uuid4()))
+
+    mock_timeline_repo.backfill.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_follow_self(follow_use_case, mock_follow_repo):
+    # Arrange
+    user_id = uuid4()
+
+    # Act & Assert
+    with pytest.raises(SelfFollowError):
+        await follow_use_case.execute(FollowUserRequest(follower_id=user_id, followed_id=user_id))
+    mock_follow_repo.follow_if_absent.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_unfollow_prunes_timeline(
+    unfollow_use_case, mock_follow_repo, mock_user_repo, mock_timeline_repo, target_user
+):
+    # Arrange
+    follower_id = uuid4()
+    mock_follow_repo.unfollow_if_present.return_value = True
+
+    # Act
+    await unfollow_use_case.execute(
+        UnfollowUserRequest(follower_id=follower_id, followed_id=target_user.id)
+    )
+
+    # Assert
+    mock_follow_repo.unfollow_if_present.assert_called_once_with(
+        follower_id=follower_id, followed_id=target_user.id
+    )
+    mock_timeline_repo.prune.assert_called_once_with(
+        owner_id=follower_id, author_id=target_user.id
+    )
+    mock_user_repo.get_by_id.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_unfollow_not_following(
+    unfollow_use_case, mock_follow_repo, mock_user_repo, mock_timeline_repo, target_user
+):
+    # Arrange
+    mock_follow_repo.unfollow_if_present.return_value = False
+    mock_user_repo.get_by_id.return_value = target_user
+
+    # Act & Assert
+    with pytest.raises(NotFollowingError):
+        await unfollow_use_case.execute(
+            UnfollowUserRequest(follower_id=uuid4(), followed_id=target_user.id)
+        )
+    mock_timeline_repo.prune.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_unfollow_unknown_user(unfollow_use_case, mock_follow_repo, mock_user_repo):
+    # Arrange
+    mock_follow_repo.unfollow_if_present.return_value = False
+    mock_user_repo.get_by_id.return_value = None
+
+    # Act & Assert
+    with pytest.raises(UserNotFoundError):
+        await unfollow_use_case.execute(
+            UnfollowUserRequest(follower_id=uuid4(), followed_id=uuid4())
+        )
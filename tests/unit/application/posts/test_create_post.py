@@ -0,0 +1,235 @@
+import pytest
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+from src.application.common.pagination import Page
+from src.application.common.task_scheduler import AbstractTaskScheduler
+from src.application.common.unit_of_work import AbstractUnitOfWork
+from src.application.feeds.timeline_repository import AbstractTimelineRepository
+from src.application.follows.follow_repository import AbstractFollowRepository
+from src.application.posts.direct_upload import AbstractDirectUploadStorage
+from src.application.posts.image_processor import AbstractPostImageProcessor
+from src.application.posts.post_repository import AbstractPostRepository
+from src.application.posts.post_storage import AbstractPostImageStorage
+from src.application.posts.use_cases.create_post import (
+    CreatePostRequest,
+    CreatePostUseCase,
+)
+from src.domain.posts.entity import MediaStatus
+from src.domain.users.user import User
+
+
+async def image_stream():
+    yield b"data"
+
+
+@pytest.fixture
+def mock_post_repo():
+    return AsyncMock(spec=AbstractPostRepository)
+
+
+@pytest.fixture
+def mock_image_storage():
+    return AsyncMock(spec=AbstractPostImageStorage)
+
+
+@pytest.fixture
+def mock_follow_repo():
+    return AsyncMock(spec=AbstractFollowRepository)
+
+
+@pytest.fixture
+def mock_timeline_repo():
+    return AsyncMock(spec=AbstractTimelineRepository)
+
+
+@pytest.fixture
+def mock_image_processor():
+    return AsyncMock(spec=AbstractPostImageProcessor)
+
+
+@pytest.fixture
+def mock_task_scheduler():
+    return Mock(spec=AbstractTaskScheduler)
+
+
+@pytest.fixture
+def mock_direct_uploads():
+    return AsyncMock(spec=AbstractDirectUploadStorage)
+
+
+@pytest.fixture
+def mock_unit_of_work():
+    return AsyncMock(spec=AbstractUnitOfWork)
+
+
+@pytest.fixture
+def create_post_use_case(
+    mock_post_repo,
+    mock_image_storage,
+    mock_follow_repo,
+    mock_timeline_repo,
+    mock_image_processor,
+    mock_task_scheduler,
+    mock_direct_uploads,
+    mock_unit_of_work,
+):
+    return CreatePostUseCase(
+        mock_post_repo,
+        mock_image_storage,
+        mock_follow_repo,
+        mock_timeline_repo,
+        celebrity_threshold=100,
+        image_processor=mock_image_processor,
+        task_scheduler=mock_task_scheduler,
+        direct_uploads=mock_direct_uploads,
+        unit_of_work=mock_unit_of_work,
+    )
+
+
+@pytest.mark.asyncio
+async def test_create_post_fans_out_to_followers(
+    create_post_use_case,
+    mock_post_repo,
+    mock_image_storage,
+    mock_follow_repo,
+    mock_timeline_repo,
+):
+    # Arrange
+    author_id = uuid4()
+    follower = User(username="follower", email="f@example.com", hashed_password="hash")
+    mock_image_storage.save.return_value = "/static/posts/image.jpg"
+    mock_follow_repo.count_followers.return_value = 1
+    mock_follow_repo.get_followers.return_value = Page(items=[follower])
+    request = CreatePostRequest(
+        user_id=author_id,
+        image_file_name="image.jpg",
+        image_file_stream=image_stream(),
+        caption="hello",
+    )
+
+    # Act
+    post = await create_post_use_case.execute(request)
+
+    # Assert
+    assert post.image_url == "/static/posts/image.jpg"
+    mock_post_repo.add.assert_called_once_with(post)
+    mock_timeline_repo.push.assert_called_once_with(post, [author_id, follower.id])
+
+
+@pytest.mark.asyncio
+async def test_create_post_by_celebrity_skips_fan_out(
+    create_post_use_case,
+    mock_image_storage,
+    mock_follow_repo,
+    mock_timeline_repo,
+):
+    # Arrange
+    author_id = uuid4()
+    mock_image_storage.save.return_value = "/static/posts/image.jpg"
+    mock_follow_repo.count_followers.return_value = 100
+    request = CreatePostRequest(
+        user_id=author_id,
+        image_file_name="image.jpg",
+        image_file_stream=image_stream(),
+    )
+
+    # Act
+    post = await create_post_use_case.execute(request)
+
+    # Assert
+    mock_follow_repo.get_followers.assert_not_called()
+    mock_timeline_repo.push.assert_called_once_with(post, [author_id])
+
+
+@pytest.mark.asyncio
+async def test_create_post_renders_variants_in_background(
+    create_post_use_case,
+    mock_post_repo,
+    mock_image_storage,
+    mock_follow_repo,
+    mock_image_processor,
+    mock_task_scheduler,
+):
+    # Arrange
+    mock_image_storage.save.return_value = "/static/posts/image.jpg"
+    mock_follow_repo.count_followers.return_value = 100
+    variants = {
+        "original": "/static/posts/image.jpg",
+        "thumbnail": "/static/posts/image_thumbnail.jpg",
+    }
+    mock_image_processor.create_variants.return_value = variants
+    request = CreatePostRequest(
+        user_id=uuid4(),
+        image_file_name="image.jpg",
+        image_file_stream=image_stream(),
+    )
+
+    # Act
+    post = await create_post_use_case.execute(request)
+
+    # Assert: the post is returned before any variant exists
+    assert post.media_status == MediaStatus.PENDING
+    assert post.variants == {"original": "/static/posts/image.jpg"}
+    mock_image_processor.create_variants.assert_not_called()
+
+    task, *args = mock_task_scheduler.schedule.call_args.args
+    await task(*args)
+
+    assert post.media_status == MediaStatus.READY
+    assert post.variants == variants
+    mock_post_repo.save.assert_called_once_with(post)
+
+
+@pytest.mark.asyncio
+async def test_create_post_marks_variants_failed_when_processing_fails(
+    create_post_use_case,
+    mock_post_repo,
+    mock_image_storage,
+    mock_follow_repo,
+    mock_image_processor,
+    mock_task_scheduler,
+):
+    # Arrange
+    mock_image_storage.save.return_value = "/static/posts/image.jpg"
+    mock_follow_repo.count_followers.return_value = 100
+    mock_image_processor.create_variants.side_effect = OSError("cannot identify image file")
+    request = CreatePostRequest(
+        user_id=uuid4(),
+        image_file_name="image.jpg",
+        image_file_stream=image_stream(),
+    )
+
+    # Act
+    post = await create_post_use_case.execute(request)
+    task, *args = mock_task_scheduler.schedule.call_args.args
+    await task(*args)
+
+    # Assert
+    assert post.media_status == MediaStatus.FAILED
+    assert post.variants == {"original": "/static/posts/image.jpg"}
+    mock_post_repo.save.assert_called_once_with(post)
+
+
+@pytest.mark.asyncio
+async def test_create_post_claims_direct_upload(
+    create_post_use_case,
+    mock_post_repo,
+    mock_image_storage,
+    mock_follow_repo,
+    mock_direct_uploads,
+):
+    # Arrange
+    author_id = uuid4()
+    mock_direct_uploads.claim_upload.return_value = "/static/blobs/ab/cd/abcd.webp"
+    mock_follow_repo.count_followers.return_value = 100
+    request = CreatePostRequest(user_id=author_id, upload_id="upload-1", caption="hi")
+
+    # Act
+    post = await create_post_use_case.execute(request)
+
+    # Assert
+    assert post.image_url == "/static/blobs/ab/cd/abcd.webp"
+    mock_direct_uploads.claim_upload.assert_called_once_with(author_id, "upload-1", post.id)
+    mock_image_storage.save.assert_not_called()
+    mock_post_repo.add.assert_called_once_with(post)
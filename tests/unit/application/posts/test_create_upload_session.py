@@ -0,0 +1,61 @@
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from src.application.common.task_scheduler import AbstractTaskScheduler
+from src.application.posts.resumable_upload import AbstractResumableUploadStorage, UploadSession
+from src.application.posts.use_cases.create_upload_session import (
+    CreateUploadSessionRequest,
+    CreateUploadSessionUseCase,
+)
+
+
+@pytest.fixture
+def mock_resumable_uploads():
+    return AsyncMock(spec=AbstractResumableUploadStorage)
+
+
+@pytest.fixture
+def mock_task_scheduler():
+    return Mock(spec=AbstractTaskScheduler)
+
+
+@pytest.fixture
+def use_case(mock_resumable_uploads, mock_task_scheduler):
+    return CreateUploadSessionUseCase(mock_resumable_uploads, mock_task_scheduler)
+
+
+@pytest.mark.asyncio
+async def test_create_upload_session_sweeps_expired_sessions_afterwards(
+    use_case, mock_resumable_uploads, mock_task_scheduler
+):
+    # Arrange
+    user_id = uuid4()
+    session = UploadSession("upload", 10, 0, 4, datetime.now(timezone.utc))
+    mock_resumable_uploads.create_session.return_value = session
+
+    # Act
+    result = await use_case.execute(
+        CreateUploadSessionRequest(user_id=user_id, file_name="photo.jpg", size=10)
+    )
+
+    # Assert
+    assert result == session
+    mock_resumable_uploads.create_session.assert_awaited_once_with(user_id, "photo.jpg", 10)
+    mock_resumable_uploads.delete_expired_sessions.assert_not_awaited()
+    (sweep,) = mock_task_scheduler.schedule.call_args.args
+    await sweep()
+    mock_resumable_uploads.delete_expired_sessions.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_failed_sweep_does_not_raise(use_case, mock_resumable_uploads, mock_task_scheduler):
+    # Arrange
+    mock_resumable_uploads.delete_expired_sessions.side_effect = OSError("disk gone")
+    await use_case.execute(CreateUploadSessionRequest(user_id=uuid4(), file_name="a.jpg", size=1))
+    (sweep,) = mock_task_scheduler.schedule.call_args.args
+
+    # Act & Assert
+    await sweep()
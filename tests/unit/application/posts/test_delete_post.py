@@ -0,0 +1,89 @@
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from src.application.common.task_scheduler import AbstractTaskScheduler
+from src.application.posts.media_reaper import MediaReaper
+from src.application.posts.post_repository import AbstractPostRepository
+from src.application.posts.use_cases.delete_post import DeletePostRequest, DeletePostUseCase
+from src.domain.posts.entity import Post
+from src.domain.posts.exceptions import PostBelongsToAnotherUser, PostNotFound
+
+
+@pytest.fixture
+def mock_post_repo():
+    return AsyncMock(spec=AbstractPostRepository)
+
+
+@pytest.fixture
+def mock_media_reaper():
+    return AsyncMock(spec=MediaReaper)
+
+
+@pytest.fixture
+def mock_task_scheduler():
+    return Mock(spec=AbstractTaskScheduler)
+
+
+@pytest.fixture
+def use_case(mock_post_repo, mock_media_reaper, mock_task_scheduler):
+    return DeletePostUseCase(mock_post_repo, mock_media_reaper, mock_task_scheduler)
+
+
+@pytest.mark.asyncio
+async def test_delete_post_deletes_row_and_reaps_media_afterwards(
+    use_case, mock_post_repo, mock_media_reaper, mock_task_scheduler
+):
+    # Arrange
+    post = Post(user_id=uuid4(), image_url="/static/posts/a.jpg")
+    mock_post_repo.get_by_id.return_value = post
+
+    # Act
+    await use_case.execute(DeletePostRequest(user_id=post.user_id, post_id=post.id))
+
+    # Assert
+    mock_post_repo.delete.assert_awaited_once_with(post)
+    mock_media_reaper.run_once.assert_not_awaited()
+    (reap,) = mock_task_scheduler.schedule.call_args.args
+    await reap()
+    mock_media_reaper.run_once.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_delete_post_not_found(use_case, mock_post_repo, mock_task_scheduler):
+    # Arrange
+    mock_post_repo.get_by_id.return_value = None
+
+    # Act & Assert
+    with pytest.raises(PostNotFound):
+        await use_case.execute(DeletePostRequest(user_id=uuid4(), post_id=uuid4()))
+    mock_post_repo.delete.assert_not_awaited()
+    mock_task_scheduler.schedule.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_delete_post_of_another_user_is_refused(use_case, mock_post_repo):
+    # Arrange
+    post = Post(user_id=uuid4(), image_url="/static/posts/a.jpg")
+    mock_post_repo.get_by_id.return_value = post
+
+    # Act & Assert
+    with pytest.raises(PostBelongsToAnotherUser):
+        await use_case.execute(DeletePostRequest(user_id=uuid4(), post_id=post.id))
+    mock_post_repo.delete.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_failed_reaping_does_not_raise(
+    use_case, mock_post_repo, mock_media_reaper, mock_task_scheduler
+):
+    # Arrange
+    post = Post(user_id=uuid4(), image_url="/static/posts/a.jpg")
+    mock_post_repo.get_by_id.return_value = post
+    mock_media_reaper.run_once.side_effect = OSError("disk gone")
+    await use_case.execute(DeletePostRequest(user_id=post.user_id, post_id=post.id))
+    (reap,) = mock_task_scheduler.schedule.call_args.args
+
+    # Act & Assert
+    await reap()
@@ -0,0 +1,174 @@
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.common.media_deletion_queue import AbstractMediaDeletionQueue, MediaDeletion
+from src.application.common.unit_of_work import AbstractUnitOfWork
+from src.application.posts.media_reaper import MediaReaper
+from src.application.posts.post_storage import AbstractPostImageStorage
+
+
+class InMemoryUnitOfWork(AbstractUnitOfWork):
+    """Snapshots the given stores on begin and restores them on rollback."""
+
+    def __init__(self, *stores: dict) -> None:
+        self._stores = stores
+        self._snapshots: list[list[dict]] = []
+
+    async def begin(self) -> None:
+        self._snapshots.append([dict(store) for store in self._stores])
+
+    async def commit(self) -> None:
+        self._snapshots.pop()
+
+    async def rollback(self) -> None:
+        for store, snapshot in zip(self._stores, self._snapshots.pop()):
+            store.clear()
+            store.update(snapshot)
+
+
+class InMemoryQueue(AbstractMediaDeletionQueue):
+    """Hands out every queued entry on each claim, as after an expired lease."""
+
+    def __init__(self, entries: dict[int, str]) -> None:
+        self.entries = entries
+
+    async def claim(self, limit: int) -> list[MediaDeletion]:
+        return [MediaDeletion(entry_id, url) for entry_id, url in sorted(self.entries.items())[:limit]]
+
+    async def complete(self, ids: list[int]) -> list[int]:
+        return [entry_id for entry_id in ids if self.entries.pop(entry_id, None) is not None]
+
+
+class SharedBlobStorage(AbstractPostImageStorage):
+    """Drops one reference per delete; the file goes with the last one."""
+
+    def __init__(self, ref_counts: dict[str, int]) -> None:
+        self.ref_counts = ref_counts
+
+    async def save(self, post_id, file_name, file_stream) -> str:
+        raise NotImplementedError
+
+    async def delete(self, image_url: str) -> None:
+        self.ref_counts[image_url] -= 1
+        if self.ref_counts[image_url] == 0:
+            del self.ref_counts[image_url]
+
+
+@pytest.fixture
+def mock_queue():
+    queue = AsyncMock(spec=AbstractMediaDeletionQueue)
+    queue.complete.side_effect = lambda ids: ids
+    return queue
+
+
+@pytest.fixture
+def unit_of_work():
+    return InMemoryUnitOfWork()
+
+
+@pytest.fixture
+def mock_storages():
+    return [AsyncMock(spec=AbstractPostImageStorage), AsyncMock(spec=AbstractPostImageStorage)]
+
+
+@pytest.fixture
+def mock_sleep():
+    return AsyncMock()
+
+
+@pytest.fixture
+def reaper(mock_queue, unit_of_work, mock_storages, mock_sleep):
+    return MediaReaper(
+        mock_queue, unit_of_work, mock_storages, batch_size=10, max_per_second=4, sleep=mock_sleep
+    )
+
+
+@pytest.mark.asyncio
+async def test_run_once_deletes_batch_from_every_storage_at_limited_rate(
+    reaper, mock_queue, mock_storages, mock_sleep
+):
+    # Arrange
+    mock_queue.claim.return_value = [MediaDeletion(1, "/a.jpg"), MediaDeletion(2, "/b.jpg")]
+
+    # Act
+    deleted = await reaper.run_once()
+
+    # Assert
+    assert deleted == 2
+    mock_queue.claim.assert_awaited_once_with(10)
+    for storage in mock_storages:
+        assert [c.args for c in storage.delete.await_args_list] == [("/a.jpg",), ("/b.jpg",)]
+    mock_sleep.assert_awaited_once_with(0.25)
+    assert [c.args for c in mock_queue.complete.await_args_list] == [([1],), ([2],)]
+
+
+@pytest.mark.asyncio
+async def test_failed_delete_stays_queued(reaper, mock_queue, mock_storages):
+    # Arrange
+    mock_queue.claim.return_value = [MediaDeletion(1, "/a.jpg"), MediaDeletion(2, "/b.jpg")]
+    mock_storages[1].delete.side_effect = [OSError("disk gone"), None]
+
+    # Act
+    deleted = await reaper.run_once()
+
+    # Assert
+    assert deleted == 1
+
+
+@pytest.mark.asyncio
+async def test_entry_completed_by_an_earlier_run_is_skipped(reaper, mock_queue, mock_storages):
+    # Arrange
+    mock_queue.claim.return_value = [MediaDeletion(1, "/a.jpg")]
+    mock_queue.complete.side_effect = lambda ids: []
+
+    # Act
+    deleted = await reaper.run_once()
+
+    # Assert
+    assert deleted == 0
+    for storage in mock_storages:
+        storage.delete.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_running_the_same_entry_twice_releases_a_shared_blob_once(mock_sleep):
+    # Arrange: two posts share one blob; one of them was deleted
+    ref_counts = {"/static/blobs/shared.jpg": 2}
+    queue = InMemoryQueue({1: "/static/blobs/shared.jpg"})
+    blob_storage = SharedBlobStorage(ref_counts)
+    failing_storage = AsyncMock(spec=AbstractPostImageStorage)
+    failing_storage.delete.side_effect = [OSError("disk gone"), None]
+    reaper = MediaReaper(
+        queue,
+        InMemoryUnitOfWork(ref_counts, queue.entries),
+        [blob_storage, failing_storage],
+        batch_size=10,
+        max_per_second=0,
+        sleep=mock_sleep,
+    )
+
+    # Act: the first run fails after the release and the entry is handed out
+    # again; then a reaper whose lease expired replays it after completion
+    first = await reaper.run_once()
+    second = await reaper.run_once()
+    queue.claim = AsyncMock(return_value=[MediaDeletion(1, "/static/blobs/shared.jpg")])
+    third = await reaper.run_once()
+
+    # Assert
+    assert (first, second, third) == (0, 1, 0)
+    assert ref_counts == {"/static/blobs/shared.jpg": 1}
+    assert queue.entries == {}
+
+
+@pytest.mark.asyncio
+async def test_drain_runs_until_queue_is_empty(reaper, mock_queue):
+    # Arrange
+    mock_queue.claim.side_effect = [[MediaDeletion(1, "/a.jpg")], [MediaDeletion(2, "/b.jpg")], []]
+
+    # Act
+    deleted = await reaper.drain()
+
+    # Assert
+    assert deleted == 2
+    assert mock_queue.claim.await_count == 3
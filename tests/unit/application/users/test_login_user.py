@@ -1,4 +1,5 @@
 import pytest
+from datetime import timedelta
 from unittest.mock import AsyncMock, Mock
 from uuid import uuid4
 
@@ -7,8 +8,12 @@ from src.application.users.login_user import (
     LoginUserRequest,
     LoginUserResponse,
 )
+from src.application.common.exceptions import PasswordHasherBusyError
 from src.application.common.password_hasher import AbstractPasswordHasher
+from src.application.common.task_scheduler import AbstractTaskScheduler
 from src.application.common.token_service import AbstractTokenService
+from src.application.common.unit_of_work import AbstractUnitOfWork
+from src.application.users.refresh_token_repository import AbstractRefreshTokenRepository
 from src.application.users.user_repository import AbstractUserRepository
 from src.domain.users.exceptions import InvalidCredentialsError
 from src.domain.users.user import User
@@ -21,7 +26,9 @@ def mock_user_repo():
 
 @pytest.fixture
 def mock_password_hasher():
-    return Mock(spec=AbstractPasswordHasher)
+    hasher = Mock(spec=AbstractPasswordHasher)
+    hasher.needs_rehash.return_value = False
+    return hasher
 
 
 @pytest.fixture
@@ -30,13 +37,47 @@ def mock_token_service():
 
 
 @pytest.fixture
-def login_use_case(mock_user_repo, mock_password_hasher, mock_token_service):
-    return LoginUserUseCase(mock_user_repo, mock_password_hasher, mock_token_service)
+def mock_task_scheduler():
+    return Mock(spec=AbstractTaskScheduler)
+
+
+@pytest.fixture
+def mock_refresh_token_repo():
+    return AsyncMock(spec=AbstractRefreshTokenRepository)
+
+
+@pytest.fixture
+def mock_unit_of_work():
+    return AsyncMock(spec=AbstractUnitOfWork)
+
+
+@pytest.fixture
+def login_use_case(
+    mock_user_repo,
+    mock_password_hasher,
+    mock_token_service,
+    mock_task_scheduler,
+    mock_refresh_token_repo,
+    mock_unit_of_work,
+):
+    return LoginUserUseCase(
+        mock_user_repo,
+        mock_password_hasher,
+        mock_token_service,
+        mock_task_scheduler,
+        mock_refresh_token_repo,
+        timedelta(days=30),
+        mock_unit_of_work,
+    )
 
 
 @pytest.mark.asyncio
 async def test_login_success(
-    login_use_case, mock_user_repo, mock_password_hasher, mock_token_service
+    login_use_case,
+    mock_user_repo,
+    mock_password_hasher,
+    mock_token_service,
+    mock_refresh_token_repo,
 ):
     # Arrange
     user_id = uuid4()
@@ -60,7 +101,12 @@ async def test_login_success(
     assert result.access_token == "valid_jwt_token"
     
     mock_password_hasher.verify.assert_called_with("password123", "hashed_secret")
-    mock_token_service.generate_token.assert_called_with(user_id)
+    mock_token_service.generate_token.assert_called_with(user)
+
+    stored_token = mock_refresh_token_repo.add.call_args.args[0]
+    assert stored_token.user_id == user_id
+    assert result.refresh_token
+    assert stored_token.token_hash != result.refresh_token
 
 
 @pytest.mark.asyncio
@@ -92,3 +138,68 @@ async def test_login_wrong_password(
     # Act & Assert
     with pytest.raises(InvalidCredentialsError):
         await login_use_case.execute(request)
+
+
+@pytest.mark.asyncio
+async def test_login_does_not_rehash_current_hash(
+    login_use_case, mock_user_repo, mock_password_hasher, mock_task_scheduler
+):
+    # Arrange
+    request = LoginUserRequest(email="test@example.com", password="password123")
+    user = User(username="testuser", email="test@example.com", hashed_password="current")
+    mock_user_repo.get_by_email.return_value = user
+    mock_password_hasher.verify.return_value = True
+
+    # Act
+    await login_use_case.execute(request)
+
+    # Assert
+    mock_task_scheduler.schedule.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_login_rehashes_outdated_hash_in_background(
+    login_use_case, mock_user_repo, mock_password_hasher, mock_task_scheduler
+):
+    # Arrange
+    request = LoginUserRequest(email="test@example.com", password="password123")
+    user = User(username="testuser", email="test@example.com", hashed_password="outdated")
+    mock_user_repo.get_by_email.return_value = user
+    mock_password_hasher.verify.return_value = True
+    mock_password_hasher.needs_rehash.return_value = True
+    mock_password_hasher.hash.return_value = "rehashed"
+
+    # Act
+    await login_use_case.execute(request)
+
+    # Assert: nothing is rehashed until the scheduled task runs
+    mock_password_hasher.hash.assert_not_called()
+    mock_task_scheduler.schedule.assert_called_once()
+    task, *args = mock_task_scheduler.schedule.call_args.args
+    await task(*args)
+
+    mock_password_hasher.hash.assert_called_once_with("password123")
+    assert user.hashed_password == "rehashed"
+    mock_user_repo.save.assert_called_once_with(user)
+
+
+@pytest.mark.asyncio
+async def test_background_rehash_skipped_when_hasher_busy(
+    login_use_case, mock_user_repo, mock_password_hasher, mock_task_scheduler
+):
+    # Arrange
+    request = LoginUserRequest(email="test@example.com", password="password123")
+    user = User(username="testuser", email="test@example.com", hashed_password="outdated")
+    mock_user_repo.get_by_email.return_value = user
+    mock_password_hasher.verify.return_value = True
+    mock_password_hasher.needs_rehash.return_value = True
+    mock_password_hasher.hash.side_effect = PasswordHasherBusyError()
+
+    # Act
+    await login_use_case.execute(request)
+    task, *args = mock_task_scheduler.schedule.call_args.args
+    await task(*args)
+
+    # Assert
+    assert user.hashed_password == "outdated"
+    mock_user_repo.save.assert_not_called()
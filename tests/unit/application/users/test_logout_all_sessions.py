@@ -0,0 +1,72 @@
+import pytest
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from src.application.common.token_revocation import AbstractTokenRevocationList
+from src.application.common.unit_of_work import AbstractUnitOfWork
+from src.application.users.logout_all_sessions import (
+    LogoutAllSessionsRequest,
+    LogoutAllSessionsUseCase,
+)
+from src.application.users.refresh_token_repository import AbstractRefreshTokenRepository
+from src.application.users.user_repository import AbstractUserRepository
+from src.domain.users.exceptions import UserNotFoundError
+
+
+@pytest.fixture
+def mock_user_repo():
+    return AsyncMock(spec=AbstractUserRepository)
+
+
+@pytest.fixture
+def mock_revocation_list():
+    return AsyncMock(spec=AbstractTokenRevocationList)
+
+
+@pytest.fixture
+def mock_refresh_token_repo():
+    return AsyncMock(spec=AbstractRefreshTokenRepository)
+
+
+@pytest.fixture
+def mock_unit_of_work():
+    return AsyncMock(spec=AbstractUnitOfWork)
+
+
+@pytest.fixture
+def logout_all_use_case(
+    mock_user_repo, mock_revocation_list, mock_refresh_token_repo, mock_unit_of_work
+):
+    return LogoutAllSessionsUseCase(
+        mock_user_repo, mock_revocation_list, mock_refresh_token_repo, mock_unit_of_work
+    )
+
+
+@pytest.mark.asyncio
+async def test_logout_all_bumps_token_version_and_revokes(
+    logout_all_use_case, mock_user_repo, mock_revocation_list, mock_refresh_token_repo
+):
+    # Arrange
+    user_id = uuid4()
+    mock_user_repo.increment_token_version.return_value = 3
+
+    # Act
+    await logout_all_use_case.execute(LogoutAllSessionsRequest(user_id=user_id))
+
+    # Assert
+    mock_user_repo.increment_token_version.assert_called_once_with(user_id)
+    mock_revocation_list.revoke.assert_called_once_with(user_id, 3)
+    mock_refresh_token_repo.revoke_all_for_user.assert_called_once_with(user_id)
+
+
+@pytest.mark.asyncio
+async def test_logout_all_unknown_user(
+    logout_all_use_case, mock_user_repo, mock_revocation_list
+):
+    # Arrange
+    mock_user_repo.increment_token_version.return_value = None
+
+    # Act & Assert
+    with pytest.raises(UserNotFoundError):
+        await logout_all_use_case.execute(LogoutAllSessionsRequest(user_id=uuid4()))
+    mock_revocation_list.revoke.assert_not_called()
@@ -0,0 +1,127 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+from src.application.common.token_service import AbstractTokenService
+from src.application.common.unit_of_work import AbstractUnitOfWork
+from src.application.users.refresh_access_token import (
+    RefreshAccessTokenRequest,
+    RefreshAccessTokenUseCase,
+)
+from src.application.users.refresh_token_repository import AbstractRefreshTokenRepository
+from src.application.users.refresh_tokens import hash_refresh_token
+from src.application.users.user_repository import AbstractUserRepository
+from src.domain.users.exceptions import InvalidCredentialsError
+from src.domain.users.refresh_token import RefreshToken
+from src.domain.users.user import User
+
+
+@pytest.fixture
+def mock_refresh_token_repo():
+    return AsyncMock(spec=AbstractRefreshTokenRepository)
+
+
+@pytest.fixture
+def mock_user_repo():
+    return AsyncMock(spec=AbstractUserRepository)
+
+
+@pytest.fixture
+def mock_token_service():
+    return Mock(spec=AbstractTokenService)
+
+
+@pytest.fixture
+def mock_unit_of_work():
+    return AsyncMock(spec=AbstractUnitOfWork)
+
+
+@pytest.fixture
+def refresh_use_case(
+    mock_refresh_token_repo, mock_user_repo, mock_token_service, mock_unit_of_work
+):
+    return RefreshAccessTokenUseCase(
+        mock_refresh_token_repo,
+        mock_user_repo,
+        mock_token_service,
+        timedelta(days=30),
+        mock_unit_of_work,
+    )
+
+
+def make_stored_token(user_id, expires_in=timedelta(days=1)):
+    return RefreshToken(
+        user_id=user_id,
+        family_id=uuid4(),
+        token_hash=hash_refresh_token("old-token"),
+        expires_at=datetime.now(timezone.utc) + expires_in,
+    )
+
+
+@pytest.mark.asyncio
+async def test_refresh_rotates_token_and_issues_access_token(
+    refresh_use_case, mock_refresh_token_repo, mock_user_repo, mock_token_service
+):
+    # Arrange
+    user = User(username="testuser", email="test@example.com", hashed_password="hashed")
+    stored = make_stored_token(user.id)
+    mock_refresh_token_repo.mark_used.return_value = stored
+    mock_user_repo.get_by_id.return_value = user
+    mock_token_service.generate_token.return_value = "new_access_token"
+
+    # Act
+    result = await refresh_use_case.execute(RefreshAccessTokenRequest(refresh_token="old-token"))
+
+    # Assert
+    assert result.access_token == "new_access_token"
+    assert result.refresh_token != "old-token"
+    mock_refresh_token_repo.mark_used.assert_called_once_with(hash_refresh_token("old-token"))
+    new_token = mock_refresh_token_repo.add.call_args.args[0]
+    assert new_token.family_id == stored.family_id
+    assert new_token.token_hash == hash_refresh_token(result.refresh_token)
+
+
+@pytest.mark.asyncio
+async def test_reused_token_revokes_family(
+    refresh_use_case, mock_refresh_token_repo, mock_unit_of_work
+):
+    # Arrange
+    used = make_stored_token(uuid4())
+    mock_refresh_token_repo.mark_used.return_value = None
+    mock_refresh_token_repo.get_by_hash.return_value = used
+    # Raising rolls the unit of work back, so the revocation must come after it
+    mock_refresh_token_repo.revoke_family.side_effect = (
+        lambda _: mock_unit_of_work.__aexit__.assert_awaited_once_with(None, None, None)
+    )
+
+    # Act & Assert
+    with pytest.raises(InvalidCredentialsError):
+        await refresh_use_case.execute(RefreshAccessTokenRequest(refresh_token="old-token"))
+    mock_refresh_token_repo.revoke_family.assert_called_once_with(used.family_id)
+    mock_refresh_token_repo.add.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_unknown_token_is_rejected(refresh_use_case, mock_refresh_token_repo):
+    # Arrange
+    mock_refresh_token_repo.mark_used.return_value = None
+    mock_refresh_token_repo.get_by_hash.return_value = None
+
+    # Act & Assert
+    with pytest.raises(InvalidCredentialsError):
+        await refresh_use_case.execute(RefreshAccessTokenRequest(refresh_token="unknown"))
+    mock_refresh_token_repo.revoke_family.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_expired_token_is_rejected(refresh_use_case, mock_refresh_token_repo):
+    # Arrange
+    mock_refresh_token_repo.mark_used.return_value = make_stored_token(
+        uuid4(), expires_in=timedelta(seconds=-1)
+    )
+
+    # Act & Assert
+    with pytest.raises(InvalidCredentialsError):
+        await refresh_use_case.execute(RefreshAccessTokenRequest(refresh_token="old-token"))
+    mock_refresh_token_repo.add.assert_not_called()
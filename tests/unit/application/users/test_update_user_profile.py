@@ -0,0 +1,133 @@
+import pytest
+from unittest.mock import AsyncMock
+
+from src.application.common.unit_of_work import AbstractUnitOfWork
+from src.application.users.avatar_storage import AbstractAvatarStorage
+from src.application.users.update_user_profile import (
+    UpdateUserProfileRequest,
+    UpdateUserProfileUseCase,
+)
+from src.application.users.user_repository import AbstractUserRepository
+from src.domain.users.user import User
+
+
+@pytest.fixture
+def mock_user_repo():
+    return AsyncMock(spec=AbstractUserRepository)
+
+
+@pytest.fixture
+def mock_avatar_storage():
+    return AsyncMock(spec=AbstractAvatarStorage)
+
+
+@pytest.fixture
+def mock_unit_of_work():
+    return AsyncMock(spec=AbstractUnitOfWork)
+
+
+@pytest.fixture
+def update_profile_use_case(mock_user_repo, mock_avatar_storage, mock_unit_of_work):
+    return UpdateUserProfileUseCase(mock_user_repo, mock_avatar_storage, mock_unit_of_work)
+
+
+@pytest.fixture
+def user():
+    return User(
+        username="alice",
+        email="alice@example.com",
+        hashed_password="hashed",
+        avatar_url="/static/blobs/old.jpg",
+    )
+
+
+async def avatar_bytes():
+    yield b"image"
+
+
+@pytest.mark.asyncio
+async def test_new_avatar_releases_the_previous_one(
+    update_profile_use_case, mock_user_repo, mock_avatar_storage, user
+):
+    # Arrange
+    mock_user_repo.get_by_id.return_value = user
+    mock_avatar_storage.save.return_value = "/static/blobs/new.jpg"
+    request = UpdateUserProfileRequest(
+        user_id=user.id, avatar_file_name="me.jpg", avatar_file_stream=avatar_bytes()
+    )
+
+    # Act
+    updated = await update_profile_use_case.execute(request)
+
+    # Assert
+    assert updated.avatar_url == "/static/blobs/new.jpg"
+    mock_user_repo.save.assert_called_once_with(user)
+    mock_avatar_storage.delete.assert_called_once_with("/static/blobs/old.jpg")
+
+
+@pytest.mark.asyncio
+async def test_same_avatar_uploaded_again_releases_the_extra_reference(
+    update_profile_use_case, mock_user_repo, mock_avatar_storage, user
+):
+    # Arrange: the store hands out one reference per upload of the same bytes
+    references = {"/static/blobs/old.jpg": 1}
+
+    async def save(user_id, file_name, file_stream):
+        references["/static/blobs/old.jpg"] += 1
+        return "/static/blobs/old.jpg"
+
+    async def delete(avatar_url):
+        references[avatar_url] -= 1
+
+    mock_user_repo.get_by_id.return_value = user
+    mock_avatar_storage.save.side_effect = save
+    mock_avatar_storage.delete.side_effect = delete
+
+    # Act
+    for _ in range(2):
+        await update_profile_use_case.execute(
+            UpdateUserProfileRequest(
+                user_id=user.id, avatar_file_name="me.jpg", avatar_file_stream=avatar_bytes()
+            )
+        )
+
+    # Assert
+    assert user.avatar_url == "/static/blobs/old.jpg"
+    assert references == {"/static/blobs/old.jpg": 1}
+
+
+@pytest.mark.asyncio
+async def test_failed_save_releases_nothing_and_rolls_the_upload_back(
+    update_profile_use_case, mock_user_repo, mock_avatar_storage, mock_unit_of_work, user
+):
+    # Arrange
+    mock_user_repo.get_by_id.return_value = user
+    mock_avatar_storage.save.return_value = "/static/blobs/new.jpg"
+    mock_user_repo.save.side_effect = RuntimeError("database gone")
+    request = UpdateUserProfileRequest(
+        user_id=user.id, avatar_file_name="me.jpg", avatar_file_stream=avatar_bytes()
+    )
+
+    # Act & Assert
+    with pytest.raises(RuntimeError):
+        await update_profile_use_case.execute(request)
+    mock_unit_of_work.__aexit__.assert_awaited_once()
+    assert mock_unit_of_work.__aexit__.await_args.args[0] is RuntimeError
+    mock_avatar_storage.delete.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_deleting_avatar_releases_it(
+    update_profile_use_case, mock_user_repo, mock_avatar_storage, user
+):
+    # Arrange
+    mock_user_repo.get_by_id.return_value = user
+
+    # Act
+    await update_profile_use_case.execute(
+        UpdateUserProfileRequest(user_id=user.id, should_delete_avatar=True)
+    )
+
+    # Assert
+    assert user.avatar_url.startswith("https://ui-avatars.com/")
+    mock_avatar_storage.delete.assert_called_once_with("/static/blobs/old.jpg")
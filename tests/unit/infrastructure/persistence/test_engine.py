@@ -0,0 +1,65 @@
+from unittest.mock import Mock
+
+import pytest
+from sqlalchemy import exc
+from sqlalchemy.util.concurrency import greenlet_spawn
+
+from src.infrastructure.persistence.engine import (
+    PROFILES,
+    InstrumentedAsyncPool,
+    load_engine_settings,
+)
+
+
+def test_load_engine_settings_defaults_to_development_profile():
+    # Act
+    settings = load_engine_settings({})
+
+    # Assert
+    assert settings == PROFILES["development"]
+    assert settings.echo is False
+
+
+def test_load_engine_settings_applies_overrides_to_profile():
+    # Act
+    settings = load_engine_settings(
+        {"DB_PROFILE": "production", "DB_POOL_SIZE": "20", "DB_ECHO": "true", "DB_POOL_PRE_PING": "0"}
+    )
+
+    # Assert
+    assert settings.pool_size == 20
+    assert settings.echo is True
+    assert settings.pool_pre_ping is False
+    assert settings.max_overflow == PROFILES["production"].max_overflow
+
+
+def test_load_engine_settings_rejects_unknown_profile():
+    # Act & Assert
+    with pytest.raises(ValueError):
+        load_engine_settings({"DB_PROFILE": "staging"})
+
+
+@pytest.mark.asyncio
+async def test_pool_counts_checkouts_and_timeouts():
+    # Arrange
+    pool = InstrumentedAsyncPool(Mock, pool_size=1, max_overflow=0, timeout=0.01)
+
+    def exhaust_pool():
+        connection = pool.connect()
+        busy = pool.stats()
+        with pytest.raises(exc.TimeoutError):
+            pool.connect()
+        connection.close()
+        return busy
+
+    # Act
+    busy = await greenlet_spawn(exhaust_pool)
+    stats = pool.stats()
+
+    # Assert
+    assert busy.checked_out == 1
+    assert stats.checked_out == 0
+    assert stats.checked_in == 1
+    assert stats.checkouts == 1
+    assert stats.timeouts == 1
+    assert stats.wait_buckets[-1] == (10.0, 1)
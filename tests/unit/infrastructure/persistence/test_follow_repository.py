@@ -0,0 +1,92 @@
+import pytest
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+from sqlalchemy.exc import IntegrityError
+
+from src.domain.follows.entity import Follow
+from src.domain.users.exceptions import UserNotFoundError
+from src.infrastructure.persistence.repositories.follow_repository import (
+    FOREIGN_KEY_VIOLATION,
+    SQLAlchemyFollowRepository,
+)
+
+
+def make_session(returned=None, error=None):
+    session = AsyncMock()
+    session.info = {}
+    result = Mock()
+    result.scalar_one_or_none.return_value = returned
+    session.execute.return_value = result
+    session.execute.side_effect = error
+    return session
+
+
+def integrity_error(sqlstate):
+    orig = Exception("violation")
+    orig.sqlstate = sqlstate
+    return IntegrityError("INSERT INTO follows ...", {}, orig)
+
+
+@pytest.mark.asyncio
+async def test_follow_if_absent_returns_new_follower_count_in_one_statement():
+    # Arrange
+    session = make_session(returned=7)
+    repo = SQLAlchemyFollowRepository(session)
+
+    # Act
+    follower_count = await repo.follow_if_absent(Follow(follower_id=uuid4(), followed_id=uuid4()))
+
+    # Assert
+    assert follower_count == 7
+    session.execute.assert_awaited_once()
+    session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_follow_if_absent_returns_none_when_already_following():
+    # Arrange
+    repo = SQLAlchemyFollowRepository(make_session(returned=None))
+
+    # Act
+    follower_count = await repo.follow_if_absent(Follow(follower_id=uuid4(), followed_id=uuid4()))
+
+    # Assert
+    assert follower_count is None
+
+
+@pytest.mark.asyncio
+async def test_follow_if_absent_maps_missing_user_to_user_not_found():
+    # Arrange
+    session = make_session(error=integrity_error(FOREIGN_KEY_VIOLATION))
+    repo = SQLAlchemyFollowRepository(session)
+
+    # Act & Assert
+    with pytest.raises(UserNotFoundError):
+        await repo.follow_if_absent(Follow(follower_id=uuid4(), followed_id=uuid4()))
+    session.commit.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_follow_if_absent_reraises_other_integrity_errors():
+    # Arrange
+    repo = SQLAlchemyFollowRepository(make_session(error=integrity_error("23514")))
+
+    # Act & Assert
+    with pytest.raises(IntegrityError):
+        await repo.follow_if_absent(Follow(follower_id=uuid4(), followed_id=uuid4()))
+
+
+@pytest.mark.asyncio
+async def test_unfollow_if_present_reports_whether_a_follow_was_removed():
+    # Arrange
+    removed_repo = SQLAlchemyFollowRepository(make_session(returned=uuid4()))
+    absent_repo = SQLAlchemyFollowRepository(make_session(returned=None))
+
+    # Act
+    removed = await removed_repo.unfollow_if_present(uuid4(), uuid4())
+    absent = await absent_repo.unfollow_if_present(uuid4(), uuid4())
+
+    # Assert
+    assert removed is True
+    assert absent is False
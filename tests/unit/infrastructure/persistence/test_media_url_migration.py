@@ -0,0 +1,75 @@
+import pytest
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+from src.infrastructure.persistence.media_url_migration import rewrite_media_urls
+
+
+def rows_result(rows):
+    result = Mock()
+    result.all.return_value = rows
+    return result
+
+
+def ids_result(ids):
+    result = Mock()
+    result.scalars.return_value = ids
+    return result
+
+
+def shard(url):
+    return url.replace("/static/posts/", "/static/posts/3f/a8/")
+
+
+def make_session(post, *update_results):
+    session = AsyncMock()
+    # Posts batch, its UPDATEs, end of posts, end of users
+    session.execute.side_effect = [
+        rows_result([post]),
+        *update_results,
+        rows_result([]),
+        rows_result([]),
+    ]
+    return session
+
+
+def executed_sql(session):
+    return [str(call.args[0]) for call in session.execute.await_args_list]
+
+
+@pytest.mark.asyncio
+async def test_rewrite_updates_only_the_image_url_and_leaves_null_variants_alone():
+    # Arrange
+    post = Mock(id=uuid4(), image_url="/static/posts/3fa8.jpg", variants=None)
+    session = make_session(post, ids_result([post.id]))
+
+    # Act
+    counts = await rewrite_media_urls(session, shard)
+
+    # Assert
+    assert counts.posts == 1
+    updates = [sql for sql in executed_sql(session) if sql.startswith("UPDATE")]
+    assert len(updates) == 1
+    assert "SET image_url=" in updates[0] and "variants" not in updates[0]
+    assert 'posts.image_url = rewrites."old"' in updates[0]
+    session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_rewrite_guards_variants_with_the_value_that_was_read():
+    # Arrange
+    post = Mock(
+        id=uuid4(),
+        image_url="/static/blobs/aa/aa/aaaa.jpg",
+        variants={"thumbnail": "/static/posts/3fa8_thumbnail.jpg"},
+    )
+    session = make_session(post, ids_result([]))
+
+    # Act
+    counts = await rewrite_media_urls(session, lambda url: shard(url) if "posts" in url else None)
+
+    # Assert: the row changed since it was read, so nothing counts as rewritten
+    assert counts.posts == 0
+    updates = [sql for sql in executed_sql(session) if sql.startswith("UPDATE")]
+    assert len(updates) == 1
+    assert 'posts.variants = rewrites."old"' in updates[0]
@@ -0,0 +1,140 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, Mock
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.infrastructure.persistence.routing import Replica, SessionRouter
+from src.infrastructure.services.ttl_cache import TTLCache
+
+
+def make_replica(name, lag=0.0, reachable=True):
+    connection = AsyncMock()
+    connection.dialect.name = "postgresql"
+    connection.execute.return_value = Mock(scalar_one=Mock(return_value=lag))
+    engine = MagicMock()
+    engine.connect.return_value.__aenter__.return_value = connection
+    if not reachable:
+        engine.connect.side_effect = OSError("connection refused")
+    return Replica(name=name, engine=engine, sessionmaker=Mock(return_value=Mock(name=name)))
+
+
+async def settle():
+    # Lets background lag checks run to completion
+    for _ in range(10):
+        await asyncio.sleep(0)
+
+
+def make_router(replicas, clock=lambda: 0.0):
+    return SessionRouter(
+        async_sessionmaker(),
+        replicas,
+        TTLCache(max_size=10, ttl_seconds=5, clock=clock),
+        sticky_seconds=5,
+        max_lag_seconds=2,
+        lag_check_interval=1,
+        clock=clock,
+    )
+
+
+def test_read_uses_primary_without_replicas():
+    # Arrange
+    router = make_router([])
+
+    # Act & Assert
+    assert router.read(uuid4()) is None
+
+
+@pytest.mark.asyncio
+async def test_read_alternates_between_current_replicas():
+    # Arrange
+    first, second = make_replica("first"), make_replica("second")
+    router = make_router([first, second])
+    await router.check_replicas()
+
+    # Act
+    sessions = [router.read(), router.read()]
+
+    # Assert
+    assert sessions == [first.sessionmaker.return_value, second.sessionmaker.return_value]
+
+
+@pytest.mark.asyncio
+async def test_read_skips_lagging_and_unreachable_replicas():
+    # Arrange
+    lagging = make_replica("lagging", lag=30.0)
+    down = make_replica("down", reachable=False)
+    current = make_replica("current", lag=0.5)
+    router = make_router([lagging, down, current])
+    await router.check_replicas()
+
+    # Act
+    sessions = {router.read() for _ in range(3)}
+
+    # Assert
+    assert sessions == {current.sessionmaker.return_value}
+    assert lagging.lag_seconds == 30.0
+    assert down.lag_seconds is None
+
+
+@pytest.mark.asyncio
+async def test_read_falls_back_to_primary_when_no_replica_is_current():
+    # Arrange
+    router = make_router([make_replica("lagging", lag=30.0)])
+    await router.check_replicas()
+
+    # Act & Assert
+    assert router.read() is None
+
+
+@pytest.mark.asyncio
+async def test_read_measures_lag_in_background_once_per_interval():
+    # Arrange
+    now = [0.0]
+    replica = make_replica("replica")
+    router = make_router([replica], clock=lambda: now[0])
+
+    # Act
+    unmeasured = router.read()
+    await settle()
+    measured = router.read()
+    now[0] = 1.0
+    router.read()
+    await settle()
+
+    # Assert
+    assert unmeasured is None
+    assert measured is replica.sessionmaker.return_value
+    assert replica.engine.connect.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_reads_of_recent_writer_stay_on_primary():
+    # Arrange
+    replica = make_replica("replica")
+    router = make_router([replica])
+    await router.check_replicas()
+    writer, other = uuid4(), uuid4()
+
+    # Act
+    router.mark_written(writer)
+
+    # Assert
+    assert router.read(writer) is None
+    assert router.read(other) is replica.sessionmaker.return_value
+
+
+@pytest.mark.asyncio
+async def test_commit_on_primary_session_makes_writer_sticky():
+    # Arrange
+    router = make_router([make_replica("replica")])
+    await router.check_replicas()
+    writer = uuid4()
+
+    # Act
+    async with router.primary(writer) as session:
+        await session.commit()
+
+    # Assert
+    assert router.read(writer) is None
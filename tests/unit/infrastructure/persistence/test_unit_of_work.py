@@ -0,0 +1,128 @@
+import pytest
+from unittest.mock import AsyncMock
+
+from src.infrastructure.persistence.unit_of_work import (
+    SQLAlchemyUnitOfWork,
+    commit_or_defer,
+    run_after_commit,
+)
+
+
+def make_session():
+    session = AsyncMock()
+    session.info = {}
+    return session
+
+
+@pytest.mark.asyncio
+async def test_writes_outside_a_unit_of_work_commit_right_away():
+    # Arrange
+    session = make_session()
+
+    # Act
+    await commit_or_defer(session)
+
+    # Assert
+    session.commit.assert_awaited_once()
+    session.flush.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_commits_its_writes_once():
+    # Arrange
+    session = make_session()
+
+    # Act
+    async with SQLAlchemyUnitOfWork(session):
+        await commit_or_defer(session)
+        await commit_or_defer(session)
+
+    # Assert
+    assert session.flush.await_count == 2
+    session.commit.assert_awaited_once()
+    session.begin_nested.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_unit_of_work_rolls_back_on_error():
+    # Arrange
+    session = make_session()
+
+    # Act
+    with pytest.raises(RuntimeError):
+        async with SQLAlchemyUnitOfWork(session):
+            await commit_or_defer(session)
+            raise RuntimeError("failed half way")
+
+    # Assert
+    session.rollback.assert_awaited_once()
+    session.commit.assert_not_called()
+
+    # Later writes commit on their own again
+    await commit_or_defer(session)
+    session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_nested_unit_of_work_uses_a_savepoint():
+    # Arrange
+    session = make_session()
+    savepoint = AsyncMock()
+    savepoint.is_active = True
+    session.begin_nested.return_value = savepoint
+    unit_of_work = SQLAlchemyUnitOfWork(session)
+
+    # Act
+    async with unit_of_work:
+        with pytest.raises(RuntimeError):
+            async with unit_of_work:
+                await commit_or_defer(session)
+                raise RuntimeError("inner step failed")
+        await commit_or_defer(session)
+
+    # Assert
+    savepoint.rollback.assert_awaited_once()
+    session.rollback.assert_not_called()
+    session.commit.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_after_commit_callbacks_run_only_once_the_outermost_unit_commits():
+    # Arrange
+    session = make_session()
+    savepoint = AsyncMock()
+    savepoint.is_active = True
+    session.begin_nested.return_value = savepoint
+    unit_of_work = SQLAlchemyUnitOfWork(session)
+    kept, dropped = AsyncMock(), AsyncMock()
+
+    # Act
+    async with unit_of_work:
+        await run_after_commit(session, kept)
+        with pytest.raises(RuntimeError):
+            async with unit_of_work:
+                await run_after_commit(session, dropped)
+                raise RuntimeError("inner step failed")
+        kept.assert_not_called()
+
+    # Assert
+    kept.assert_awaited_once()
+    dropped.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_after_commit_callbacks_are_dropped_on_rollback():
+    # Arrange
+    session = make_session()
+    callback = AsyncMock()
+
+    # Act
+    with pytest.raises(RuntimeError):
+        async with SQLAlchemyUnitOfWork(session):
+            await run_after_commit(session, callback)
+            raise RuntimeError("failed half way")
+    async with SQLAlchemyUnitOfWork(session):
+        pass
+
+    # Assert
+    callback.assert_not_called()
@@ -0,0 +1,80 @@
+import pytest
+from unittest.mock import AsyncMock, Mock
+from uuid import UUID, uuid4
+
+from src.domain.users.user import User
+from src.infrastructure.persistence.orm.user import SQLAlchemyUser
+from src.infrastructure.persistence.repositories.user_repository import (
+    SQLAlchemyUserRepository,
+)
+from src.infrastructure.services.ttl_cache import TTLCache
+
+
+def make_session(user_id):
+    session = AsyncMock()
+    session.info = {}
+    result = Mock()
+    result.scalar_one_or_none.return_value = SQLAlchemyUser(
+        id=user_id,
+        username="testuser",
+        email="test@example.com",
+        password_hash="hashed",
+        is_public=True,
+    )
+    session.execute.return_value = result
+    return session
+
+
+@pytest.fixture
+def cache():
+    return TTLCache[UUID, User](max_size=10, ttl_seconds=60)
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_is_served_from_shared_cache_across_requests(cache):
+    # Arrange
+    user_id = uuid4()
+    first_session = make_session(user_id)
+    second_session = make_session(user_id)
+
+    # Act
+    first = await SQLAlchemyUserRepository(first_session, cache).get_by_id(user_id)
+    first.bio = "mutated by the caller"
+    second = await SQLAlchemyUserRepository(second_session, cache).get_by_id(user_id)
+
+    # Assert
+    first_session.execute.assert_called_once()
+    second_session.execute.assert_not_called()
+    assert second.bio is None
+    assert cache.stats().hits == 1
+
+
+@pytest.mark.asyncio
+async def test_get_by_id_within_a_request_returns_same_instance(cache):
+    # Arrange
+    user_id = uuid4()
+    repo = SQLAlchemyUserRepository(make_session(user_id), cache)
+
+    # Act
+    first = await repo.get_by_id(user_id)
+    second = await repo.get_by_id(user_id)
+
+    # Assert
+    assert first is second
+
+
+@pytest.mark.asyncio
+async def test_save_invalidates_cached_user(cache):
+    # Arrange
+    user_id = uuid4()
+    session = make_session(user_id)
+    repo = SQLAlchemyUserRepository(session, cache)
+    user = await repo.get_by_id(user_id)
+
+    # Act
+    await repo.save(user)
+    await SQLAlchemyUserRepository(session, cache).get_by_id(user_id)
+
+    # Assert
+    assert session.execute.call_count == 2
+    session.commit.assert_awaited_once()
@@ -0,0 +1,113 @@
+import hashlib
+from unittest.mock import AsyncMock
+
+import pytest
+
+from src.application.common.media_blob_repository import AbstractMediaBlobRepository
+from src.infrastructure.services.blob_store import ContentAddressedBlobStore, file_extension
+
+
+async def chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+@pytest.fixture
+def mock_blob_repo():
+    return AsyncMock(spec=AbstractMediaBlobRepository)
+
+
+@pytest.mark.asyncio
+async def test_put_stores_new_content_under_its_digest(tmp_path, mock_blob_repo):
+    # Arrange
+    digest = hashlib.sha256(b"image-bytes").hexdigest()
+    mock_blob_repo.acquire.return_value = None
+    mock_blob_repo.register.side_effect = lambda blob_digest, file_name, size: file_name
+    store = ContentAddressedBlobStore(mock_blob_repo, str(tmp_path), "/static/blobs")
+
+    # Act
+    url = await store.put(chunks(b"image-", b"bytes"), ".jpg", max_bytes=1024)
+
+    # Assert
+    _, file_name, size = mock_blob_repo.register.call_args.args
+    assert file_name.startswith(f"{digest}-") and file_name.endswith(".jpg")
+    assert size == 11
+    assert url == f"/static/blobs/{digest[:2]}/{digest[2:4]}/{file_name}"
+    assert (tmp_path / digest[:2] / digest[2:4] / file_name).read_bytes() == b"image-bytes"
+
+
+@pytest.mark.asyncio
+async def test_put_removes_its_file_when_a_concurrent_upload_registered_first(
+    tmp_path, mock_blob_repo
+):
+    # Arrange
+    digest = hashlib.sha256(b"image-bytes").hexdigest()
+    mock_blob_repo.acquire.return_value = None
+    mock_blob_repo.register.return_value = f"{digest}-0123456789ab.jpg"
+    store = ContentAddressedBlobStore(mock_blob_repo, str(tmp_path), "/static/blobs")
+
+    # Act
+    url = await store.put(chunks(b"image-bytes"), ".jpg", max_bytes=1024)
+
+    # Assert
+    assert url == f"/static/blobs/{digest[:2]}/{digest[2:4]}/{digest}-0123456789ab.jpg"
+    assert list((tmp_path / digest[:2] / digest[2:4]).iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_put_references_identical_content_without_storing_it_again(
+    tmp_path, mock_blob_repo
+):
+    # Arrange
+    digest = hashlib.sha256(b"image-bytes").hexdigest()
+    mock_blob_repo.acquire.return_value = f"{digest}.webp"
+    store = ContentAddressedBlobStore(mock_blob_repo, str(tmp_path), "/static/blobs")
+
+    # Act
+    url = await store.put(chunks(b"image-bytes"), ".jpg", max_bytes=1024)
+
+    # Assert
+    assert url == f"/static/blobs/{digest[:2]}/{digest[2:4]}/{digest}.webp"
+    assert list(tmp_path.iterdir()) == []
+    mock_blob_repo.register.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_release_deletes_the_file_with_the_last_reference(tmp_path, mock_blob_repo):
+    # Arrange
+    digest = "a" * 64
+    blob_path = tmp_path / "aa" / "aa" / f"{digest}-0123456789ab.jpg"
+    blob_path.parent.mkdir(parents=True)
+    blob_path.write_bytes(b"x")
+
+    async def release(blob_digest, delete_file):
+        await delete_file(f"{blob_digest}-0123456789ab.jpg")
+        return True
+
+    mock_blob_repo.release.side_effect = release
+    store = ContentAddressedBlobStore(mock_blob_repo, str(tmp_path), "/static/blobs")
+
+    # Act
+    await store.release(f"/static/blobs/aa/aa/{digest}-0123456789ab.jpg")
+
+    # Assert
+    assert not blob_path.exists()
+
+
+@pytest.mark.asyncio
+async def test_release_ignores_foreign_urls(tmp_path, mock_blob_repo):
+    # Arrange
+    store = ContentAddressedBlobStore(mock_blob_repo, str(tmp_path), "/static/blobs")
+
+    # Act
+    await store.release("https://ui-avatars.com/api/?name=alice")
+    await store.release("/static/blobs/../secrets.txt")
+
+    # Assert
+    mock_blob_repo.release.assert_not_called()
+
+
+def test_file_extension_drops_suspicious_suffixes():
+    assert file_extension("photo.JPG") == ".jpg"
+    assert file_extension("photo") == ""
+    assert file_extension("photo.j p g") == ""
@@ -0,0 +1,40 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.application.common.exceptions import PasswordHasherBusyError
+from src.infrastructure.services.bounded_executor import BoundedExecutor
+
+
+@pytest.fixture
+def executor():
+    executor = BoundedExecutor(max_workers=1, max_pending=2, reject_with=PasswordHasherBusyError)
+    yield executor
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_run_executes_off_the_event_loop_thread(executor):
+    # Act
+    thread_name = await executor.run(lambda: threading.current_thread().name)
+
+    # Assert
+    assert thread_name != threading.current_thread().name
+
+
+@pytest.mark.asyncio
+async def test_run_fails_fast_when_queue_is_full(executor):
+    # Arrange
+    release = threading.Event()
+    blocked = [asyncio.create_task(executor.run(release.wait)) for _ in range(2)]
+    await asyncio.sleep(0)
+
+    # Act & Assert
+    with pytest.raises(PasswordHasherBusyError):
+        await executor.run(lambda: None)
+
+    release.set()
+    await asyncio.gather(*blocked)
+    assert executor.stats().pending == 0
+    assert executor.stats().rejected == 1
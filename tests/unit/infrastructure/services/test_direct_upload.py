@@ -0,0 +1,177 @@
+from unittest.mock import AsyncMock, Mock
+from urllib.parse import parse_qs, urlsplit
+from uuid import uuid4
+
+import pytest
+
+from src.application.common.exceptions import UploadNotFoundError, UploadTooLargeError
+from src.infrastructure.services.blob_store import ContentAddressedBlobStore
+from src.infrastructure.services.direct_upload import (
+    InvalidUploadSignatureError,
+    LocalDirectUploadStorage,
+    LocalUploadGateway,
+    S3DirectUploadStorage,
+)
+from src.infrastructure.services.object_storage import S3Client
+
+
+async def body(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+def signed_query(url: str) -> dict[str, str]:
+    return {key: values[0] for key, values in parse_qs(urlsplit(url).query).items()}
+
+
+@pytest.fixture
+def gateway(tmp_path):
+    return LocalUploadGateway(signing_key="secret", incoming_path=str(tmp_path))
+
+
+@pytest.fixture
+def mock_blob_store():
+    return AsyncMock(spec=ContentAddressedBlobStore)
+
+
+@pytest.fixture
+def local_storage(gateway, mock_blob_store):
+    return LocalDirectUploadStorage(gateway, mock_blob_store, max_bytes=100)
+
+
+@pytest.mark.asyncio
+async def test_gateway_stores_upload_sent_to_signed_url(gateway, local_storage):
+    # Arrange
+    target = await local_storage.create_upload_target(uuid4(), "photo.JPG", size=6)
+    query = signed_query(target.url)
+
+    # Act
+    await gateway.receive(
+        target.upload_id,
+        int(query["size"]),
+        int(query["expires"]),
+        query["signature"],
+        body(b"abc", b"def"),
+    )
+
+    # Assert
+    assert target.upload_id.endswith(".jpg")
+    assert gateway.path_of(target.upload_id).read_bytes() == b"abcdef"
+
+
+@pytest.mark.asyncio
+async def test_gateway_rejects_tampered_size(gateway, local_storage):
+    # Arrange
+    target = await local_storage.create_upload_target(uuid4(), "photo.jpg", size=6)
+    query = signed_query(target.url)
+
+    # Act & Assert
+    with pytest.raises(InvalidUploadSignatureError):
+        await gateway.receive(
+            target.upload_id, 60, int(query["expires"]), query["signature"], body(b"abc")
+        )
+
+
+@pytest.mark.asyncio
+async def test_gateway_rejects_body_of_other_size(gateway, local_storage):
+    # Arrange
+    target = await local_storage.create_upload_target(uuid4(), "photo.jpg", size=6)
+    query = signed_query(target.url)
+
+    # Act & Assert
+    with pytest.raises(InvalidUploadSignatureError):
+        await gateway.receive(
+            target.upload_id, 6, int(query["expires"]), query["signature"], body(b"abc")
+        )
+    assert not gateway.path_of(target.upload_id).exists()
+
+
+@pytest.mark.asyncio
+async def test_create_upload_target_rejects_oversized_image(local_storage):
+    with pytest.raises(UploadTooLargeError):
+        await local_storage.create_upload_target(uuid4(), "photo.jpg", size=101)
+
+
+@pytest.mark.asyncio
+async def test_claim_moves_upload_into_blob_store(gateway, local_storage, mock_blob_store):
+    # Arrange
+    user_id = uuid4()
+    target = await local_storage.create_upload_target(user_id, "photo.jpg", size=3)
+    path = gateway.path_of(target.upload_id)
+    path.parent.mkdir(parents=True)
+    path.write_bytes(b"abc")
+    mock_blob_store.adopt.return_value = "/static/blobs/ab/cd/abcd.webp"
+
+    # Act
+    image_url = await local_storage.claim_upload(user_id, target.upload_id, uuid4())
+
+    # Assert
+    assert image_url == "/static/blobs/ab/cd/abcd.webp"
+    mock_blob_store.adopt.assert_called_once_with(path, ".jpg")
+
+
+@pytest.mark.asyncio
+async def test_claim_of_another_users_upload_is_not_found(local_storage, mock_blob_store):
+    # Arrange
+    target = await local_storage.create_upload_target(uuid4(), "photo.jpg", size=3)
+
+    # Act & Assert
+    with pytest.raises(UploadNotFoundError):
+        await local_storage.claim_upload(uuid4(), target.upload_id, uuid4())
+    mock_blob_store.adopt.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_claim_of_missing_upload_is_not_found(local_storage, mock_blob_store):
+    # Arrange
+    user_id = uuid4()
+    target = await local_storage.create_upload_target(user_id, "photo.jpg", size=3)
+    mock_blob_store.adopt.side_effect = FileNotFoundError()
+
+    # Act & Assert
+    with pytest.raises(UploadNotFoundError):
+        await local_storage.claim_upload(user_id, target.upload_id, uuid4())
+
+
+@pytest.mark.asyncio
+async def test_s3_claim_copies_upload_to_post_key():
+    # Arrange
+    user_id, post_id = uuid4(), uuid4()
+    client = Mock(spec=S3Client)
+    client.presign_put.return_value = "https://s3.test/bucket/incoming/x?X-Amz-Signature=sig"
+    client.stat_object.return_value = (3, '"etag-1"')
+    client.create_object.return_value = True
+    storage = S3DirectUploadStorage(client, "https://cdn.test", max_bytes=100)
+    target = await storage.create_upload_target(user_id, "photo.png", size=3)
+
+    # Act
+    image_url = await storage.claim_upload(user_id, target.upload_id, post_id)
+
+    # Assert
+    assert target.headers == {"Content-Length": "3"}
+    assert image_url == f"https://cdn.test/posts/{post_id}.png"
+    client.create_object.assert_called_once_with(
+        f"claims/{target.upload_id}", str(post_id).encode()
+    )
+    client.copy_object.assert_called_once_with(
+        f"incoming/{target.upload_id}", f"posts/{post_id}.png", if_match='"etag-1"'
+    )
+    client.delete_object.assert_called_once_with(f"incoming/{target.upload_id}")
+
+
+@pytest.mark.asyncio
+async def test_s3_claim_of_an_upload_claimed_concurrently_is_not_found():
+    # Arrange
+    user_id = uuid4()
+    client = Mock(spec=S3Client)
+    client.presign_put.return_value = "https://s3.test/bucket/incoming/x?X-Amz-Signature=sig"
+    client.stat_object.return_value = (3, '"etag-1"')
+    client.create_object.return_value = False
+    storage = S3DirectUploadStorage(client, "https://cdn.test", max_bytes=100)
+    target = await storage.create_upload_target(user_id, "photo.png", size=3)
+
+    # Act & Assert
+    with pytest.raises(UploadNotFoundError):
+        await storage.claim_upload(user_id, target.upload_id, uuid4())
+    client.copy_object.assert_not_called()
+    client.delete_object.assert_not_called()
@@ -0,0 +1,95 @@
+import pytest
+
+from src.application.common.exceptions import UploadOffsetMismatchError, UploadTooLargeError
+from src.infrastructure.services.file_writer import append_stream, write_stream
+
+
+async def chunks(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+@pytest.mark.asyncio
+async def test_write_stream_writes_all_chunks(tmp_path):
+    # Arrange
+    destination = tmp_path / "image.jpg"
+
+    # Act
+    written = await write_stream(chunks(b"abc", b"def"), destination, max_bytes=6)
+
+    # Assert
+    assert written == 6
+    assert destination.read_bytes() == b"abcdef"
+    assert list(tmp_path.iterdir()) == [destination]
+
+
+@pytest.mark.asyncio
+async def test_write_stream_aborts_once_limit_is_exceeded(tmp_path):
+    # Arrange
+    destination = tmp_path / "image.jpg"
+    consumed = []
+
+    async def tracked():
+        for part in (b"abc", b"def", b"ghi"):
+            consumed.append(part)
+            yield part
+
+    # Act & Assert
+    with pytest.raises(UploadTooLargeError):
+        await write_stream(tracked(), destination, max_bytes=5)
+    assert consumed == [b"abc", b"def"]
+    assert list(tmp_path.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_write_stream_keeps_existing_file_on_failure(tmp_path):
+    # Arrange
+    destination = tmp_path / "image.jpg"
+    destination.write_bytes(b"old")
+
+    # Act & Assert
+    with pytest.raises(UploadTooLargeError):
+        await write_stream(chunks(b"too large"), destination, max_bytes=3)
+    assert destination.read_bytes() == b"old"
+
+
+@pytest.mark.asyncio
+async def test_append_stream_keeps_what_arrived_before_a_failure(tmp_path):
+    # Arrange
+    path = tmp_path / "upload.part"
+    path.write_bytes(b"abc")
+
+    async def dropped():
+        yield b"def"
+        raise ConnectionError("client went away")
+
+    # Act
+    with pytest.raises(ConnectionError):
+        await append_stream(dropped(), path, offset=3, max_bytes=10)
+
+    # Assert
+    assert path.read_bytes() == b"abcdef"
+
+
+@pytest.mark.asyncio
+async def test_append_stream_discards_a_stream_over_the_limit(tmp_path):
+    # Arrange
+    path = tmp_path / "upload.part"
+    path.write_bytes(b"abc")
+
+    # Act & Assert
+    with pytest.raises(UploadTooLargeError):
+        await append_stream(chunks(b"def", b"ghi"), path, offset=3, max_bytes=4)
+    assert path.read_bytes() == b"abc"
+
+
+@pytest.mark.asyncio
+async def test_append_stream_rejects_wrong_offset(tmp_path):
+    # Arrange
+    path = tmp_path / "upload.part"
+    path.write_bytes(b"abc")
+
+    # Act & Assert
+    with pytest.raises(UploadOffsetMismatchError) as exc_info:
+        await append_stream(chunks(b"def"), path, offset=0, max_bytes=10)
+    assert exc_info.value.offset == 3
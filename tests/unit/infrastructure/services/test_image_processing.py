@@ -0,0 +1,86 @@
+import pytest
+from uuid import uuid4
+
+from PIL import Image
+
+from src.infrastructure.services.bounded_executor import BoundedExecutor
+from src.infrastructure.services.image_processing import (
+    OriginalOnlyPostImageProcessor,
+    PillowPostImageProcessor,
+    VariantSpec,
+    render_variants,
+)
+
+
+def test_render_variants_resizes_and_crops(tmp_path):
+    # Arrange
+    source = tmp_path / "source.png"
+    Image.new("RGB", (2000, 1000), "red").save(source)
+    thumbnail = tmp_path / "thumbnail.jpg"
+    feed = tmp_path / "feed.jpg"
+
+    # Act
+    render_variants(
+        str(source),
+        [(VariantSpec("thumbnail", 100, square=True), str(thumbnail)), (VariantSpec("feed", 500), str(feed))],
+    )
+
+    # Assert
+    with Image.open(thumbnail) as image:
+        assert image.size == (100, 100)
+        assert image.format == "JPEG"
+    with Image.open(feed) as image:
+        assert image.size == (500, 250)
+
+
+def test_render_variants_never_upscales(tmp_path):
+    # Arrange
+    source = tmp_path / "source.jpg"
+    Image.new("RGB", (300, 200), "blue").save(source)
+    feed = tmp_path / "feed.jpg"
+
+    # Act
+    render_variants(str(source), [(VariantSpec("feed", 1080), str(feed))])
+
+    # Assert
+    with Image.open(feed) as image:
+        assert image.size == (300, 200)
+
+
+@pytest.mark.asyncio
+async def test_processor_returns_variant_urls(tmp_path):
+    # Arrange
+    post_id = uuid4()
+    Image.new("RGB", (640, 480), "green").save(tmp_path / f"{post_id}.jpg")
+    executor = BoundedExecutor(max_workers=1, max_pending=1, reject_with=RuntimeError)
+    processor = PillowPostImageProcessor(
+        base_path=str(tmp_path),
+        base_url="/static/posts",
+        executor=executor,
+        variants=(VariantSpec("thumbnail", 64, square=True),),
+    )
+
+    # Act
+    variants = await processor.create_variants(post_id, f"/static/posts/{post_id}.jpg")
+
+    # Assert
+    shard = f"{str(post_id)[:2]}/{str(post_id)[2:4]}"
+    assert variants == {
+        "thumbnail": f"/static/posts/{shard}/{post_id}_thumbnail.jpg",
+        "original": f"/static/posts/{post_id}.jpg",
+    }
+    assert (tmp_path / shard / f"{post_id}_thumbnail.jpg").exists()
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_original_only_processor_lists_just_the_original():
+    # Arrange
+    processor = OriginalOnlyPostImageProcessor()
+    image_url = "https://media.example.com/posts/3f/a8/3fa8.jpg"
+
+    # Act
+    variants = await processor.create_variants(uuid4(), image_url)
+
+    # Assert
+    assert variants == {"original": image_url}
@@ -0,0 +1,78 @@
+import pytest
+
+from PIL import Image
+
+from src.infrastructure.services.bounded_executor import BoundedExecutor
+from src.infrastructure.services.image_transform import TransformStats, UploadImageTransformer
+
+
+@pytest.fixture
+def executor():
+    executor = BoundedExecutor(max_workers=1, max_pending=4, reject_with=RuntimeError)
+    yield executor
+    executor.shutdown()
+
+
+def write_jpeg_with_exif(path):
+    image = Image.new("RGB", (400, 300), "orange")
+    exif = Image.Exif()
+    exif[0x010F] = "PhoneMaker"  # Make
+    exif[0x0112] = 6  # Orientation: rotate 90 degrees clockwise
+    image.save(path, "JPEG", quality=100, exif=exif)
+
+
+@pytest.mark.asyncio
+async def test_transform_reencodes_to_webp_without_metadata(tmp_path, executor):
+    # Arrange
+    source = tmp_path / ".upload"
+    write_jpeg_with_exif(source)
+    transformer = UploadImageTransformer("WEBP", 80, executor)
+
+    # Act
+    stored = await transformer.transform(source, tmp_path / "post", ".jpg")
+
+    # Assert
+    assert stored == tmp_path / "post.webp"
+    assert not source.exists()
+    with Image.open(stored) as image:
+        assert image.format == "WEBP"
+        assert not image.getexif()
+        # The orientation was applied to the pixels before the EXIF was dropped
+        assert image.size == (300, 400)
+
+
+@pytest.mark.asyncio
+async def test_transform_passes_through_undecodable_files(tmp_path, executor):
+    # Arrange
+    source = tmp_path / ".upload"
+    source.write_bytes(b"fake image content")
+    transformer = UploadImageTransformer("JPEG", 80, executor)
+
+    # Act
+    stored = await transformer.transform(source, tmp_path / "post", ".jpg")
+
+    # Assert
+    assert stored == tmp_path / "post.jpg"
+    assert stored.read_bytes() == b"fake image content"
+    assert transformer.stats() == TransformStats(
+        images=1, passed_through=1, original_bytes=18, stored_bytes=18
+    )
+
+
+@pytest.mark.asyncio
+async def test_transform_counts_original_and_stored_bytes(tmp_path, executor):
+    # Arrange
+    source = tmp_path / ".upload"
+    write_jpeg_with_exif(source)
+    original_size = source.stat().st_size
+    transformer = UploadImageTransformer("JPEG", 70, executor)
+
+    # Act
+    stored = await transformer.transform(source, tmp_path / "post", ".png")
+
+    # Assert
+    stats = transformer.stats()
+    assert stored.suffix == ".jpg"
+    assert stats.original_bytes == original_size
+    assert stats.stored_bytes == stored.stat().st_size
+    assert stats.stored_bytes < stats.original_bytes
@@ -0,0 +1,95 @@
+import pytest
+from unittest.mock import patch
+
+from src.domain.users.exceptions import InvalidCredentialsError
+from src.domain.users.user import User
+from src.infrastructure.services import jwt as jwt_service
+from src.infrastructure.services.jwt import ACCESS_TOKEN_EXPIRE_MINUTES, JWTTokenService
+from src.infrastructure.services.ttl_cache import TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_user():
+    return User(
+        username="testuser",
+        email="test@example.com",
+        hashed_password="hashed",
+        is_public=False,
+        token_version=4,
+    )
+
+
+def test_token_without_user_claims():
+    # Arrange
+    user = make_user()
+    service = JWTTokenService(embed_user_claims=False)
+
+    # Act
+    claims = service.verify_token(service.generate_token(user))
+
+    # Assert
+    assert claims.user_id == user.id
+    assert claims.token_version == 4
+    assert not claims.has_user_claims
+
+
+def test_token_with_embedded_user_claims():
+    # Arrange
+    user = make_user()
+    service = JWTTokenService(embed_user_claims=True)
+
+    # Act
+    claims = service.verify_token(service.generate_token(user))
+
+    # Assert
+    assert claims.has_user_claims
+    assert claims.username == "testuser"
+    assert claims.email == "test@example.com"
+    assert claims.is_public is False
+
+
+def test_tampered_token_is_rejected():
+    # Arrange
+    service = JWTTokenService()
+    token = service.generate_token(make_user())
+
+    # Act & Assert
+    with pytest.raises(InvalidCredentialsError):
+        service.verify_token(token[:-2] + "xx")
+
+
+def test_verified_token_is_served_from_cache_until_it_expires():
+    # Arrange
+    clock = FakeClock()
+    cache = TTLCache(max_size=10, ttl_seconds=3600, clock=clock)
+    service = JWTTokenService(verified_cache=cache)
+    token = service.generate_token(make_user())
+
+    # Act & Assert
+    with patch.object(jwt_service.jwt, "decode", wraps=jwt_service.jwt.decode) as decode:
+        first = service.verify_token(token)
+        assert service.verify_token(token) == first
+        assert decode.call_count == 1
+
+        # The entry lives exactly as long as the token, not the cache-wide TTL
+        clock.now = ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        service.verify_token(token)
+        assert decode.call_count == 2
+
+
+def test_invalid_token_is_not_cached():
+    # Arrange
+    cache = TTLCache(max_size=10, ttl_seconds=3600)
+    service = JWTTokenService(verified_cache=cache)
+
+    # Act & Assert
+    with pytest.raises(InvalidCredentialsError):
+        service.verify_token("not-a-token")
+    assert cache.stats().size == 0
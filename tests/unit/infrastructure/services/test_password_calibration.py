@@ -0,0 +1,40 @@
+from src.infrastructure.services.password_calibration import Argon2Parameters, calibrate
+
+
+def fake_measure(parameters: Argon2Parameters) -> float:
+    # 10 ms per pass over 64 MiB
+    return 0.01 * parameters.time_cost * parameters.memory_cost / 65536
+
+
+def test_calibrate_picks_largest_memory_then_time_cost_within_budget():
+    # Act
+    result = calibrate(target_ms=100, logins_per_second_per_core=100, measure=fake_measure)
+
+    # Assert: budget is 10 ms per hash (throughput bound), 64 MiB fits once
+    assert result.budget_seconds == 0.01
+    assert result.parameters == Argon2Parameters(time_cost=1, memory_cost=65536)
+
+
+def test_calibrate_raises_time_cost_when_budget_allows():
+    # Act
+    result = calibrate(target_ms=100, logins_per_second_per_core=1, measure=fake_measure)
+
+    # Assert: latency bound of 100 ms, 256 MiB costs 40 ms per pass
+    assert result.budget_seconds == 0.1
+    assert result.parameters == Argon2Parameters(time_cost=2, memory_cost=262144)
+    assert result.hash_seconds <= result.budget_seconds
+
+
+def test_calibrate_returns_cheapest_parameters_when_nothing_fits():
+    # Act
+    result = calibrate(target_ms=0.1, logins_per_second_per_core=1, measure=fake_measure)
+
+    # Assert
+    assert result.parameters == Argon2Parameters(time_cost=1, memory_cost=7168)
+    assert result.hash_seconds > result.budget_seconds
+    assert not result.parameters.meets_owasp_minimum()
+
+
+def test_owasp_minimum():
+    assert Argon2Parameters(time_cost=2, memory_cost=19456).meets_owasp_minimum()
+    assert not Argon2Parameters(time_cost=1, memory_cost=19456).meets_owasp_minimum()
@@ -0,0 +1,167 @@
+import json
+import os
+import time
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+import pytest
+
+from src.application.common.exceptions import (
+    InvalidUploadChunkError,
+    UploadNotFoundError,
+    UploadOffsetMismatchError,
+)
+from src.infrastructure.services.direct_upload import LocalUploadGateway
+from src.infrastructure.services.object_storage import MIN_PART_SIZE, S3Client
+from src.infrastructure.services.resumable_upload import (
+    LocalResumableUploadStorage,
+    S3ResumableUploadStorage,
+)
+
+
+async def body(*parts: bytes):
+    for part in parts:
+        yield part
+
+
+@pytest.fixture
+def gateway(tmp_path):
+    return LocalUploadGateway(signing_key="secret", incoming_path=str(tmp_path))
+
+
+@pytest.fixture
+def local_storage(gateway):
+    return LocalResumableUploadStorage(gateway, max_bytes=100, chunk_size=4)
+
+
+@pytest.mark.asyncio
+async def test_local_upload_finishes_where_direct_uploads_are_claimed(gateway, local_storage):
+    # Arrange
+    user_id = uuid4()
+    session = await local_storage.create_session(user_id, "photo.jpg", size=6)
+
+    # Act
+    first = await local_storage.append_chunk(user_id, session.upload_id, 0, body(b"abcd"))
+    last = await local_storage.append_chunk(user_id, session.upload_id, 4, body(b"ef"))
+
+    # Assert
+    assert (first.offset, first.is_complete) == (4, False)
+    assert last.is_complete
+    assert gateway.path_of(session.upload_id).read_bytes() == b"abcdef"
+    assert [path.name for path in gateway.path_of(session.upload_id).parent.iterdir()] == [
+        gateway.path_of(session.upload_id).name
+    ]
+
+
+@pytest.mark.asyncio
+async def test_local_upload_resumes_after_interrupted_chunk(local_storage):
+    # Arrange
+    user_id = uuid4()
+    session = await local_storage.create_session(user_id, "photo.jpg", size=6)
+
+    async def dropped():
+        yield b"abc"
+        raise ConnectionError("client went away")
+
+    with pytest.raises(ConnectionError):
+        await local_storage.append_chunk(user_id, session.upload_id, 0, dropped())
+
+    # Act
+    resumed = await local_storage.get_session(user_id, session.upload_id)
+
+    # Assert
+    assert resumed.offset == 3
+    with pytest.raises(UploadOffsetMismatchError) as exc_info:
+        await local_storage.append_chunk(user_id, session.upload_id, 0, body(b"abcdef"))
+    assert exc_info.value.offset == 3
+
+
+@pytest.mark.asyncio
+async def test_local_session_of_another_user_is_not_found(local_storage):
+    # Arrange
+    session = await local_storage.create_session(uuid4(), "photo.jpg", size=6)
+
+    # Act & Assert
+    with pytest.raises(UploadNotFoundError):
+        await local_storage.get_session(uuid4(), session.upload_id)
+
+
+@pytest.mark.asyncio
+async def test_local_sweep_removes_expired_sessions_and_unclaimed_uploads(gateway, tmp_path):
+    # Arrange
+    storage = LocalResumableUploadStorage(gateway, max_bytes=100, expires_seconds=60)
+    user_id = uuid4()
+    expired = await storage.create_session(user_id, "old.jpg", size=6)
+    active = await storage.create_session(user_id, "new.jpg", size=6)
+    session_file = gateway.path_of(expired.upload_id).with_name(
+        gateway.path_of(expired.upload_id).name + ".session"
+    )
+    session_file.write_text(json.dumps({"size": 6, "expires_at": time.time() - 1}))
+    unclaimed = gateway.path_of(f"{user_id}/{'0' * 32}.jpg")
+    unclaimed.write_bytes(b"image")
+    old = time.time() - 120
+    os.utime(unclaimed, (old, old))
+
+    # Act
+    removed = await storage.delete_expired_sessions()
+
+    # Assert
+    assert removed == 2
+    with pytest.raises(UploadNotFoundError):
+        await storage.get_session(user_id, expired.upload_id)
+    assert (await storage.get_session(user_id, active.upload_id)).offset == 0
+    assert not unclaimed.exists()
+    assert sorted(path.suffix for path in unclaimed.parent.iterdir()) == [".part", ".session"]
+
+
+@pytest.fixture
+def mock_s3_client():
+    return AsyncMock(spec=S3Client)
+
+
+@pytest.fixture
+def s3_storage(mock_s3_client):
+    return S3ResumableUploadStorage(mock_s3_client, max_bytes=20 * 1024 * 1024)
+
+
+def s3_session(size: int) -> bytes:
+    return json.dumps(
+        {"size": size, "expires_at": time.time() + 60, "multipart_id": "mp-1"}
+    ).encode()
+
+
+@pytest.mark.asyncio
+async def test_s3_last_chunk_completes_multipart_upload(s3_storage, mock_s3_client):
+    # Arrange
+    user_id = uuid4()
+    upload_id = f"{user_id}/{'a' * 32}.jpg"
+    mock_s3_client.get_object.return_value = s3_session(MIN_PART_SIZE + 3)
+    mock_s3_client.list_parts.return_value = [(1, '"etag-1"', MIN_PART_SIZE)]
+    mock_s3_client.upload_part.return_value = '"etag-2"'
+
+    # Act
+    session = await s3_storage.append_chunk(user_id, upload_id, MIN_PART_SIZE, body(b"xyz"))
+
+    # Assert
+    assert session.is_complete
+    mock_s3_client.upload_part.assert_awaited_once_with(
+        f"incoming/{upload_id}", "mp-1", 2, b"xyz"
+    )
+    mock_s3_client.complete_multipart_upload.assert_awaited_once_with(
+        f"incoming/{upload_id}", "mp-1", [(1, '"etag-1"'), (2, '"etag-2"')]
+    )
+    mock_s3_client.delete_object.assert_awaited_once_with(f"upload-sessions/{upload_id}.json")
+
+
+@pytest.mark.asyncio
+async def test_s3_rejects_short_chunk_before_the_end(s3_storage, mock_s3_client):
+    # Arrange
+    user_id = uuid4()
+    upload_id = f"{user_id}/{'a' * 32}.jpg"
+    mock_s3_client.get_object.return_value = s3_session(2 * MIN_PART_SIZE)
+    mock_s3_client.list_parts.return_value = []
+
+    # Act & Assert
+    with pytest.raises(InvalidUploadChunkError):
+        await s3_storage.append_chunk(user_id, upload_id, 0, body(b"too short"))
+    mock_s3_client.upload_part.assert_not_awaited()
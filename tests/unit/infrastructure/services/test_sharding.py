@@ -0,0 +1,45 @@
+import pytest
+
+from src.infrastructure.services.sharding import (
+    link_into_shards,
+    relative_media_path,
+    shard_dir,
+    sharded_url,
+)
+
+
+def test_shard_dir_uses_leading_hex_characters():
+    assert shard_dir("3fa85f64-5717-4562-b3fc-2c963f66afa6.jpg") == "3f/a8"
+
+
+def test_shard_dir_rejects_names_without_hex_prefix():
+    with pytest.raises(ValueError):
+        shard_dir("avatar.jpg")
+
+
+def test_sharded_url_rewrites_flat_urls_only():
+    assert sharded_url("/static/posts/3fa85f64.jpg", "/static/posts") == (
+        "/static/posts/3f/a8/3fa85f64.jpg"
+    )
+    assert sharded_url("/static/posts/3f/a8/3fa85f64.jpg", "/static/posts") is None
+    assert sharded_url("https://ui-avatars.com/api/?name=a", "/static/posts") is None
+
+
+def test_relative_media_path_rejects_escapes():
+    assert str(relative_media_path("/static/posts/3f/a8/x.jpg", "/static/posts")) == "3f/a8/x.jpg"
+    assert relative_media_path("/static/posts/../secret", "/static/posts") is None
+
+
+def test_link_into_shards_keeps_flat_file_until_removed(tmp_path):
+    # Arrange
+    (tmp_path / "3fa85f64.jpg").write_bytes(b"image")
+    (tmp_path / ".3fa85f64.upload").write_bytes(b"partial")
+
+    # Act
+    flat_files = link_into_shards(tmp_path)
+    again = link_into_shards(tmp_path)
+
+    # Assert
+    assert flat_files == again == [tmp_path / "3fa85f64.jpg"]
+    assert (tmp_path / "3f" / "a8" / "3fa85f64.jpg").read_bytes() == b"image"
+    assert (tmp_path / "3fa85f64.jpg").exists()
@@ -0,0 +1,81 @@
+import pytest
+from datetime import timedelta
+from unittest.mock import AsyncMock
+from uuid import uuid4
+
+from src.infrastructure.services.token_revocation import InMemoryTokenRevocationList
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def make_revocation_list(loader, clock):
+    return InMemoryTokenRevocationList(
+        loader=loader,
+        token_lifetime=timedelta(minutes=30),
+        refresh_seconds=10,
+        clock=clock,
+    )
+
+
+@pytest.mark.asyncio
+async def test_tokens_below_loaded_version_are_revoked():
+    # Arrange
+    user_id = uuid4()
+    loader = AsyncMock(return_value={user_id: 2})
+    revocation_list = make_revocation_list(loader, FakeClock())
+
+    # Act & Assert
+    assert await revocation_list.is_revoked(user_id, 1)
+    assert not await revocation_list.is_revoked(user_id, 2)
+    assert not await revocation_list.is_revoked(uuid4(), 0)
+
+
+@pytest.mark.asyncio
+async def test_reloads_only_after_refresh_interval():
+    # Arrange
+    user_id = uuid4()
+    clock = FakeClock()
+    loader = AsyncMock(side_effect=[{}, {user_id: 1}])
+    revocation_list = make_revocation_list(loader, clock)
+
+    # Act & Assert
+    assert not await revocation_list.is_revoked(user_id, 0)
+    clock.now = 9
+    assert not await revocation_list.is_revoked(user_id, 0)
+    clock.now = 10
+    assert await revocation_list.is_revoked(user_id, 0)
+    assert loader.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_local_revocation_applies_immediately():
+    # Arrange
+    user_id = uuid4()
+    revocation_list = make_revocation_list(AsyncMock(return_value={}), FakeClock())
+    await revocation_list.is_revoked(user_id, 0)
+
+    # Act
+    await revocation_list.revoke(user_id, 1)
+
+    # Assert
+    assert await revocation_list.is_revoked(user_id, 0)
+
+
+@pytest.mark.asyncio
+async def test_failed_reload_keeps_previous_set():
+    # Arrange
+    user_id = uuid4()
+    clock = FakeClock()
+    loader = AsyncMock(side_effect=[{user_id: 1}, ConnectionError()])
+    revocation_list = make_revocation_list(loader, clock)
+    await revocation_list.is_revoked(user_id, 0)
+    clock.now = 10
+
+    # Act & Assert
+    assert await revocation_list.is_revoked(user_id, 0)
@@ -0,0 +1,79 @@
+from src.infrastructure.services.ttl_cache import CacheStats, TTLCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_get_returns_value_until_ttl_expires():
+    # Arrange
+    clock = FakeClock()
+    cache: TTLCache[str, int] = TTLCache(max_size=10, ttl_seconds=5, clock=clock)
+    cache.set("a", 1)
+
+    # Act & Assert
+    assert cache.get("a") == 1
+    clock.now = 5
+    assert cache.get("a") is None
+    assert cache.stats() == CacheStats(hits=1, misses=1, evictions=0, size=0, max_size=10)
+
+
+def test_least_recently_used_entry_is_evicted():
+    # Arrange
+    cache: TTLCache[str, int] = TTLCache(max_size=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+
+    # Act
+    cache.set("c", 3)
+
+    # Assert
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats().evictions == 1
+
+
+def test_invalidate_removes_entry():
+    # Arrange
+    cache: TTLCache[str, int] = TTLCache(max_size=10, ttl_seconds=60)
+    cache.set("a", 1)
+
+    # Act
+    cache.invalidate("a")
+    cache.invalidate("missing")
+
+    # Assert
+    assert cache.get("a") is None
+
+
+def test_zero_size_disables_cache():
+    # Arrange
+    cache: TTLCache[str, int] = TTLCache(max_size=0, ttl_seconds=60)
+
+    # Act
+    cache.set("a", 1)
+
+    # Assert
+    assert cache.get("a") is None
+    assert cache.stats().size == 0
+
+
+def test_per_entry_ttl_overrides_default():
+    # Arrange
+    clock = FakeClock()
+    cache: TTLCache[str, int] = TTLCache(max_size=10, ttl_seconds=60, clock=clock)
+    cache.set("short", 1, ttl_seconds=5)
+    cache.set("gone", 2, ttl_seconds=0)
+
+    # Act
+    clock.now = 5
+
+    # Assert
+    assert cache.get("short") is None
+    assert cache.get("gone") is None
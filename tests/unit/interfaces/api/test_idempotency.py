@@ -0,0 +1,182 @@
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+from pydantic import BaseModel
+from starlette.requests import Request
+
+from src.application.common.exceptions import IdempotencyKeyInUseError, IdempotencyKeyMismatchError
+from src.application.common.idempotency_repository import (
+    AbstractIdempotencyRepository,
+    IdempotencyRecord,
+)
+from src.application.common.task_scheduler import AbstractTaskScheduler
+from src.interfaces.api.idempotency import REPLAYED_HEADER, Idempotency, request_fingerprint
+
+
+class ThingOut(BaseModel):
+    name: str
+
+
+@pytest.fixture
+def mock_repo():
+    return AsyncMock(spec=AbstractIdempotencyRepository)
+
+
+@pytest.fixture
+def mock_task_scheduler():
+    return Mock(spec=AbstractTaskScheduler)
+
+
+@pytest.fixture
+def user_id():
+    return uuid4()
+
+
+def idempotency(mock_repo, mock_task_scheduler, user_id, key="key-1"):
+    return Idempotency(mock_repo, mock_task_scheduler, user_id, key, request_hash="hash")
+
+
+@pytest.mark.asyncio
+async def test_first_request_runs_and_stores_its_response(mock_repo, mock_task_scheduler, user_id):
+    # Arrange
+    mock_repo.reserve.return_value = None
+    execute = AsyncMock(return_value=ThingOut(name="post"))
+
+    # Act
+    response = await idempotency(mock_repo, mock_task_scheduler, user_id).run(
+        execute, 201, ThingOut
+    )
+
+    # Assert
+    assert response.status_code == 201
+    assert response.body == b'{"name":"post"}'
+    execute.assert_awaited_once()
+    mock_repo.complete.assert_awaited_once_with(
+        user_id, "key-1", IdempotencyRecord("hash", 201, {"name": "post"})
+    )
+
+
+@pytest.mark.asyncio
+async def test_replay_returns_stored_response_without_running(
+    mock_repo, mock_task_scheduler, user_id
+):
+    # Arrange
+    mock_repo.reserve.return_value = IdempotencyRecord("hash", 204)
+    execute = AsyncMock()
+
+    # Act
+    response = await idempotency(mock_repo, mock_task_scheduler, user_id).run(execute, 204)
+
+    # Assert
+    assert response.status_code == 204
+    assert response.headers[REPLAYED_HEADER] == "true"
+    execute.assert_not_awaited()
+    mock_repo.complete.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_key_in_progress_is_rejected(mock_repo, mock_task_scheduler, user_id):
+    # Arrange
+    mock_repo.reserve.return_value = IdempotencyRecord("hash")
+
+    # Act & Assert
+    with pytest.raises(IdempotencyKeyInUseError):
+        await idempotency(mock_repo, mock_task_scheduler, user_id).run(AsyncMock(), 204)
+
+
+@pytest.mark.asyncio
+async def test_key_reused_for_another_request_is_rejected(mock_repo, mock_task_scheduler, user_id):
+    # Arrange
+    mock_repo.reserve.return_value = IdempotencyRecord("other hash", 204)
+
+    # Act & Assert
+    with pytest.raises(IdempotencyKeyMismatchError):
+        await idempotency(mock_repo, mock_task_scheduler, user_id).run(AsyncMock(), 204)
+
+
+@pytest.mark.asyncio
+async def test_failed_request_releases_key(mock_repo, mock_task_scheduler, user_id):
+    # Arrange
+    mock_repo.reserve.return_value = None
+    execute = AsyncMock(side_effect=ValueError("boom"))
+
+    # Act & Assert
+    with pytest.raises(ValueError):
+        await idempotency(mock_repo, mock_task_scheduler, user_id).run(execute, 204)
+    mock_repo.release.assert_awaited_once_with(user_id, "key-1")
+    mock_repo.complete.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_request_without_key_skips_the_store(mock_repo, mock_task_scheduler, user_id):
+    # Arrange
+    execute = AsyncMock()
+
+    # Act
+    response = await idempotency(mock_repo, mock_task_scheduler, user_id, key=None).run(
+        execute, 204
+    )
+
+    # Assert
+    assert response.status_code == 204
+    execute.assert_awaited_once()
+    mock_repo.reserve.assert_not_awaited()
+
+
+def make_request(body: bytes, content_type: str = "application/json", path: str = "/api/v1/posts/"):
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": path,
+        "query_string": b"",
+        "headers": [(b"content-type", content_type.encode())],
+    }
+    return Request(scope, receive)
+
+
+def multipart(caption: str, image: bytes) -> tuple[bytes, str]:
+    boundary = "boundary"
+    body = (
+        f"--{boundary}\r\n"
+        'Content-Disposition: form-data; name="caption"\r\n\r\n'
+        f"{caption}\r\n"
+        f"--{boundary}\r\n"
+        'Content-Disposition: form-data; name="image"; filename="photo.jpg"\r\n'
+        "Content-Type: image/jpeg\r\n\r\n"
+    ).encode() + image + f"\r\n--{boundary}--\r\n".encode()
+    return body, f"multipart/form-data; boundary={boundary}"
+
+
+@pytest.mark.asyncio
+async def test_fingerprint_covers_route_and_json_body():
+    # Act
+    first = await request_fingerprint(make_request(b'{"upload_id": "a"}'))
+    retry = await request_fingerprint(make_request(b'{"upload_id": "a"}'))
+    other_body = await request_fingerprint(make_request(b'{"upload_id": "b"}'))
+    other_route = await request_fingerprint(make_request(b'{"upload_id": "a"}', path="/other"))
+
+    # Assert
+    assert first == retry
+    assert len({first, other_body, other_route}) == 3
+
+
+@pytest.mark.asyncio
+async def test_fingerprint_covers_form_fields_and_uploaded_bytes():
+    # Arrange
+    request = make_request(*multipart("hello", b"image-1"))
+
+    # Act
+    first = await request_fingerprint(request)
+    retry = await request_fingerprint(make_request(*multipart("hello", b"image-1")))
+    other_caption = await request_fingerprint(make_request(*multipart("bye", b"image-1")))
+    other_image = await request_fingerprint(make_request(*multipart("hello", b"image-2")))
+
+    # Assert
+    assert first == retry
+    assert len({first, other_caption, other_image}) == 3
+    # The upload can still be read in full by the route
+    assert await (await request.form())["image"].read() == b"image-1"
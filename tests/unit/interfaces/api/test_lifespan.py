@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse
+from starlette.routing import Route
+
+from src.interfaces.api.lifespan import InFlightRequests, InFlightRequestsMiddleware
+
+
+@pytest.fixture
+def in_flight():
+    return InFlightRequests()
+
+
+@pytest.fixture
+def release():
+    return asyncio.Event()
+
+
+@pytest.fixture
+def client(in_flight, release):
+    async def slow(request):
+        await release.wait()
+        return PlainTextResponse("done")
+
+    app = Starlette(routes=[Route("/slow", slow)])
+    app.add_middleware(InFlightRequestsMiddleware, in_flight=in_flight)
+    return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_drain_waits_for_running_requests_and_refuses_new_ones(client, in_flight, release):
+    # Arrange
+    running = asyncio.create_task(client.get("/slow"))
+    while in_flight.count == 0:
+        await asyncio.sleep(0)
+    drain = asyncio.create_task(in_flight.drain(timeout=5))
+    await asyncio.sleep(0)
+
+    # Act
+    refused = await client.get("/slow")
+    release.set()
+
+    # Assert
+    assert refused.status_code == 503
+    assert refused.headers["retry-after"] == "1"
+    assert (await running).text == "done"
+    assert await drain is True
+    assert in_flight.count == 0
+
+
+@pytest.mark.asyncio
+async def test_drain_gives_up_after_timeout(client, in_flight, release):
+    # Arrange
+    running = asyncio.create_task(client.get("/slow"))
+    while in_flight.count == 0:
+        await asyncio.sleep(0)
+
+    # Act
+    drained = await in_flight.drain(timeout=0.01)
+
+    # Assert
+    assert drained is False
+    assert in_flight.count == 1
+    release.set()
+    await running
+
+
+@pytest.mark.asyncio
+async def test_drain_returns_at_once_when_idle(in_flight):
+    # Act & Assert
+    assert await in_flight.drain(timeout=0) is True
@@ -0,0 +1,106 @@
+import pytest
+import pytest_asyncio
+from httpx import ASGITransport, AsyncClient
+from starlette.applications import Starlette
+from starlette.routing import Mount
+
+from src.interfaces.api.media import IMMUTABLE, MediaFileResponse, MediaFiles
+
+
+@pytest_asyncio.fixture
+async def client(tmp_path):
+    (tmp_path / "image.jpg").write_bytes(b"0123456789")
+    app = Starlette(
+        routes=[
+            Mount("/blobs", MediaFiles(tmp_path, cache_control=IMMUTABLE)),
+            Mount("/missing", MediaFiles(tmp_path / "not-created-yet")),
+        ]
+    )
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        yield ac
+
+
+@pytest.mark.asyncio
+async def test_serves_file_with_strong_etag_and_cache_control(client):
+    # Act
+    response = await client.get("/blobs/image.jpg")
+
+    # Assert
+    assert response.status_code == 200
+    assert response.content == b"0123456789"
+    assert not response.headers["etag"].startswith("W/")
+    assert response.headers["cache-control"] == IMMUTABLE
+    assert response.headers["accept-ranges"] == "bytes"
+
+
+@pytest.mark.asyncio
+async def test_matching_etag_returns_not_modified(client):
+    # Arrange
+    etag = (await client.get("/blobs/image.jpg")).headers["etag"]
+
+    # Act
+    response = await client.get("/blobs/image.jpg", headers={"If-None-Match": etag})
+
+    # Assert
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["cache-control"] == IMMUTABLE
+
+
+@pytest.mark.asyncio
+async def test_if_modified_since_returns_not_modified(client):
+    # Arrange
+    last_modified = (await client.get("/blobs/image.jpg")).headers["last-modified"]
+
+    # Act
+    response = await client.get("/blobs/image.jpg", headers={"If-Modified-Since": last_modified})
+
+    # Assert
+    assert response.status_code == 304
+
+
+@pytest.mark.asyncio
+async def test_range_request_returns_partial_content(client):
+    # Act
+    response = await client.get("/blobs/image.jpg", headers={"Range": "bytes=2-5"})
+
+    # Assert
+    assert response.status_code == 206
+    assert response.content == b"2345"
+    assert response.headers["content-range"] == "bytes 2-5/10"
+
+
+@pytest.mark.asyncio
+async def test_missing_root_is_not_found(client):
+    response = await client.get("/missing/image.jpg")
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_zerocopy_send_hands_file_to_server(tmp_path):
+    # Arrange
+    path = tmp_path / "image.jpg"
+    path.write_bytes(b"0123456789")
+    response = MediaFileResponse(path, stat_result=path.stat())
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "headers": [(b"range", b"bytes=4-")],
+        "extensions": {"http.response.zerocopysend": {}},
+        "asgi": {"spec_version": "2.4"},
+    }
+    messages = []
+
+    async def send(message):
+        if message["type"] == "http.response.zerocopysend":
+            message["file"].seek(message["offset"])
+            message = {**message, "body": message["file"].read(message["count"])}
+        messages.append(message)
+
+    # Act
+    await response(scope, None, send)
+
+    # Assert
+    assert messages[0]["status"] == 206
+    assert messages[1]["type"] == "http.response.zerocopysend"
+    assert messages[1]["body"] == b"456789"
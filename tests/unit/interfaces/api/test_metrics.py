@@ -0,0 +1,61 @@
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from src.interfaces.api.dependencies import get_user_cache
+from src.interfaces.api.metrics import metrics_router
+
+
+@pytest.mark.asyncio
+async def test_metrics_exposes_pool_cache_and_executor_stats():
+    # Arrange
+    app = FastAPI()
+    app.include_router(metrics_router)
+    get_user_cache().get("not-cached")
+
+    # Act
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
+        response = await ac.get("/metrics")
+
+    # Assert
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    lines = response.text.splitlines()
+    assert "# TYPE insta_db_pool_checkout_seconds histogram" in lines
+    assert 'insta_db_pool_checkout_seconds_bucket{le="+Inf"} 0' in lines
+    assert any(line.startswith('insta_cache_misses_total{cache="user"} ') for line in lines)
+    assert 'insta_executor_rejected_total{executor="password_hasher"} 0' in lines
+    assert lines.count("# TYPE insta_cache_hits_total counter") == 1
+
+
+@pytest.mark.asyncio
+async def test_metrics_refuses_remote_clients_without_a_token():
+    # Arrange
+    app = FastAPI()
+    app.include_router(metrics_router)
+    transport = ASGITransport(app=app, client=("203.0.113.7", 40000))
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        response = await ac.get("/metrics")
+
+    # Assert
+    assert response.status_code == 403
+
+
+@pytest.mark.asyncio
+async def test_metrics_requires_the_configured_token(monkeypatch):
+    # Arrange
+    monkeypatch.setattr("src.interfaces.api.metrics.METRICS_TOKEN", "scrape-secret")
+    app = FastAPI()
+    app.include_router(metrics_router)
+    transport = ASGITransport(app=app, client=("203.0.113.7", 40000))
+
+    # Act
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        missing = await ac.get("/metrics")
+        wrong = await ac.get("/metrics", headers={"Authorization": "Bearer nope"})
+        right = await ac.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+
+    # Assert
+    assert (missing.status_code, wrong.status_code, right.status_code) == (401, 401, 200)